@@ -573,6 +573,7 @@ class AccountAdmin(ModelAdmin):
                     'logo_sm',
                     'is_verified',
                     'log_api_requests',
+                    'log_api_requests_sample_rate',
                     'bucket_name',
                     'bucket_is_public',
                 )
@@ -703,6 +704,9 @@ class AccountAdmin(ModelAdmin):
                 max_invites=obj.max_invites,
                 max_ai_templates_generations=obj.max_ai_templates_generations,
                 log_api_requests=obj.log_api_requests,
+                log_api_requests_sample_rate=(
+                    obj.log_api_requests_sample_rate
+                ),
                 bucket_name=obj.bucket_name,
                 bucket_is_public=obj.bucket_is_public,
                 force_save=True
@@ -295,3 +295,16 @@ class Language:
     LITERALS = Literal[en, es, de, fr, ru]
     VALUES = (en, es, de, fr, ru)
     EURO_VALUES = (en, es, de, fr)
+
+
+class ReassignJobStatus:
+
+    RUNNING = 'running'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    LITERALS = Literal[
+        RUNNING,
+        COMPLETED,
+        FAILED,
+    ]
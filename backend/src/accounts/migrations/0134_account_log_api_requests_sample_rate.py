@@ -0,0 +1,19 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0133_account_bucket_is_public'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='account',
+            name='log_api_requests_sample_rate',
+            field=models.PositiveSmallIntegerField(default=100, help_text='Percentage of successful API requests saved to the log', validators=[django.core.validators.MaxValueValidator(100)]),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0134_account_log_api_requests_sample_rate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='photo_etag',
+            field=models.CharField(blank=True, max_length=255, null=True),
+        ),
+    ]
@@ -5,6 +5,7 @@ from django.conf import settings
 from django.contrib.auth.models import AbstractUser
 from django.contrib.postgres.fields import JSONField
 from django.contrib.postgres.search import SearchVectorField
+from django.core.validators import MaxValueValidator
 from django.db import models
 from django.db.models import UniqueConstraint, Q, Manager
 from django.utils import timezone
@@ -130,6 +131,11 @@ class Account(SoftDeleteModel):
         )
     )
     log_api_requests = models.BooleanField(default=False)
+    log_api_requests_sample_rate = models.PositiveSmallIntegerField(
+        default=100,
+        validators=[MaxValueValidator(100)],
+        help_text='Percentage of successful API requests saved to the log'
+    )
     bucket_name = models.CharField(max_length=255, blank=True, null=True)
     bucket_is_public = models.BooleanField(default=True)
     objects = BaseSoftDeleteManager.from_queryset(AccountQuerySet)()
@@ -224,23 +230,12 @@ class Account(SoftDeleteModel):
 
     def get_paid_users_count(self) -> int:
 
+        """ The users of the tenants are paid by the subscribed master,
+            the counters are maintained by the AccountService """
+
         if self.is_subscribed:
-            return User.objects.filter(
-                Q(
-                    account_id=self.id,
-                    status=UserStatus.ACTIVE
-                )
-                | Q(
-                    account__lease_level=LeaseLevel.TENANT,
-                    account__master_account_id=self.id,
-                    status=UserStatus.ACTIVE
-                )
-            ).count()
-        else:
-            return User.objects.filter(
-                account_id=self.id,
-                status=UserStatus.ACTIVE
-            ).count()
+            return self.total_active_users
+        return self.active_users
 
     @property
     def is_tenant(self):
@@ -605,6 +600,7 @@ class Contact(
     first_name = models.CharField(max_length=150, blank=True, null=True)
     last_name = models.CharField(max_length=150, blank=True, null=True)
     photo = models.URLField(max_length=1024, null=True, blank=True)
+    photo_etag = models.CharField(max_length=255, null=True, blank=True)
     job_title = models.CharField(max_length=150, blank=True, null=True)
     source = models.CharField(
         max_length=255,
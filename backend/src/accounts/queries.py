@@ -1,9 +1,11 @@
 from abc import abstractmethod
-from typing import List
+from typing import List, Optional, Tuple
 from src.accounts.enums import (
+    LeaseLevel,
     NotificationStatus,
     NotificationType,
-    UserStatus
+    UserStatus,
+    UserType,
 )
 from src.processes.enums import (
     DirectlyStatus,
@@ -103,10 +105,33 @@ class CountTemplatesByGroupQuery(SqlQueryObject):
         """, self.params
 
 
-class BaseDeleteRawPerformerTemplateQuery(SqlQueryObject):
-    def __init__(self, delete_id: int, substitution_id: int):
+class ReassignChunkMixin:
+
+    """ Restricts the reassignment query to the chunk of the keys,
+        see ReassignService """
+
+    ids: Optional[List[int]] = None
+
+    def _get_chunk_condition(self, column: str) -> Tuple[str, dict]:
+        if self.ids is None:
+            return '', {}
+        sql, params = self._to_sql_list(self.ids, 'chunk_id')
+        return f'{column} IN {sql} AND', params
+
+
+class BaseDeleteRawPerformerTemplateQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
+    def __init__(
+        self,
+        delete_id: int,
+        substitution_id: int,
+        ids: Optional[List[int]] = None,
+    ):
         self.delete_id = delete_id
         self.substitution_id = substitution_id
+        self.ids = ids
         self.params = {
             'delete_id': delete_id,
             'substitution_id': substitution_id,
@@ -121,16 +146,18 @@ class BaseDeleteRawPerformerTemplateQuery(SqlQueryObject):
         pass
 
     def get_sql(self):
+        chunk_sql, chunk_params = self._get_chunk_condition('task_id')
         return f"""
         DELETE FROM processes_rawperformertemplate
         WHERE
           {self.substitution_field} = %(substitution_id)s AND
+          {chunk_sql}
           task_id IN (
             SELECT task_id FROM processes_rawperformertemplate
             WHERE {self.delete_field} = %(delete_id)s
               AND is_deleted IS FALSE
           )
-        """, self.params
+        """, {**self.params, **chunk_params}
 
 
 class DeleteGroupFromRawPerformerTemplateQuery(
@@ -161,10 +188,19 @@ class DeleteUserFromRawPerformerTemplateQuery(
     substitution_field = "user_id"
 
 
-class BaseDeleteRawPerformerQuery(SqlQueryObject):
-    def __init__(self, delete_id: int, substitution_id: int):
+class BaseDeleteRawPerformerQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
+    def __init__(
+        self,
+        delete_id: int,
+        substitution_id: int,
+        ids: Optional[List[int]] = None,
+    ):
         self.delete_id = delete_id
         self.substitution_id = substitution_id
+        self.ids = ids
         self.params = {
             'delete_id': delete_id,
             'substitution_id': substitution_id,
@@ -179,16 +215,18 @@ class BaseDeleteRawPerformerQuery(SqlQueryObject):
         pass
 
     def get_sql(self):
+        chunk_sql, chunk_params = self._get_chunk_condition('task_id')
         return f"""
         DELETE FROM processes_rawperformer
         WHERE
           {self.substitution_field} = %(substitution_id)s AND
+          {chunk_sql}
           task_id IN (
             SELECT task_id FROM processes_rawperformer
             WHERE {self.delete_field} = %(delete_id)s
               AND is_deleted IS FALSE
           )
-        """, self.params
+        """, {**self.params, **chunk_params}
 
 
 class DeleteGroupFromRawPerformerQuery(BaseDeleteRawPerformerQuery):
@@ -211,10 +249,19 @@ class DeleteUserFromRawPerformerQuery(BaseDeleteRawPerformerQuery):
     substitution_field = "user_id"
 
 
-class BaseDeleteTaskPerformerQuery(SqlQueryObject):
-    def __init__(self, delete_id: int, substitution_id: int):
+class BaseDeleteTaskPerformerQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
+    def __init__(
+        self,
+        delete_id: int,
+        substitution_id: int,
+        ids: Optional[List[int]] = None,
+    ):
         self.delete_id = delete_id
         self.substitution_id = substitution_id
+        self.ids = ids
         self.params = {
             'delete_id': delete_id,
             'substitution_id': substitution_id,
@@ -229,10 +276,12 @@ class BaseDeleteTaskPerformerQuery(SqlQueryObject):
         pass
 
     def get_sql(self):
+        chunk_sql, chunk_params = self._get_chunk_condition('task_id')
         return f"""
         DELETE FROM processes_taskperformer
         WHERE
           {self.substitution_field} = %(substitution_id)s AND
+          {chunk_sql}
           task_id IN (
             SELECT task_id FROM processes_taskperformer
             WHERE {self.delete_field} = %(delete_id)s
@@ -241,7 +290,7 @@ class BaseDeleteTaskPerformerQuery(SqlQueryObject):
                 WHERE status != 'completed'
             )
           )
-        """, self.params
+        """, {**self.params, **chunk_params}
 
 
 class DeleteGroupFromTaskPerformerQuery(BaseDeleteTaskPerformerQuery):
@@ -264,10 +313,19 @@ class DeleteUserFromTaskPerformerQuery(BaseDeleteTaskPerformerQuery):
     substitution_field = "user_id"
 
 
-class BaseDeleteTemplateOwnerQuery(SqlQueryObject):
-    def __init__(self, delete_id: int, substitution_id: int):
+class BaseDeleteTemplateOwnerQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
+    def __init__(
+        self,
+        delete_id: int,
+        substitution_id: int,
+        ids: Optional[List[int]] = None,
+    ):
         self.delete_id = delete_id
         self.substitution_id = substitution_id
+        self.ids = ids
         self.params = {
             'delete_id': delete_id,
             'substitution_id': substitution_id,
@@ -282,15 +340,17 @@ class BaseDeleteTemplateOwnerQuery(SqlQueryObject):
         pass
 
     def get_sql(self):
+        chunk_sql, chunk_params = self._get_chunk_condition('template_id')
         return f"""
         DELETE FROM processes_templateowner
         WHERE
           {self.substitution_field} = %(substitution_id)s AND
+          {chunk_sql}
           template_id IN (
             SELECT template_id FROM processes_templateowner
             WHERE {self.delete_field} = %(delete_id)s
           )
-        """, self.params
+        """, {**self.params, **chunk_params}
 
 
 class DeleteGroupFromTemplateOwnerQuery(BaseDeleteTemplateOwnerQuery):
@@ -313,7 +373,10 @@ class DeleteUserFromTemplateOwnerQuery(BaseDeleteTemplateOwnerQuery):
     substitution_field = "user_id"
 
 
-class DeleteUserFromWorkflowMembersQuery(SqlQueryObject):
+class DeleteUserFromWorkflowMembersQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
 
     """ Deletes membership records for user_to_delete
         where user_to_substitution exists in workflow """
@@ -322,15 +385,19 @@ class DeleteUserFromWorkflowMembersQuery(SqlQueryObject):
         self,
         user_to_delete: int,
         user_to_substitution: int,
+        ids: Optional[List[int]] = None,
     ):
         self.user_to_delete = user_to_delete
         self.user_to_substitution = user_to_substitution
+        self.ids = ids
 
     def get_sql(self):
-        return """
+        chunk_sql, chunk_params = self._get_chunk_condition('workflow_id')
+        return f"""
         DELETE FROM processes_workflow_members
         WHERE
           user_id = %(user_to_delete)s AND
+          {chunk_sql}
           workflow_id IN (
             SELECT workflow_id FROM processes_workflow_members
             WHERE user_id = %(user_to_substitution)s
@@ -338,6 +405,7 @@ class DeleteUserFromWorkflowMembersQuery(SqlQueryObject):
         """, {
             'user_to_delete': self.user_to_delete,
             'user_to_substitution': self.user_to_substitution,
+            **chunk_params,
         }
 
 
@@ -369,7 +437,10 @@ class DeleteUserFromWorkflowOwnersQuery(SqlQueryObject):
         }
 
 
-class DeleteUserFromTemplateConditionsQuery(SqlQueryObject):
+class DeleteUserFromTemplateConditionsQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
 
     """ Deletes conditions in template for user_to_delete
         where user_to_substitution exists in conditions """
@@ -378,16 +449,20 @@ class DeleteUserFromTemplateConditionsQuery(SqlQueryObject):
         self,
         user_to_delete: str,
         user_to_substitution: str,
+        ids: Optional[List[int]] = None,
     ):
         self.user_to_delete = user_to_delete
         self.user_to_substitution = user_to_substitution
+        self.ids = ids
 
     def get_sql(self):
-        return """
+        chunk_sql, chunk_params = self._get_chunk_condition('rule_id')
+        return f"""
         DELETE FROM processes_predicatetemplate
         WHERE
           field_type = %(field_type)s AND
           value = %(user_to_delete)s AND
+          {chunk_sql}
           (rule_id, operator) IN (
             SELECT rule_id, operator
             FROM processes_predicatetemplate
@@ -399,10 +474,14 @@ class DeleteUserFromTemplateConditionsQuery(SqlQueryObject):
             'field_type': FieldType.USER,
             'user_to_delete': self.user_to_delete,
             'user_to_substitution': self.user_to_substitution,
+            **chunk_params,
         }
 
 
-class DeleteUserFromConditionsQuery(SqlQueryObject):
+class DeleteUserFromConditionsQuery(
+    ReassignChunkMixin,
+    SqlQueryObject
+):
 
     """ Deletes conditions in workflow for user_to_delete
         where user_to_substitution exists in conditions """
@@ -411,16 +490,20 @@ class DeleteUserFromConditionsQuery(SqlQueryObject):
         self,
         user_to_delete: str,
         user_to_substitution: str,
+        ids: Optional[List[int]] = None,
     ):
         self.user_to_delete = user_to_delete
         self.user_to_substitution = user_to_substitution
+        self.ids = ids
 
     def get_sql(self):
-        return """
+        chunk_sql, chunk_params = self._get_chunk_condition('rule_id')
+        return f"""
         DELETE FROM processes_predicate
         WHERE
           field_type = %(field_type)s AND
           value = %(user_to_delete)s AND
+          {chunk_sql}
           (rule_id, operator) IN (
             SELECT rule_id, operator
             FROM processes_predicate
@@ -432,6 +515,7 @@ class DeleteUserFromConditionsQuery(SqlQueryObject):
             'field_type': FieldType.USER,
             'user_to_delete': self.user_to_delete,
             'user_to_substitution': self.user_to_substitution,
+            **chunk_params,
         }
 
 
@@ -587,3 +671,58 @@ class FetchGroupTaskNotificationRecipientsQuery(SqlQueryObject):
         existent_performer.id IS NULL
 
         """, self.params
+
+
+class ReconcileUsersCountsQuery(SqlQueryObject):
+
+    """ Recounts the active users of all accounts and their tenants,
+        updates only the accounts with the changed counters
+        and returns their ids """
+
+    def get_sql(self):
+        return """
+          WITH active AS (
+            SELECT
+              account_id,
+              COUNT(id) AS count
+            FROM accounts_user
+            WHERE is_deleted IS FALSE
+              AND type = %(user_type)s
+              AND status = %(user_status)s
+            GROUP BY account_id
+          ),
+          tenants_active AS (
+            SELECT
+              ta.master_account_id AS account_id,
+              SUM(active.count)::int AS count
+            FROM accounts_account ta
+            JOIN active ON active.account_id = ta.id
+            WHERE ta.lease_level = %(lease_level)s
+            GROUP BY ta.master_account_id
+          ),
+          counts AS (
+            SELECT
+              aa.id,
+              COALESCE(active.count, 0) AS active_users,
+              COALESCE(tenants_active.count, 0) AS tenants_active_users
+            FROM accounts_account aa
+            LEFT JOIN active ON active.account_id = aa.id
+            LEFT JOIN tenants_active ON tenants_active.account_id = aa.id
+            WHERE aa.is_deleted IS FALSE
+          )
+          UPDATE accounts_account aa
+          SET
+            active_users = counts.active_users,
+            tenants_active_users = counts.tenants_active_users
+          FROM counts
+          WHERE aa.id = counts.id
+            AND (
+              aa.active_users != counts.active_users
+              OR aa.tenants_active_users != counts.tenants_active_users
+            )
+          RETURNING aa.id
+        """, {
+            'user_type': UserType.USER,
+            'user_status': UserStatus.ACTIVE,
+            'lease_level': LeaseLevel.TENANT,
+        }
@@ -1,11 +1,13 @@
-from typing import Optional
+from typing import List, Optional
 from django.conf import settings
-from django.db import transaction
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.db.models import F
 from django.contrib.auth import get_user_model
 from src.accounts.models import (
     Account,
     AccountSignupData,
 )
+from src.accounts.queries import ReconcileUsersCountsQuery
 from src.analytics.mixins import BaseIdentifyMixin
 from src.generics.mixins.services import ClsCacheMixin
 from src.generics.base.service import BaseModelService
@@ -16,6 +18,8 @@ from src.accounts.serializers.accounts import (
     AccountCacheSerializer
 )
 from src.analytics.tasks import identify_users
+from src.authentication.tokens import PneumaticToken
+from src.executor import RawSqlExecutor
 from src.accounts.enums import (
     LeaseLevel,
     UserStatus,
@@ -181,6 +185,47 @@ class AccountService(
             value=self.instance
         )
 
+    def change_users_counts(self, delta: int):
+
+        """ Applies the user status transition to the counters
+            by the atomic increment without the users recount.
+            The users of the tenant are counted in the master account too.
+            Counters are reconciled by the reconcile_users_counts task """
+
+        Account.objects.filter(id=self.instance.id).update(
+            active_users=F('active_users') + delta
+        )
+        self.instance.refresh_from_db(fields=['active_users'])
+        self._set_cache(
+            key=self.instance.id,
+            value=self.instance
+        )
+        self.group(user=self.user, account=self.instance)
+        if self.instance.is_tenant and self.instance.master_account_id:
+            Account.objects.filter(
+                id=self.instance.master_account_id
+            ).update(
+                tenants_active_users=F('tenants_active_users') + delta
+            )
+            self._delete_cache(key=self.instance.master_account_id)
+
+    @classmethod
+    def reconcile_users_counts(cls) -> List[int]:
+
+        """ Fixes the counters drifted from the users
+            and returns the ids of the fixed accounts """
+
+        query = ReconcileUsersCountsQuery()
+        account_ids = [
+            row['id'] for row in RawSqlExecutor.fetch(
+                *query.get_sql(),
+                db=DEFAULT_DB_ALIAS
+            )
+        ]
+        for account_id in account_ids:
+            cls._delete_cache(key=account_id)
+        return account_ids
+
     def _update_tenants(self):
         if self.instance.billing_plan == BillingPlanType.PREMIUM:
             self.instance.tenants.only_tenants().update(
@@ -262,6 +307,17 @@ class AccountService(
                     },
                 )
 
+    def _update_api_keys_data(self):
+
+        """ The flag is cached with the api keys data,
+            see AuthMiddleware """
+
+        for user in self.instance.users.filter(apikey__isnull=False):
+            PneumaticToken.update_api_keys_data(
+                user,
+                log_api_requests=self.instance.log_api_requests
+            )
+
     def partial_update(
         self,
         force_save=False,
@@ -278,6 +334,8 @@ class AccountService(
                 self._update_stripe_account(**update_kwargs)
             self._identify_users()
             self.group(user=self.user, account=self.instance)
+            if 'log_api_requests' in update_kwargs:
+                self._update_api_keys_data()
         return self.instance
 
     @classmethod
@@ -20,6 +20,9 @@ from src.processes.enums import (
     OwnerType,
     PerformerType
 )
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 from src.processes.tasks.update_workflow import (
     update_workflow_owners,
 )
@@ -247,5 +250,6 @@ class UserGroupService(BaseModelService):
             is_superuser=self.is_superuser,
         )
         self.instance.delete()
+        WorkflowDetailsCache.account_changed(self.user.account_id)
         if template_ids:
             update_workflow_owners.delay(template_ids)
@@ -1,8 +1,13 @@
-from typing import Optional
+import uuid
+from functools import partial
+from typing import List, Optional, Tuple
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import caches
 from django.db import transaction
 
+from src.accounts.enums import ReassignJobStatus
 from src.accounts.models import UserGroup
 from src.accounts.queries import (
     DeleteUserFromConditionsQuery,
@@ -46,6 +51,9 @@ from src.processes.models import (
 )
 from src.processes.queries import UpdateWorkflowOwnersQuery
 from src.processes.tasks.tasks import complete_tasks
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 
 UserModel = get_user_model()
 
@@ -53,9 +61,27 @@ UserModel = get_user_model()
 class ReassignService:
     """
     Reassigns entities from one performer (user or group) to another
-    performer (user or group) within the same account
+    performer (user or group) within the same account.
+
+    Each step is processed by the chunks of REASSIGN_CHUNK_SIZE keys
+    ordered by id, every chunk in the own short transaction.
+    The chunks are selected by the old performer, so the repeated chunk
+    does nothing and the interrupted job is continued from the last chunk
     """
 
+    STEPS = (
+        'raw_performer_templates',
+        'raw_performers',
+        'performers',
+        'template_owners',
+        'workflow_owners',
+        'workflow_members',
+        'template_conditions',
+        'conditions',
+    )
+    cache = caches['default']
+    key_prefix = 'reassign_job'
+
     def __init__(
         self,
         old_user: Optional[UserModel] = None,
@@ -89,17 +115,56 @@ class ReassignService:
         else:
             self.account = old_group.account
 
-    def _reassign_in_raw_performer_templates(self):
+    @classmethod
+    def from_ids(
+        cls,
+        old_user_id: Optional[int],
+        new_user_id: Optional[int],
+        old_group_id: Optional[int],
+        new_group_id: Optional[int],
+        is_superuser: bool,
+        auth_type: AuthTokenType.LITERALS,
+    ) -> 'ReassignService':
+        users = UserModel.objects.in_bulk(
+            [elem for elem in (old_user_id, new_user_id) if elem]
+        )
+        groups = UserGroup.objects.in_bulk(
+            [elem for elem in (old_group_id, new_group_id) if elem]
+        )
+        return cls(
+            old_user=users.get(old_user_id),
+            new_user=users.get(new_user_id),
+            old_group=groups.get(old_group_id),
+            new_group=groups.get(new_group_id),
+            is_superuser=is_superuser,
+            auth_type=auth_type,
+        )
+
+    @staticmethod
+    def _get_chunk_filter(lookup: str, ids: Optional[List[int]]) -> dict:
+        return {} if ids is None else {lookup: ids}
+
+    def _get_old_performer_filter(self, prefix: str = '') -> dict:
+        if self.old_group:
+            return {f'{prefix}group_id': self.old_group.id}
+        return {f'{prefix}user_id': self.old_user.id}
+
+    def _reassign_in_raw_performer_templates(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_group:
             if self.new_group:
                 delete_query = DeleteGroupFromRawPerformerTemplateQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformerTemplate.objects.filter(
                     group_id=self.old_group.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     group_id=self.new_group.id,
                 )
@@ -107,11 +172,13 @@ class ReassignService:
                 delete_query = DeleteGroupUserFromRawPerformerTemplateQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformerTemplate.objects.filter(
                     group_id=self.old_group.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     type=PerformerType.USER,
                     user_id=self.new_user.id,
@@ -122,11 +189,13 @@ class ReassignService:
                 delete_query = DeleteUserGroupFromRawPerformerTemplateQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformerTemplate.objects.filter(
                     user_id=self.old_user.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     type=PerformerType.GROUP,
                     group_id=self.new_group.id,
@@ -136,24 +205,31 @@ class ReassignService:
                 delete_query = DeleteUserFromRawPerformerTemplateQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformerTemplate.objects.filter(
                     user_id=self.old_user.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(user_id=self.new_user.id)
 
-    def _reassign_in_raw_performers(self):
+    def _reassign_in_raw_performers(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_group:
             if self.new_group:
                 delete_query = DeleteGroupFromRawPerformerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformer.objects.filter(
                     group_id=self.old_group.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     group_id=self.new_group.id,
                 )
@@ -161,11 +237,13 @@ class ReassignService:
                 delete_query = DeleteGroupUserFromRawPerformerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformer.objects.filter(
                     group_id=self.old_group.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     type=PerformerType.USER,
                     user_id=self.new_user.id,
@@ -176,11 +254,13 @@ class ReassignService:
                 delete_query = DeleteUserGroupFromRawPerformerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformer.objects.filter(
                     user_id=self.old_user.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(
                     type=PerformerType.GROUP,
                     group_id=self.new_group.id,
@@ -190,24 +270,31 @@ class ReassignService:
                 delete_query = DeleteUserFromRawPerformerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 RawPerformer.objects.filter(
                     user_id=self.old_user.id,
-                    account=self.account
+                    account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).update(user_id=self.new_user.id)
 
-    def _reassign_in_performers(self):
+    def _reassign_in_performers(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_group:
             if self.new_group:
                 delete_query = DeleteGroupFromTaskPerformerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TaskPerformer.objects.filter(
                     group_id=self.old_group.id,
                     task__account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).exclude(
                     task__status=TaskStatus.COMPLETED,
                 ).update(
@@ -217,11 +304,13 @@ class ReassignService:
                 delete_query = DeleteGroupUserFromTaskPerformerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TaskPerformer.objects.filter(
                     group_id=self.old_group.id,
                     task__account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).exclude(
                     task__status=TaskStatus.COMPLETED,
                 ).update(
@@ -234,11 +323,13 @@ class ReassignService:
                 delete_query = DeleteUserGroupFromTaskPerformerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TaskPerformer.objects.filter(
                     user_id=self.old_user.id,
                     task__account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).exclude(
                     task__status=TaskStatus.COMPLETED,
                 ).update(
@@ -250,26 +341,33 @@ class ReassignService:
                 delete_query = DeleteUserFromTaskPerformerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TaskPerformer.objects.filter(
                     user_id=self.old_user.id,
                     task__account=self.account,
+                    **self._get_chunk_filter('task_id__in', ids)
                 ).exclude(
                     task__status=TaskStatus.COMPLETED,
                 ).update(user_id=self.new_user.id)
 
-    def _reassign_in_template_owners(self):
+    def _reassign_in_template_owners(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_group:
             if self.new_group:
                 delete_query = DeleteGroupFromTemplateOwnerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TemplateOwner.objects.filter(
                     group_id=self.old_group.id,
                     template__account=self.account,
+                    **self._get_chunk_filter('template_id__in', ids)
                 ).update(
                     group_id=self.new_group.id
                 )
@@ -277,11 +375,13 @@ class ReassignService:
                 delete_query = DeleteGroupUserFromTemplateOwnerQuery(
                     delete_id=self.old_group.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TemplateOwner.objects.filter(
                     group_id=self.old_group.id,
                     template__account=self.account,
+                    **self._get_chunk_filter('template_id__in', ids)
                 ).update(
                     type=PerformerType.USER,
                     user_id=self.new_user.id,
@@ -292,11 +392,13 @@ class ReassignService:
                 delete_query = DeleteUserGroupFromTemplateOwnerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_group.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TemplateOwner.objects.filter(
                     user=self.old_user,
                     template__account=self.account,
+                    **self._get_chunk_filter('template_id__in', ids)
                 ).update(
                     type=PerformerType.GROUP,
                     group_id=self.new_group.id,
@@ -306,24 +408,31 @@ class ReassignService:
                 delete_query = DeleteUserFromTemplateOwnerQuery(
                     delete_id=self.old_user.id,
                     substitution_id=self.new_user.id,
+                    **self._get_chunk_filter('ids', ids),
                 )
                 RawSqlExecutor.execute(*delete_query.get_sql())
                 TemplateOwner.objects.filter(
                     user=self.old_user,
                     template__account=self.account,
+                    **self._get_chunk_filter('template_id__in', ids)
                 ).update(user=self.new_user)
 
-    def _reassign_in_workflow_members(self):
+    def _reassign_in_workflow_members(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_user and self.new_user:
             delete_query = DeleteUserFromWorkflowMembersQuery(
                 user_to_delete=self.old_user.id,
                 user_to_substitution=self.new_user.id,
+                **self._get_chunk_filter('ids', ids),
             )
             RawSqlExecutor.execute(*delete_query.get_sql())
 
             Workflow.members.through.objects.filter(
                 user_id=self.old_user.id,
                 workflow__account=self.account,
+                **self._get_chunk_filter('workflow_id__in', ids),
             ).update(user_id=self.new_user.id)
 
     def _affected_template_ids(self):
@@ -363,49 +472,287 @@ class ReassignService:
                 )
                 RawSqlExecutor.execute(*query.insert_sql())
 
-    def _reassign_in_template_conditions(self):
+    def _reassign_in_template_conditions(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_user and self.new_user:
             delete_query = DeleteUserFromTemplateConditionsQuery(
                 user_to_delete=str(self.old_user.id),
                 user_to_substitution=str(self.new_user.id),
+                **self._get_chunk_filter('ids', ids),
             )
             RawSqlExecutor.execute(*delete_query.get_sql())
             PredicateTemplate.objects.filter(
                 field_type=FieldType.USER,
                 value=self.old_user.id,
+                **self._get_chunk_filter('rule_id__in', ids),
             ).update(value=self.new_user.id)
 
-    def _reassign_in_conditions(self):
+    def _reassign_in_conditions(
+        self,
+        ids: Optional[List[int]] = None,
+    ):
         if self.old_user and self.new_user:
             delete_query = DeleteUserFromConditionsQuery(
                 user_to_delete=str(self.old_user.id),
                 user_to_substitution=str(self.new_user.id),
+                **self._get_chunk_filter('ids', ids),
             )
             RawSqlExecutor.execute(*delete_query.get_sql())
             Predicate.objects.filter(
                 field_type=FieldType.USER,
                 value=self.old_user.id,
+                **self._get_chunk_filter('rule_id__in', ids),
             ).update(value=self.new_user.id)
 
-    def reassign_everywhere(self):
-        with transaction.atomic():
-            self._reassign_in_raw_performer_templates()
-            self._reassign_in_raw_performers()
-            self._reassign_in_performers()
-            affected_template_ids = self._affected_template_ids()
-            self._reassign_in_template_owners()
-            self._reassign_in_workflow_owners(affected_template_ids)
-            self._reassign_in_workflow_members()
-            self._reassign_in_template_conditions()
-            self._reassign_in_conditions()
-            if self.new_user:
-                user_id = self.new_user.id
-            elif self.new_group and self.new_group.users.exists():
-                user_id = self.new_group.users.first().id
+    def _get_chunk_ids(
+        self,
+        step: str,
+        after_id: int,
+        template_ids: List[int],
+    ) -> List[int]:
+
+        """ Returns the next ordered keys of the step after the given key """
+
+        size = settings.REASSIGN_CHUNK_SIZE
+        if step == 'workflow_owners':
+            return [elem for elem in template_ids if elem > after_id][:size]
+        key = 'task_id'
+        if step == 'raw_performer_templates':
+            qst = RawPerformerTemplate.objects.filter(
+                account=self.account,
+                **self._get_old_performer_filter(),
+            )
+        elif step == 'raw_performers':
+            qst = RawPerformer.objects.filter(
+                account=self.account,
+                **self._get_old_performer_filter(),
+            )
+        elif step == 'performers':
+            qst = TaskPerformer.objects.filter(
+                task__account=self.account,
+                **self._get_old_performer_filter(),
+            ).exclude(task__status=TaskStatus.COMPLETED)
+        elif step == 'template_owners':
+            key = 'template_id'
+            qst = TemplateOwner.objects.filter(
+                template__account=self.account,
+                **self._get_old_performer_filter(),
+            )
+        elif not (self.old_user and self.new_user):
+            return []
+        elif step == 'workflow_members':
+            key = 'workflow_id'
+            qst = Workflow.members.through.objects.filter(
+                user_id=self.old_user.id,
+                workflow__account=self.account,
+            )
+        else:
+            key = 'rule_id'
+            if step == 'template_conditions':
+                qst = PredicateTemplate.objects.all()
             else:
-                user_id = self.account.get_owner().id
-            complete_tasks.delay(
-                user_id=user_id,
-                is_superuser=self.is_superuser,
-                auth_type=self.auth_type
+                qst = Predicate.objects.all()
+            qst = qst.filter(
+                field_type=FieldType.USER,
+                value=self.old_user.id,
+            )
+        return list(
+            qst.filter(**{f'{key}__gt': after_id})
+            .order_by(key)
+            .values_list(key, flat=True)
+            .distinct()[:size]
+        )
+
+    def _get_complete_tasks_user_id(self) -> int:
+        if self.new_user:
+            return self.new_user.id
+        elif self.new_group and self.new_group.users.exists():
+            return self.new_group.users.first().id
+        return self.account.get_owner().id
+
+    def _complete_tasks(self, task_ids: List[int]):
+        complete_tasks.delay(
+            user_id=self._get_complete_tasks_user_id(),
+            is_superuser=self.is_superuser,
+            auth_type=self.auth_type,
+            task_ids=task_ids,
+        )
+
+    def reassign_chunk(
+        self,
+        step: int,
+        after_id: int,
+        template_ids: List[int],
+    ) -> Optional[Tuple[int, int]]:
+
+        """ Reassigns the chunk of the step after the given key
+            and returns the position of the next chunk
+            or None if all steps are completed """
+
+        name = self.STEPS[step]
+        ids = self._get_chunk_ids(name, after_id, template_ids)
+        if ids:
+            with transaction.atomic():
+                getattr(self, f'_reassign_in_{name}')(ids)
+                WorkflowDetailsCache.account_changed(self.account.id)
+                if name == 'performers':
+                    transaction.on_commit(partial(self._complete_tasks, ids))
+        if len(ids) == settings.REASSIGN_CHUNK_SIZE:
+            return step, ids[-1]
+        elif step + 1 < len(self.STEPS):
+            return step + 1, 0
+        return None
+
+    def reassign_everywhere(self):
+        template_ids = sorted(self._affected_template_ids())
+        position = (0, 0)
+        while position is not None:
+            position = self.reassign_chunk(*position, template_ids)
+
+    @classmethod
+    def _get_job_cache_key(cls, account_id: int, job_id: str) -> str:
+        return f'{cls.key_prefix}:{account_id}:{job_id}'
+
+    def _save_job(self, job: dict):
+        self.cache.set(
+            self._get_job_cache_key(self.account.id, job['id']),
+            job,
+            settings.REASSIGN_JOB_TIMEOUT
+        )
+
+    def _get_performers_ids(self) -> dict:
+        return {
+            'old_user_id': self.old_user.id if self.old_user else None,
+            'new_user_id': self.new_user.id if self.new_user else None,
+            'old_group_id': self.old_group.id if self.old_group else None,
+            'new_group_id': self.new_group.id if self.new_group else None,
+        }
+
+    def _send_chunk_task(self, **kwargs):
+        from src.accounts.tasks import reassign_chunk
+        reassign_chunk.delay(
+            **self._get_performers_ids(),
+            is_superuser=self.is_superuser,
+            auth_type=self.auth_type,
+            **kwargs
+        )
+
+    def start_job(self) -> dict:
+
+        """ Saves the job progress and queues the first chunk
+            after the commit. The progress keeps the position
+            of the next chunk and the performers to resume the job """
+
+        template_ids = sorted(self._affected_template_ids())
+        job = {
+            'id': uuid.uuid4().hex,
+            'status': ReassignJobStatus.RUNNING,
+            'step': self.STEPS[0],
+            'completed_steps': 0,
+            'steps_count': len(self.STEPS),
+            'after_id': 0,
+            'template_ids': template_ids,
+            **self._get_performers_ids(),
+        }
+        self._save_job(job)
+        transaction.on_commit(
+            partial(
+                self._send_chunk_task,
+                job_id=job['id'],
+                step=0,
+                after_id=0,
+                template_ids=template_ids,
+            )
+        )
+        return job
+
+    def run_job_chunk(
+        self,
+        job_id: str,
+        step: int,
+        after_id: int,
+        template_ids: List[int],
+    ):
+
+        """ Reassigns the chunk, saves the progress
+            and queues the next chunk. The failed chunk is rolled back,
+            the job is saved as failed with the position of the chunk """
+
+        job = self.get_progress(self.account.id, job_id) or {
+            'id': job_id,
+            'steps_count': len(self.STEPS),
+            **self._get_performers_ids(),
+        }
+        job['template_ids'] = template_ids
+        try:
+            position = self.reassign_chunk(step, after_id, template_ids)
+        except Exception:
+            job['status'] = ReassignJobStatus.FAILED
+            job['step'] = self.STEPS[step]
+            job['completed_steps'] = step
+            job['after_id'] = after_id
+            self._save_job(job)
+            raise
+        if position is None:
+            job['status'] = ReassignJobStatus.COMPLETED
+            job['step'] = None
+            job['completed_steps'] = len(self.STEPS)
+            job['after_id'] = 0
+        else:
+            job['status'] = ReassignJobStatus.RUNNING
+            job['step'] = self.STEPS[position[0]]
+            job['completed_steps'] = position[0]
+            job['after_id'] = position[1]
+        self._save_job(job)
+        if position is not None:
+            transaction.on_commit(
+                partial(
+                    self._send_chunk_task,
+                    job_id=job_id,
+                    step=position[0],
+                    after_id=position[1],
+                    template_ids=template_ids,
+                )
+            )
+
+    @classmethod
+    def get_progress(cls, account_id: int, job_id: str) -> Optional[dict]:
+        return cls.cache.get(cls._get_job_cache_key(account_id, job_id))
+
+    @classmethod
+    def resume_job(
+        cls,
+        account_id: int,
+        job_id: str,
+        is_superuser: bool = False,
+        auth_type: AuthTokenType.LITERALS = AuthTokenType.USER,
+    ) -> Optional[dict]:
+
+        """ Queues the failed job again from the saved position,
+            the job in the other statuses is returned as is """
+
+        job = cls.get_progress(account_id, job_id)
+        if job is None or job['status'] != ReassignJobStatus.FAILED:
+            return job
+        service = cls.from_ids(
+            old_user_id=job['old_user_id'],
+            new_user_id=job['new_user_id'],
+            old_group_id=job['old_group_id'],
+            new_group_id=job['new_group_id'],
+            is_superuser=is_superuser,
+            auth_type=auth_type,
+        )
+        job['status'] = ReassignJobStatus.RUNNING
+        service._save_job(job)
+        transaction.on_commit(
+            partial(
+                service._send_chunk_task,
+                job_id=job_id,
+                step=job['completed_steps'],
+                after_id=job['after_id'],
+                template_ids=job['template_ids'],
             )
+        )
+        return job
@@ -214,6 +214,7 @@ class UserService(
                 user_id=user.id,
             )
             user.incoming_invites.delete()
+            was_active = user.status == UserStatus.ACTIVE
             user.status = UserStatus.INACTIVE
             user.is_active = False  # need for django admin
             user.save(update_fields=('status', 'is_active'))
@@ -224,12 +225,13 @@ class UserService(
             ).update(
                 status=UserStatus.INVITED
             )
-            from src.accounts.services import AccountService
-            service = AccountService(
-                instance=user.account,
-                user=user
-            )
-            service.update_users_counts()
+            if was_active:
+                from src.accounts.services import AccountService
+                service = AccountService(
+                    instance=user.account,
+                    user=user
+                )
+                service.change_users_counts(-1)
             cls.identify(user)
 
     @classmethod
@@ -392,6 +392,7 @@ class UserInviteService(
             user.first_name = first_name
             user.last_name = last_name
             user.is_active = True  # need for django admin
+            was_active = user.status == UserStatus.ACTIVE
             user.status = UserStatus.ACTIVE
             if timezone:
                 user.timezone = timezone
@@ -407,11 +408,12 @@ class UserInviteService(
             service = SystemWorkflowService(user=invite.invited_user)
             service.create_onboarding_workflows()
             service.create_activated_workflows()
-            account_service = AccountService(
-                instance=user.account,
-                user=user
-            )
-            account_service.update_users_counts()
+            if not was_active:
+                account_service = AccountService(
+                    instance=user.account,
+                    user=user
+                )
+                account_service.change_users_counts(1)
         if (
             settings.PROJECT_CONF['BILLING']
             and user.account.billing_sync
@@ -151,6 +151,7 @@ class UserTransferService(
 
     def _activate_user(self):
 
+        was_active = self.user.status == UserStatus.ACTIVE
         self.user.is_active = True  # need for django admin
         self.user.first_name = self.prev_user.first_name
         self.user.last_name = self.prev_user.last_name
@@ -158,11 +159,12 @@ class UserTransferService(
         self.user.save(update_fields=[
             'status', 'is_active', 'first_name', 'last_name'
         ])
-        service = AccountService(
-            instance=self.user.account,
-            user=self.user
-        )
-        service.update_users_counts()
+        if not was_active:
+            service = AccountService(
+                instance=self.user.account,
+                user=self.user
+            )
+            service.change_users_counts(1)
 
     def accept_transfer(
         self,
@@ -1,34 +1,81 @@
+from typing import List, Optional
 from celery import shared_task
 from django.db import transaction
-from src.accounts.models import (
-    SystemMessage,
-    Notification,
-)
+from src.accounts.models import SystemMessage
 from src.accounts.queries import CreateSystemNotificationsQuery
+from src.accounts.services.account import AccountService
+from src.accounts.services.reassign import ReassignService
+from src.authentication.enums import AuthTokenType
+from src.celery import periodic_lock
 from src.executor import RawSqlExecutor
-from src.notifications.tasks import _send_notification
-from src.notifications.enums import NotificationMethod
+from src.notifications.services.websockets import WebSocketService
+from src.utils.logging import capture_sentry_message
 
 
 @shared_task
 def send_system_notification():
+
+    """ The notifications of all users are inserted by one query,
+        then the message is broadcast once to all connected clients """
+
     for system_message in SystemMessage.objects.new():
         query = CreateSystemNotificationsQuery(system_message)
         with transaction.atomic():
             RawSqlExecutor.execute(*query.get_sql())
             system_message.is_delivery_completed = True
             system_message.save()
-        notifications = Notification.objects.filter(
-            system_message=system_message
-        ).select_related('user', 'account').exclude_read()
-        for notification in notifications:
-            _send_notification(
-                logging=notification.account.log_api_requests,
-                logo_lg=notification.account.logo_lg,
-                account_id=notification.account_id,
-                user_id=notification.user_id,
-                user_email=notification.user.email,
-                sync=True,
-                notification=notification,
-                method_name=NotificationMethod.system,
+        WebSocketService(account_id=None).send_system_broadcast(
+            system_message_id=system_message.id,
+        )
+
+
+@shared_task(ignore_result=True, acks_late=True)
+def reassign_chunk(
+    job_id: str,
+    step: int,
+    after_id: int,
+    template_ids: List[int],
+    old_user_id: Optional[int],
+    new_user_id: Optional[int],
+    old_group_id: Optional[int],
+    new_group_id: Optional[int],
+    is_superuser: bool,
+    auth_type: AuthTokenType.LITERALS,
+):
+
+    """ Reassigns one chunk of the reassignment job,
+        the next chunk is queued by the service.
+        The failed job is resumed from the failed chunk """
+
+    service = ReassignService.from_ids(
+        old_user_id=old_user_id,
+        new_user_id=new_user_id,
+        old_group_id=old_group_id,
+        new_group_id=new_group_id,
+        is_superuser=is_superuser,
+        auth_type=auth_type,
+    )
+    service.run_job_chunk(
+        job_id=job_id,
+        step=step,
+        after_id=after_id,
+        template_ids=template_ids,
+    )
+
+
+@shared_task(ignore_result=True)
+def reconcile_users_counts():
+
+    """ The active users counters are changed by the user status
+        transitions, the recount fixes the missed transitions.
+        Should be run periodically """
+
+    with periodic_lock('reconcile_users_counts') as acquired:
+        if not acquired:
+            return
+        account_ids = AccountService.reconcile_users_counts()
+        if account_ids:
+            capture_sentry_message(
+                message='Active users counters are reconciled',
+                data={'account_ids': account_ids}
             )
@@ -24,6 +24,8 @@ from src.processes.tests.fixtures import (
     create_invited_user,
     create_test_account,
 )
+from src.accounts.models import APIKey
+from src.authentication.tokens import PneumaticToken
 from src.payment.stripe.service import StripeService
 from src.payment.stripe.exceptions import StripeServiceException
 
@@ -787,6 +789,130 @@ def test_update_users_counts__master__ok(mocker):
     assert account.tenants_active_users == 2
 
 
+def test_change_users_counts__standard__ok(mocker):
+
+    # arrange
+    account = create_test_account(lease_level=LeaseLevel.STANDARD)
+    user = create_test_user(account=account)
+    account.active_users = 3
+    account.save(update_fields=['active_users'])
+    set_cache_mock = mocker.patch(
+        'src.accounts.services.account'
+        '.AccountService._set_cache'
+    )
+    partial_update_mock = mocker.patch(
+        'src.accounts.services.account'
+        '.AccountService.partial_update'
+    )
+    service = AccountService(
+        instance=account,
+        user=user
+    )
+
+    # act
+    service.change_users_counts(-1)
+
+    # assert
+    account.refresh_from_db()
+    assert account.active_users == 2
+    assert service.instance.active_users == 2
+    set_cache_mock.assert_called_once_with(
+        key=account.id,
+        value=account
+    )
+    partial_update_mock.assert_not_called()
+
+
+def test_change_users_counts__tenant__increase_master(mocker):
+
+    # arrange
+    account = create_test_account(
+        plan=BillingPlanType.UNLIMITED
+    )
+    create_test_user(account=account)
+    account.tenants_active_users = 2
+    account.save(update_fields=['tenants_active_users'])
+    tenant_account = create_test_account(
+        lease_level=LeaseLevel.TENANT,
+        master_account=account
+    )
+    tenant_account_owner = create_test_user(
+        account=tenant_account,
+        email='tenant_owner@test.test'
+    )
+    mocker.patch(
+        'src.accounts.services.account'
+        '.AccountService._set_cache'
+    )
+    delete_cache_mock = mocker.patch(
+        'src.accounts.services.account'
+        '.AccountService._delete_cache'
+    )
+    service = AccountService(
+        instance=tenant_account,
+        user=tenant_account_owner
+    )
+
+    # act
+    service.change_users_counts(1)
+
+    # assert
+    tenant_account.refresh_from_db()
+    assert tenant_account.active_users == 2
+    account.refresh_from_db()
+    assert account.active_users == 1
+    assert account.tenants_active_users == 3
+    delete_cache_mock.assert_called_once_with(key=account.id)
+
+
+def test_reconcile_users_counts__drifted__fix(mocker):
+
+    # arrange
+    account = create_test_account(
+        plan=BillingPlanType.UNLIMITED
+    )
+    account_owner = create_test_user(account=account)
+    create_invited_user(account_owner)
+    create_test_guest(account=account)
+    tenant_account = create_test_account(
+        lease_level=LeaseLevel.TENANT,
+        master_account=account
+    )
+    create_test_user(
+        account=tenant_account,
+        email='tenant_owner@test.test'
+    )
+    create_test_user(
+        account=tenant_account,
+        email='inactive@test.test',
+        status=UserStatus.INACTIVE
+    )
+    tenant_account.active_users = 5
+    tenant_account.save(update_fields=['active_users'])
+    another_account = create_test_account()
+    create_test_user(
+        account=another_account,
+        email='another@test.test'
+    )
+    delete_cache_mock = mocker.patch(
+        'src.accounts.services.account'
+        '.AccountService._delete_cache'
+    )
+
+    # act
+    result = AccountService.reconcile_users_counts()
+
+    # assert
+    assert set(result) == {account.id, tenant_account.id}
+    account.refresh_from_db()
+    assert account.active_users == 1
+    assert account.tenants_active_users == 1
+    tenant_account.refresh_from_db()
+    assert tenant_account.active_users == 1
+    assert tenant_account.tenants_active_users == 0
+    assert delete_cache_mock.call_count == 2
+
+
 def test_partial_update__ok(mocker):
 
     # arrange
@@ -846,6 +972,37 @@ def test_partial_update__ok(mocker):
     group_mock.assert_called_once_with(user=user, account=account)
 
 
+def test_partial_update__log_api_requests__update_api_keys_data(mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=False)
+    user = create_test_user(account=account)
+    token = PneumaticToken.create(user=user, for_api_key=True)
+    APIKey.objects.create(
+        user=user,
+        account=account,
+        name='Token for API',
+        key=token,
+    )
+    mocker.patch(
+        'src.accounts.services.account.'
+        'AccountService._identify_users'
+    )
+    service = AccountService(
+        instance=account,
+        user=user,
+    )
+
+    # act
+    service.partial_update(
+        log_api_requests=True,
+        force_save=True
+    )
+
+    # assert
+    assert PneumaticToken.data(token)['log_api_requests'] is True
+
+
 def test_partial_update__disabled_billing_sync__ok(mocker):
 
     # arrange
@@ -1834,9 +1834,9 @@ def test__accept__all_fields__ok(identify_mock, group_mock, mocker):
         attribute='__init__',
         return_value=None
     )
-    update_users_counts_mock = mocker.patch(
+    change_users_counts_mock = mocker.patch(
         'src.accounts.services.user_invite.AccountService.'
-        'update_users_counts'
+        'change_users_counts'
     )
     increase_plan_users_mock = mocker.patch(
         'src.accounts.services.user_invite.'
@@ -1890,7 +1890,7 @@ def test__accept__all_fields__ok(identify_mock, group_mock, mocker):
         instance=account,
         user=invited_user
     )
-    update_users_counts_mock.assert_called_once()
+    change_users_counts_mock.assert_called_once_with(1)
     increase_plan_users_mock.assert_not_called()
     users_joined_mock.assert_called_once_with(invited_user)
     identify_mock.assert_called_once_with(invited_user)
@@ -1949,9 +1949,9 @@ def test__accept__only_required_fields__ok(identify_mock, group_mock, mocker):
         attribute='__init__',
         return_value=None
     )
-    update_users_counts_mock = mocker.patch(
+    change_users_counts_mock = mocker.patch(
         'src.accounts.services.user_invite.AccountService.'
-        'update_users_counts'
+        'change_users_counts'
     )
     increase_plan_users_mock = mocker.patch(
         'src.accounts.services.user_invite.'
@@ -2000,7 +2000,7 @@ def test__accept__only_required_fields__ok(identify_mock, group_mock, mocker):
         instance=account,
         user=invited_user
     )
-    update_users_counts_mock.assert_called_once()
+    change_users_counts_mock.assert_called_once_with(1)
     increase_plan_users_mock.assert_not_called()
     users_joined_mock.assert_called_once_with(invited_user)
     identify_mock.assert_called_once_with(invited_user)
@@ -1,4 +1,5 @@
 import pytest
+from django.db import DatabaseError
 from src.processes.tests.fixtures import (
     create_test_template,
     create_test_workflow,
@@ -18,6 +19,7 @@ from src.processes.models import (
     PredicateTemplate,
     Workflow
 )
+from src.accounts.enums import ReassignJobStatus
 
 
 pytestmark = pytest.mark.django_db
@@ -135,6 +137,15 @@ class TestReassignService:
             'src.accounts.services.reassign.ReassignService.'
             '_reassign_in_conditions'
         )
+        get_chunk_ids_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_get_chunk_ids',
+            return_value=[3, 4]
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
         complete_tasks_mock = mocker.patch(
             'src.processes.tasks.tasks.'
             'complete_tasks.delay'
@@ -148,19 +159,24 @@ class TestReassignService:
         service.reassign_everywhere()
 
         # assert
-        reassign_in_raw_performer_templates_mock.assert_called_once()
-        reassign_in_template_owners_mock.assert_called_once()
-        reassign_in_raw_performers_mock.assert_called_once()
-        reassign_in_performers_mock.assert_called_once()
+        assert get_chunk_ids_mock.call_count == len(ReassignService.STEPS)
+        get_chunk_ids_mock.assert_any_call('workflow_owners', 0, [1, 2])
+        reassign_in_raw_performer_templates_mock.assert_called_once_with(
+            [3, 4]
+        )
+        reassign_in_template_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_raw_performers_mock.assert_called_once_with([3, 4])
+        reassign_in_performers_mock.assert_called_once_with([3, 4])
         affected_template_ids_mock.assert_called_once()
-        reassign_in_workflow_members_mock.assert_called_once()
-        reassign_in_workflow_owners_mock.assert_called_once_with([1, 2])
-        reassign_in_template_conditions_mock.assert_called_once()
-        reassign_in_conditions_mock.assert_called_once()
+        reassign_in_workflow_members_mock.assert_called_once_with([3, 4])
+        reassign_in_workflow_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_template_conditions_mock.assert_called_once_with([3, 4])
+        reassign_in_conditions_mock.assert_called_once_with([3, 4])
         complete_tasks_mock.assert_called_once_with(
             user_id=new_user.id,
             is_superuser=False,
-            auth_type='User'
+            auth_type='User',
+            task_ids=[3, 4]
         )
 
     def test_reassign_everywhere__call_services_new_group__ok(self, mocker):
@@ -216,6 +232,15 @@ class TestReassignService:
             'src.accounts.services.reassign.ReassignService.'
             '_reassign_in_conditions'
         )
+        get_chunk_ids_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_get_chunk_ids',
+            return_value=[3, 4]
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
         complete_tasks_mock = mocker.patch(
             'src.processes.tasks.tasks.'
             'complete_tasks.delay'
@@ -229,19 +254,24 @@ class TestReassignService:
         service.reassign_everywhere()
 
         # assert
-        reassign_in_raw_performer_templates_mock.assert_called_once()
-        reassign_in_template_owners_mock.assert_called_once()
-        reassign_in_raw_performers_mock.assert_called_once()
-        reassign_in_performers_mock.assert_called_once()
+        assert get_chunk_ids_mock.call_count == len(ReassignService.STEPS)
+        get_chunk_ids_mock.assert_any_call('workflow_owners', 0, [1, 2])
+        reassign_in_raw_performer_templates_mock.assert_called_once_with(
+            [3, 4]
+        )
+        reassign_in_template_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_raw_performers_mock.assert_called_once_with([3, 4])
+        reassign_in_performers_mock.assert_called_once_with([3, 4])
         affected_template_ids_mock.assert_called_once()
-        reassign_in_workflow_members_mock.assert_called_once()
-        reassign_in_workflow_owners_mock.assert_called_once_with([1, 2])
-        reassign_in_template_conditions_mock.assert_called_once()
-        reassign_in_conditions_mock.assert_called_once()
+        reassign_in_workflow_members_mock.assert_called_once_with([3, 4])
+        reassign_in_workflow_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_template_conditions_mock.assert_called_once_with([3, 4])
+        reassign_in_conditions_mock.assert_called_once_with([3, 4])
         complete_tasks_mock.assert_called_once_with(
             user_id=new_user.id,
             is_superuser=False,
-            auth_type='User'
+            auth_type='User',
+            task_ids=[3, 4]
         )
 
     def test_reassign_everywhere__call_services_new_group_users_null__ok(
@@ -299,6 +329,15 @@ class TestReassignService:
             'src.accounts.services.reassign.ReassignService.'
             '_reassign_in_conditions'
         )
+        get_chunk_ids_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_get_chunk_ids',
+            return_value=[3, 4]
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
         complete_tasks_mock = mocker.patch(
             'src.processes.tasks.tasks.'
             'complete_tasks.delay'
@@ -312,19 +351,24 @@ class TestReassignService:
         service.reassign_everywhere()
 
         # assert
-        reassign_in_raw_performer_templates_mock.assert_called_once()
-        reassign_in_template_owners_mock.assert_called_once()
-        reassign_in_raw_performers_mock.assert_called_once()
-        reassign_in_performers_mock.assert_called_once()
+        assert get_chunk_ids_mock.call_count == len(ReassignService.STEPS)
+        get_chunk_ids_mock.assert_any_call('workflow_owners', 0, [1, 2])
+        reassign_in_raw_performer_templates_mock.assert_called_once_with(
+            [3, 4]
+        )
+        reassign_in_template_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_raw_performers_mock.assert_called_once_with([3, 4])
+        reassign_in_performers_mock.assert_called_once_with([3, 4])
         affected_template_ids_mock.assert_called_once()
-        reassign_in_workflow_members_mock.assert_called_once()
-        reassign_in_workflow_owners_mock.assert_called_once_with([1, 2])
-        reassign_in_template_conditions_mock.assert_called_once()
-        reassign_in_conditions_mock.assert_called_once()
+        reassign_in_workflow_members_mock.assert_called_once_with([3, 4])
+        reassign_in_workflow_owners_mock.assert_called_once_with([3, 4])
+        reassign_in_template_conditions_mock.assert_called_once_with([3, 4])
+        reassign_in_conditions_mock.assert_called_once_with([3, 4])
         complete_tasks_mock.assert_called_once_with(
             user_id=new_user.id,
             is_superuser=False,
-            auth_type='User'
+            auth_type='User',
+            task_ids=[3, 4]
         )
 
     def test_reassign_in_raw_performer_templates__group_to_group__ok(
@@ -1414,3 +1458,384 @@ class TestReassignService:
             value=old_user.id
         )
         update_mock.assert_called_once_with(value=new_user.id)
+
+    def test_get_chunk_ids__performers__ordered_after_id(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        workflow = create_test_workflow(user=old_user, tasks_count=3)
+        task_ids = list(
+            workflow.tasks.order_by('id').values_list('id', flat=True)
+        )
+        settings_mock = mocker.patch(
+            'src.accounts.services.reassign.settings'
+        )
+        settings_mock.REASSIGN_CHUNK_SIZE = 2
+        service = ReassignService(old_user=old_user, new_user=new_user)
+
+        # act
+        first_chunk = service._get_chunk_ids('performers', 0, [])
+        last_chunk = service._get_chunk_ids(
+            'performers',
+            first_chunk[-1],
+            []
+        )
+
+        # assert
+        assert first_chunk == task_ids[:2]
+        assert last_chunk == task_ids[2:]
+
+    def test_get_chunk_ids__conditions_old_group__empty(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        user = create_test_user(account=account)
+        old_group = create_test_group(account, users=[user])
+        settings_mock = mocker.patch(
+            'src.accounts.services.reassign.settings'
+        )
+        settings_mock.REASSIGN_CHUNK_SIZE = 2
+        service = ReassignService(old_group=old_group, new_user=user)
+
+        # act
+        result = service._get_chunk_ids('conditions', 0, [])
+
+        # assert
+        assert result == []
+
+    def test_reassign_chunk__full_chunk__return_same_step(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        settings_mock = mocker.patch(
+            'src.accounts.services.reassign.settings'
+        )
+        settings_mock.REASSIGN_CHUNK_SIZE = 2
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_get_chunk_ids',
+            return_value=[3, 4]
+        )
+        reassign_in_raw_performers_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_reassign_in_raw_performers'
+        )
+        account_changed_mock = mocker.patch(
+            'src.accounts.services.reassign.'
+            'WorkflowDetailsCache.account_changed'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+
+        # act
+        result = service.reassign_chunk(
+            step=1,
+            after_id=0,
+            template_ids=[]
+        )
+
+        # assert
+        assert result == (1, 4)
+        reassign_in_raw_performers_mock.assert_called_once_with([3, 4])
+        account_changed_mock.assert_called_once_with(account.id)
+
+    def test_reassign_chunk__last_step_empty__return_none(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_get_chunk_ids',
+            return_value=[]
+        )
+        reassign_in_conditions_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_reassign_in_conditions'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+
+        # act
+        result = service.reassign_chunk(
+            step=len(ReassignService.STEPS) - 1,
+            after_id=0,
+            template_ids=[]
+        )
+
+        # assert
+        assert result is None
+        reassign_in_conditions_mock.assert_not_called()
+
+    def test_start_job__ok(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_affected_template_ids',
+            return_value=[2, 1]
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
+        delay_mock = mocker.patch('src.accounts.tasks.reassign_chunk.delay')
+        service = ReassignService(
+            old_user=old_user,
+            new_user=new_user,
+            is_superuser=True
+        )
+
+        # act
+        job = service.start_job()
+
+        # assert
+        assert job['status'] == ReassignJobStatus.RUNNING
+        assert job['step'] == ReassignService.STEPS[0]
+        assert job['completed_steps'] == 0
+        assert ReassignService.get_progress(account.id, job['id']) == job
+        delay_mock.assert_called_once_with(
+            old_user_id=old_user.id,
+            new_user_id=new_user.id,
+            old_group_id=None,
+            new_group_id=None,
+            is_superuser=True,
+            auth_type='User',
+            job_id=job['id'],
+            step=0,
+            after_id=0,
+            template_ids=[1, 2],
+        )
+
+    def test_run_job_chunk__next_chunk__queue(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+        job = service.start_job()
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            'reassign_chunk',
+            return_value=(3, 0)
+        )
+        send_chunk_task_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_send_chunk_task'
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
+
+        # act
+        service.run_job_chunk(
+            job_id=job['id'],
+            step=2,
+            after_id=10,
+            template_ids=[1]
+        )
+
+        # assert
+        result = ReassignService.get_progress(account.id, job['id'])
+        assert result['status'] == ReassignJobStatus.RUNNING
+        assert result['step'] == ReassignService.STEPS[3]
+        assert result['completed_steps'] == 3
+        assert result['after_id'] == 0
+        assert result['template_ids'] == [1]
+        send_chunk_task_mock.assert_called_once_with(
+            job_id=job['id'],
+            step=3,
+            after_id=0,
+            template_ids=[1],
+        )
+
+    def test_run_job_chunk__last_chunk__completed(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        on_commit_mock = mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+        job = service.start_job()
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            'reassign_chunk',
+            return_value=None
+        )
+
+        # act
+        service.run_job_chunk(
+            job_id=job['id'],
+            step=len(ReassignService.STEPS) - 1,
+            after_id=0,
+            template_ids=[]
+        )
+
+        # assert
+        result = ReassignService.get_progress(account.id, job['id'])
+        assert result['status'] == ReassignJobStatus.COMPLETED
+        assert result['step'] is None
+        assert result['completed_steps'] == len(ReassignService.STEPS)
+        on_commit_mock.assert_called_once()
+
+    def test_run_job_chunk__chunk_failed__save_failed_position(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+        job = service.start_job()
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            'reassign_chunk',
+            side_effect=DatabaseError
+        )
+        send_chunk_task_mock = mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            '_send_chunk_task'
+        )
+
+        # act
+        with pytest.raises(DatabaseError):
+            service.run_job_chunk(
+                job_id=job['id'],
+                step=2,
+                after_id=10,
+                template_ids=[1]
+            )
+
+        # assert
+        result = ReassignService.get_progress(account.id, job['id'])
+        assert result['status'] == ReassignJobStatus.FAILED
+        assert result['step'] == ReassignService.STEPS[2]
+        assert result['completed_steps'] == 2
+        assert result['after_id'] == 10
+        assert result['template_ids'] == [1]
+        send_chunk_task_mock.assert_not_called()
+
+    def test_resume_job__failed__queue_failed_chunk(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+        job = service.start_job()
+        mocker.patch(
+            'src.accounts.services.reassign.ReassignService.'
+            'reassign_chunk',
+            side_effect=DatabaseError
+        )
+        with pytest.raises(DatabaseError):
+            service.run_job_chunk(
+                job_id=job['id'],
+                step=2,
+                after_id=10,
+                template_ids=[1]
+            )
+        mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit',
+            side_effect=lambda func: func()
+        )
+        delay_mock = mocker.patch('src.accounts.tasks.reassign_chunk.delay')
+
+        # act
+        result = ReassignService.resume_job(
+            account_id=account.id,
+            job_id=job['id']
+        )
+
+        # assert
+        assert result['status'] == ReassignJobStatus.RUNNING
+        assert ReassignService.get_progress(account.id, job['id']) == result
+        delay_mock.assert_called_once_with(
+            old_user_id=old_user.id,
+            new_user_id=new_user.id,
+            old_group_id=None,
+            new_group_id=None,
+            is_superuser=False,
+            auth_type='User',
+            job_id=job['id'],
+            step=2,
+            after_id=10,
+            template_ids=[1],
+        )
+
+    def test_resume_job__running__not_queue(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        old_user = create_test_user(account=account, email='old@example.com')
+        new_user = create_test_user(
+            account=account,
+            email='new@example.com',
+            is_account_owner=False
+        )
+        on_commit_mock = mocker.patch(
+            'src.accounts.services.reassign.transaction.on_commit'
+        )
+        service = ReassignService(old_user=old_user, new_user=new_user)
+        job = service.start_job()
+
+        # act
+        result = ReassignService.resume_job(
+            account_id=account.id,
+            job_id=job['id']
+        )
+
+        # assert
+        assert result == job
+        on_commit_mock.assert_called_once()
@@ -823,9 +823,9 @@ def test_activate_user__ok(mocker):
         attribute='__init__',
         return_value=None
     )
-    update_users_counts_mock = mocker.patch(
+    change_users_counts_mock = mocker.patch(
         'src.accounts.services.'
-        'AccountService.update_users_counts'
+        'AccountService.change_users_counts'
     )
 
     # act
@@ -841,4 +841,4 @@ def test_activate_user__ok(mocker):
         instance=account_2_new_user.account,
         user=account_2_new_user
     )
-    update_users_counts_mock.assert_called_once()
+    change_users_counts_mock.assert_called_once_with(1)
@@ -1115,9 +1115,9 @@ def test_private_deactivate__ok(mocker):
         'src.accounts.services.user.'
         'remove_user_from_draft'
     )
-    update_users_counts_mock = mocker.patch(
+    change_users_counts_mock = mocker.patch(
         'src.accounts.services.AccountService.'
-        'update_users_counts'
+        'change_users_counts'
     )
     identify_mock = mocker.patch(
         'src.accounts.services.user.UserService.'
@@ -1136,10 +1136,48 @@ def test_private_deactivate__ok(mocker):
         user_id=invited_user.id,
         account_id=account.id
     )
-    update_users_counts_mock.assert_called_once()
+    change_users_counts_mock.assert_not_called()
     identify_mock.assert_called_once_with(invited_user)
 
 
+def test_private_deactivate__active_user__decrease_counts(mocker):
+
+    # arrange
+    account = create_test_account()
+    create_test_user(account=account)
+    active_user = create_test_user(
+        account=account,
+        email='active@email.com',
+        is_account_owner=False
+    )
+    remove_user_from_draft_mock = mocker.patch(
+        'src.accounts.services.user.'
+        'remove_user_from_draft'
+    )
+    change_users_counts_mock = mocker.patch(
+        'src.accounts.services.AccountService.'
+        'change_users_counts'
+    )
+    identify_mock = mocker.patch(
+        'src.accounts.services.user.UserService.'
+        'identify'
+    )
+
+    # act
+    UserService._deactivate(active_user)
+
+    # assert
+    active_user.refresh_from_db()
+    assert active_user.status == UserStatus.INACTIVE
+    assert active_user.is_active is False
+    remove_user_from_draft_mock.assert_called_once_with(
+        user_id=active_user.id,
+        account_id=account.id
+    )
+    change_users_counts_mock.assert_called_once_with(-1)
+    identify_mock.assert_called_once_with(active_user)
+
+
 def test_private_deactivate__activate_contacts__ok(mocker):
 
     # arrange
@@ -1160,7 +1198,7 @@ def test_private_deactivate__activate_contacts__ok(mocker):
     )
     mocker.patch(
         'src.accounts.services.AccountService.'
-        'update_users_counts'
+        'change_users_counts'
     )
     mocker.patch(
         'src.accounts.services.user.UserService.'
@@ -17,6 +17,7 @@ from src.accounts.models import (
     Account,
     UserInvite,
 )
+from src.accounts.services import AccountService
 
 UserModel = get_user_model()
 
@@ -137,6 +138,8 @@ class TestAccountModels:
             status=UserStatus.INACTIVE
         )
         create_test_guest(account=another_account)
+        AccountService.reconcile_users_counts()
+        master_account.refresh_from_db()
 
         # act
         count = master_account.get_paid_users_count()
@@ -182,6 +185,8 @@ class TestAccountModels:
             status=UserStatus.INACTIVE
         )
         create_test_guest(account=another_account)
+        AccountService.reconcile_users_counts()
+        master_account.refresh_from_db()
 
         # act
         count = master_account.get_paid_users_count()
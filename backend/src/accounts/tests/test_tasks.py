@@ -10,9 +10,12 @@ from src.accounts.models import (
     Notification,
 )
 from src.accounts.tasks import (
+    reassign_chunk,
+    reconcile_users_counts,
     send_system_notification,
 )
 from src.processes.tests.fixtures import (
+    create_test_group,
     create_test_user,
 )
 
@@ -27,10 +30,10 @@ class TestSendSystemNotification:
         user = create_test_user()
         another_user = create_test_user(email='another@pneumatic.app')
 
-        send_notification_mock = mocker.patch(
-            'src.accounts.tasks._send_notification'
+        send_broadcast_mock = mocker.patch(
+            'src.accounts.tasks.WebSocketService.send_system_broadcast'
         )
-        SystemMessage.objects.create(
+        system_message = SystemMessage.objects.create(
             text='If you smell what The Rock is cooking!',
             publication_date=timezone.now(),
             is_delivery_completed=False,
@@ -42,15 +45,17 @@ class TestSendSystemNotification:
         # assert
         assert Notification.objects.filter(user=user).exists()
         assert Notification.objects.filter(user=another_user).exists()
-        assert send_notification_mock.call_count == 2
+        send_broadcast_mock.assert_called_once_with(
+            system_message_id=system_message.id
+        )
 
-    def test_exists_read_notification__do_not_send_notification(self, mocker):
+    def test_exists_read_notification__not_create(self, mocker):
         # arrange
         user = create_test_user()
         another_user = create_test_user(email='another@pneumatic.app')
 
-        send_notification_mock = mocker.patch(
-            'src.accounts.tasks._send_notification'
+        send_broadcast_mock = mocker.patch(
+            'src.accounts.tasks.WebSocketService.send_system_broadcast'
         )
 
         system_message = SystemMessage.objects.create(
@@ -74,15 +79,17 @@ class TestSendSystemNotification:
         # assert
         assert Notification.objects.filter(user=user).exists()
         assert Notification.objects.filter(user=another_user).count() == 1
-        assert send_notification_mock.call_count == 1
+        send_broadcast_mock.assert_called_once_with(
+            system_message_id=system_message.id
+        )
 
     def test_is_delivery_completed__do_not_send_notification(self, mocker):
         # arrange
         user = create_test_user()
         another_user = create_test_user(email='another@pneumatic.app')
 
-        send_notification_mock = mocker.patch(
-            'src.accounts.tasks._send_notification'
+        send_broadcast_mock = mocker.patch(
+            'src.accounts.tasks.WebSocketService.send_system_broadcast'
         )
 
         SystemMessage.objects.create(
@@ -97,4 +104,88 @@ class TestSendSystemNotification:
         # assert
         assert Notification.objects.filter(user=user).exists() is False
         assert Notification.objects.filter(user=another_user).exists() is False
-        send_notification_mock.assert_not_called()
+        send_broadcast_mock.assert_not_called()
+
+
+class TestReassignChunk:
+
+    def test_call(self, mocker):
+        # arrange
+        user = create_test_user()
+        group = create_test_group(user.account, users=[user])
+        init_mock = mocker.patch(
+            'src.accounts.tasks.ReassignService.__init__',
+            return_value=None
+        )
+        run_job_chunk_mock = mocker.patch(
+            'src.accounts.tasks.ReassignService.run_job_chunk'
+        )
+
+        # act
+        reassign_chunk(
+            job_id='a' * 32,
+            step=1,
+            after_id=10,
+            template_ids=[1],
+            old_user_id=user.id,
+            new_user_id=None,
+            old_group_id=None,
+            new_group_id=group.id,
+            is_superuser=False,
+            auth_type='User',
+        )
+
+        # assert
+        init_mock.assert_called_once_with(
+            old_user=user,
+            new_user=None,
+            old_group=None,
+            new_group=group,
+            is_superuser=False,
+            auth_type='User',
+        )
+        run_job_chunk_mock.assert_called_once_with(
+            job_id='a' * 32,
+            step=1,
+            after_id=10,
+            template_ids=[1],
+        )
+
+
+class TestReconcileUsersCounts:
+
+    def test_call(self, mocker):
+        # arrange
+        reconcile_mock = mocker.patch(
+            'src.accounts.tasks.AccountService.reconcile_users_counts',
+            return_value=[1]
+        )
+        capture_sentry_message_mock = mocker.patch(
+            'src.accounts.tasks.capture_sentry_message'
+        )
+
+        # act
+        reconcile_users_counts()
+
+        # assert
+        reconcile_mock.assert_called_once()
+        capture_sentry_message_mock.assert_called_once_with(
+            message='Active users counters are reconciled',
+            data={'account_ids': [1]}
+        )
+
+    def test_not_drifted__not_capture(self, mocker):
+        # arrange
+        mocker.patch(
+            'src.accounts.tasks.AccountService.reconcile_users_counts',
+            return_value=[]
+        )
+        capture_sentry_message_mock = mocker.patch(
+            'src.accounts.tasks.capture_sentry_message'
+        )
+
+        # act
+        reconcile_users_counts()
+
+        # assert
+        capture_sentry_message_mock.assert_not_called()
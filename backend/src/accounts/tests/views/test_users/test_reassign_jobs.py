@@ -0,0 +1,160 @@
+import pytest
+from src.accounts.enums import ReassignJobStatus
+from src.accounts.services.reassign import ReassignService
+from src.processes.tests.fixtures import (
+    create_test_user,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_reassign_jobs__with_valid_data__ok(mocker, api_client):
+    # arrange
+    account_owner = create_test_user()
+    old_user = create_test_user(
+        account=account_owner.account,
+        email='new@pneumatic.app'
+    )
+    new_user = create_test_user(
+        account=account_owner.account,
+        email='new1@pneumatic.app'
+    )
+    api_client.token_authenticate(account_owner)
+    job = {
+        'id': 'a' * 32,
+        'status': ReassignJobStatus.RUNNING,
+        'step': ReassignService.STEPS[0],
+        'completed_steps': 0,
+        'steps_count': len(ReassignService.STEPS),
+    }
+    service_class_mock = mocker.patch(
+        'src.accounts.views.users.ReassignService'
+    )
+    service_instance_mock = service_class_mock.return_value
+    service_instance_mock.start_job.return_value = job
+
+    # act
+    response = api_client.post(
+        '/accounts/users/reassign-jobs',
+        data={
+            'old_user': old_user.id,
+            'new_user': new_user.id,
+        }
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == job
+    service_class_mock.assert_called_once_with(
+        is_superuser=False,
+        auth_type='User',
+        old_user=old_user,
+        new_user=new_user,
+    )
+    service_instance_mock.reassign_everywhere.assert_not_called()
+
+
+def test_reassign_job__started__ok(mocker, api_client):
+    # arrange
+    account_owner = create_test_user()
+    old_user = create_test_user(
+        account=account_owner.account,
+        email='new@pneumatic.app'
+    )
+    new_user = create_test_user(
+        account=account_owner.account,
+        email='new1@pneumatic.app'
+    )
+    mocker.patch(
+        'src.accounts.services.reassign.transaction.on_commit'
+    )
+    job = ReassignService(
+        old_user=old_user,
+        new_user=new_user,
+    ).start_job()
+    api_client.token_authenticate(account_owner)
+
+    # act
+    response = api_client.get(f'/accounts/users/reassign-jobs/{job["id"]}')
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == job
+
+
+def test_reassign_job__another_account__not_found(mocker, api_client):
+    # arrange
+    account_owner = create_test_user()
+    old_user = create_test_user(
+        account=account_owner.account,
+        email='new@pneumatic.app'
+    )
+    new_user = create_test_user(
+        account=account_owner.account,
+        email='new1@pneumatic.app'
+    )
+    another_account_owner = create_test_user(email='another@pneumatic.app')
+    mocker.patch(
+        'src.accounts.services.reassign.transaction.on_commit'
+    )
+    job = ReassignService(
+        old_user=old_user,
+        new_user=new_user,
+    ).start_job()
+    api_client.token_authenticate(another_account_owner)
+
+    # act
+    response = api_client.get(f'/accounts/users/reassign-jobs/{job["id"]}')
+
+    # assert
+    assert response.status_code == 404
+
+
+def test_reassign_job_resume__failed__ok(mocker, api_client):
+    # arrange
+    account_owner = create_test_user()
+    job = {
+        'id': 'a' * 32,
+        'status': ReassignJobStatus.RUNNING,
+        'step': ReassignService.STEPS[2],
+        'completed_steps': 2,
+        'steps_count': len(ReassignService.STEPS),
+    }
+    resume_job_mock = mocker.patch(
+        'src.accounts.views.users.ReassignService.resume_job',
+        return_value=job
+    )
+    api_client.token_authenticate(account_owner)
+
+    # act
+    response = api_client.post(
+        f'/accounts/users/reassign-jobs/{job["id"]}/resume'
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == job
+    resume_job_mock.assert_called_once_with(
+        account_id=account_owner.account_id,
+        job_id=job['id'],
+        is_superuser=False,
+        auth_type='User',
+    )
+
+
+def test_reassign_job_resume__not_found(mocker, api_client):
+    # arrange
+    account_owner = create_test_user()
+    mocker.patch(
+        'src.accounts.views.users.ReassignService.resume_job',
+        return_value=None
+    )
+    api_client.token_authenticate(account_owner)
+
+    # act
+    response = api_client.post(
+        f'/accounts/users/reassign-jobs/{"a" * 32}/resume'
+    )
+
+    # assert
+    assert response.status_code == 404
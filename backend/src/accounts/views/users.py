@@ -75,6 +75,7 @@ class UsersViewSet(
     filter_backends = [PneumaticFilterBackend]
     action_serializer_classes = {
         'reassign': ReassignSerializer,
+        'reassign_jobs': ReassignSerializer,
         'privileges': UserPrivilegesSerializer,
     }
     action_filterset_classes = {
@@ -188,6 +189,54 @@ class UsersViewSet(
             raise_validation_error(message=ex.message)
         return self.response_ok()
 
+    @action(detail=False, methods=('post',), url_path='reassign-jobs')
+    def reassign_jobs(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            service = ReassignService(
+                is_superuser=request.is_superuser,
+                auth_type=request.token_type,
+                **serializer.validated_data
+            )
+            job = service.start_job()
+        except ReassignServiceException as ex:
+            raise_validation_error(message=ex.message)
+        return self.response_ok(job)
+
+    @action(
+        detail=False,
+        methods=('get',),
+        url_path=r'reassign-jobs/(?P<job_id>[0-9a-f]{32})'
+    )
+    def reassign_job(self, request, job_id):
+        job = ReassignService.get_progress(
+            account_id=request.user.account_id,
+            job_id=job_id
+        )
+        if job is None:
+            raise Http404
+        return self.response_ok(job)
+
+    @action(
+        detail=False,
+        methods=('post',),
+        url_path=r'reassign-jobs/(?P<job_id>[0-9a-f]{32})/resume'
+    )
+    def reassign_job_resume(self, request, job_id):
+        try:
+            job = ReassignService.resume_job(
+                account_id=request.user.account_id,
+                job_id=job_id,
+                is_superuser=request.is_superuser,
+                auth_type=request.token_type,
+            )
+        except ReassignServiceException as ex:
+            raise_validation_error(message=ex.message)
+        if job is None:
+            raise Http404
+        return self.response_ok(job)
+
     # TODO uncomment in https://my.pneumatic.app/workflows/15691/
     # @action(detail=True, methods=('get',))
     # def transfer(self, request, pk=None):
@@ -7,6 +7,7 @@ from src.ai.models import (
     OpenAiPrompt,
     OpenAiMessage
 )
+from src.ai.cache import OpenAiPromptCache
 from django.forms.models import BaseInlineFormSet
 from django.forms import ModelForm, ValidationError
 
@@ -84,3 +85,11 @@ class OpenAiPromptAdmin(ModelAdmin):
             OpenAiPrompt.objects.active().by_target(obj.target).exclude(
                 id=obj.id
             ).update(is_active=False)
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        OpenAiPromptCache.clear()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        OpenAiPromptCache.clear()
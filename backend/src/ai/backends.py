@@ -0,0 +1,31 @@
+import time
+import openai
+from types import SimpleNamespace
+from django.conf import settings
+
+
+class OpenAiCompletionBackend:
+
+    """ Creates the chat completion by the OpenAI API """
+
+    def create(self, **kwargs):
+        openai.api_key = settings.OPENAI_API_KEY
+        openai.organization = settings.OPENAI_API_ORG
+        return openai.ChatCompletion.create(**kwargs)
+
+
+class FakeCompletionBackend:
+
+    """ Returns the completion with the given content after the delay
+        without the network calls, so the template generation
+        is load tested offline """
+
+    def __init__(self, content: str, delay: float = 0):
+        self.content = content
+        self.delay = delay
+
+    def create(self, **kwargs):
+        if self.delay:
+            time.sleep(self.delay)
+        message = SimpleNamespace(content=self.content, finish_reason=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
@@ -0,0 +1,118 @@
+import hashlib
+import json
+import threading
+import time
+from typing import Optional
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import Prefetch
+from src.ai.models import (
+    OpenAiPrompt,
+    OpenAiMessage,
+)
+
+
+class OpenAiPromptCache:
+
+    """ Active prompts with the prefetched messages by the target
+        in the memory of the process. The prompt changed in the admin
+        is read by the other processes after AI_PROMPT_CACHE_TIMEOUT """
+
+    _items = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def _load(cls, target: str) -> Optional[OpenAiPrompt]:
+        return (
+            OpenAiPrompt.objects
+            .active()
+            .by_target(target)
+            .prefetch_related(
+                Prefetch(
+                    'messages',
+                    queryset=OpenAiMessage.objects.order_by('order')
+                )
+            )
+            .first()
+        )
+
+    @classmethod
+    def get(cls, target: str) -> Optional[OpenAiPrompt]:
+        if not settings.AI_CACHE:
+            return cls._load(target)
+        now = time.monotonic()
+        with cls._lock:
+            item = cls._items.get(target)
+        if item is not None and item[0] > now:
+            return item[1]
+        prompt = cls._load(target)
+        with cls._lock:
+            cls._items[target] = (
+                now + settings.AI_PROMPT_CACHE_TIMEOUT,
+                prompt
+            )
+        return prompt
+
+    @classmethod
+    def clear(cls):
+        with cls._lock:
+            cls._items.clear()
+
+
+class OpenAiResponseCache:
+
+    """ Responses by the normalized user description and the version
+        of the prompt, the version is the hash of the prompt parameters
+        and the messages, so the changed prompt is not answered
+        by the previous responses """
+
+    cache = caches['default']
+    key_prefix = 'ai_response'
+
+    @classmethod
+    def _get_prompt_version(cls, prompt: OpenAiPrompt) -> str:
+        data = [
+            prompt.model,
+            prompt.temperature,
+            prompt.top_p,
+            prompt.presence_penalty,
+            prompt.frequency_penalty,
+            [
+                (elem.order, elem.role, elem.content)
+                for elem in prompt.messages.all()
+            ]
+        ]
+        return hashlib.sha1(json.dumps(data).encode()).hexdigest()
+
+    @classmethod
+    def _get_key(cls, prompt: OpenAiPrompt, user_description: str) -> str:
+        description = ' '.join(user_description.lower().split())
+        description_hash = hashlib.sha1(description.encode()).hexdigest()
+        return (
+            f'{cls.key_prefix}:{cls._get_prompt_version(prompt)}:'
+            f'{description_hash}'
+        )
+
+    @classmethod
+    def get(
+        cls,
+        prompt: OpenAiPrompt,
+        user_description: str,
+    ) -> Optional[str]:
+        if not settings.AI_CACHE:
+            return None
+        return cls.cache.get(cls._get_key(prompt, user_description))
+
+    @classmethod
+    def set(
+        cls,
+        prompt: OpenAiPrompt,
+        user_description: str,
+        response: str,
+    ):
+        if settings.AI_CACHE:
+            cls.cache.set(
+                cls._get_key(prompt, user_description),
+                response,
+                settings.AI_RESPONSE_CACHE_TIMEOUT
+            )
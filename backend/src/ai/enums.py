@@ -39,3 +39,16 @@ class OpenAIPromptTarget:
     CHOICES = (
         (GET_STEPS, 'Get template steps'),
     )
+
+
+class AiJobStatus:
+
+    PENDING = 'pending'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+
+    LITERALS = Literal[
+        PENDING,
+        COMPLETED,
+        FAILED,
+    ]
@@ -0,0 +1,99 @@
+import pytest
+from src.ai.cache import (
+    OpenAiPromptCache,
+    OpenAiResponseCache,
+)
+from src.ai.enums import OpenAIPromptTarget
+from src.ai.tests.fixtures import create_test_prompt
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_prompt_cache_get__cached__not_query(
+    mocker,
+    django_assert_num_queries,
+):
+
+    # arrange
+    settings_mock = mocker.patch('src.ai.cache.settings')
+    settings_mock.AI_CACHE = True
+    settings_mock.AI_PROMPT_CACHE_TIMEOUT = 60
+    prompt = create_test_prompt(messages_count=2)
+    OpenAiPromptCache.clear()
+    OpenAiPromptCache.get(OpenAIPromptTarget.GET_STEPS)
+
+    # act
+    with django_assert_num_queries(0):
+        result = OpenAiPromptCache.get(OpenAIPromptTarget.GET_STEPS)
+        messages = list(result.messages.all())
+
+    # assert
+    assert result == prompt
+    assert [elem.order for elem in messages] == [1, 2]
+
+
+def test_prompt_cache_get__disabled__load_each_time(mocker):
+
+    # arrange
+    settings_mock = mocker.patch('src.ai.cache.settings')
+    settings_mock.AI_CACHE = False
+    OpenAiPromptCache.clear()
+    OpenAiPromptCache.get(OpenAIPromptTarget.GET_STEPS)
+    prompt = create_test_prompt()
+
+    # act
+    result = OpenAiPromptCache.get(OpenAIPromptTarget.GET_STEPS)
+
+    # assert
+    assert result == prompt
+
+
+def test_response_cache_get__same_normalized_description__return(mocker):
+
+    # arrange
+    settings_mock = mocker.patch('src.ai.cache.settings')
+    settings_mock.AI_CACHE = True
+    settings_mock.AI_RESPONSE_CACHE_TIMEOUT = 60
+    prompt = create_test_prompt()
+    OpenAiResponseCache.set(
+        prompt=prompt,
+        user_description='Hire  the employee',
+        response='1. Interview | Talk',
+    )
+
+    # act
+    result = OpenAiResponseCache.get(
+        prompt=prompt,
+        user_description=' hire the Employee\n',
+    )
+
+    # assert
+    assert result == '1. Interview | Talk'
+
+
+def test_response_cache_get__prompt_changed__not_return(mocker):
+
+    # arrange
+    settings_mock = mocker.patch('src.ai.cache.settings')
+    settings_mock.AI_CACHE = True
+    settings_mock.AI_RESPONSE_CACHE_TIMEOUT = 60
+    prompt = create_test_prompt()
+    description = 'Hire the employee'
+    OpenAiResponseCache.set(
+        prompt=prompt,
+        user_description=description,
+        response='1. Interview | Talk',
+    )
+    message = prompt.messages.get(order=1)
+    message.content = 'Other {{ user_description }} text'
+    message.save()
+
+    # act
+    result = OpenAiResponseCache.get(
+        prompt=prompt,
+        user_description=description,
+    )
+
+    # assert
+    assert result is None
@@ -7,8 +7,13 @@
 # culprit is not CORS, but async mind games.
 
 
+import asyncio
+import contextvars
 import logging
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Optional
 
 from channels.exceptions import RequestAborted, RequestTimeout
 from channels.http import AsgiHandler as ChannelsAsgiHandler
@@ -25,29 +30,74 @@ logger = logging.getLogger("django.request")
 class AsgiHandler(ChannelsAsgiHandler):
     # All methods have been copied and slightly modified from the parent-class
     # If you wanna know what happens here - look in the parent class
+
+    # Views are synchronous (Django 2.2) and run in the thread pool,
+    # so a slow query doesn't block the event loop with websockets
+    # and other requests. Each thread keeps its own db connection.
+    executor: Optional[ThreadPoolExecutor] = None
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        # Settings aren't configured yet when the module is imported
+        if cls.executor is None:
+            cls.executor = ThreadPoolExecutor(
+                max_workers=settings.ASGI_HTTP_THREADS,
+                thread_name_prefix='asgi-http',
+            )
+        return cls.executor
+
     async def __call__(self, scope, receive, send):
         if scope["type"] != "http":
             raise ValueError(
                 "The AsgiHandler can only handle HTTP connections, not %s"
                 % scope["type"]
             )
-        self.scope = scope
-        self.send = send
-
+        # The handler instance is shared between requests,
+        # so the scope isn't saved to the instance
         try:
             body_stream = await self.read_body(receive)
         except RequestAborted:
             return
-        await self.handle(body_stream)
+        await self.handle(scope, send, body_stream)
+
+    async def handle(self, scope, send, body):
+        loop = asyncio.get_event_loop()
+        # Copy context vars (sentry scope) to the thread
+        context = contextvars.copy_context()
+        await loop.run_in_executor(
+            self.get_executor(),
+            partial(context.run, self.serve, scope, send, body, loop),
+        )
+
+    def serve(self, scope, send, body, loop):
+
+        """ Runs in the thread pool. The response is encoded and closed
+            on the same thread, so the request_finished signal closes
+            the db connection of the thread that used it """
+
+        response = self.get_sync_response(scope, body)
+        if response is None:
+            return
+        try:
+            for response_message in self.encode_response(response):
+                asyncio.run_coroutine_threadsafe(
+                    send(response_message),
+                    loop,
+                ).result()
+        finally:
+            response.close()
 
-    async def handle(self, body):
-        script_prefix = self.scope.get("root_path", "") or ""
+    def get_sync_response(self, scope, body) -> Optional[HttpResponse]:
+
+        """ Returns None if the client closed the connection """
+
+        script_prefix = scope.get("root_path", "") or ""
         if settings.FORCE_SCRIPT_NAME:
             script_prefix = settings.FORCE_SCRIPT_NAME
         set_script_prefix(script_prefix)
-        signals.request_started.send(sender=self.__class__, scope=self.scope)
+        signals.request_started.send(sender=self.__class__, scope=scope)
         try:
-            request = self.request_class(self.scope, body)
+            request = self.request_class(scope, body)
         except UnicodeDecodeError:
             logger.warning(
                 "Bad Request (UnicodeDecodeError)",
@@ -61,13 +111,11 @@ class AsgiHandler(ChannelsAsgiHandler):
                 status=408
             )
         except RequestAborted:
-            return
+            return None
         except RequestDataTooBig:
             response = HttpResponse("413 Payload too large", status=413)
         else:
             response = self.get_response(request)
             if isinstance(response, FileResponse):
                 response.block_size = 1024 * 512
-        for response_message in self.encode_response(response):
-            await self.send(response_message)
-        response.close()
+        return response
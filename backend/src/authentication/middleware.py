@@ -1,5 +1,8 @@
 import json
+from typing import Optional, Tuple
 from urllib.parse import parse_qs
+from django.conf import settings
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils.deprecation import MiddlewareMixin
@@ -7,11 +10,15 @@ from src.authentication.tokens import PneumaticToken
 from src.authentication.enums import AuthTokenType
 from src.utils.user_agent import get_user_agent
 from src.logs.service import AccountLogService
+from src.logs.utils import redact_log_data, redact_log_text
 from rest_framework.authentication import get_authorization_header
 from django.contrib.auth.middleware import AuthenticationMiddleware
 from src.generics.mixins.views import AnonymousMixin
 
 
+UserModel = get_user_model()
+
+
 class UserAgentMiddleware(MiddlewareMixin):
     def __call__(self, request):
         request.user_agent = get_user_agent(request)
@@ -41,15 +48,113 @@ class WebsocketAuthMiddleware:
         return await self.inner(scope, *args, **kwargs)
 
 
+class BodyLogStream:
+
+    """ Wraps the request stream and keeps the first bytes
+        read from it, the body is not read into memory twice """
+
+    def __init__(self, stream, limit: int):
+        self.stream = stream
+        self.limit = limit
+        self.captured = bytearray()
+        self.truncated = False
+
+    def _capture(self, chunk: bytes):
+        free = self.limit - len(self.captured)
+        if free >= len(chunk):
+            self.captured += chunk
+        else:
+            self.captured += chunk[:max(free, 0)]
+            self.truncated = True
+
+    def read(self, *args, **kwargs) -> bytes:
+        chunk = self.stream.read(*args, **kwargs)
+        self._capture(chunk)
+        return chunk
+
+    def readline(self, *args, **kwargs) -> bytes:
+        chunk = self.stream.readline(*args, **kwargs)
+        self._capture(chunk)
+        return chunk
+
+    def get_body(self) -> Tuple[str, bool]:
+
+        """ Reads up to the limit if the view didn't read the body """
+
+        if not self.truncated:
+            self.read(self.limit - len(self.captured) + 1)
+        return self.captured.decode(errors='replace'), self.truncated
+
+
 class AuthMiddleware(
     AuthenticationMiddleware,
     AnonymousMixin
 ):
+
+    def _get_api_token_data(
+        self,
+        request
+    ) -> Tuple[Optional[str], Optional[dict]]:
+
+        """ Returns the api key and its cached data
+            if the request is authenticated with an api key """
+
+        auth_header = get_authorization_header(request).decode()
+        auth_header_parts = auth_header.split()
+        if (
+            len(auth_header_parts) == 2
+            and auth_header_parts[0].lower() == 'bearer'
+        ):
+            token = auth_header_parts[1]
+            cached_data = PneumaticToken.data(token)
+            # after logout token cached_data not exist
+            if cached_data and cached_data['for_api_key']:
+                return token, cached_data
+        return None, None
+
+    def _get_body_to_log(self, request) -> Optional[dict]:
+        stream = getattr(request, '_body_log_stream', None)
+        if stream is None:
+            return None
+        body, truncated = stream.get_body()
+        if not truncated:
+            try:
+                return redact_log_data(json.loads(body))
+            except ValueError:
+                pass
+        return {'body': redact_log_text(body), 'truncated': truncated}
+
+    def _log_api_requests(self, token: str, cached_data: dict) -> bool:
+
+        """ The flag is cached with the api key data, the keys cached
+            before the flag was added are checked in the db once """
+
+        log_api_requests = cached_data.get('log_api_requests')
+        if log_api_requests is None:
+            log_api_requests = UserModel.objects.filter(
+                id=cached_data['user_id'],
+                account__log_api_requests=True,
+            ).exists()
+            PneumaticToken.update_data(
+                token,
+                log_api_requests=log_api_requests
+            )
+        return log_api_requests
+
     def process_request(self, request):
         super().process_request(request)
-        # Danger: save raw request body to memory creates vulnerability
-        # Don't enable account.log_api_requests for all accounts
-        request._body_to_log = request.body
+        if (
+            request.method in ('POST', 'PUT', 'PATCH')
+            and request.META.get('CONTENT_LENGTH') not in (None, '', '0')
+        ):
+            token, cached_data = self._get_api_token_data(request)
+            if token and self._log_api_requests(token, cached_data):
+                # Only the first bytes of the body are kept in memory
+                request._body_log_stream = BodyLogStream(
+                    stream=request._stream,
+                    limit=settings.API_LOG_MAX_BODY_SIZE,
+                )
+                request._stream = request._body_log_stream
 
     def process_response(self, request, response):
         user = request.user
@@ -59,40 +164,29 @@ class AuthMiddleware(
             and user.is_user
             and user.account.log_api_requests
         ):
-            auth_header = get_authorization_header(request).decode()
-            auth_header_parts = auth_header.split()
-            if (
-                len(auth_header_parts) == 2
-                and auth_header_parts[0].lower() == 'bearer'
-            ):
-                token = auth_header_parts[1]
-                cached_data = PneumaticToken.data(token)
-                # after logout token cached_data not exist
-                if cached_data and cached_data['for_api_key']:
-                    if request.method == 'GET':
-                        body = request.GET
-                    elif (
-                        request.method in ('POST', 'PUT', 'PATCH')
-                        and request.META['CONTENT_LENGTH'] != '0'
-                    ):
-                        body = request._body_to_log.decode()
-                        body = json.loads(body)
-                    else:
-                        body = None
-                    response_data = (
-                        response.data if hasattr(response, 'data') else None
-                    )
-                    AccountLogService().api_request(
-                        user=request.user,
-                        ip=self.get_user_ip(request),
-                        user_agent=self.get_user_agent(request),
-                        auth_token=token,
-                        scheme=request.scheme,
-                        method=request.method,
-                        title='API request',
-                        path=request.path,
-                        request_data=body,
-                        http_status=response.status_code,
-                        response_data=response_data
-                    )
+            token, _ = self._get_api_token_data(request)
+            if token:
+                if request.method == 'GET':
+                    body = redact_log_data({
+                        key: value if len(value) > 1 else value[0]
+                        for key, value in request.GET.lists()
+                    })
+                else:
+                    body = self._get_body_to_log(request)
+                response_data = (
+                    response.data if hasattr(response, 'data') else None
+                )
+                AccountLogService().api_request(
+                    user=request.user,
+                    ip=self.get_user_ip(request),
+                    user_agent=self.get_user_agent(request),
+                    auth_token=token,
+                    scheme=request.scheme,
+                    method=request.method,
+                    title='API request',
+                    path=request.path,
+                    request_data=body,
+                    http_status=response.status_code,
+                    response_data=response_data
+                )
         return response
@@ -1,5 +1,4 @@
-import json
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 from django.core.cache import cache as default_cache
 from django.contrib.auth import get_user_model
 from rest_framework import HTTP_HEADER_ENCODING
@@ -31,6 +30,8 @@ UserModel = get_user_model()
 class GuestJWTAuthService(JWTAuthentication):
 
     CACHE_TIMEOUT = 86400  # day
+    NEGATIVE_CACHE_TIMEOUT = 300
+    USER_CACHE_TIMEOUT = 300
     cache = default_cache
 
     @classmethod
@@ -125,57 +126,65 @@ class GuestJWTAuthService(JWTAuthentication):
             return user
 
     @classmethod
-    def _get_cache_key(cls, task_id: int) -> str:
-        return f'task-{task_id}-guests'
+    def _get_cache_key(cls, task_id: int, user_id: int) -> str:
+        return f'task-{task_id}-guest-{user_id}'
 
     @classmethod
-    def _get_task_cached_value(cls, task_id: int) -> dict:
+    def _get_user_cache_key(cls, user_id: int) -> str:
+        return f'guest-{user_id}'
 
-        """ Returns dict with task guests statues.
-            If cache empty or invalid returns empty dict
+    @classmethod
+    def _get_tasks_guests_ids(
+        cls,
+        task_ids: Iterable[int],
+    ) -> List[Tuple[int, int]]:
 
-            For example:
-            task cache value = {
-               user_id_1: GuestCachedStatus.ACTIVE
-               user_id_N: GuestCachedStatus.INACTIVE
-            }
-        """
+        """ Returns pairs (task_id, user_id) of the tasks guests """
 
-        key = cls._get_cache_key(task_id)
-        json_value = cls.cache.get(key, {})
-        if not isinstance(json_value, str):
-            value = {}
-        else:
-            value = json.loads(json_value)
-            if not isinstance(value, dict):
-                value = {}
-        return value
+        from src.processes.models import TaskPerformer
+        return list(
+            TaskPerformer.objects
+            .filter(task_id__in=task_ids)
+            .guests()
+            .values_list('task_id', 'user_id')
+        )
 
     @classmethod
     def _set_guest_cache(
         cls,
         task_id: int,
+        user_id: int,
         status: GuestCachedStatus,
-        user_id: Optional[int] = None
+        timeout: Optional[int] = None,
     ):
 
-        """ Store in cache guests status for task.
-            If 'user_id' not specified - sets status for all task guests.
+        """ Store in cache the guest status for task.
+            Each guest has own key, so the update does not need
+            to read the statuses of other task guests """
 
-            For example:
-            task cache value = {
-               user_id: GuestCachedStatus.ACTIVE
-            }
-        """
+        cls.cache.set(
+            cls._get_cache_key(task_id, user_id),
+            status,
+            timeout or cls.CACHE_TIMEOUT
+        )
 
-        key = cls._get_cache_key(task_id)
-        value = cls._get_task_cached_value(task_id)
-        if user_id:
-            value[str(user_id)] = status
-        else:
-            for elem in value.keys():
-                value[elem] = status
-        cls.cache.set(key, json.dumps(value), cls.CACHE_TIMEOUT)
+    @classmethod
+    def _set_tasks_guests_cache(
+        cls,
+        task_ids: Iterable[int],
+        status: GuestCachedStatus,
+    ):
+
+        """ Store in cache the status for all guests of the tasks
+            with one query and one cache request """
+
+        cls.cache.set_many(
+            {
+                cls._get_cache_key(task_id, user_id): status
+                for task_id, user_id in cls._get_tasks_guests_ids(task_ids)
+            },
+            cls.CACHE_TIMEOUT
+        )
 
     @classmethod
     def deactivate_task_guest_cache(
@@ -183,13 +192,28 @@ class GuestJWTAuthService(JWTAuthentication):
         task_id: int,
         user_id: Optional[int] = None
     ):
-        """ Set the guest status active in cache
+        """ Set the guest status inactive in cache
             It means that guest user will receive and permission denied error
-            for next request """
+            for next request.
+            If 'user_id' not specified - sets status for all task guests """
 
-        cls._set_guest_cache(
-            task_id=task_id,
-            user_id=user_id,
+        if user_id:
+            cls._set_guest_cache(
+                task_id=task_id,
+                user_id=user_id,
+                status=GuestCachedStatus.INACTIVE
+            )
+        else:
+            cls.deactivate_tasks_guest_cache(task_ids=[task_id])
+
+    @classmethod
+    def deactivate_tasks_guest_cache(cls, task_ids: Iterable[int]):
+
+        """ Set the status inactive for all guests of the tasks,
+            used when the task completed or the workflow finished """
+
+        cls._set_tasks_guests_cache(
+            task_ids=task_ids,
             status=GuestCachedStatus.INACTIVE
         )
 
@@ -201,60 +225,81 @@ class GuestJWTAuthService(JWTAuthentication):
     ):
         """ Set the guest status active in cache
             It means that the guest will be authenticated quickly
-            (using cache value) during the day (CACHE_TIMEOUT) """
+            (using cache value) during the day (CACHE_TIMEOUT).
+            If 'user_id' not specified - sets status for all task guests """
 
-        cls._set_guest_cache(
-            task_id=task_id,
-            user_id=user_id,
-            status=GuestCachedStatus.ACTIVE
-        )
+        if user_id:
+            cls._set_guest_cache(
+                task_id=task_id,
+                user_id=user_id,
+                status=GuestCachedStatus.ACTIVE
+            )
+        else:
+            cls._set_tasks_guests_cache(
+                task_ids=[task_id],
+                status=GuestCachedStatus.ACTIVE
+            )
 
     @classmethod
     def delete_task_guest_cache(
         cls,
         task_id: int
     ):
-        key = cls._get_cache_key(task_id)
-        cls.cache.delete(key)
+        cls.cache.delete_many([
+            cls._get_cache_key(task_id, user_id)
+            for task_id, user_id in cls._get_tasks_guests_ids([task_id])
+        ])
 
     def get_cached_user(self, validated_token: GuestToken) -> UserModel:
 
         """ Uses for quick access to the user instance.
-            First gets user form db and then sets the value in the cache
-            for quick access during the day (CACHE_TIMEOUT).
-
-            The structure of the data in the cache for each task with guests:
-            task_cache_key : {
-               user_1_id: GuestCachedStatus.ACTIVE,
-               user_2_id: GuestCachedStatus.INACTIVE,
-               ...
-            }
-        """
+            The guest status for the task and the user instance
+            are read from the cache with one request.
 
-        user_id = str(validated_token['user_id'])
+            The status is cached during the day (CACHE_TIMEOUT),
+            the user instance and the status of the failed
+            authentication expire faster, so the changes
+            of the user and the task made without the cache update
+            are applied soon """
+
+        user_id = validated_token['user_id']
         task_id = validated_token['task_id']
-        key = self._get_cache_key(task_id)
-        value = self._get_task_cached_value(task_id)
-        guest_status = value.get(user_id)
-        if guest_status == GuestCachedStatus.ACTIVE:
-            try:
-                user = UserModel.guests_objects.get(id=user_id)
-            except UserModel.DoesNotExist:
-                value[user_id] = GuestCachedStatus.INACTIVE
-                self.cache.set(key, json.dumps(value), self.CACHE_TIMEOUT)
-                raise AuthenticationFailed(MSG_AU_0009)
-        elif guest_status == GuestCachedStatus.INACTIVE:
+        status_key = self._get_cache_key(task_id, user_id)
+        user_key = self._get_user_cache_key(user_id)
+        values = self.cache.get_many([status_key, user_key])
+        guest_status = values.get(status_key)
+        if guest_status == GuestCachedStatus.INACTIVE:
             raise AuthenticationFailed(MSG_AU_0009)
-        else:
-            try:
-                user = self.get_user(validated_token)
-            except AuthenticationFailed:
-                value[user_id] = GuestCachedStatus.INACTIVE
-                raise
-            else:
-                value[user_id] = GuestCachedStatus.ACTIVE
-            finally:
-                self.cache.set(key, json.dumps(value), self.CACHE_TIMEOUT)
+        if guest_status == GuestCachedStatus.ACTIVE:
+            user = values.get(user_key)
+            if user is None:
+                try:
+                    user = UserModel.guests_objects.get(id=user_id)
+                except UserModel.DoesNotExist:
+                    self._set_guest_cache(
+                        task_id=task_id,
+                        user_id=user_id,
+                        status=GuestCachedStatus.INACTIVE
+                    )
+                    raise AuthenticationFailed(MSG_AU_0009)
+                self.cache.set(user_key, user, self.USER_CACHE_TIMEOUT)
+            return user
+        try:
+            user = self.get_user(validated_token)
+        except AuthenticationFailed:
+            self._set_guest_cache(
+                task_id=task_id,
+                user_id=user_id,
+                status=GuestCachedStatus.INACTIVE,
+                timeout=self.NEGATIVE_CACHE_TIMEOUT,
+            )
+            raise
+        self._set_guest_cache(
+            task_id=task_id,
+            user_id=user_id,
+            status=GuestCachedStatus.ACTIVE
+        )
+        self.cache.set(user_key, user, self.USER_CACHE_TIMEOUT)
         return user
 
     def authenticate(self, request) -> Tuple[UserModel, GuestToken]:
@@ -1,14 +1,17 @@
 # pylint: disable=broad-except
 
 import json
-from typing import Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple, Union
 
 import msal
 import requests
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import transaction
 
-from src.accounts.enums import SourceType, UserType
+from src.accounts.enums import SourceType, UserStatus, UserType
 from src.accounts.models import Account, Contact
 from src.authentication.entities import UserData
 from src.authentication.models import AccessToken
@@ -27,8 +30,6 @@ UserModel = get_user_model()
 
 class MicrosoftGraphApiMixin:
 
-    api_url = 'https://graph.microsoft.com/v1.0/'
-
     me_path = (
         'me?$select=id,givenName,surname,jobTitle,'
         'mail,userPrincipalName,userType,creationType'
@@ -37,6 +38,10 @@ class MicrosoftGraphApiMixin:
         'users?$select=id,givenName,surname,jobTitle,'
         'mail,userPrincipalName,userType,creationType'
     )
+    users_delta_path = (
+        'users/delta?$select=id,givenName,surname,jobTitle,'
+        'mail,userPrincipalName,userType,creationType'
+    )
     photo_path = 'users/{user_id}/photos/96x96/$value'
 
     ext_map = {
@@ -53,20 +58,30 @@ class MicrosoftGraphApiMixin:
         'image/avif': 'avif',
     }
 
+    @property
+    def api_url(self) -> str:
+        return settings.MS_GRAPH_API_URL
+
     def _graph_api_request(
         self,
         access_token: str,
         path: str,
-        raise_exception=True
+        raise_exception=True,
+        headers: Optional[dict] = None,
     ) -> requests.Response:
 
         """ Authorization_RequestDenied is returned for personal
-            accounts that request a list of users  """
+            accounts that request a list of users.
+            The path may be the absolute URL of the next page  """
 
-        response = requests.get(
-            url=f'{self.api_url}{path}',
-            headers={'Authorization': access_token}
-        )
+        if path.startswith(('http://', 'https://')):
+            url = path
+        else:
+            url = f'{self.api_url}{path}'
+        request_headers = {'Authorization': access_token}
+        if headers:
+            request_headers.update(headers)
+        response = requests.get(url=url, headers=request_headers)
         if not response.ok and raise_exception:
             data = response.json()
             if data['error'].get('code') != 'Authorization_RequestDenied':
@@ -74,7 +89,7 @@ class MicrosoftGraphApiMixin:
                     message='Microsoft Graph API return an error',
                     data={
                         'response_data': data,
-                        'uri': f'{self.api_url}{path}'
+                        'uri': url
                     },
                     level=SentryLogLevel.ERROR
                 )
@@ -112,10 +127,14 @@ class MicrosoftGraphApiMixin:
         )
         return response.json()
 
-    def _get_users(self, access_token: str) -> list:
+    def _get_users(
+        self,
+        access_token: str,
+        path: Optional[str] = None,
+    ) -> dict:
 
         response = self._graph_api_request(
-            path=self.users_path,
+            path=path or self.users_path,
             access_token=access_token
         )
         try:
@@ -149,21 +168,60 @@ class MicrosoftGraphApiMixin:
             raise_exception=False
         )
         if response.ok:
-            binary_photo: bytes = response.content
-            content_type = response.headers['content-type']
-            ext = self.ext_map.get(content_type, '')
-            if ext:
-                filepath = f'{get_salt(30)}_photo_96x96.{ext}'
-            else:
-                filepath = f'{get_salt(30)}_photo_96x96'
-            storage = GoogleCloudService(account=account)
-            public_url = storage.upload_from_binary(
-                binary=binary_photo,
-                filepath=filepath,
-                content_type=content_type
+            public_url = self._upload_photo(
+                response=response,
+                storage=GoogleCloudService(account=account)
             )
         return public_url
 
+    def _upload_photo(
+        self,
+        response: requests.Response,
+        storage: GoogleCloudService,
+    ) -> str:
+        binary_photo: bytes = response.content
+        content_type = response.headers['content-type']
+        ext = self.ext_map.get(content_type, '')
+        if ext:
+            filepath = f'{get_salt(30)}_photo_96x96.{ext}'
+        else:
+            filepath = f'{get_salt(30)}_photo_96x96'
+        return storage.upload_from_binary(
+            binary=binary_photo,
+            filepath=filepath,
+            content_type=content_type
+        )
+
+    def _get_contact_photo(
+        self,
+        access_token: str,
+        user_id: str,
+        storage: GoogleCloudService,
+        etag: Optional[str] = None,
+    ) -> Optional[Tuple[Optional[str], Optional[str]]]:
+
+        """ Returns the public URL and the ETag of the photo
+            or None if the photo is not changed since the given ETag.
+            The missing photo returns (None, None) """
+
+        response = self._graph_api_request(
+            path=self.photo_path.format(user_id=user_id),
+            access_token=access_token,
+            raise_exception=False,
+            headers={'If-None-Match': etag} if etag else None,
+        )
+        if response.status_code == 304:
+            return None
+        if response.status_code == 404:
+            return None, None
+        if not response.ok:
+            # Keep the current photo until the next sync
+            return None
+        new_etag = response.headers.get('ETag')
+        if etag and new_etag == etag:
+            return None
+        return self._upload_photo(response=response, storage=storage), new_etag
+
 
 class MicrosoftAuthService(
     CacheMixin,
@@ -172,6 +230,14 @@ class MicrosoftAuthService(
 
     cache_key_prefix = 'ms_flow'
     cache_timeout = 600  # 10 min
+    # The delta tokens of the directory objects are valid for 7 days
+    delta_link_key_prefix = 'ms_contacts_delta'
+    delta_link_timeout = 518400  # 6 days
+    contact_fields = {
+        'first_name': 'givenName',
+        'last_name': 'surname',
+        'job_title': 'jobTitle',
+    }
     scopes = [
         'User.Read.All',
         'User.Read',
@@ -447,47 +513,207 @@ class MicrosoftAuthService(
             company_name=None,
         )
 
+    def _get_users_delta(
+        self,
+        access_token: str,
+        delta_link: Optional[str] = None,
+    ) -> Tuple[List[dict], Optional[str]]:
+
+        """ Follows all pages of the delta query of the users.
+            Returns the profiles changed since the delta link
+            (all profiles without the link) and the link for the next sync """
+
+        profiles = []
+        next_delta_link = None
+        path = delta_link or self.users_delta_path
+        while path:
+            data = self._get_users(access_token, path=path)
+            profiles.extend(data['value'])
+            path = data.get('@odata.nextLink')
+            next_delta_link = data.get('@odata.deltaLink')
+        return profiles, next_delta_link
+
+    def _get_contacts_photos(
+        self,
+        access_token: str,
+        account: Account,
+        etags: Dict[str, Optional[str]],
+    ) -> Dict[str, Optional[Tuple[Optional[str], Optional[str]]]]:
+
+        """ Downloads the photos concurrently, skips the photos
+            with unchanged ETag. Returns the result by the user id """
+
+        if not settings.PROJECT_CONF['STORAGE'] or not etags:
+            return {}
+        storage = GoogleCloudService(account=account)
+        with ThreadPoolExecutor(
+            max_workers=settings.MS_CONTACTS_PHOTO_WORKERS
+        ) as executor:
+            futures = {
+                user_id: executor.submit(
+                    self._get_contact_photo,
+                    access_token=access_token,
+                    user_id=user_id,
+                    storage=storage,
+                    etag=etag,
+                )
+                for user_id, etag in etags.items()
+            }
+        photos = {}
+        for user_id, future in futures.items():
+            try:
+                photos[user_id] = future.result()
+            except Exception as ex:
+                capture_sentry_message(
+                    message='Microsoft contact photo is not loaded',
+                    data={'user_id': user_id, 'exception': str(ex)},
+                    level=SentryLogLevel.WARNING
+                )
+                photos[user_id] = None
+        return photos
+
+    def _get_contact_email(
+        self,
+        user_profile: dict,
+        contact: Optional[Contact],
+    ) -> Optional[str]:
+
+        """ The delta query may return the updated user
+            without the unchanged email fields """
+
+        has_email = (
+            'mail' in user_profile.keys()
+            or 'userPrincipalName' in user_profile.keys()
+        )
+        if contact and not has_email:
+            return contact.email
+        return self._get_user_profile_email(user_profile)
+
+    def _save_contacts(
+        self,
+        user: UserModel,
+        access_token: str,
+        profiles: List[dict],
+        response_data: dict,
+    ):
+        contacts = list(Contact.objects.by_user(user.id).microsoft())
+        contacts_by_email = {contact.email: contact for contact in contacts}
+        contacts_by_source_id = {
+            contact.source_id: contact for contact in contacts
+        }
+        removed_ids = []
+        changed_profiles = {}
+        for user_profile in profiles:
+            if '@removed' in user_profile:
+                removed_ids.append(user_profile['id'])
+                continue
+            email = self._get_contact_email(
+                user_profile=user_profile,
+                contact=contacts_by_source_id.get(user_profile['id']),
+            )
+            if email and email != user.email:
+                changed_profiles[email] = user_profile
+
+        photos = self._get_contacts_photos(
+            access_token=access_token,
+            account=user.account,
+            etags={
+                user_profile['id']: getattr(
+                    contacts_by_email.get(email), 'photo_etag', None
+                )
+                for email, user_profile in changed_profiles.items()
+            }
+        )
+        new_contacts = []
+        updated_contacts = []
+        for email, user_profile in changed_profiles.items():
+            contact = contacts_by_email.get(email)
+            created = contact is None
+            if created:
+                contact = Contact(
+                    account=user.account,
+                    user=user,
+                    source=SourceType.MICROSOFT,
+                    email=email,
+                )
+                new_contacts.append(contact)
+                response_data['created_contacts'].append(email)
+            else:
+                updated_contacts.append(contact)
+                response_data['updated_contacts'].append(email)
+            for field_name, profile_key in self.contact_fields.items():
+                if created or profile_key in user_profile:
+                    setattr(contact, field_name, user_profile.get(profile_key))
+            contact.first_name = contact.first_name or email.split('@')[0]
+            contact.source_id = user_profile['id']
+            contact.status = UserStatus.ACTIVE
+            photo = photos.get(user_profile['id'])
+            if photo is not None:
+                contact.photo, contact.photo_etag = photo
+
+        with transaction.atomic():
+            Contact.objects.bulk_create(new_contacts)
+            Contact.objects.bulk_update(
+                updated_contacts,
+                fields=(
+                    'first_name',
+                    'last_name',
+                    'job_title',
+                    'source_id',
+                    'status',
+                    'photo',
+                    'photo_etag',
+                )
+            )
+            if removed_ids:
+                (
+                    Contact.objects
+                    .by_user(user.id)
+                    .microsoft()
+                    .filter(source_id__in=removed_ids)
+                    .update(status=UserStatus.INACTIVE)
+                )
+
     def update_user_contacts(self, user: UserModel):
 
-        """ Save all organization users in contacts """
+        """ Save all organization users in contacts.
+            The first sync requests all users with the delta query,
+            next syncs request only the changes by the saved delta link """
 
         response_data = {'created_contacts': [], 'updated_contacts': []}
-        path = f'{self.api_url}{self.users_path}'
+        delta_link_key = f'{self.delta_link_key_prefix}:{user.id}'
+        delta_link = cache.get(delta_link_key)
+        path = delta_link or f'{self.api_url}{self.users_delta_path}'
         title = f'Contacts request: {user.email}'
         http_status = 200
         try:
             access_token = self._get_access_token(user.id)
-            users_data = self._get_users(access_token)
-            response_data['users_data'] = users_data
-            for user_profile in users_data['value']:
-                email = self._get_user_profile_email(user_profile)
-                if email and email != user.email:
-                    photo = self._get_user_photo(
-                        access_token=access_token,
-                        user_id=user_profile['id'],
-                        account=user.account
-                    )
-                    first_name = (
-                        user_profile['givenName'] or email.split('@')[0]
-                    )
-                    _, created = Contact.objects.update_or_create(
-                        account=user.account,
-                        user=user,
-                        source=SourceType.MICROSOFT,
-                        email=email,
-                        defaults={
-                            'photo': photo,
-                            'first_name': first_name,
-                            'last_name': user_profile['surname'],
-                            'job_title': user_profile['jobTitle'],
-                            'source_id': user_profile['id'],
-                        }
-                    )
-                    if created:
-                        response_data['created_contacts'].append(email)
-                    else:
-                        response_data['updated_contacts'].append(email)
-
+            try:
+                profiles, next_delta_link = self._get_users_delta(
+                    access_token=access_token,
+                    delta_link=delta_link,
+                )
+            except exceptions.GraphApiRequestError:
+                if not delta_link:
+                    raise
+                # The delta token is expired, start the full sync
+                path = f'{self.api_url}{self.users_delta_path}'
+                profiles, next_delta_link = self._get_users_delta(
+                    access_token=access_token,
+                )
+            response_data['users_data'] = {'value': profiles}
+            self._save_contacts(
+                user=user,
+                access_token=access_token,
+                profiles=profiles,
+                response_data=response_data,
+            )
+            if next_delta_link:
+                cache.set(
+                    delta_link_key,
+                    next_delta_link,
+                    self.delta_link_timeout
+                )
         except Exception as ex:
             http_status = 400
             response_data['message'] = str(ex)
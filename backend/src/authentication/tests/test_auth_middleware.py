@@ -157,6 +157,45 @@ def test__get_request_with_query_string__ok(api_client, mocker):
     )
 
 
+def test__get_request_multi_valued_query_params__all_values(
+    api_client,
+    mocker
+):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.data',
+        return_value={
+            'user_id': user.id,
+            'is_superuser': False,
+            'for_api_key': True
+        }
+    )
+    path = '/accounts/account'
+
+    # act
+    response = api_client.get(
+        f'{path}?key_1=Value1&key_1=Value2&key_2=123&password=secret'
+    )
+
+    # assert
+    assert response.status_code == 200
+    event = AccountEvent.objects.get(
+        user=user,
+        method='GET',
+        path=path,
+    )
+    assert event.request_data == {
+        'key_1': ['Value1', 'Value2'],
+        'key_2': '123',
+        'password': '***',
+    }
+
+
 def test__post_request_with_data__ok(api_client, mocker):
 
     # arrange
@@ -318,3 +357,169 @@ def test__bad_request__save_error(api_client, mocker):
     assert event.response_data['details']['reason'] == (
         'This field is required.'
     )
+
+
+def test__post_request_sensitive_data__redacted(api_client, mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.data',
+        return_value={
+            'user_id': user.id,
+            'is_superuser': False,
+            'for_api_key': True
+        }
+    )
+    path = '/accounts/notifications/read'
+    data = {'notifications': [1, 2], 'password': 'secret'}
+
+    # act
+    response = api_client.post(path, data=data)
+
+    # assert
+    assert response.status_code == 204
+    event = AccountEvent.objects.get(
+        user=user,
+        method='POST',
+        path=path,
+    )
+    assert event.request_data == {'notifications': [1, 2], 'password': '***'}
+
+
+def test__post_request_large_body__truncated(api_client, mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.data',
+        return_value={
+            'user_id': user.id,
+            'is_superuser': False,
+            'for_api_key': True
+        }
+    )
+    settings_mock = mocker.patch(
+        'src.authentication.middleware.settings'
+    )
+    settings_mock.API_LOG_MAX_BODY_SIZE = 10
+    path = '/accounts/notifications/read'
+    data = {'notifications': [1, 2]}
+
+    # act
+    response = api_client.post(path, data=data)
+
+    # assert
+    assert response.status_code == 204
+    event = AccountEvent.objects.get(
+        user=user,
+        method='POST',
+        path=path,
+    )
+    assert event.request_data == {
+        'body': '{"notifica',
+        'truncated': True
+    }
+
+
+def test__post_request_disable_log_api_requests__body_not_captured(
+    api_client,
+    mocker
+):
+
+    # arrange
+    account = create_test_account(log_api_requests=False)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.data',
+        return_value={
+            'user_id': user.id,
+            'is_superuser': False,
+            'for_api_key': True
+        }
+    )
+    body_log_stream_mock = mocker.patch(
+        'src.authentication.middleware.BodyLogStream'
+    )
+
+    # act
+    response = api_client.post(
+        '/accounts/notifications/read',
+        data={'notifications': [1, 2]}
+    )
+
+    # assert
+    assert response.status_code == 204
+    body_log_stream_mock.assert_not_called()
+    assert not AccountEvent.objects.all().exists()
+
+
+def test__post_request_cached_log_flag__not_query(api_client, mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    user_model_mock = mocker.patch(
+        'src.authentication.middleware.UserModel'
+    )
+    path = '/accounts/notifications/read'
+    data = {'notifications': [1, 2]}
+
+    # act
+    response = api_client.post(path, data=data)
+
+    # assert
+    assert response.status_code == 204
+    user_model_mock.objects.filter.assert_not_called()
+    event = AccountEvent.objects.get(
+        user=user,
+        method='POST',
+        path=path,
+    )
+    assert event.request_data == data
+
+
+def test__post_request_log_flag_not_cached__update_data(
+    api_client,
+    mocker
+):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    user = create_test_user(account=account)
+    api_client.token_authenticate(user, token_type=AuthTokenType.API)
+    mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.data',
+        return_value={
+            'user_id': user.id,
+            'is_superuser': False,
+            'for_api_key': True
+        }
+    )
+    update_data_mock = mocker.patch(
+        'src.authentication.tokens.'
+        'PneumaticToken.update_data'
+    )
+
+    # act
+    response = api_client.post(
+        '/accounts/notifications/read',
+        data={'notifications': [1, 2]}
+    )
+
+    # assert
+    assert response.status_code == 204
+    update_data_mock.assert_called_once_with(
+        user.apikey.key,
+        log_api_requests=True
+    )
@@ -1,4 +1,3 @@
-import json
 import pytest
 from rest_framework_simplejwt.exceptions import (
     AuthenticationFailed,
@@ -294,18 +293,12 @@ class TestGuestJWTAuthService:
         # assert
         assert ex.value.detail['detail'] == messages.MSG_AU_0009
 
-    def test_set_guest_cache__create_new__ok(self, mocker):
+    def test_set_guest_cache__ok(self, mocker):
 
         # arrange
         task_id = 55
         user_id = 44
-        key = f'task-{task_id}-guests'
-        result_json_value = json.dumps({user_id: GuestCachedStatus.ACTIVE})
-        cache_get_mock = mocker.patch(
-            'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=None
-        )
+        key = f'task-{task_id}-guest-{user_id}'
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
             'GuestJWTAuthService.cache.set'
@@ -320,83 +313,51 @@ class TestGuestJWTAuthService:
         )
 
         # assert
-        cache_get_mock.assert_called_once_with(key, {})
         cache_set_mock.assert_called_once_with(
-            key, result_json_value, service.CACHE_TIMEOUT
+            key, GuestCachedStatus.ACTIVE, service.CACHE_TIMEOUT
         )
 
-    def test_set_guest_cache__update_existent__ok(self, mocker):
+    def test_deactivate_tasks_guest_cache__ok(self, mocker):
 
         # arrange
-        task_id = 55
-        user_id = 44
-        key = f'task-{task_id}-guests'
-        cache_json_value = json.dumps({
-            user_id: GuestCachedStatus.INACTIVE,
-            45: GuestCachedStatus.INACTIVE
-        })
-        result_json_value = json.dumps({
-            user_id: GuestCachedStatus.ACTIVE,
-            45: GuestCachedStatus.INACTIVE
-        })
-        cache_get_mock = mocker.patch(
-            'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=cache_json_value
-        )
-        cache_set_mock = mocker.patch(
-            'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.set'
-        )
-        service = GuestJWTAuthService()
-
-        # act
-        service._set_guest_cache(
-            task_id=task_id,
-            user_id=user_id,
-            status=GuestCachedStatus.ACTIVE
+        account = create_test_account()
+        account_owner = create_test_user(
+            account=account,
+            is_account_owner=True
         )
-
-        # assert
-        cache_get_mock.assert_called_once_with(key, {})
-        cache_set_mock.assert_called_once_with(
-            key, result_json_value, service.CACHE_TIMEOUT
+        guest = create_test_guest(account=account)
+        workflow = create_test_workflow(user=account_owner, tasks_count=2)
+        task_1 = workflow.tasks.get(number=1)
+        task_2 = workflow.tasks.get(number=2)
+        TaskPerformer.objects.create(
+            task_id=task_1.id,
+            user_id=guest.id
         )
-
-    def test_set_guest_cache__for_all_guest_users__ok(self, mocker):
-
-        # arrange
-        task_id = 55
-        key = f'task-{task_id}-guests'
-        cache_json_value = json.dumps({
-            44: GuestCachedStatus.INACTIVE,
-            45: GuestCachedStatus.INACTIVE
-        })
-        result_json_value = json.dumps({
-            44: GuestCachedStatus.ACTIVE,
-            45: GuestCachedStatus.ACTIVE
-        })
-        cache_get_mock = mocker.patch(
-            'src.authentication.services.guest_auth'
-            '.GuestJWTAuthService.cache.get',
-            return_value=cache_json_value
+        TaskPerformer.objects.create(
+            task_id=task_2.id,
+            user_id=guest.id
         )
-        cache_set_mock = mocker.patch(
-            'src.authentication.services.guest_auth'
-            '.GuestJWTAuthService.cache.set',
+        cache_set_many_mock = mocker.patch(
+            'src.authentication.services.guest_auth.'
+            'GuestJWTAuthService.cache.set_many'
         )
-        service = GuestJWTAuthService()
 
         # act
-        service._set_guest_cache(
-            task_id=task_id,
-            status=GuestCachedStatus.ACTIVE
+        GuestJWTAuthService.deactivate_tasks_guest_cache(
+            task_ids=[task_1.id, task_2.id]
         )
 
         # assert
-        cache_get_mock.assert_called_once_with(key, {})
-        cache_set_mock.assert_called_once_with(
-            key, result_json_value, service.CACHE_TIMEOUT
+        cache_set_many_mock.assert_called_once_with(
+            {
+                f'task-{task_1.id}-guest-{guest.id}': (
+                    GuestCachedStatus.INACTIVE
+                ),
+                f'task-{task_2.id}-guest-{guest.id}': (
+                    GuestCachedStatus.INACTIVE
+                ),
+            },
+            GuestJWTAuthService.CACHE_TIMEOUT
         )
 
     def test_deactivate_task_guest_cache__ok(self, mocker):
@@ -422,6 +383,23 @@ class TestGuestJWTAuthService:
             status=GuestCachedStatus.INACTIVE
         )
 
+    def test_deactivate_task_guest_cache__all_guests__ok(self, mocker):
+
+        # act
+        task_id = 55
+        deactivate_tasks_guest_cache_mock = mocker.patch(
+            'src.authentication.services.GuestJWTAuthService'
+            '.deactivate_tasks_guest_cache'
+        )
+
+        # act
+        GuestJWTAuthService.deactivate_task_guest_cache(task_id=task_id)
+
+        # assert
+        deactivate_tasks_guest_cache_mock.assert_called_once_with(
+            task_ids=[task_id]
+        )
+
     def test_activate_task_guest_cache__ok(self, mocker):
 
         # act
@@ -445,6 +423,69 @@ class TestGuestJWTAuthService:
             status=GuestCachedStatus.ACTIVE
         )
 
+    def test_delete_task_guest_cache__ok(self, mocker):
+
+        # arrange
+        account = create_test_account()
+        account_owner = create_test_user(
+            account=account,
+            is_account_owner=True
+        )
+        guest = create_test_guest(account=account)
+        workflow = create_test_workflow(user=account_owner, tasks_count=1)
+        task = workflow.tasks.get(number=1)
+        TaskPerformer.objects.create(
+            task_id=task.id,
+            user_id=guest.id
+        )
+        cache_delete_many_mock = mocker.patch(
+            'src.authentication.services.guest_auth.'
+            'GuestJWTAuthService.cache.delete_many'
+        )
+
+        # act
+        GuestJWTAuthService.delete_task_guest_cache(task_id=task.id)
+
+        # assert
+        cache_delete_many_mock.assert_called_once_with(
+            [f'task-{task.id}-guest-{guest.id}']
+        )
+
+    def test_get_cached_user__active_and_user_cached__ok(self, mocker):
+
+        # arrange
+        user_id = 45
+        task_id = 55
+        status_key = f'task-{task_id}-guest-{user_id}'
+        user_key = f'guest-{user_id}'
+        guest = mocker.Mock(id=user_id)
+        service = GuestJWTAuthService()
+        token = service.get_token(
+            task_id=task_id,
+            user_id=user_id,
+            account_id=35
+        )
+        cache_get_many_mock = mocker.patch(
+            'src.authentication.services.guest_auth.'
+            'GuestJWTAuthService.cache.get_many',
+            return_value={
+                status_key: GuestCachedStatus.ACTIVE,
+                user_key: guest,
+            }
+        )
+        cache_set_mock = mocker.patch(
+            'src.authentication.services.guest_auth.'
+            'GuestJWTAuthService.cache.set'
+        )
+
+        # act
+        user = service.get_cached_user(validated_token=token)
+
+        # assert
+        assert user is guest
+        cache_get_many_mock.assert_called_once_with([status_key, user_key])
+        cache_set_mock.assert_not_called()
+
     def test_get_cached_user__active_and_user_exists__ok(self, mocker):
 
         # arrange
@@ -454,20 +495,18 @@ class TestGuestJWTAuthService:
         )
         guest = create_test_guest(account=owner.account)
         task_id = 55
-        key = f'task-{task_id}-guests'
+        status_key = f'task-{task_id}-guest-{guest.id}'
+        user_key = f'guest-{guest.id}'
         service = GuestJWTAuthService()
         token = service.get_token(
             task_id=task_id,
             user_id=guest.id,
             account_id=guest.account_id
         )
-        cache_json_value = json.dumps({
-            guest.id: GuestCachedStatus.ACTIVE,
-        })
-        cache_get_mock = mocker.patch(
+        cache_get_many_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=cache_json_value
+            'GuestJWTAuthService.cache.get_many',
+            return_value={status_key: GuestCachedStatus.ACTIVE}
         )
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
@@ -481,8 +520,12 @@ class TestGuestJWTAuthService:
 
         # assert
         assert user.id == guest.id
-        cache_get_mock.assert_called_once_with(key, {})
-        cache_set_mock.assert_not_called()
+        cache_get_many_mock.assert_called_once_with([status_key, user_key])
+        cache_set_mock.assert_called_once_with(
+            user_key,
+            user,
+            service.USER_CACHE_TIMEOUT
+        )
 
     def test_get_cached_user__active_and_not_user_exists__raise_exception(
         self,
@@ -493,23 +536,17 @@ class TestGuestJWTAuthService:
         account_id = 35
         user_id = 45
         task_id = 55
-        key = f'task-{task_id}-guests'
+        status_key = f'task-{task_id}-guest-{user_id}'
         service = GuestJWTAuthService()
         token = service.get_token(
             task_id=task_id,
             user_id=user_id,
             account_id=account_id
         )
-        cache_json_value = json.dumps({
-            user_id: GuestCachedStatus.ACTIVE,
-        })
-        result_json_value = json.dumps({
-            user_id: GuestCachedStatus.INACTIVE,
-        })
-        cache_get_mock = mocker.patch(
+        mocker.patch(
             'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=cache_json_value
+            'GuestJWTAuthService.cache.get_many',
+            return_value={status_key: GuestCachedStatus.ACTIVE}
         )
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
@@ -521,10 +558,9 @@ class TestGuestJWTAuthService:
             service.get_cached_user(validated_token=token)
 
         # assert
-        cache_get_mock.assert_called_once_with(key, {})
         cache_set_mock.assert_called_once_with(
-            key,
-            result_json_value,
+            status_key,
+            GuestCachedStatus.INACTIVE,
             service.CACHE_TIMEOUT
         )
 
@@ -537,33 +573,34 @@ class TestGuestJWTAuthService:
         account_id = 35
         user_id = 45
         task_id = 55
-        key = f'task-{task_id}-guests'
+        status_key = f'task-{task_id}-guest-{user_id}'
         service = GuestJWTAuthService()
         token = service.get_token(
             task_id=task_id,
             user_id=user_id,
             account_id=account_id
         )
-        cache_json_value = json.dumps({
-            user_id: GuestCachedStatus.INACTIVE,
-        })
-        cache_get_mock = mocker.patch(
+        mocker.patch(
             'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=cache_json_value
+            'GuestJWTAuthService.cache.get_many',
+            return_value={status_key: GuestCachedStatus.INACTIVE}
         )
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
             'GuestJWTAuthService.cache.set'
         )
+        get_user_mock = mocker.patch(
+            'src.authentication.services.guest_auth.'
+            'GuestJWTAuthService.get_user'
+        )
 
         # act
         with pytest.raises(AuthenticationFailed):
             service.get_cached_user(validated_token=token)
 
         # assert
-        cache_get_mock.assert_called_once_with(key, {})
         cache_set_mock.assert_not_called()
+        get_user_mock.assert_not_called()
 
     def test_get_cached_user__not_in_cache_get_from_db__ok(self, mocker):
 
@@ -574,20 +611,18 @@ class TestGuestJWTAuthService:
         )
         guest = create_test_guest(account=owner.account)
         task_id = 55
-        key = f'task-{task_id}-guests'
+        status_key = f'task-{task_id}-guest-{guest.id}'
+        user_key = f'guest-{guest.id}'
         service = GuestJWTAuthService()
         token = service.get_token(
             task_id=task_id,
             user_id=guest.id,
             account_id=guest.account_id
         )
-        result_json_value = json.dumps({
-            guest.id: GuestCachedStatus.ACTIVE,
-        })
-        cache_get_mock = mocker.patch(
+        mocker.patch(
             'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=None
+            'GuestJWTAuthService.cache.get_many',
+            return_value={}
         )
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
@@ -606,12 +641,14 @@ class TestGuestJWTAuthService:
 
         # assert
         assert user.id == guest.id
-        cache_get_mock.assert_called_once_with(key, {})
-        cache_set_mock.assert_called_once_with(
-            key,
-            result_json_value,
-            service.CACHE_TIMEOUT
-        )
+        cache_set_mock.assert_has_calls([
+            mocker.call(
+                status_key,
+                GuestCachedStatus.ACTIVE,
+                service.CACHE_TIMEOUT
+            ),
+            mocker.call(user_key, guest, service.USER_CACHE_TIMEOUT),
+        ])
         get_user_mock.assert_called_once_with(token)
 
     def test_get_cached_user__not_in_cache_not_in_db__raise_exception(
@@ -623,20 +660,17 @@ class TestGuestJWTAuthService:
         account_id = 35
         user_id = 55
         task_id = 55
-        key = f'task-{task_id}-guests'
+        status_key = f'task-{task_id}-guest-{user_id}'
         service = GuestJWTAuthService()
         token = service.get_token(
             task_id=task_id,
             user_id=user_id,
             account_id=account_id
         )
-        result_json_value = json.dumps({
-            user_id: GuestCachedStatus.INACTIVE,
-        })
-        cache_get_mock = mocker.patch(
+        mocker.patch(
             'src.authentication.services.guest_auth.'
-            'GuestJWTAuthService.cache.get',
-            return_value=None
+            'GuestJWTAuthService.cache.get_many',
+            return_value={}
         )
         cache_set_mock = mocker.patch(
             'src.authentication.services.guest_auth.'
@@ -653,11 +687,10 @@ class TestGuestJWTAuthService:
             service.get_cached_user(validated_token=token)
 
         # assert
-        cache_get_mock.assert_called_once_with(key, {})
         cache_set_mock.assert_called_once_with(
-            key,
-            result_json_value,
-            service.CACHE_TIMEOUT
+            status_key,
+            GuestCachedStatus.INACTIVE,
+            service.NEGATIVE_CACHE_TIMEOUT
         )
         get_user_mock.assert_called_once_with(token)
 
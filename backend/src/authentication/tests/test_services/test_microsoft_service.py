@@ -2,6 +2,8 @@ import json
 from datetime import timedelta
 
 import pytest
+import requests
+from django.core.cache import cache
 from django.utils import timezone
 
 from src.accounts.enums import (
@@ -26,6 +28,41 @@ from src.utils.logging import SentryLogLevel
 
 pytestmark = pytest.mark.django_db
 
+FAKE_GRAPH_URL = 'http://localhost:8081/v1.0/'
+USERS_DELTA_PATH = (
+    'users/delta?$select=id,givenName,surname,jobTitle,'
+    'mail,userPrincipalName,userType,creationType'
+)
+
+
+def create_graph_response(
+    status_code: int = 200,
+    data: dict = None,
+    content: bytes = b'',
+    headers: dict = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(data).encode() if data else content
+    response.headers.update(headers or {})
+    return response
+
+
+class FakeGraphApi:
+
+    """ Replaces requests.get, serves the responses by the URL """
+
+    def __init__(self, routes: dict):
+        self.routes = routes
+        self.requests = []
+
+    def get(self, url: str, headers: dict) -> requests.Response:
+        self.requests.append((url, headers))
+        return self.routes.get(url) or create_graph_response(
+            status_code=404,
+            data={'error': {'code': 'ResourceNotFound'}}
+        )
+
 
 class TestMicrosoftGraphApiMixin:
 
@@ -445,6 +482,105 @@ class TestMicrosoftGraphApiMixin:
         upload_from_binary_mock.assert_not_called()
         assert result is None
 
+    def test_graph_api_request__absolute_url__ok(self, mocker):
+
+        # arrange
+        access_token = '!@#!@#@!wqww23'
+        next_link = f'{FAKE_GRAPH_URL}users/delta?$skiptoken=page2'
+        response_mock = mocker.Mock(ok=True)
+        request_user_mock = mocker.patch(
+            'src.authentication.services.microsoft.requests.get',
+            return_value=response_mock
+        )
+        service = MicrosoftGraphApiMixin()
+
+        # act
+        result = service._graph_api_request(
+            access_token=access_token,
+            path=next_link,
+            headers={'If-None-Match': 'etag'}
+        )
+
+        # assert
+        assert result == response_mock
+        request_user_mock.assert_called_once_with(
+            url=next_link,
+            headers={
+                'Authorization': access_token,
+                'If-None-Match': 'etag',
+            }
+        )
+
+    def test_get_contact_photo__not_modified__return_none(self, mocker):
+
+        # arrange
+        access_token = '!@#!@#@!wqww23'
+        graph_api_request_mock = mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftGraphApiMixin._graph_api_request',
+            return_value=create_graph_response(status_code=304)
+        )
+        storage_mock = mocker.Mock()
+        user_id = 'UQ@SDW@31221'
+        service = MicrosoftGraphApiMixin()
+
+        # act
+        result = service._get_contact_photo(
+            access_token=access_token,
+            user_id=user_id,
+            storage=storage_mock,
+            etag='"etag"'
+        )
+
+        # assert
+        assert result is None
+        graph_api_request_mock.assert_called_once_with(
+            path=f'users/{user_id}/photos/96x96/$value',
+            access_token=access_token,
+            raise_exception=False,
+            headers={'If-None-Match': '"etag"'},
+        )
+        storage_mock.upload_from_binary.assert_not_called()
+
+    def test_get_contact_photo__changed__upload(self, mocker):
+
+        # arrange
+        access_token = '!@#!@#@!wqww23'
+        binary_photo = b'123'
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftGraphApiMixin._graph_api_request',
+            return_value=create_graph_response(
+                content=binary_photo,
+                headers={'content-type': 'image/png', 'ETag': '"new"'}
+            )
+        )
+        salt = '123asd'
+        mocker.patch(
+            'src.authentication.services.microsoft.get_salt',
+            return_value=salt
+        )
+        public_url = 'https://test.com/image.png'
+        storage_mock = mocker.Mock()
+        storage_mock.upload_from_binary.return_value = public_url
+        service = MicrosoftGraphApiMixin()
+
+        # act
+        result = service._get_contact_photo(
+            access_token=access_token,
+            user_id='UQ@SDW@31221',
+            storage=storage_mock,
+            etag='"old"'
+        )
+
+        # assert
+        assert result == (public_url, '"new"')
+        storage_mock.upload_from_binary.assert_called_once_with(
+            binary=binary_photo,
+            filepath=f'{salt}_photo_96x96.png',
+            content_type='image/png'
+        )
+
 
 class TestMicrosoftAuthService:
 
@@ -1256,8 +1392,8 @@ class TestMicrosoftAuthService:
         photo_url = 'https://test.image.com'
         get_user_photo_mock = mocker.patch(
             'src.authentication.services.microsoft.'
-            'MicrosoftAuthService._get_user_photo',
-            return_value=photo_url
+            'MicrosoftAuthService._get_contacts_photos',
+            return_value={user_profile['id']: (photo_url, 'etag')}
         )
         log_mock = mocker.patch(
             'src.authentication.services.microsoft.'
@@ -1283,12 +1419,18 @@ class TestMicrosoftAuthService:
         # assert
         get_auth_client_mock.assert_called_once()
         get_access_token_mock.assert_called_once_with(user.id)
-        get_users_mock.assert_called_once_with(access_token)
+        get_users_mock.assert_called_once_with(
+            access_token,
+            path=(
+                'users/delta?$select=id,givenName,surname,jobTitle,'
+                'mail,userPrincipalName,userType,creationType'
+            )
+        )
         get_user_profile_email_mock.assert_called_once_with(user_profile)
         get_user_photo_mock.assert_called_once_with(
             access_token=access_token,
-            user_id=user_profile['id'],
             account=account,
+            etags={user_profile['id']: None},
         )
         google_contact.refresh_from_db()
         assert google_contact.status == UserStatus.ACTIVE
@@ -1308,7 +1450,7 @@ class TestMicrosoftAuthService:
         log_mock.assert_called_once_with(
             user=user,
             path=(
-                'https://graph.microsoft.com/v1.0/users?$select=id,'
+                'https://graph.microsoft.com/v1.0/users/delta?$select=id,'
                 'givenName,surname,jobTitle,mail,userPrincipalName,'
                 'userType,creationType'
             ),            title=f'Contacts request: {user.email}',
@@ -1316,7 +1458,7 @@ class TestMicrosoftAuthService:
             response_data={
                 'created_contacts': ['login@domain.com'],
                 'updated_contacts': [],
-                'users_data': get_users_response,
+                'users_data': {'value': [user_profile]},
             },
             contractor='Microsoft Graph API',
         )
@@ -1380,8 +1522,8 @@ class TestMicrosoftAuthService:
         photo_url = 'https://test.image.com'
         get_user_photo_mock = mocker.patch(
             'src.authentication.services.microsoft.'
-            'MicrosoftAuthService._get_user_photo',
-            return_value=photo_url
+            'MicrosoftAuthService._get_contacts_photos',
+            return_value={user_profile['id']: (photo_url, 'etag')}
         )
         log_mock = mocker.patch(
             'src.authentication.services.microsoft.'
@@ -1395,12 +1537,18 @@ class TestMicrosoftAuthService:
         # assert
         get_auth_client_mock.assert_called_once()
         get_access_token_mock.assert_called_once_with(user.id)
-        get_users_mock.assert_called_once_with(access_token)
+        get_users_mock.assert_called_once_with(
+            access_token,
+            path=(
+                'users/delta?$select=id,givenName,surname,jobTitle,'
+                'mail,userPrincipalName,userType,creationType'
+            )
+        )
         get_user_profile_email_mock.assert_called_once_with(user_profile)
         get_user_photo_mock.assert_called_once_with(
             access_token=access_token,
-            user_id=user_profile['id'],
             account=account,
+            etags={user_profile['id']: None},
         )
         contact.refresh_from_db()
         assert contact.photo == photo_url
@@ -1408,10 +1556,11 @@ class TestMicrosoftAuthService:
         assert contact.last_name == user_profile['surname']
         assert contact.job_title == user_profile['jobTitle']
         assert contact.source_id == user_profile['id']
+        assert contact.photo_etag == 'etag'
         log_mock.assert_called_once_with(
             user=user,
             path=(
-                'https://graph.microsoft.com/v1.0/users?$select=id,'
+                'https://graph.microsoft.com/v1.0/users/delta?$select=id,'
                 'givenName,surname,jobTitle,mail,userPrincipalName,'
                 'userType,creationType'
             ),
@@ -1420,7 +1569,7 @@ class TestMicrosoftAuthService:
             response_data={
                 'created_contacts': [],
                 'updated_contacts': [email],
-                'users_data': get_users_response,
+                'users_data': {'value': [user_profile]},
             },
             contractor='Microsoft Graph API',
         )
@@ -1441,7 +1590,7 @@ class TestMicrosoftAuthService:
             'MicrosoftAuthService._get_access_token',
             return_value=access_token
         )
-        user_profile = mocker.Mock()
+        user_profile = {'id': '111'}
         get_users_mock = mocker.patch(
             'src.authentication.services.microsoft.'
             'MicrosoftAuthService._get_users',
@@ -1462,7 +1611,8 @@ class TestMicrosoftAuthService:
         )
         get_user_photo_mock = mocker.patch(
             'src.authentication.services.microsoft.'
-            'MicrosoftAuthService._get_user_photo'
+            'MicrosoftAuthService._get_contacts_photos',
+            return_value={}
         )
         log_mock = mocker.patch(
             'src.authentication.services.microsoft.'
@@ -1488,9 +1638,19 @@ class TestMicrosoftAuthService:
         # assert
         get_auth_client_mock.assert_called_once()
         get_access_token_mock.assert_called_once_with(user.id)
-        get_users_mock.assert_called_once_with(access_token)
+        get_users_mock.assert_called_once_with(
+            access_token,
+            path=(
+                'users/delta?$select=id,givenName,surname,jobTitle,'
+                'mail,userPrincipalName,userType,creationType'
+            )
+        )
         get_user_profile_email_mock.assert_called_once_with(user_profile)
-        get_user_photo_mock.assert_not_called()
+        get_user_photo_mock.assert_called_once_with(
+            access_token=access_token,
+            account=user.account,
+            etags={},
+        )
         google_contact.refresh_from_db()
         assert google_contact.status == UserStatus.ACTIVE
         ms_contact.refresh_from_db()
@@ -1514,6 +1674,7 @@ class TestMicrosoftAuthService:
             return_value=access_token
         )
         user_profile = {
+            'id': '111',
             'mail': user.email,
         }
         get_users_mock = mocker.patch(
@@ -1536,7 +1697,8 @@ class TestMicrosoftAuthService:
         )
         get_user_photo_mock = mocker.patch(
             'src.authentication.services.microsoft.'
-            'MicrosoftAuthService._get_user_photo'
+            'MicrosoftAuthService._get_contacts_photos',
+            return_value={}
         )
         log_mock = mocker.patch(
             'src.authentication.services.microsoft.'
@@ -1550,9 +1712,19 @@ class TestMicrosoftAuthService:
         # assert
         get_auth_client_mock.assert_called_once()
         get_access_token_mock.assert_called_once_with(user.id)
-        get_users_mock.assert_called_once_with(access_token)
+        get_users_mock.assert_called_once_with(
+            access_token,
+            path=(
+                'users/delta?$select=id,givenName,surname,jobTitle,'
+                'mail,userPrincipalName,userType,creationType'
+            )
+        )
         get_user_profile_email_mock.assert_called_once_with(user_profile)
-        get_user_photo_mock.assert_not_called()
+        get_user_photo_mock.assert_called_once_with(
+            access_token=access_token,
+            account=user.account,
+            etags={},
+        )
         assert not Contact.objects.filter(
             account=user.account,
             user_id=user.id,
@@ -1603,7 +1775,8 @@ class TestMicrosoftAuthService:
         )
         get_user_photo_mock = mocker.patch(
             'src.authentication.services.microsoft.'
-            'MicrosoftAuthService._get_user_photo'
+            'MicrosoftAuthService._get_contacts_photos',
+            return_value={}
         )
         log_mock = mocker.patch(
             'src.authentication.services.microsoft.'
@@ -1617,13 +1790,19 @@ class TestMicrosoftAuthService:
         # assert
         get_auth_client_mock.assert_called_once()
         get_access_token_mock.assert_called_once_with(user.id)
-        get_users_mock.assert_called_once_with(access_token)
+        get_users_mock.assert_called_once_with(
+            access_token,
+            path=(
+                'users/delta?$select=id,givenName,surname,jobTitle,'
+                'mail,userPrincipalName,userType,creationType'
+            )
+        )
         get_user_profile_email_mock.assert_not_called()
         get_user_photo_mock.assert_not_called()
         log_mock.assert_called_once_with(
             user=user,
             path=(
-                'https://graph.microsoft.com/v1.0/users?$select=id,'
+                'https://graph.microsoft.com/v1.0/users/delta?$select=id,'
                 'givenName,surname,jobTitle,mail,userPrincipalName,'
                 'userType,creationType'
             ),
@@ -1638,3 +1817,244 @@ class TestMicrosoftAuthService:
             },
             contractor='Microsoft Graph API',
         )
+
+    def test_update_user_contacts__fake_graph_pages__create_all(
+        self,
+        mocker
+    ):
+
+        # arrange
+        user = create_test_user()
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._build_msal_app'
+        )
+        access_token = '!@#!@#@!wqww23'
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._get_access_token',
+            return_value=access_token
+        )
+        settings_mock = mocker.patch(
+            'src.authentication.services.microsoft.settings'
+        )
+        settings_mock.MS_GRAPH_API_URL = FAKE_GRAPH_URL
+        settings_mock.MS_CONTACTS_PHOTO_WORKERS = 2
+        settings_mock.PROJECT_CONF = {'STORAGE': True}
+        mocker.patch.object(
+            GoogleCloudService,
+            attribute='__init__',
+            return_value=None
+        )
+        public_url = 'https://test.com/image.png'
+        upload_from_binary_mock = mocker.patch(
+            'src.storage.google_cloud.GoogleCloudService.'
+            'upload_from_binary',
+            return_value=public_url
+        )
+        next_link = f'{FAKE_GRAPH_URL}users/delta?$skiptoken=page2'
+        delta_link = f'{FAKE_GRAPH_URL}users/delta?$deltatoken=token'
+        graph = FakeGraphApi(routes={
+            f'{FAKE_GRAPH_URL}{USERS_DELTA_PATH}': create_graph_response(
+                data={
+                    'value': [{
+                        'id': '111',
+                        'mail': 'first@test.test',
+                        'givenName': 'First',
+                        'surname': None,
+                        'jobTitle': None,
+                    }],
+                    '@odata.nextLink': next_link,
+                }
+            ),
+            next_link: create_graph_response(
+                data={
+                    'value': [{
+                        'id': '222',
+                        'mail': 'second@test.test',
+                        'givenName': None,
+                        'surname': 'Second',
+                        'jobTitle': 'QA',
+                    }],
+                    '@odata.deltaLink': delta_link,
+                }
+            ),
+            f'{FAKE_GRAPH_URL}users/111/photos/96x96/$value': (
+                create_graph_response(
+                    content=b'123',
+                    headers={'content-type': 'image/png', 'ETag': '"e1"'}
+                )
+            ),
+        })
+        mocker.patch(
+            'src.authentication.services.microsoft.requests.get',
+            side_effect=graph.get
+        )
+        service = MicrosoftAuthService()
+
+        # act
+        service.update_user_contacts(user)
+
+        # assert
+        first = Contact.objects.get(user=user, email='first@test.test')
+        assert first.first_name == 'First'
+        assert first.source_id == '111'
+        assert first.photo == public_url
+        assert first.photo_etag == '"e1"'
+        second = Contact.objects.get(user=user, email='second@test.test')
+        assert second.first_name == 'second'
+        assert second.last_name == 'Second'
+        assert second.job_title == 'QA'
+        assert second.photo is None
+        upload_from_binary_mock.assert_called_once()
+        assert cache.get(f'ms_contacts_delta:{user.id}') == delta_link
+
+    def test_update_user_contacts__delta_link__save_changes(self, mocker):
+
+        # arrange
+        user = create_test_user()
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._build_msal_app'
+        )
+        access_token = '!@#!@#@!wqww23'
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._get_access_token',
+            return_value=access_token
+        )
+        settings_mock = mocker.patch(
+            'src.authentication.services.microsoft.settings'
+        )
+        settings_mock.MS_GRAPH_API_URL = FAKE_GRAPH_URL
+        settings_mock.MS_CONTACTS_PHOTO_WORKERS = 2
+        settings_mock.PROJECT_CONF = {'STORAGE': True}
+        mocker.patch.object(
+            GoogleCloudService,
+            attribute='__init__',
+            return_value=None
+        )
+        upload_from_binary_mock = mocker.patch(
+            'src.storage.google_cloud.GoogleCloudService.'
+            'upload_from_binary'
+        )
+        photo_url = 'https://test.com/image.png'
+        updated_contact = Contact.objects.create(
+            account=user.account,
+            user=user,
+            source=SourceType.MICROSOFT,
+            email='first@test.test',
+            first_name='First',
+            source_id='111',
+            photo=photo_url,
+            photo_etag='"e1"',
+        )
+        removed_contact = Contact.objects.create(
+            account=user.account,
+            user=user,
+            source=SourceType.MICROSOFT,
+            email='second@test.test',
+            source_id='222',
+        )
+        delta_link = f'{FAKE_GRAPH_URL}users/delta?$deltatoken=token'
+        cache.set(f'ms_contacts_delta:{user.id}', delta_link)
+        next_delta_link = f'{FAKE_GRAPH_URL}users/delta?$deltatoken=next'
+        photo_link = f'{FAKE_GRAPH_URL}users/111/photos/96x96/$value'
+        graph = FakeGraphApi(routes={
+            delta_link: create_graph_response(
+                data={
+                    'value': [
+                        {'id': '111', 'jobTitle': 'CTO'},
+                        {'id': '222', '@removed': {'reason': 'changed'}},
+                    ],
+                    '@odata.deltaLink': next_delta_link,
+                }
+            ),
+            photo_link: create_graph_response(status_code=304),
+        })
+        mocker.patch(
+            'src.authentication.services.microsoft.requests.get',
+            side_effect=graph.get
+        )
+        service = MicrosoftAuthService()
+
+        # act
+        service.update_user_contacts(user)
+
+        # assert
+        updated_contact.refresh_from_db()
+        assert updated_contact.job_title == 'CTO'
+        assert updated_contact.first_name == 'First'
+        assert updated_contact.photo == photo_url
+        assert updated_contact.photo_etag == '"e1"'
+        removed_contact.refresh_from_db()
+        assert removed_contact.status == UserStatus.INACTIVE
+        assert (
+            photo_link,
+            {'Authorization': access_token, 'If-None-Match': '"e1"'}
+        ) in graph.requests
+        upload_from_binary_mock.assert_not_called()
+        assert cache.get(f'ms_contacts_delta:{user.id}') == next_delta_link
+
+    def test_update_user_contacts__expired_delta_link__full_sync(
+        self,
+        mocker
+    ):
+
+        # arrange
+        user = create_test_user()
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._build_msal_app'
+        )
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'MicrosoftAuthService._get_access_token',
+            return_value='!@#!@#@!wqww23'
+        )
+        settings_mock = mocker.patch(
+            'src.authentication.services.microsoft.settings'
+        )
+        settings_mock.MS_GRAPH_API_URL = FAKE_GRAPH_URL
+        settings_mock.PROJECT_CONF = {'STORAGE': False}
+        mocker.patch(
+            'src.authentication.services.microsoft.'
+            'capture_sentry_message'
+        )
+        delta_link = f'{FAKE_GRAPH_URL}users/delta?$deltatoken=expired'
+        cache.set(f'ms_contacts_delta:{user.id}', delta_link)
+        next_delta_link = f'{FAKE_GRAPH_URL}users/delta?$deltatoken=new'
+        graph = FakeGraphApi(routes={
+            delta_link: create_graph_response(
+                status_code=410,
+                data={'error': {'code': 'syncStateNotFound'}}
+            ),
+            f'{FAKE_GRAPH_URL}{USERS_DELTA_PATH}': create_graph_response(
+                data={
+                    'value': [{
+                        'id': '111',
+                        'mail': 'first@test.test',
+                        'givenName': 'First',
+                        'surname': None,
+                        'jobTitle': None,
+                    }],
+                    '@odata.deltaLink': next_delta_link,
+                }
+            ),
+        })
+        mocker.patch(
+            'src.authentication.services.microsoft.requests.get',
+            side_effect=graph.get
+        )
+        service = MicrosoftAuthService()
+
+        # act
+        service.update_user_contacts(user)
+
+        # assert
+        assert Contact.objects.filter(
+            user=user,
+            email='first@test.test',
+            source_id='111',
+        ).exists()
+        assert cache.get(f'ms_contacts_delta:{user.id}') == next_delta_link
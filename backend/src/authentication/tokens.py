@@ -89,11 +89,35 @@ class PneumaticToken:
             'for_api_key': for_api_key,
             'is_superuser': for_superuser,
         }
+        if for_api_key:
+            # Checked by the AuthMiddleware on each api request
+            cache_values['log_api_requests'] = (
+                user.account.log_api_requests
+            )
 
         cls.set_key_value(encrypted_token, cache_values)
         cls.set_key_value(user.pk, tokens)
         return token
 
+    @classmethod
+    def update_data(cls, token: str, **values):
+        encrypted_token = cls.encrypt(token)
+        cached_data = cls.cache.get(encrypted_token)
+        if cached_data:
+            cached_data.update(values)
+            cls.set_key_value(encrypted_token, cached_data)
+
+    @classmethod
+    def update_api_keys_data(cls, user: UserModel, **values):
+
+        """ Updates the cached data of all api keys of the user """
+
+        for encrypted_token in cls.cache.get(user.pk) or []:
+            cached_data = cls.cache.get(encrypted_token)
+            if cached_data and cached_data['for_api_key']:
+                cached_data.update(values)
+                cls.set_key_value(encrypted_token, cached_data)
+
     @classmethod
     def set_user_token(cls, token: str, user: UserModel):
         encrypted_token = cls.encrypt(token)
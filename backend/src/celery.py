@@ -1,13 +1,14 @@
 import os
+import time
 import firebase_admin
-from datetime import timedelta
 from contextlib import contextmanager
 from celery import Celery
+from celery.signals import before_task_publish, task_prerun
 from typing import Optional
-from django.core.cache import cache
 from django.conf import settings
 from configurations import importer
-from django.utils import timezone
+from src.locks import LockLease, LockStats
+from src.queue_stats import mark_published, record_latency
 
 configuration = os.getenv('ENVIRONMENT', 'Development').title()
 os.environ.setdefault('DJANGO_CONFIGURATION', configuration)
@@ -51,6 +52,8 @@ celery_app = Celery(
 )
 celery_app.conf.setdefault('broker_login_method', 'PLAIN')
 celery_app.config_from_object('django.conf:settings')
+before_task_publish.connect(mark_published)
+task_prerun.connect(record_latency)
 
 
 default_lock_expire = 60 * 10  # Lock expires in 10 minutes
@@ -63,13 +66,27 @@ def periodic_lock(
 ):
 
     """ Ensuring a periodic task is only executed one at a time
-        https://docs.celeryq.dev/en/stable/tutorials/task-cookbook.html """
+        https://docs.celeryq.dev/en/stable/tutorials/task-cookbook.html
 
-    lock_expire = lock_expire or default_lock_expire
-    timeout_at = timezone.now() + timedelta(seconds=lock_expire)
-    status = cache.add(lock_id, celery_app.oid, lock_expire)
+        The job should run inside the "with" block: the lease is renewed
+        while the block runs and released at the exit.
+        Yields the LockLease, which is false if the lock is taken """
+
+    lease = LockLease(
+        lock_id=lock_id,
+        lock_expire=lock_expire or default_lock_expire
+    )
+    lease.acquire()
+    started = time.monotonic()
     try:
-        yield status
+        yield lease
     finally:
-        if timezone.now() < timeout_at and status:
-            cache.delete(lock_id)
+        if lease:
+            lease.release()
+            LockStats.incr(
+                lock_id,
+                acquired=1,
+                sum_ms=(time.monotonic() - started) * 1000
+            )
+        else:
+            LockStats.incr(lock_id, contended=1)
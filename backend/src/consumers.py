@@ -13,6 +13,8 @@ class PneumaticBaseConsumer(AsyncWebsocketConsumer):
     HEARTBEAT_PING_MESSAGE = 'PING'
     HEARTBEAT_PONG_MESSAGE = 'PONG'
     classname = None
+    # The group of all connections of the consumer
+    broadcast_group_name = None
 
     async def validate_connection(self):
         if self.scope['user'].is_anonymous:
@@ -28,6 +30,11 @@ class PneumaticBaseConsumer(AsyncWebsocketConsumer):
             room_group_name,
             self.channel_name,
         )
+        if self.broadcast_group_name:
+            await self.channel_layer.group_add(
+                self.broadcast_group_name,
+                self.channel_name,
+            )
 
         await self.accept()
 
@@ -39,6 +46,11 @@ class PneumaticBaseConsumer(AsyncWebsocketConsumer):
                 room_group_name,
                 self.channel_name,
             )
+        if self.broadcast_group_name:
+            await self.channel_layer.group_discard(
+                self.broadcast_group_name,
+                self.channel_name,
+            )
 
     async def notification(self, event):
         await self.send(
@@ -0,0 +1,151 @@
+import re
+import threading
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+
+class ReadState(threading.local):
+
+    """ Read routing state of the current request.
+        Routing to the replica is enabled only inside a request,
+        celery tasks and commands always read from the primary """
+
+    enabled = False
+    has_writes = False
+
+
+read_state = ReadState()
+
+
+class ReplicaRouter:
+
+    """ Objects loaded from the replica are always saved to the primary """
+
+    def db_for_read(self, model, **hints):
+        return None
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaLag:
+
+    cache_key = 'db:replica_lag'
+    cache_timeout = 5
+    # Lag of the unavailable replica, reads go to the primary
+    unavailable_lag = float('inf')
+    unavailable_timeout = 30
+
+    query = """
+        SELECT CASE
+          WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+          ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+        END
+    """
+
+    @classmethod
+    def get(cls) -> float:
+
+        """ Returns the replica lag in seconds, cached for a few seconds
+            to not ask the replica before each query.
+            The unavailable replica is not asked again for a while """
+
+        lag = cache.get(cls.cache_key)
+        if lag is None:
+            try:
+                with connections[settings.REPLICA].cursor() as cursor:
+                    cursor.execute(cls.query)
+                    lag = float(cursor.fetchone()[0] or 0)
+            except DatabaseError:
+                lag = cls.unavailable_lag
+                cache.set(cls.cache_key, lag, cls.unavailable_timeout)
+            else:
+                cache.set(cls.cache_key, lag, cls.cache_timeout)
+        return lag
+
+
+def replica_enabled() -> bool:
+    return (
+        settings.REPLICA_READS
+        and settings.REPLICA in settings.DATABASES
+    )
+
+
+write_sql_pattern = re.compile(
+    r'\b(INSERT|UPDATE|DELETE|NEXTVAL|SETVAL)\b',
+    flags=re.IGNORECASE
+)
+
+
+def get_statement(sql: str) -> str:
+
+    """ Returns the first keyword of the sql, skips the query label """
+
+    sql = sql.lstrip()
+    if sql.startswith('/*'):
+        sql = sql[sql.find('*/') + 2:].lstrip()
+    return sql[:6].upper()
+
+
+def is_read_sql(sql: str) -> bool:
+    return (
+        get_statement(sql).startswith(('SELECT', 'WITH'))
+        and write_sql_pattern.search(sql) is None
+    )
+
+
+def get_read_db(sql: str) -> str:
+
+    """ Returns the database alias for the query.
+        Only read only queries go to the replica, the primary is used
+        after a write in the same request, inside a transaction
+        and when the replica lags behind """
+
+    if (
+        not read_state.enabled
+        or read_state.has_writes
+        or not replica_enabled()
+        or not is_read_sql(sql)
+        or connections[DEFAULT_DB_ALIAS].in_atomic_block
+    ):
+        return DEFAULT_DB_ALIAS
+    if ReplicaLag.get() > settings.REPLICA_MAX_LAG_SECONDS:
+        return DEFAULT_DB_ALIAS
+    return settings.REPLICA
+
+
+class ReadRoutingMiddleware:
+
+    """ Enables reads from the replica for the request
+        and tracks writes to the primary """
+
+    write_statements = ('INSERT', 'UPDATE', 'DELETE')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def _track_writes(self, execute, sql, params, many, context):
+        if get_statement(sql) in self.write_statements:
+            read_state.has_writes = True
+        return execute(sql, params, many, context)
+
+    def __call__(self, request):
+        if not replica_enabled():
+            return self.get_response(request)
+        read_state.enabled = True
+        read_state.has_writes = False
+        try:
+            with connections[DEFAULT_DB_ALIAS].execute_wrapper(
+                self._track_writes
+            ):
+                return self.get_response(request)
+        finally:
+            read_state.enabled = False
+            read_state.has_writes = False
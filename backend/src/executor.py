@@ -1,31 +1,68 @@
-from django.db import connections
+import logging
+import time
+from typing import Optional
+from django.db import connections, DEFAULT_DB_ALIAS
+from src.db_routing import get_read_db
+
+
+logger = logging.getLogger('src.executor')
+
+
+def log_query(query: str, db: str, started: float, row_count: int):
+    logger.debug(
+        'sql query: %.2f ms, %s rows, db "%s"\n%s',
+        (time.perf_counter() - started) * 1000,
+        row_count,
+        db,
+        query,
+    )
 
 
 class RawSqlExecutor:
 
+    """ Read queries are routed to the replica if "db" is not specified,
+        see src.db_routing.get_read_db """
+
     @staticmethod
-    def exists(query, params, db='default'):
+    def exists(query, params, db: Optional[str] = None):
+        db = db or get_read_db(query)
+        started = time.perf_counter()
         with connections[db].cursor() as cursor:
             cursor.execute(query, params)
-            return bool(cursor.fetchone())
+            result = bool(cursor.fetchone())
+        log_query(query, db, started, int(result))
+        return result
 
     @staticmethod
-    def fetchone(query, params, db='default'):
+    def fetchone(query, params, db: Optional[str] = None):
+        db = db or get_read_db(query)
+        started = time.perf_counter()
         with connections[db].cursor() as cursor:
             cursor.execute(query, params)
             columns = [col[0] for col in cursor.description]
-            return [
-                dict(zip(columns, row))
-                for row in cursor.fetchall()
-            ][0]
+            rows = cursor.fetchall()
+        log_query(query, db, started, len(rows))
+        return [dict(zip(columns, row)) for row in rows][0]
 
     @staticmethod
-    def execute(query, params, db='default'):
+    def execute(query, params, db: str = DEFAULT_DB_ALIAS):
+        started = time.perf_counter()
         with connections[db].cursor() as cursor:
             cursor.execute(query, params)
+            row_count = cursor.rowcount
+        log_query(query, db, started, row_count)
 
     @staticmethod
-    def fetch(query, params, stream=False, fetch_size=300, db='default'):
+    def fetch(
+        query,
+        params,
+        stream=False,
+        fetch_size=300,
+        db: Optional[str] = None
+    ):
+        db = db or get_read_db(query)
+        started = time.perf_counter()
+        row_count = 0
         with connections[db].cursor() as cursor:
             cursor.execute(query, params)
             columns = [col[0] for col in cursor.description]
@@ -35,6 +72,9 @@ class RawSqlExecutor:
                     if not results:
                         break
                     for row in results:
+                        row_count += 1
                         yield dict(zip(columns, row))
             for row in cursor.fetchall():
+                row_count += 1
                 yield dict(zip(columns, row))
+        log_query(query, db, started, row_count)
@@ -0,0 +1,56 @@
+import time
+from django.conf import settings
+from src.locks import get_redis
+
+
+TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local bucket = redis.call('hmget', KEYS[1], 'tokens', 'updated')
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - updated) * rate)
+local wait = 0
+if tokens >= 1 then
+  tokens = tokens - 1
+else
+  wait = (1 - tokens) / rate
+end
+redis.call('hset', KEYS[1], 'tokens', tokens, 'updated', now)
+redis.call('expire', KEYS[1], math.ceil(capacity / rate) + 1)
+return tostring(wait)
+"""
+
+
+class AccountTokenBucket:
+
+    """ Fair share of the heavy tasks between the accounts.
+
+        Each chunk of the heavy task takes a token of the account bucket.
+        The bucket is refilled with ACCOUNT_TASKS_BUCKET_RATE tokens
+        per second up to ACCOUNT_TASKS_BUCKET_CAPACITY. The task
+        of the account with the empty bucket is postponed, so the queue
+        is shared with the tasks of the other accounts """
+
+    key_prefix = 'account_tasks_bucket'
+
+    @classmethod
+    def take(cls, account_id: int) -> float:
+
+        """ Returns 0 if the token is taken,
+            otherwise the seconds to wait for the next token.
+            Without the redis cache backend the token is always taken """
+
+        redis = get_redis()
+        if redis is None:
+            return 0
+        wait = redis.eval(
+            TAKE_SCRIPT,
+            1,
+            f'{cls.key_prefix}:{account_id}',
+            settings.ACCOUNT_TASKS_BUCKET_CAPACITY,
+            settings.ACCOUNT_TASKS_BUCKET_RATE,
+            time.time()
+        )
+        return float(wait)
@@ -0,0 +1 @@
+default_app_config = 'src.generics.apps.GenericsConfig'
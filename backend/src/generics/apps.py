@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class GenericsConfig(AppConfig):
+    name = 'src.generics'
+    verbose_name = u'Generics'
+
+    def ready(self):
+        from src.query_stats import install_query_instrumentation
+        connection_created.connect(install_query_instrumentation)
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from src.query_stats import QueryStats
+
+
+class Command(BaseCommand):
+
+    help = "Show the stats of the SqlQueryObject queries"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--order',
+            choices=('total', 'avg', 'count', 'rows'),
+            default='total',
+        )
+        parser.add_argument('--plans', action='store_true')
+        parser.add_argument('--reset', action='store_true')
+
+    def handle(self, *args, **options):
+        QueryStats.flush()
+        stats = QueryStats.get_stats()
+        rows = []
+        for label, values in stats.items():
+            count = values['count'] or 1
+            rows.append({
+                'label': label,
+                'count': int(values['count']),
+                'total': values['sum_ms'],
+                'avg': values['sum_ms'] / count,
+                'rows': values['rows'] / count,
+            })
+        rows.sort(key=lambda row: row[options['order']], reverse=True)
+
+        self.stdout.write(
+            f'{"query":<60} {"count":>10} {"total ms":>14} '
+            f'{"avg ms":>10} {"avg rows":>10}'
+        )
+        for row in rows:
+            self.stdout.write(
+                f'{row["label"]:<60} {row["count"]:>10} '
+                f'{row["total"]:>14.1f} {row["avg"]:>10.1f} '
+                f'{row["rows"]:>10.1f}'
+            )
+
+        if options['plans']:
+            for label, plan in QueryStats.get_plans().items():
+                self.stdout.write(
+                    self.style.WARNING(
+                        f'\n{label}: {plan["duration_ms"]:.1f} ms '
+                        f'at {plan["date"]}'
+                    )
+                )
+                self.stdout.write('\n'.join(plan['plan']))
+
+        if options['reset']:
+            QueryStats.reset()
+            self.stdout.write(self.style.SUCCESS('Stats are reset'))
@@ -0,0 +1,19 @@
+import math
+
+
+class RateLimitHeadersMiddleware:
+
+    """ Adds the state of the most restrictive throttle of the request
+        to the response, so the clients may pace the requests """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        state = getattr(request, 'throttle_state', None)
+        if state is not None:
+            response['X-RateLimit-Limit'] = state['limit']
+            response['X-RateLimit-Remaining'] = state['remaining']
+            response['X-RateLimit-Reset'] = math.ceil(state['reset'])
+        return response
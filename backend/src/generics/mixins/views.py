@@ -3,9 +3,12 @@ from typing import List, Optional, Tuple
 from django.conf import settings
 from django.core.cache import caches
 from django.http import HttpResponse, HttpResponseRedirect
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.request import Request
+from rest_framework.settings import api_settings
 from src.processes.models import Template
 from src.processes.utils.common import get_prefetch_fields
 
@@ -127,12 +130,48 @@ class BasePaginationMixin:
         return self.response_ok(serializer.data)
 
 
+class ConditionalResponseMixin:
+
+    """ Responds "304 Not Modified" without building the response data
+        when the "If-None-Match" header matches the ETag.
+        The ETag is built from the state of the data, e.g. last change date,
+        the user and the query params """
+
+    def get_etag(self, state: str) -> str:
+        value = (
+            f'{state}:{self.request.user.id}:{self.request.get_full_path()}'
+        )
+        return quote_etag(hashlib.md5(value.encode()).hexdigest())
+
+    def conditional_paginated_response(self, queryset, state: str):
+        etag = self.get_etag(state)
+        response = get_conditional_response(self.request, etag=etag)
+        if response is None:
+            response = self.paginated_response(queryset)
+        response['ETag'] = etag
+        return response
+
+
+class BaseThrottleMixin:
+
+    """ The default throttles, e.g. the account API quota,
+        are checked in addition to the throttles of the view """
+
+    def get_throttles(self):
+        throttle_classes = list(self.throttle_classes)
+        for throttle_class in api_settings.DEFAULT_THROTTLE_CLASSES:
+            if throttle_class not in throttle_classes:
+                throttle_classes.append(throttle_class)
+        return [throttle() for throttle in throttle_classes]
+
+
 class CustomViewSetMixin(
     ActionViewMixin,
     BaseContextMixin,
     BasePrefetchMixin,
     BasePaginationMixin,
     BaseResponseMixin,
+    BaseThrottleMixin,
 ):
     pass
 
@@ -3,6 +3,7 @@ from django.db import transaction
 from django.db.models import QuerySet, Q
 from src.generics.mixins.models import SoftDeleteMixin
 from src.queries import SqlQueryObject
+from src.db_routing import get_read_db
 
 
 class BaseQuerySet(SoftDeleteMixin, QuerySet):
@@ -44,7 +45,11 @@ class BaseQuerySet(SoftDeleteMixin, QuerySet):
         using: Optional[str] = None
     ):
         query, raw_params = query.get_sql()
-        return self.raw(query, raw_params, using=using)
+        return self.raw(
+            query,
+            raw_params,
+            using=using or get_read_db(query)
+        )
 
     def by_id(self, pk):
         return self.filter(id=pk)
@@ -64,7 +69,7 @@ class BaseQuerySet(SoftDeleteMixin, QuerySet):
 class BaseHardQuerySet(QuerySet):
     def execute_raw(self, query: SqlQueryObject):
         query, raw_params = query.get_sql()
-        return self.raw(query, raw_params)
+        return self.raw(query, raw_params, using=get_read_db(query))
 
     def by_id(self, pk):
         return self.filter(id=pk)
@@ -0,0 +1,128 @@
+import threading
+
+import pytest
+from django.core import signals
+from django.http import HttpResponse, StreamingHttpResponse
+from src.asgi_handler import AsgiHandler
+
+
+def get_scope():
+    return {
+        'type': 'http',
+        'method': 'GET',
+        'path': '/',
+        'query_string': b'',
+        'headers': [],
+    }
+
+
+async def receive():
+    return {'type': 'http.request', 'body': b'', 'more_body': False}
+
+
+@pytest.mark.asyncio
+async def test_call__view__run_in_pool_thread(mocker):
+
+    # arrange
+    threads = []
+    messages = []
+
+    def get_response(request):
+        threads.append(threading.current_thread().name)
+        return HttpResponse('ok')
+
+    async def send(message):
+        messages.append(message)
+
+    mocker.patch.object(AsgiHandler, 'get_response', side_effect=get_response)
+    handler = AsgiHandler()
+
+    # act
+    await handler(get_scope(), receive, send)
+
+    # assert
+    assert threads[0].startswith('asgi-http')
+    assert messages[0]['type'] == 'http.response.start'
+    assert messages[0]['status'] == 200
+    assert messages[-1]['body'] == b'ok'
+
+
+@pytest.mark.asyncio
+async def test_call__streaming_response__send_chunks(mocker):
+
+    # arrange
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    mocker.patch.object(
+        AsgiHandler,
+        'get_response',
+        return_value=StreamingHttpResponse(iter([b'first', b'second'])),
+    )
+    handler = AsgiHandler()
+
+    # act
+    await handler(get_scope(), receive, send)
+
+    # assert
+    body = b''.join(message.get('body', b'') for message in messages[1:])
+    assert messages[0]['status'] == 200
+    assert body == b'firstsecond'
+    assert messages[-1].get('more_body', False) is False
+
+
+@pytest.mark.asyncio
+async def test_call__streaming_response__finished_on_serving_thread(mocker):
+
+    # arrange
+    view_threads = []
+    finished_threads = []
+
+    def stream():
+        yield b'chunk'
+
+    def get_response(request):
+        view_threads.append(threading.current_thread().name)
+        return StreamingHttpResponse(stream())
+
+    def request_finished(**kwargs):
+        finished_threads.append(threading.current_thread().name)
+
+    async def send(message):
+        pass
+
+    mocker.patch.object(AsgiHandler, 'get_response', side_effect=get_response)
+    signals.request_finished.connect(request_finished)
+    handler = AsgiHandler()
+
+    # act
+    try:
+        await handler(get_scope(), receive, send)
+    finally:
+        signals.request_finished.disconnect(request_finished)
+
+    # assert
+    assert finished_threads == view_threads
+
+
+@pytest.mark.asyncio
+async def test_call__send_failed__close_response(mocker):
+
+    # arrange
+    response = HttpResponse('ok')
+    close_mock = mocker.patch.object(response, 'close')
+    mocker.patch.object(AsgiHandler, 'get_response', return_value=response)
+
+    async def send(message):
+        raise ConnectionError
+
+    handler = AsgiHandler()
+
+    # act
+    with pytest.raises(ConnectionError):
+        await handler(get_scope(), receive, send)
+
+    # assert
+    close_mock.assert_called_once()
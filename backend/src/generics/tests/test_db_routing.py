@@ -0,0 +1,144 @@
+import pytest
+from django.db import DatabaseError
+from src.db_routing import (
+    ReplicaLag,
+    get_read_db,
+    is_read_sql,
+    read_state,
+)
+
+
+@pytest.fixture
+def replica_settings(mocker):
+    settings_mock = mocker.patch('src.db_routing.settings')
+    settings_mock.REPLICA = 'replica'
+    settings_mock.REPLICA_READS = True
+    settings_mock.REPLICA_MAX_LAG_SECONDS = 5
+    settings_mock.DATABASES = {'default': {}, 'replica': {}}
+    return settings_mock
+
+
+@pytest.fixture
+def request_state():
+    read_state.enabled = True
+    read_state.has_writes = False
+    yield read_state
+    read_state.enabled = False
+    read_state.has_writes = False
+
+
+@pytest.mark.parametrize(
+    'sql',
+    (
+        'SELECT id FROM processes_workflow',
+        '\n  WITH result AS (SELECT 1) SELECT * FROM result',
+    )
+)
+def test_is_read_sql__select__true(sql):
+
+    # act
+    result = is_read_sql(sql)
+
+    # assert
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    'sql',
+    (
+        'UPDATE processes_workflowevent SET watched = %(watched)s',
+        'SELECT id FROM processes_workflow FOR UPDATE',
+        'WITH deleted AS (DELETE FROM a RETURNING id) SELECT * FROM deleted',
+    )
+)
+def test_is_read_sql__write__false(sql):
+
+    # act
+    result = is_read_sql(sql)
+
+    # assert
+    assert result is False
+
+
+def test_get_read_db__request__replica(
+    mocker,
+    replica_settings,
+    request_state
+):
+
+    # arrange
+    mocker.patch('src.db_routing.ReplicaLag.get', return_value=0)
+
+    # act
+    result = get_read_db('SELECT 1')
+
+    # assert
+    assert result == 'replica'
+
+
+def test_get_read_db__outside_request__default(replica_settings):
+
+    # act
+    result = get_read_db('SELECT 1')
+
+    # assert
+    assert result == 'default'
+
+
+def test_get_read_db__after_write__default(
+    mocker,
+    replica_settings,
+    request_state
+):
+
+    # arrange
+    lag_mock = mocker.patch('src.db_routing.ReplicaLag.get', return_value=0)
+    request_state.has_writes = True
+
+    # act
+    result = get_read_db('SELECT 1')
+
+    # assert
+    assert result == 'default'
+    lag_mock.assert_not_called()
+
+
+def test_get_read_db__replica_lag__default(
+    mocker,
+    replica_settings,
+    request_state
+):
+
+    # arrange
+    mocker.patch('src.db_routing.ReplicaLag.get', return_value=10)
+
+    # act
+    result = get_read_db('SELECT 1')
+
+    # assert
+    assert result == 'default'
+
+
+def test_replica_lag__replica_unavailable__cache_unavailable(
+    mocker,
+    replica_settings
+):
+
+    # arrange
+    mocker.patch('src.db_routing.cache.get', return_value=None)
+    cache_set_mock = mocker.patch('src.db_routing.cache.set')
+    connections_mock = mocker.patch('src.db_routing.connections')
+    connections_mock.__getitem__.return_value.cursor.side_effect = (
+        DatabaseError
+    )
+
+    # act
+    lag = ReplicaLag.get()
+
+    # assert
+    assert lag > replica_settings.REPLICA_MAX_LAG_SECONDS
+    cache_set_mock.assert_called_once_with(
+        ReplicaLag.cache_key,
+        ReplicaLag.unavailable_lag,
+        ReplicaLag.unavailable_timeout
+    )
@@ -0,0 +1,98 @@
+from django.core.cache import cache
+from src.celery import periodic_lock
+from src.locks import LockLease
+
+
+def test_periodic_lock__free__acquire_and_release():
+
+    # act
+    with periodic_lock('test_lock_free') as acquired:
+        locked = cache.get('lock:test_lock_free')
+
+    # assert
+    assert acquired
+    assert locked == acquired.token
+    assert cache.get('lock:test_lock_free') is None
+
+
+def test_periodic_lock__taken__not_acquired(mocker):
+
+    # arrange
+    lock_stats_mock = mocker.patch('src.celery.LockStats.incr')
+
+    # act
+    with periodic_lock('test_lock_taken'):
+        with periodic_lock('test_lock_taken') as acquired:
+            pass
+
+    # assert
+    assert not acquired
+    lock_stats_mock.assert_any_call('test_lock_taken', contended=1)
+
+
+def test_periodic_lock__next_acquire__greater_token():
+
+    # arrange
+    with periodic_lock('test_lock_token') as first:
+        pass
+
+    # act
+    with periodic_lock('test_lock_token') as second:
+        pass
+
+    # assert
+    assert second.token > first.token
+
+
+def test_release__lock_taken_by_another__not_delete():
+
+    # arrange
+    lease = LockLease(lock_id='test_lock_expired', lock_expire=60)
+    lease.acquire()
+    cache.set('lock:test_lock_expired', lease.token + 1)
+
+    # act
+    lease.release()
+
+    # assert
+    assert cache.get('lock:test_lock_expired') == lease.token + 1
+
+
+def test_renew__lock_taken_by_another__lost():
+
+    # arrange
+    lease = LockLease(lock_id='test_lock_lost', lock_expire=60)
+    lease.acquire()
+    cache.set('lock:test_lock_lost', lease.token + 1)
+
+    # act
+    result = lease.renew()
+
+    # assert
+    assert result is False
+    assert lease.lost is True
+    lease.release()
+
+
+def test_acquire__redis__expire_token_key(mocker):
+
+    # arrange
+    redis_mock = mocker.Mock()
+    pipe_mock = redis_mock.pipeline.return_value
+    pipe_mock.execute.return_value = [5, True]
+    redis_mock.set.return_value = True
+    mocker.patch('src.locks.get_redis', return_value=redis_mock)
+    lease = LockLease(lock_id='test_lock_redis', lock_expire=60)
+    mocker.patch.object(lease, '_renew_periodically')
+
+    # act
+    lease.acquire()
+
+    # assert
+    assert lease.token == 5
+    pipe_mock.incr.assert_called_once_with('lock_token:test_lock_redis')
+    pipe_mock.expire.assert_called_once_with(
+        'lock_token:test_lock_redis',
+        LockLease.token_expire
+    )
+    lease.release()
@@ -0,0 +1,38 @@
+from types import SimpleNamespace
+from src.generics.middleware import RateLimitHeadersMiddleware
+
+
+def test_rate_limit_headers__throttled__add_headers():
+
+    # arrange
+    response = {}
+    request = SimpleNamespace(
+        throttle_state={
+            'scope': 'scope',
+            'limit': 10,
+            'remaining': 7,
+            'reset': 2.2,
+        }
+    )
+    middleware = RateLimitHeadersMiddleware(lambda req: response)
+
+    # act
+    result = middleware(request)
+
+    # assert
+    assert result['X-RateLimit-Limit'] == 10
+    assert result['X-RateLimit-Remaining'] == 7
+    assert result['X-RateLimit-Reset'] == 3
+
+
+def test_rate_limit_headers__not_throttled__skip():
+
+    # arrange
+    response = {}
+    middleware = RateLimitHeadersMiddleware(lambda req: response)
+
+    # act
+    result = middleware(SimpleNamespace())
+
+    # assert
+    assert result == {}
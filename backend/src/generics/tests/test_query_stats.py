@@ -0,0 +1,116 @@
+from src.queries import SqlQueryObject, get_query_label
+from src.query_stats import (
+    instrument_query,
+    render_prometheus_metrics,
+)
+
+
+class ParentQuery(SqlQueryObject):
+
+    def get_sql(self):
+        return 'SELECT 1', {}
+
+
+class ChildQuery(ParentQuery):
+    pass
+
+
+def test_get_sql__labeled():
+
+    # act
+    sql, params = ParentQuery().get_sql()
+
+    # assert
+    assert sql == '/* query: ParentQuery */SELECT 1'
+    assert get_query_label(sql) == 'ParentQuery'
+
+
+def test_get_sql__inherited__child_label():
+
+    # act
+    sql, _ = ChildQuery().get_sql()
+
+    # assert
+    assert get_query_label(sql) == 'ChildQuery'
+
+
+def test_get_query_label__not_labeled__none():
+
+    # act
+    result = get_query_label('SELECT 1')
+
+    # assert
+    assert result is None
+
+
+def test_instrument_query__labeled__record(mocker):
+
+    # arrange
+    settings_mock = mocker.patch('src.query_stats.settings')
+    settings_mock.QUERY_STATS = True
+    settings_mock.QUERY_STATS_SLOW_QUERY_MS = 1000
+    record_mock = mocker.patch('src.query_stats.QueryStats.record')
+    explain_mock = mocker.patch('src.query_stats.explain_query')
+    execute = mocker.Mock(return_value='result')
+    cursor = mocker.Mock(rowcount=3)
+    context = {'cursor': cursor, 'connection': mocker.Mock()}
+    sql, params = ParentQuery().get_sql()
+
+    # act
+    result = instrument_query(execute, sql, params, False, context)
+
+    # assert
+    assert result == 'result'
+    execute.assert_called_once_with(sql, params, False, context)
+    record_mock.assert_called_once()
+    assert record_mock.call_args[1]['label'] == 'ParentQuery'
+    assert record_mock.call_args[1]['row_count'] == 3
+    explain_mock.assert_not_called()
+
+
+def test_instrument_query__not_labeled__skip(mocker):
+
+    # arrange
+    settings_mock = mocker.patch('src.query_stats.settings')
+    settings_mock.QUERY_STATS = True
+    record_mock = mocker.patch('src.query_stats.QueryStats.record')
+    execute = mocker.Mock()
+
+    # act
+    instrument_query(execute, 'SELECT 1', None, False, {})
+
+    # assert
+    execute.assert_called_once()
+    record_mock.assert_not_called()
+
+
+def test_render_prometheus_metrics__cumulative_buckets(mocker):
+
+    # arrange
+    mocker.patch(
+        'src.query_stats.QueryStats.get_stats',
+        return_value={
+            'ParentQuery': {
+                'count': 3,
+                'sum_ms': 40.5,
+                'rows': 12,
+                'buckets': {'5': 1, '25': 2},
+            }
+        }
+    )
+
+    # act
+    result = render_prometheus_metrics()
+
+    # assert
+    assert (
+        'sql_query_duration_ms_bucket{query="ParentQuery",le="5"} 1'
+    ) in result
+    assert (
+        'sql_query_duration_ms_bucket{query="ParentQuery",le="25"} 3'
+    ) in result
+    assert (
+        'sql_query_duration_ms_bucket{query="ParentQuery",le="+Inf"} 3'
+    ) in result
+    assert 'sql_query_duration_ms_count{query="ParentQuery"} 3' in result
+    assert 'sql_query_rows_total{query="ParentQuery"} 12' in result
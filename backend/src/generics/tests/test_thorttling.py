@@ -1,11 +1,15 @@
+from types import SimpleNamespace
 import pytest
 from src.generics.throttling import (
     CustomSimpleRateThrottle,
     TokenThrottle,
     ApiKeyThrottle,
-    AnonThrottle
+    AnonThrottle,
+    AccountApiQuotaThrottle,
 )
 from src.authentication.enums import AuthTokenType
+from src.processes.throttling import AiTemplateGenThrottle
+from src.processes.views.template import TemplateViewSet
 
 
 pytestmark = pytest.mark.django_db
@@ -182,26 +186,12 @@ class TestCustomSimpleRateThrottle:
             attribute='__init__',
             return_value=None
         )
-        period = 3
-        current_request_time = 65
-        key = 'key'
-        cache_mock = mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '.cache',
-        )
-        cache_mock.set = mocker.Mock()
         service = CustomSimpleRateThrottle()
-        service.period = period
-        service.key = key
-        service.current_request_time = current_request_time
 
         # act
         result = service.throttle_success()
 
         # assert
-        cache_mock.set.assert_called_once_with(
-            key, current_request_time, period
-        )
         assert result is True
 
     def test_skip_condition__not_rate__skip(self, mocker):
@@ -226,179 +216,184 @@ class TestCustomSimpleRateThrottle:
         assert result is True
         get_rate_mock.assert_called_once()
 
-    def test_private_allow_request__not_prev_request_time__allow(self, mocker):
-
-        # arrange
+    def _create_service(self, mocker, burst: int = 1):
         mocker.patch.object(
             CustomSimpleRateThrottle,
             attribute='__init__',
             return_value=None
         )
-        rate = '3/s'
-        get_rate_mock = mocker.patch(
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
             '.get_rate',
-            return_value=rate
+            return_value='10/s'
         )
-        period = 0.3
-        get_period_mock = mocker.patch(
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '._get_period',
-            return_value=period
+            '.get_burst',
+            return_value=burst
         )
-        key = 'key'
-        get_cache_key_mock = mocker.patch(
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
             '.get_cache_key',
-            return_value=key
+            return_value='key'
         )
-        cache_get_mock = mocker.Mock(return_value=None)
         mocker.patch(
+            'src.generics.throttling.get_redis',
+            return_value=None
+        )
+        service = CustomSimpleRateThrottle()
+        service.scope = 'scope'
+        return service
+
+    def _create_request(self, mocker):
+        return mocker.Mock(_request=SimpleNamespace())
+
+    def test_private_allow_request__not_prev_request_time__allow(
+        self,
+        mocker
+    ):
+
+        # arrange
+        service = self._create_service(mocker)
+        cache_mock = mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '.cache',
-            get=cache_get_mock
+            '.cache'
         )
-        throttle_success_mock = mocker.patch(
+        cache_mock.get.return_value = None
+        current_request_time = 1639048599.0
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '.throttle_success',
-            return_value=True
+            '.timer',
+            return_value=current_request_time
         )
-        request = mocker.Mock()
-        service = CustomSimpleRateThrottle()
+        request = self._create_request(mocker)
 
         # act
         result = service._allow_request(request)
 
         # assert
-        get_rate_mock.get_period_mock()
-        get_period_mock.assert_called_once()
-        get_cache_key_mock.assert_called_once_with(request)
-        cache_get_mock.assert_called_once_with(key, None)
-        throttle_success_mock.assert_called_once()
-        assert service.prev_request_time is None
         assert result is True
+        assert service.remaining == 0
+        cache_mock.get.assert_called_once_with('key', None)
+        cache_mock.set.assert_called_once_with(
+            'key',
+            current_request_time + 0.1,
+            pytest.approx(0.1)
+        )
+        assert request._request.throttle_state['limit'] == 1
 
     def test_private_allow_request__period_expired__allow(self, mocker):
 
         # arrange
-        mocker.patch.object(
-            CustomSimpleRateThrottle,
-            attribute='__init__',
-            return_value=None
-        )
-        key = 'key'
-        mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '.get_cache_key',
-            return_value=key
-        )
-        rate = '3/s'
-        get_rate_mock = mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '.get_rate',
-            return_value=rate
-        )
-        period = 0.3
-        get_period_mock = mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '._get_period',
-            return_value=period
-        )
-        prev_request_time = 1639048599.1951413
-        prev_request_time_mock = mocker.Mock(return_value=prev_request_time)
+        service = self._create_service(mocker)
+        current_request_time = 1639048599.0
         mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
             '.cache',
-            get=prev_request_time_mock
+            get=mocker.Mock(return_value=current_request_time - 0.05)
         )
-        current_request_time = prev_request_time + 0.4
-        current_request_time_mock = mocker.patch(
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
             '.timer',
             return_value=current_request_time
         )
-        result_mock = mocker.Mock()
-        throttle_success_mock = mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '.throttle_success',
-            return_value=result_mock
-        )
-        request = mocker.Mock()
-        service = CustomSimpleRateThrottle()
 
         # act
-        result = service._allow_request(request)
+        result = service._allow_request(self._create_request(mocker))
 
         # assert
-        prev_request_time_mock.assert_called_once_with(key, None)
-        current_request_time_mock.assert_called_once()
-        throttle_success_mock.assert_called_once()
-        get_rate_mock.assert_called_once()
-        get_period_mock.assert_called_once()
-        assert result is result_mock
+        assert result is True
         assert service.need_wait is False
-        assert service.wait_time < 0
 
-    def test_private_allow_request__period_not_expired__disallow(self, mocker):
+    def test_private_allow_request__period_not_expired__disallow(
+        self,
+        mocker
+    ):
 
         # arrange
-        mocker.patch.object(
-            CustomSimpleRateThrottle,
-            attribute='__init__',
-            return_value=None
+        service = self._create_service(mocker)
+        current_request_time = 1639048599.0
+        cache_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.cache',
+            get=mocker.Mock(return_value=current_request_time + 0.05)
         )
-        key = 'key'
         mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '.get_cache_key',
-            return_value=key
+            '.timer',
+            return_value=current_request_time
         )
-        rate = '3/s'
-        get_rate_mock = mocker.patch(
+
+        # act
+        result = service._allow_request(self._create_request(mocker))
+
+        # assert
+        assert result is False
+        assert service.need_wait is True
+        assert service.wait_time == pytest.approx(0.05)
+        assert service.remaining == 0
+        cache_mock.set.assert_not_called()
+
+    def test_private_allow_request__burst__allow_at_a_time(self, mocker):
+
+        # arrange
+        service = self._create_service(mocker, burst=3)
+        current_request_time = 1639048599.0
+        cache_mock = mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '.get_rate',
-            return_value=rate
+            '.cache',
+            get=mocker.Mock(return_value=current_request_time + 0.1)
         )
-        period = 0.3
-        get_period_mock = mocker.patch(
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
-            '._get_period',
-            return_value=period
+            '.timer',
+            return_value=current_request_time
         )
-        prev_request_time = 1639048599.1951413
-        prev_request_time_mock = mocker.Mock(return_value=prev_request_time)
-        cache_mock = mocker.patch(
-            'src.generics.throttling.CustomSimpleRateThrottle'
-            '.cache'
+
+        # act
+        result = service._allow_request(self._create_request(mocker))
+
+        # assert
+        assert result is True
+        assert service.remaining == 1
+        cache_mock.set.assert_called_once_with(
+            'key',
+            current_request_time + 0.2,
+            pytest.approx(0.2)
         )
-        cache_mock.get = prev_request_time_mock
-        current_request_time = prev_request_time + 0.2
-        current_request_time_mock = mocker.patch(
+
+    def test_private_allow_request__redis__one_script_call(self, mocker):
+
+        # arrange
+        service = self._create_service(mocker, burst=2)
+        current_request_time = 1639048599.0
+        mocker.patch(
             'src.generics.throttling.CustomSimpleRateThrottle'
             '.timer',
             return_value=current_request_time
         )
-        result_mock = mocker.Mock()
-        throttle_failure_mock = mocker.patch(
-            'rest_framework.throttling.SimpleRateThrottle'
-            '.throttle_failure',
-            return_value=result_mock
+        redis_mock = mocker.Mock()
+        redis_mock.eval.return_value = [
+            1,
+            str(current_request_time + 0.1).encode()
+        ]
+        mocker.patch(
+            'src.generics.throttling.get_redis',
+            return_value=redis_mock
+        )
+        cache_mock = mocker.patch(
+            'src.generics.throttling.CustomSimpleRateThrottle'
+            '.cache'
         )
-        request = mocker.Mock()
-        service = CustomSimpleRateThrottle()
 
         # act
-        result = service._allow_request(request)
+        result = service._allow_request(self._create_request(mocker))
 
         # assert
-        get_rate_mock.assert_called_once()
-        prev_request_time_mock.assert_called_once_with(key, None)
-        current_request_time_mock.assert_called_once()
-        throttle_failure_mock.assert_called_once()
-        get_period_mock.assert_called_once()
-        assert result is result_mock
-        assert service.need_wait is True
-        assert service.wait_time > 0
+        assert result is True
+        assert service.remaining == 1
+        redis_mock.eval.assert_called_once()
+        cache_mock.get.assert_not_called()
 
     def test_wait__return_wait_time(self, mocker):
 
@@ -792,3 +787,33 @@ class TestApiKeyThrottle:
 
         # assert
         assert result == token
+
+
+class TestBaseThrottleMixin:
+
+    def test_get_throttles__view_throttles__add_account_quota(self):
+
+        # arrange
+        view = TemplateViewSet(action='ai')
+
+        # act
+        result = view.get_throttles()
+
+        # assert
+        assert [type(throttle) for throttle in result] == [
+            AiTemplateGenThrottle,
+            AccountApiQuotaThrottle,
+        ]
+
+    def test_get_throttles__no_view_throttles__account_quota(self):
+
+        # arrange
+        view = TemplateViewSet(action='list')
+
+        # act
+        result = view.get_throttles()
+
+        # assert
+        assert [type(throttle) for throttle in result] == [
+            AccountApiQuotaThrottle,
+        ]
@@ -1,8 +1,29 @@
 # pylint: disable=super-init-not-called,attribute-defined-outside-init
-from typing import Optional
+import math
+from typing import Optional, Tuple
+from django.conf import settings
 from rest_framework.throttling import SimpleRateThrottle
 from django.core.exceptions import ImproperlyConfigured
 from src.authentication.enums import AuthTokenType
+from src.locks import get_redis
+
+
+# Generic cell rate algorithm: the key keeps the theoretical arrival
+# time (TAT) of the next request. The request is allowed if it comes
+# not earlier than "burst" periods before the TAT.
+GCRA_SCRIPT = """
+local period = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tat = math.max(tonumber(redis.call('get', KEYS[1])) or now, now)
+local allow_at = tat + period - period * burst
+if allow_at > now then
+  return {0, tostring(tat)}
+end
+tat = tat + period
+redis.call('set', KEYS[1], tostring(tat), 'PX', math.ceil((tat - now) * 1000))
+return {1, tostring(tat)}
+"""
 
 
 class CustomSimpleRateThrottle(SimpleRateThrottle):
@@ -14,7 +35,15 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
     as 'create' and 'retrieve'
 
     * Unlike the drf throttling implementation, it counts the speed,
-        not the number of request at a time """
+        not the number of request at a time. "burst" requests are allowed
+        at a time, then one request per period.
+
+    * With the redis cache the check is done in one atomic script call
+
+    The state of the check is saved to the request
+    for the RateLimitHeadersMiddleware """
+
+    burst = 1
 
     def __init__(self):
         self.need_wait = False
@@ -33,6 +62,9 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
 
         return self.THROTTLE_RATES.get(self.scope)
 
+    def get_burst(self) -> int:
+        return settings.THROTTLE_BURSTS.get(self.scope, self.burst)
+
     def get_cache_key(self, request, *args, **kwargs) -> str:
         return self.cache_format % {
             'scope': self.scope,
@@ -40,7 +72,6 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
         }
 
     def throttle_success(self):
-        self.cache.set(self.key, self.current_request_time, self.period)
         return True
 
     def skip_condition(self, *args, **kwargs) -> bool:
@@ -54,25 +85,78 @@ class CustomSimpleRateThrottle(SimpleRateThrottle):
         num_requests, duration = self.parse_rate(self.rate)
         return duration / num_requests
 
+    def _check_tat(self) -> Tuple[bool, float]:
+
+        """ Returns the check result and the TAT after the check """
+
+        redis = get_redis()
+        if redis is not None:
+            allowed, tat = redis.eval(
+                GCRA_SCRIPT,
+                1,
+                self.key,
+                self.period,
+                self.burst_size,
+                self.current_request_time
+            )
+            return bool(allowed), float(tat)
+        tat = max(
+            self.cache.get(self.key, None) or self.current_request_time,
+            self.current_request_time
+        )
+        allow_at = tat + self.period - self.period * self.burst_size
+        if allow_at > self.current_request_time:
+            return False, tat
+        tat += self.period
+        self.cache.set(self.key, tat, tat - self.current_request_time)
+        return True, tat
+
+    def _save_state(self, request):
+        state = {
+            'scope': self.scope,
+            'limit': self.burst_size,
+            'remaining': self.remaining,
+            'reset': max(self.tat - self.current_request_time, 0),
+        }
+        http_request = getattr(request, '_request', request)
+        prev_state = getattr(http_request, 'throttle_state', None)
+        if prev_state is None or prev_state['remaining'] >= self.remaining:
+            http_request.throttle_state = state
+
     def _allow_request(self, request) -> bool:
 
         """ Returns 'False' if request should be throttled """
 
         self.rate = self.get_rate()
         self.period = self._get_period()
+        self.burst_size = self.get_burst()
         self.key = self.get_cache_key(request)
-        self.prev_request_time = self.cache.get(self.key, None)
         self.current_request_time = self.timer()
-        if self.prev_request_time is None:
+        allowed, self.tat = self._check_tat()
+        # Rounding drops the float error of the timestamps
+        self.remaining = max(
+            math.floor(
+                round(
+                    (
+                        self.current_request_time
+                        + self.period * self.burst_size
+                        - self.tat
+                    ) / self.period,
+                    6
+                )
+            ),
+            0
+        )
+        self._save_state(request)
+        if allowed:
             return self.throttle_success()
-
+        self.need_wait = True
         self.wait_time = (
-            self.prev_request_time + self.period - self.current_request_time
+            self.tat + self.period
+            - self.period * self.burst_size
+            - self.current_request_time
         )
-        self.need_wait = self.wait_time >= 0
-        if self.need_wait:
-            return self.throttle_failure()
-        return self.throttle_success()
+        return self.throttle_failure()
 
     def allow_request(self, request, view) -> bool:
 
@@ -156,3 +240,26 @@ class ApiKeyThrottle(BaseAuthThrottle):
             return True
         else:
             return False
+
+
+class AccountApiQuotaThrottle(BaseAuthThrottle):
+
+    """ Quota of the API requests of the account.
+        All API keys of the account share the quota,
+        the whole quota may be used at a time """
+
+    scope = '12_api__account_quota'
+    skip_for_paid_accounts = False
+
+    def get_burst(self) -> int:
+        num_requests, _ = self.parse_rate(self.rate)
+        return num_requests
+
+    def get_ident(self, request) -> str:
+        return str(request.user.account_id)
+
+    def skip_condition(self, request) -> bool:
+
+        if super().skip_condition(request):
+            return True
+        return request.token_type != AuthTokenType.API
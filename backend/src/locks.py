@@ -0,0 +1,247 @@
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger('src.locks')
+
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('expire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+  return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def get_redis():
+
+    """ Returns the redis client of the default cache,
+        or None for the other cache backends (e.g. in tests) """
+
+    try:
+        return get_redis_connection('default')
+    except NotImplementedError:
+        return None
+
+
+class LockStats:
+
+    """ Counters of the periodic locks by the lock id
+        in the redis hash shared by all processes. The lock ids are
+        the hash fields and the prometheus labels, so they must not
+        contain the entity ids.
+
+        Hash fields: "<lock_id>|acquired", "<lock_id>|contended",
+        "<lock_id>|lost", "<lock_id>|sum_ms" """
+
+    key = 'lock_stats'
+
+    @classmethod
+    def incr(cls, lock_id: str, **values: float):
+        if not settings.LOCK_STATS:
+            return
+        try:
+            pipe = get_redis_connection('default').pipeline(
+                transaction=False
+            )
+            for name, value in values.items():
+                pipe.hincrbyfloat(cls.key, f'{lock_id}|{name}', value)
+            pipe.execute()
+        except RedisError as ex:
+            logger.warning('Failed to save lock stats: %s', ex)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, dict]:
+        stats = defaultdict(lambda: {
+            'acquired': 0,
+            'contended': 0,
+            'lost': 0,
+            'sum_ms': 0,
+        })
+        values = get_redis_connection('default').hgetall(cls.key)
+        for field, value in values.items():
+            lock_id, name = field.decode().rsplit('|', 1)
+            stats[lock_id][name] = float(value)
+        return stats
+
+
+class LockLease:
+
+    """ Lease of the lock held by the job.
+
+        The token increases with each acquiring of the lock, the job
+        may save it with the results to reject the writes of the previous
+        holder (fencing token). The lease is renewed in the background
+        while the job runs. The lock is released only by the holder
+        of the token, the expired lock taken by another job is kept """
+
+    key_prefix = 'lock'
+    token_key_prefix = 'lock_token'
+    # The token counter lives much longer than the lease,
+    # the unused counters expire
+    token_expire = 60 * 60 * 24 * 7
+
+    def __init__(self, lock_id: str, lock_expire: int):
+        self.lock_id = lock_id
+        self.key = f'{self.key_prefix}:{lock_id}'
+        self.lock_expire = lock_expire
+        self.token: Optional[int] = None
+        self.lost = False
+        self._redis = get_redis()
+        self._stopped = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def __bool__(self):
+        return self.token is not None
+
+    def _get_next_token(self) -> int:
+        key = f'{self.token_key_prefix}:{self.lock_id}'
+        if self._redis is not None:
+            pipe = self._redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, self.token_expire)
+            return pipe.execute()[0]
+        try:
+            token = cache.incr(key)
+        except ValueError:
+            cache.add(key, 0, self.token_expire)
+            token = cache.incr(key)
+        cache.touch(key, self.token_expire)
+        return token
+
+    def _add(self, token: int) -> bool:
+        if self._redis is not None:
+            return bool(
+                self._redis.set(
+                    self.key,
+                    token,
+                    nx=True,
+                    ex=self.lock_expire
+                )
+            )
+        return cache.add(self.key, token, self.lock_expire)
+
+    def is_holder(self) -> bool:
+        if self.token is None:
+            return False
+        if self._redis is not None:
+            value = self._redis.get(self.key)
+            return value is not None and int(value) == self.token
+        return cache.get(self.key) == self.token
+
+    def acquire(self) -> bool:
+        token = self._get_next_token()
+        if self._add(token):
+            self.token = token
+            self._heartbeat = threading.Thread(
+                target=self._renew_periodically,
+                name=f'lock-heartbeat-{self.lock_id}',
+                daemon=True
+            )
+            self._heartbeat.start()
+        return bool(self)
+
+    def renew(self) -> bool:
+        if self._redis is not None:
+            renewed = bool(
+                self._redis.eval(
+                    RENEW_SCRIPT,
+                    1,
+                    self.key,
+                    self.token,
+                    self.lock_expire
+                )
+            )
+        else:
+            renewed = (
+                self.is_holder()
+                and cache.touch(self.key, self.lock_expire)
+            )
+        if not renewed:
+            self.lost = True
+            LockStats.incr(self.lock_id, lost=1)
+            logger.warning(
+                'Lock %s with token %s is lost',
+                self.lock_id,
+                self.token
+            )
+        return renewed
+
+    def _renew_periodically(self):
+        interval = max(self.lock_expire / 3, 1)
+        while not self._stopped.wait(interval):
+            try:
+                if not self.renew():
+                    return
+            except RedisError as ex:
+                logger.warning(
+                    'Failed to renew lock %s: %s',
+                    self.lock_id,
+                    ex
+                )
+
+    def release(self):
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+        if self.lost:
+            return
+        if self._redis is not None:
+            self._redis.eval(RELEASE_SCRIPT, 1, self.key, self.token)
+        elif self.is_holder():
+            cache.delete(self.key)
+
+
+def render_prometheus_metrics() -> str:
+    lines = [
+        '# HELP periodic_lock_acquired_total Jobs run under the lock',
+        '# TYPE periodic_lock_acquired_total counter',
+    ]
+    contended_lines = [
+        '# HELP periodic_lock_contended_total Jobs skipped, lock was taken',
+        '# TYPE periodic_lock_contended_total counter',
+    ]
+    lost_lines = [
+        '# HELP periodic_lock_lost_total Leases expired before the job end',
+        '# TYPE periodic_lock_lost_total counter',
+    ]
+    duration_lines = [
+        '# HELP periodic_lock_job_duration_ms Duration of the jobs',
+        '# TYPE periodic_lock_job_duration_ms summary',
+    ]
+    for lock_id, stats in sorted(LockStats.get_stats().items()):
+        lines.append(
+            f'periodic_lock_acquired_total{{lock="{lock_id}"}} '
+            f'{int(stats["acquired"])}'
+        )
+        contended_lines.append(
+            f'periodic_lock_contended_total{{lock="{lock_id}"}} '
+            f'{int(stats["contended"])}'
+        )
+        lost_lines.append(
+            f'periodic_lock_lost_total{{lock="{lock_id}"}} '
+            f'{int(stats["lost"])}'
+        )
+        duration_lines.append(
+            f'periodic_lock_job_duration_ms_sum{{lock="{lock_id}"}} '
+            f'{stats["sum_ms"]:.3f}'
+        )
+        duration_lines.append(
+            f'periodic_lock_job_duration_ms_count{{lock="{lock_id}"}} '
+            f'{int(stats["acquired"])}'
+        )
+    return '\n'.join(
+        lines + contended_lines + lost_lines + duration_lines
+    ) + '\n'
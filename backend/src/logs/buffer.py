@@ -0,0 +1,87 @@
+import json
+from typing import List
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django_redis import get_redis_connection
+from src.logs.models import AccountEvent
+
+
+class AccountEventBuffer:
+
+    """ Redis list of not yet saved account events.
+        The "flush_account_events" task saves them in batches.
+
+        When the list is full, new events are dropped and counted,
+        so a slow database does not make the queue grow without limit """
+
+    key = 'logs:account_events'
+    dropped_key = 'logs:account_events:dropped'
+
+    # Single round trip check of the length limit before the push
+    push_script = """
+        if redis.call('LLEN', KEYS[1]) >= tonumber(ARGV[2]) then
+            redis.call('INCR', KEYS[2])
+            return 0
+        end
+        return redis.call('RPUSH', KEYS[1], ARGV[1])
+    """
+
+    def __init__(self):
+        self.connection = get_redis_connection('default')
+
+    def push(self, **fields) -> bool:
+
+        """ Returns False if the event was dropped """
+
+        value = json.dumps(fields, cls=DjangoJSONEncoder)
+        result = self.connection.eval(
+            self.push_script,
+            2,
+            self.key,
+            self.dropped_key,
+            value,
+            settings.ACCOUNT_LOG_BUFFER_MAX_SIZE,
+        )
+        return bool(result)
+
+    def read_batch(self, size: int) -> List[dict]:
+        values = self.connection.lrange(self.key, 0, size - 1)
+        return [json.loads(value) for value in values]
+
+    def trim(self, count: int):
+
+        """ Removes the saved events from the head of the list,
+            the new events are pushed to the tail """
+
+        self.connection.ltrim(self.key, count, -1)
+
+    def pop_dropped_count(self) -> int:
+        pipe = self.connection.pipeline(transaction=True)
+        pipe.get(self.dropped_key)
+        pipe.delete(self.dropped_key)
+        count, _ = pipe.execute()
+        return int(count or 0)
+
+    def flush(self) -> int:
+
+        """ Saves all buffered events, returns the number of saved events.
+            The batch is removed from the list after the commit,
+            so the failed insert keeps the events for the next flush """
+
+        batch_size = settings.ACCOUNT_LOG_FLUSH_BATCH_SIZE
+        saved = 0
+        while True:
+            batch = self.read_batch(batch_size)
+            if not batch:
+                break
+            with transaction.atomic():
+                AccountEvent.objects.bulk_create(
+                    [AccountEvent(**fields) for fields in batch],
+                    batch_size=batch_size,
+                )
+            self.trim(len(batch))
+            saved += len(batch)
+            if len(batch) < batch_size:
+                break
+        return saved
@@ -0,0 +1,19 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('logs', '0008_auto_20241205_1159'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='accountevent',
+            name='date_created',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.contrib.auth import get_user_model
 from django.db import models
+from django.utils import timezone
 from django.contrib.postgres.fields import JSONField
 from src.generics.managers import BaseSoftDeleteManager
 from src.logs.querysets import AccountEventQuerySet
@@ -30,7 +31,8 @@ class AccountEvent(
         null=True,
         blank=True
     )
-    date_created = models.DateTimeField(auto_now_add=True)
+    # Not auto_now_add: buffered events are inserted after they happened
+    date_created = models.DateTimeField(default=timezone.now)
     response_data = JSONField(
         blank=True,
         null=True,
@@ -1,6 +1,11 @@
+import random
 from typing import Optional
+from django.conf import settings
+from django.utils import timezone
+from redis.exceptions import RedisError
 from src.generics.base.service import BaseModelService
 from src.logs.models import AccountEvent
+from src.logs.buffer import AccountEventBuffer
 from django.contrib.auth import get_user_model
 from src.logs.enums import (
     AccountEventStatus,
@@ -35,7 +40,7 @@ class AccountLogService(BaseModelService):
         **kwargs
     ):
 
-        self.instance = AccountEvent.objects.create(
+        fields = dict(
             event_type=event_type,
             title=title,
             ip=ip,
@@ -53,6 +58,17 @@ class AccountLogService(BaseModelService):
             direction=direction,
             contractor=contractor,
         )
+        if settings.ACCOUNT_LOG_BUFFER:
+            # The event will be saved by the "flush_account_events" task
+            try:
+                AccountEventBuffer().push(
+                    date_created=timezone.now(),
+                    **fields
+                )
+            except RedisError:
+                self.instance = AccountEvent.objects.create(**fields)
+        else:
+            self.instance = AccountEvent.objects.create(**fields)
 
     def _create_related(self, **kwargs):
         pass
@@ -75,6 +91,9 @@ class AccountLogService(BaseModelService):
     ):
         if 200 <= http_status < 300:
             status = AccountEventStatus.SUCCESS
+            sample_rate = user.account.log_api_requests_sample_rate
+            if random.randrange(100) >= sample_rate:
+                return
         else:
             status = AccountEventStatus.FAILED
         self.create(
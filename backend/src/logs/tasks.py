@@ -0,0 +1,26 @@
+from celery import shared_task
+from django.conf import settings
+from src.celery import periodic_lock
+from src.logs.buffer import AccountEventBuffer
+from src.utils.logging import capture_sentry_message
+
+
+@shared_task(ignore_result=True)
+def flush_account_events() -> None:
+
+    """ Saves account events buffered by the AccountLogService.
+        Should be run periodically when ACCOUNT_LOG_BUFFER enabled """
+
+    if not settings.ACCOUNT_LOG_BUFFER:
+        return
+    with periodic_lock('flush_account_events') as acquired:
+        if not acquired:
+            return
+        buffer = AccountEventBuffer()
+        buffer.flush()
+        dropped_count = buffer.pop_dropped_count()
+        if dropped_count:
+            capture_sentry_message(
+                message='Account events buffer is full',
+                data={'dropped_count': dropped_count}
+            )
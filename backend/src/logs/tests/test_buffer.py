@@ -0,0 +1,104 @@
+import pytest
+from django.db import DatabaseError
+from src.logs.buffer import AccountEventBuffer
+from src.logs.models import AccountEvent
+from src.logs.enums import AccountEventType
+from src.processes.tests.fixtures import (
+    create_test_user
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_flush__save_batches(mocker):
+
+    # arrange
+    user = create_test_user()
+    events = [
+        {
+            'event_type': AccountEventType.API,
+            'title': f'Event {i}',
+            'account_id': user.account_id,
+            'user_id': user.id,
+            'date_created': '2026-01-01T10:00:00Z',
+        } for i in range(3)
+    ]
+    mocker.patch('src.logs.buffer.get_redis_connection')
+    settings_mock = mocker.patch('src.logs.buffer.settings')
+    settings_mock.ACCOUNT_LOG_FLUSH_BATCH_SIZE = 2
+    read_batch_mock = mocker.patch(
+        'src.logs.buffer.AccountEventBuffer.read_batch',
+        side_effect=[events[:2], events[2:]]
+    )
+    trim_mock = mocker.patch('src.logs.buffer.AccountEventBuffer.trim')
+    buffer = AccountEventBuffer()
+
+    # act
+    saved = buffer.flush()
+
+    # assert
+    assert saved == 3
+    assert read_batch_mock.call_count == 2
+    assert trim_mock.call_args_list == [mocker.call(2), mocker.call(1)]
+    assert AccountEvent.objects.filter(
+        account_id=user.account_id,
+        date_created__year=2026,
+    ).count() == 3
+
+
+def test_flush__empty_buffer__skip(mocker):
+
+    # arrange
+    mocker.patch('src.logs.buffer.get_redis_connection')
+    settings_mock = mocker.patch('src.logs.buffer.settings')
+    settings_mock.ACCOUNT_LOG_FLUSH_BATCH_SIZE = 100
+    mocker.patch(
+        'src.logs.buffer.AccountEventBuffer.read_batch',
+        return_value=[]
+    )
+    bulk_create_mock = mocker.patch(
+        'src.logs.buffer.AccountEvent.objects.bulk_create'
+    )
+    buffer = AccountEventBuffer()
+
+    # act
+    saved = buffer.flush()
+
+    # assert
+    assert saved == 0
+    bulk_create_mock.assert_not_called()
+
+
+def test_flush__insert_failed__keep_events(mocker):
+
+    # arrange
+    user = create_test_user()
+    events = [
+        {
+            'event_type': AccountEventType.API,
+            'title': 'Event',
+            'account_id': user.account_id,
+            'user_id': user.id,
+            'date_created': '2026-01-01T10:00:00Z',
+        }
+    ]
+    mocker.patch('src.logs.buffer.get_redis_connection')
+    settings_mock = mocker.patch('src.logs.buffer.settings')
+    settings_mock.ACCOUNT_LOG_FLUSH_BATCH_SIZE = 100
+    mocker.patch(
+        'src.logs.buffer.AccountEventBuffer.read_batch',
+        return_value=events
+    )
+    mocker.patch(
+        'src.logs.buffer.AccountEvent.objects.bulk_create',
+        side_effect=DatabaseError()
+    )
+    trim_mock = mocker.patch('src.logs.buffer.AccountEventBuffer.trim')
+    buffer = AccountEventBuffer()
+
+    # act
+    with pytest.raises(DatabaseError):
+        buffer.flush()
+
+    # assert
+    trim_mock.assert_not_called()
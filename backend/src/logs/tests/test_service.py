@@ -5,8 +5,10 @@ from src.logs.enums import (
     AccountEventType,
     RequestDirection,
 )
+from src.logs.models import AccountEvent
 from src.processes.tests.fixtures import (
-    create_test_user
+    create_test_user,
+    create_test_account,
 )
 
 pytestmark = pytest.mark.django_db
@@ -76,3 +78,91 @@ def test_create_instance():
     assert event.response_data == response_data
     assert event.direction == direction
     assert event.contractor == contractor
+
+
+def test_create_instance__buffer_enabled__push_to_buffer(mocker):
+
+    # arrange
+    user = create_test_user()
+    settings_mock = mocker.patch('src.logs.service.settings')
+    settings_mock.ACCOUNT_LOG_BUFFER = True
+    buffer_mock = mocker.patch('src.logs.service.AccountEventBuffer')
+    title = 'Some title'
+    service = AccountLogService()
+
+    # act
+    service._create_instance(
+        event_type=AccountEventType.API,
+        title=title,
+        user_id=user.id,
+        account_id=user.account_id,
+    )
+
+    # assert
+    buffer_mock.return_value.push.assert_called_once()
+    push_kwargs = buffer_mock.return_value.push.call_args[1]
+    assert push_kwargs['title'] == title
+    assert push_kwargs['account_id'] == user.account_id
+    assert push_kwargs['date_created'] is not None
+    assert service.instance is None
+    assert not AccountEvent.objects.exists()
+
+
+def test_api_request__sample_rate_zero__skip(mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    account.log_api_requests_sample_rate = 0
+    account.save()
+    user = create_test_user(account=account)
+    create_mock = mocker.patch(
+        'src.logs.service.AccountLogService.create'
+    )
+    service = AccountLogService()
+
+    # act
+    service.api_request(
+        user=user,
+        ip='192.168.0.1',
+        user_agent='Firefox',
+        auth_token='token',
+        scheme='https',
+        method='GET',
+        title='API request',
+        path='/accounts/account',
+        http_status=200,
+    )
+
+    # assert
+    create_mock.assert_not_called()
+
+
+def test_api_request__sample_rate_zero__failed_request_logged(mocker):
+
+    # arrange
+    account = create_test_account(log_api_requests=True)
+    account.log_api_requests_sample_rate = 0
+    account.save()
+    user = create_test_user(account=account)
+    service = AccountLogService()
+
+    # act
+    service.api_request(
+        user=user,
+        ip='192.168.0.1',
+        user_agent='Firefox',
+        auth_token='token',
+        scheme='https',
+        method='GET',
+        title='API request',
+        path='/accounts/account',
+        http_status=400,
+    )
+
+    # assert
+    assert AccountEvent.objects.get(
+        user=user,
+        account=account,
+        http_status=400,
+        status=AccountEventStatus.FAILED,
+    )
@@ -1,4 +1,5 @@
 import os
+import re
 from django.db import connection
 from contextlib import contextmanager
 from django.conf import settings
@@ -11,3 +12,44 @@ def log_sql():
     connection.force_debug_cursor = True
     yield
     connection.force_debug_cursor = False
+
+
+SENSITIVE_KEYS = (
+    'password',
+    'token',
+    'secret',
+    'api_key',
+    'authorization',
+)
+
+
+def redact_log_data(data):
+
+    """ Replaces values of sensitive keys before saving to the log """
+
+    if isinstance(data, dict):
+        return {
+            key: (
+                '***' if any(
+                    sensitive in str(key).lower()
+                    for sensitive in SENSITIVE_KEYS
+                ) else redact_log_data(value)
+            )
+            for key, value in data.items()
+        }
+    if isinstance(data, list):
+        return [redact_log_data(value) for value in data]
+    return data
+
+
+sensitive_text_pattern = re.compile(
+    r'("[^"]*(?:' + '|'.join(SENSITIVE_KEYS) + r')[^"]*"\s*:\s*)"[^"]*"?',
+    flags=re.IGNORECASE
+)
+
+
+def redact_log_text(text: str) -> str:
+
+    """ Same as redact_log_data for a raw, possibly truncated, json text """
+
+    return sensitive_text_pattern.sub(r'\1"***"', text)
@@ -1,9 +1,46 @@
+import json
+from typing import Optional
+from channels.db import database_sync_to_async
+from src.accounts.models import Notification
 from src.consumers import PneumaticBaseConsumer
 
 
 class NotificationsConsumer(PneumaticBaseConsumer):
 
     classname = 'notifications'
+    broadcast_group_name = 'notifications_broadcast'
+
+    @database_sync_to_async
+    def _get_system_notification_id(
+        self,
+        system_message_id: int
+    ) -> Optional[int]:
+        return (
+            Notification.objects
+            .filter(
+                user_id=self.scope['user'].id,
+                system_message_id=system_message_id,
+            )
+            .exclude_read()
+            .values_list('id', flat=True)
+            .first()
+        )
+
+    async def system_notification(self, event):
+
+        """ The system message is broadcast once for all connections
+            with the notification data shared by all users,
+            each connection adds the notification id of its user """
+
+        notification_id = await self._get_system_notification_id(
+            event['system_message_id']
+        )
+        if notification_id is not None:
+            await self.send(
+                text_data=json.dumps(
+                    {'id': notification_id, **event['notification']}
+                )
+            )
 
 
 class NewTaskConsumer(PneumaticBaseConsumer):
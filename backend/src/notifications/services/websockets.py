@@ -119,6 +119,43 @@ class WebSocketService(NotificationService):
     def _handle_error(self, *args, **kwargs):
         pass
 
+    def send_system_broadcast(
+        self,
+        system_message_id: int,
+        sync: bool = True,
+    ):
+
+        """ One message for all connected clients
+            instead of the message for each user.
+            The notification is serialized once, the connections
+            load only the notification id of their user """
+
+        self._validate_send(NotificationMethod.system)
+        notifications = (
+            Notification.objects
+            .filter(system_message_id=system_message_id)
+            .exclude_read()
+        )
+        notification = notifications.first()
+        if notification is None:
+            return
+        data = dict(NotificationsSerializer(instance=notification).data)
+        data.pop('id')
+        layer = get_channel_layer()
+        message = {
+            'type': 'system_notification',
+            'system_message_id': system_message_id,
+            'notification': data,
+        }
+        group_name = NotificationsConsumer.broadcast_group_name
+        if sync:
+            try:
+                async_to_sync(layer.group_send)(group_name, message)
+                return
+            except RuntimeError:
+                pass
+        get_event_loop().create_task(layer.group_send(group_name, message))
+
     def send_overdue_task(
         self,
         user_id: int,
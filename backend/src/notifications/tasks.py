@@ -346,7 +346,7 @@ def send_overdue_task_notification():
     with periodic_lock('send_overdue_task_notification') as acquired:
         if not acquired:
             return
-    _send_overdue_task_notification()
+        _send_overdue_task_notification()
 
 
 def _send_resumed_workflow_notification(
@@ -845,7 +845,7 @@ def send_workflow_comment_watched():
     with periodic_lock('comment_watched', lock_expire) as acquired:
         if not acquired:
             return
-    _send_workflow_comment_watched()
+        _send_workflow_comment_watched()
 
 
 def _send_reaction_notification(
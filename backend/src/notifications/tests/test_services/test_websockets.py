@@ -9,8 +9,12 @@ from src.notifications.services.websockets import (
 from src.notifications.services.exceptions import (
     NotificationServiceError,
 )
-from src.accounts.enums import UserType, NotificationType
-from src.accounts.models import Notification
+from src.accounts.enums import (
+    NotificationStatus,
+    NotificationType,
+    UserType,
+)
+from src.accounts.models import Notification, SystemMessage
 from src.processes.models import Delay
 from src.accounts.serializers.notifications import (
     NotificationTaskSerializer,
@@ -24,6 +28,7 @@ from src.processes.tests.fixtures import (
 from channels.testing import WebsocketCommunicator
 from src.asgi import application
 from src.consumers import PneumaticBaseConsumer
+from src.notifications.consumers import NotificationsConsumer
 
 
 pytestmark = pytest.mark.django_db
@@ -664,6 +669,129 @@ async def test_consumer__ping_pong__ok(mocker, api_client):
     await communicator.disconnect()
 
 
+@pytest.mark.asyncio
+async def test_consumer_system_broadcast__received(mocker):
+
+    # arrange
+    user = create_test_user()
+    system_message = SystemMessage.objects.create(
+        text='System message',
+        publication_date=timezone.now(),
+        is_delivery_completed=True,
+    )
+    notification = Notification.objects.create(
+        user=user,
+        account=user.account,
+        system_message=system_message,
+        text=system_message.text,
+        datetime=system_message.publication_date,
+        type=NotificationType.SYSTEM,
+    )
+    mocker.patch(
+        'src.authentication.'
+        'middleware.PneumaticToken.get_user_from_token',
+        return_value=user
+    )
+    communicator = WebsocketCommunicator(
+        application,
+        '/ws/notifications/?auth_token=123456',
+    )
+    await communicator.connect()
+    service = WebSocketService(account_id=None)
+
+    # act
+    service.send_system_broadcast(
+        system_message_id=system_message.id,
+        sync=False
+    )
+
+    # assert
+    response = await communicator.receive_json_from()
+    assert response['id'] == notification.id
+    assert response['text'] == system_message.text
+    await communicator.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_consumer_system_broadcast__read__not_sent(mocker):
+
+    # arrange
+    user = create_test_user()
+    system_message = SystemMessage.objects.create(
+        text='System message',
+        publication_date=timezone.now(),
+        is_delivery_completed=True,
+    )
+    Notification.objects.create(
+        user=user,
+        account=user.account,
+        system_message=system_message,
+        text=system_message.text,
+        datetime=system_message.publication_date,
+        type=NotificationType.SYSTEM,
+        status=NotificationStatus.READ,
+    )
+    mocker.patch(
+        'src.authentication.'
+        'middleware.PneumaticToken.get_user_from_token',
+        return_value=user
+    )
+    communicator = WebsocketCommunicator(
+        application,
+        '/ws/notifications/?auth_token=123456',
+    )
+    await communicator.connect()
+    service = WebSocketService(account_id=None)
+
+    # act
+    service.send_system_broadcast(
+        system_message_id=system_message.id,
+        sync=False
+    )
+
+    # assert
+    assert await communicator.receive_nothing() is True
+    await communicator.disconnect()
+
+
+def test_send_system_broadcast__send_serialized_notification(mocker):
+
+    # arrange
+    user = create_test_user()
+    system_message = SystemMessage.objects.create(
+        text='System message',
+        publication_date=timezone.now(),
+        is_delivery_completed=True,
+    )
+    Notification.objects.create(
+        user=user,
+        account=user.account,
+        system_message=system_message,
+        text=system_message.text,
+        datetime=system_message.publication_date,
+        type=NotificationType.SYSTEM,
+    )
+    mocker.patch(
+        'src.notifications.services.websockets.get_channel_layer'
+    )
+    async_to_sync_mock = mocker.patch(
+        'src.notifications.services.websockets.async_to_sync'
+    )
+    service = WebSocketService(account_id=None)
+
+    # act
+    service.send_system_broadcast(system_message_id=system_message.id)
+
+    # assert
+    group_send_mock = async_to_sync_mock.return_value
+    group_send_mock.assert_called_once()
+    group_name, message = group_send_mock.call_args[0]
+    assert group_name == NotificationsConsumer.broadcast_group_name
+    assert message['system_message_id'] == system_message.id
+    assert message['notification']['text'] == system_message.text
+    assert 'id' not in message['notification']
+
+
 def test_send_urgent__ok(mocker):
 
     # arrange
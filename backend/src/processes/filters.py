@@ -1,6 +1,7 @@
 from django_filters import (
     ChoiceFilter,
     BooleanFilter,
+    NumberFilter,
     OrderingFilter,
 )
 from django_filters.rest_framework import (
@@ -118,6 +119,7 @@ class WorkflowEventFilter(FilterSet):
             'ordering',
             'include_comments',
             'only_attachments',
+            'since_id',
         )
 
     ordering = OrderingFilter(
@@ -127,6 +129,7 @@ class WorkflowEventFilter(FilterSet):
     )
     include_comments = BooleanFilter(method='filter_comments')
     only_attachments = BooleanFilter(method='filter_only_attachments')
+    since_id = NumberFilter(method='filter_since_id', min_value=0)
 
     def filter_comments(self, queryset, name, value):
         if not value:
@@ -139,6 +142,9 @@ class WorkflowEventFilter(FilterSet):
             return queryset.only_with_attachments().distinct()
         return queryset
 
+    def filter_since_id(self, queryset, name, value):
+        return queryset.since(int(value))
+
 
 class SystemTemplateFilter(FilterSet):
 
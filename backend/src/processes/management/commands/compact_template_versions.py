@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+from src.processes.models import TemplateVersion
+from src.processes.services.versioning.schemas import TemplateSchemaV1
+from src.processes.services.versioning.versioning import (
+    TemplateVersioningService
+)
+
+
+class Command(BaseCommand):
+
+    help = "Store the template versions as the snapshots and the deltas"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--template-id', type=int)
+
+    def handle(self, *args, **options):
+        template_ids = (
+            TemplateVersion.objects
+            .order_by('template_id')
+            .values_list('template_id', flat=True)
+            .distinct()
+        )
+        if options['template_id']:
+            template_ids = template_ids.filter(
+                template_id=options['template_id']
+            )
+        service = TemplateVersioningService(TemplateSchemaV1)
+        total_before = total_after = 0
+        for template_id in template_ids.iterator():
+            size_before, size_after = service.compact(template_id)
+            total_before += size_before
+            total_after += size_after
+            self.stdout.write(
+                f'Template {template_id}: {size_before} -> {size_after}'
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Compacted {total_before} -> {total_after} bytes of json'
+            )
+        )
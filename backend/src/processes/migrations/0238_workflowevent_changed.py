@@ -0,0 +1,18 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processes', '0237_auto_20250916_2245'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='workflowevent',
+            name='changed',
+            field=models.DateTimeField(help_text='Last change after creation, used by the events feed', null=True),
+        ),
+    ]
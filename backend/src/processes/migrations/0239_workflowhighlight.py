@@ -0,0 +1,63 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0135_contact_photo_etag'),
+        ('processes', '0238_workflowevent_changed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WorkflowHighlight',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('author_id', models.IntegerField(default=0, help_text='User of the event, 0 for the events without the user')),
+                ('created', models.DateTimeField()),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='accounts.Account')),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='processes.WorkflowEvent')),
+                ('workflow', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='highlights', to='processes.Workflow')),
+            ],
+            options={
+                'unique_together': {('workflow', 'author_id')},
+            },
+        ),
+        migrations.AddIndex(
+            model_name='workflowhighlight',
+            index=models.Index(fields=['account', 'created'], name='processes_w_account_8fb81b_idx'),
+        ),
+        # Fill with the last highlight events:
+        # RUN, COMPLETE, TASK_COMPLETE, TASK_REVERT, COMMENT, ENDED, REVERT,
+        # URGENT, NOT_URGENT, TASK_PERFORMER_CREATED, TASK_PERFORMER_DELETED,
+        # FORCE_RESUME, FORCE_DELAY, DUE_DATE_CHANGED, SUB_WORKFLOW_RUN
+        migrations.RunSQL(
+            sql="""
+              INSERT INTO processes_workflowhighlight (
+                account_id,
+                workflow_id,
+                author_id,
+                event_id,
+                created
+              )
+              SELECT DISTINCT ON (we.workflow_id, COALESCE(we.user_id, 0))
+                we.account_id,
+                we.workflow_id,
+                COALESCE(we.user_id, 0),
+                we.id,
+                we.created
+              FROM processes_workflowevent we
+              WHERE NOT we.is_deleted
+                AND we.type IN (0, 1, 3, 4, 5, 6, 8, 11, 12, 14, 15, 16, 17, 18, 19)
+              ORDER BY
+                we.workflow_id,
+                COALESCE(we.user_id, 0),
+                we.created DESC,
+                we.id DESC
+            """,
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
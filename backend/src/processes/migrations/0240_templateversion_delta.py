@@ -0,0 +1,38 @@
+# Generated by Django 2.2 on 2026-10-19 10:12
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processes', '0239_workflowhighlight'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='templateversion',
+            name='data',
+            field=django.contrib.postgres.fields.jsonb.JSONField(null=True),
+        ),
+        migrations.AddField(
+            model_name='templateversion',
+            name='base_version',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='templateversion',
+            name='snapshot_version',
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='templateversion',
+            name='delta',
+            field=django.contrib.postgres.fields.jsonb.JSONField(null=True),
+        ),
+        migrations.AddIndex(
+            model_name='templateversion',
+            index=models.Index(fields=['template_id', 'version'], name='processes_t_templat_bcbb74_idx'),
+        ),
+    ]
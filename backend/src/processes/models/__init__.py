@@ -64,6 +64,7 @@ from src.processes.models.workflows.checklist import (
 from src.processes.models.workflows.event import (
     WorkflowEvent,
     WorkflowEventAction,
+    WorkflowHighlight,
 )
 from src.processes.models.templates.owner import (
     TemplateOwner
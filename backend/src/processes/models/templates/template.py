@@ -255,9 +255,25 @@ class TemplateDraft(SoftDeleteModel):
 
 class TemplateVersion(SoftDeleteModel):
 
+    """ The version is stored as the full snapshot in the data
+        or as the delta from the base version. The chain of the deltas
+        starts from the snapshot of the snapshot_version """
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['template_id', 'version']),
+        ]
+
     version = models.IntegerField(default=0)
     template_id = models.PositiveIntegerField()
-    data = JSONField()
+    data = JSONField(null=True)
+    base_version = models.IntegerField(null=True)
+    snapshot_version = models.IntegerField(null=True)
+    delta = JSONField(null=True)
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.delta is None
 
 
 class TemplateIntegrations(
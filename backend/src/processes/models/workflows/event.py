@@ -42,6 +42,10 @@ class WorkflowEvent(
     )
     created = models.DateTimeField(auto_now_add=True)
     updated = models.DateTimeField(null=True)
+    changed = models.DateTimeField(
+        null=True,
+        help_text='Last change after creation, used by the events feed'
+    )
     workflow = models.ForeignKey(
         Workflow,
         on_delete=models.CASCADE,
@@ -94,3 +98,35 @@ class WorkflowEventAction(
     objects = BaseSoftDeleteManager.from_queryset(
         WorkflowEventActionQuerySet
     )()
+
+
+class WorkflowHighlight(models.Model):
+
+    """ The last highlight event of the workflow by the event author,
+        maintained by WorkflowEventService on the event creation """
+
+    class Meta:
+        unique_together = ('workflow', 'author_id')
+        indexes = [
+            models.Index(fields=['account', 'created']),
+        ]
+
+    account = models.ForeignKey(
+        'accounts.Account',
+        on_delete=models.CASCADE,
+    )
+    workflow = models.ForeignKey(
+        Workflow,
+        on_delete=models.CASCADE,
+        related_name='highlights',
+    )
+    author_id = models.IntegerField(
+        default=0,
+        help_text='User of the event, 0 for the events without the user'
+    )
+    event = models.ForeignKey(
+        WorkflowEvent,
+        on_delete=models.CASCADE,
+        related_name='+',
+    )
+    created = models.DateTimeField()
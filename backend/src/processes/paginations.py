@@ -1,3 +1,8 @@
+from rest_framework.pagination import (
+    CursorPagination,
+    LimitOffsetPagination,
+)
+from rest_framework.utils.urls import replace_query_param
 from src.generics.paginations import DefaultPagination
 
 
@@ -19,3 +24,93 @@ class WorkflowListPagination(DefaultPagination):
             return []
         # Pagination at the WorkflowListQuery was used
         return queryset
+
+
+class WorkflowEventCursorPagination(CursorPagination):
+
+    """ Keyset pagination by the event id, the page is selected
+        without OFFSET and COUNT. An empty "cursor" returns the first page """
+
+    page_size = DefaultPagination.default_limit
+    page_size_query_param = 'limit'
+    max_page_size = DefaultPagination.max_limit
+    ordering = '-id'
+
+    def get_ordering(self, request, queryset, view):
+        if request.query_params.get('ordering') == 'created':
+            return ('id',)
+        return (self.ordering,)
+
+    def decode_cursor(self, request):
+        if not request.query_params.get(self.cursor_query_param):
+            return None
+        return super().decode_cursor(request)
+
+
+class WorkflowEventPagination(LimitOffsetPagination):
+
+    """ Limit/offset pagination of the events,
+        the keyset pagination is used if the "cursor" param is passed """
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if WorkflowEventCursorPagination.cursor_query_param in (
+            request.query_params
+        ):
+            self.cursor_paginator = WorkflowEventCursorPagination()
+            return self.cursor_paginator.paginate_queryset(
+                queryset,
+                request,
+                view
+            )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+
+class HighlightsPagination(LimitOffsetPagination):
+
+    """ Limit/offset pagination of the highlights. The page after
+        the "before_id" event is limited by the query and returned
+        in the same envelope, the count is the size of the page """
+
+    before_id_query_param = 'before_id'
+
+    def __init__(self):
+        self.before_id = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.before_id = request.query_params.get(self.before_id_query_param)
+        if self.before_id is None:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = min(
+            self.get_limit(request) or DefaultPagination.default_limit,
+            DefaultPagination.max_limit
+        )
+        self.page = list(queryset)
+        self.count = len(self.page)
+        return self.page
+
+    def get_next_link(self):
+        if self.before_id is None:
+            return super().get_next_link()
+        if self.count < self.limit:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(
+            url,
+            self.before_id_query_param,
+            self.page[-1].id
+        )
+
+    def get_previous_link(self):
+        if self.before_id is None:
+            return super().get_previous_link()
+        return None
@@ -4,6 +4,7 @@ from datetime import datetime
 from django.contrib.auth import get_user_model
 from src.accounts.models import User, UserGroup
 from src.generics.mixins.managers import SearchSqlQueryMixin
+from src.generics.paginations import DefaultPagination
 from src.processes.paginations import WorkflowListPagination
 from src.queries import (
     SqlQueryObject,
@@ -1216,6 +1217,7 @@ class TemplateListQuery(
             pt.is_embedded,
             pt.type,
             pt.search_content,
+            pt.version,
             {self.get_workflows_select()}
             COUNT(DISTINCT ptt.id) as tasks_count
 
@@ -1493,6 +1495,8 @@ class HighlightsQuery(SqlQueryObject):
         WorkflowEventType.DUE_DATE_CHANGED,
         WorkflowEventType.SUB_WORKFLOW_RUN,
     )
+    default_limit = DefaultPagination.default_limit
+    max_limit = DefaultPagination.max_limit
 
     def __init__(
         self,
@@ -1503,6 +1507,8 @@ class HighlightsQuery(SqlQueryObject):
         current_performer_group_ids: Optional[List[int]] = None,
         date_before_tsp: Optional[datetime] = None,
         date_after_tsp: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ):
 
         # TODO Refactoring need
@@ -1544,48 +1550,44 @@ class HighlightsQuery(SqlQueryObject):
         if date_after_tsp is not None:
             self.date_after_tsp = date_after_tsp
 
+        if before_id is not None:
+            self.before_id = before_id
+            self.limit = min(limit or self.default_limit, self.max_limit)
+
     def get_sql(self):
-        subquery = f"""
-        SELECT DISTINCT ON (we.workflow_id)
-          we.id,
-          we.type,
-          we.task_json,
-          we.delay_json,
-          we.text,
-          we.created,
-          we.user_id,
-          we.target_user_id,
-          we.workflow_id
-        FROM processes_workflowevent we
-        LEFT JOIN processes_workflow workflow ON
-          we.workflow_id = workflow.id
-        LEFT JOIN processes_template template ON
+
+        """ The last highlight events of the workflows are selected
+            from the projection maintained by WorkflowEventService,
+            the event history of the workflows is not scanned """
+
+        subquery = """
+        SELECT DISTINCT ON (hl.workflow_id)
+          hl.event_id
+        FROM processes_workflow_owners workflow_owners
+        INNER JOIN processes_workflowhighlight hl ON
+          workflow_owners.workflow_id = hl.workflow_id
+        INNER JOIN processes_workflow workflow ON
+          hl.workflow_id = workflow.id
+        INNER JOIN processes_template template ON
           workflow.template_id = template.id
-        LEFT JOIN processes_workflow_owners workflow_owners ON
-          workflow.id = workflow_owners.workflow_id
         WHERE
-          NOT we.is_deleted AND
-          we.account_id = %(account_id)s AND
+          workflow_owners.user_id = %(user_id)s AND
+          hl.account_id = %(account_id)s AND
           NOT workflow.is_deleted AND
-          NOT template.is_deleted AND
-          workflow_owners.user_id = %(user_id)s
+          NOT template.is_deleted
         """
         ordering = 'ORDER BY we.created DESC, we.id DESC'
-        sub_ordering = ' ORDER BY we.workflow_id, we.created DESC'
-        additional_where = []
-        where = []
-
-        result, params = self._to_sql_list(self.event_types, 'type')
-        self.sql_params.update(params)
-        additional_where.append(
-            f'we.type in {result}'
+        sub_ordering = (
+            ' ORDER BY hl.workflow_id, hl.created DESC, hl.event_id DESC'
         )
+        additional_where = []
+        where = ['NOT we.is_deleted']
 
         if hasattr(self, 'users'):
             result, params = self._to_sql_list(self.users, 'user')
             self.sql_params.update(params)
             additional_where.append(
-                f'we.user_id in {result}'
+                f'hl.author_id in {result}'
             )
 
         if hasattr(self, 'templates'):
@@ -1597,34 +1599,90 @@ class HighlightsQuery(SqlQueryObject):
 
         if hasattr(self, 'date_before_tsp'):
             self.sql_params['date_before_tsp'] = self.date_before_tsp
-            where.append(f'we.created <= %(date_before_tsp)s')
+            where.append('we.created <= %(date_before_tsp)s')
 
         if hasattr(self, 'date_after_tsp'):
+            # The last event is the same for the older events excluded
             self.sql_params['date_after_tsp'] = self.date_after_tsp
-            where.append(f'we.created >= %(date_after_tsp)s')
+            additional_where.append('hl.created >= %(date_after_tsp)s')
+
+        if hasattr(self, 'before_id'):
+            self.sql_params['before_id'] = self.before_id
+            where.append(
+                '(we.created, we.id) < ('
+                'SELECT created, id FROM processes_workflowevent '
+                'WHERE id = %(before_id)s)'
+            )
 
         if additional_where:
             additional_where = ' AND '.join(additional_where)
             subquery += f'AND {additional_where}'
-
-        if where:
-            where = ' AND '.join(where)
-            where = f'WHERE {where}'
-        else:
-            where = ''
-
         subquery += sub_ordering
+        where = ' AND '.join(where)
+
+        limit = ''
+        if hasattr(self, 'limit'):
+            self.sql_params['limit'] = self.limit
+            limit = 'LIMIT %(limit)s'
 
         return f"""
           SELECT
-            we.*
+            we.id,
+            we.type,
+            we.task_json,
+            we.delay_json,
+            we.text,
+            we.created,
+            we.user_id,
+            we.target_user_id,
+            we.workflow_id
           FROM ({subquery}
-          ) AS we
-          {where}
+          ) AS hl
+          INNER JOIN processes_workflowevent we ON we.id = hl.event_id
+          WHERE {where}
           {ordering}
+          {limit}
         """, self.sql_params
 
 
+class UpsertWorkflowHighlightQuery(SqlQueryObject):
+
+    """ Replaces the last highlight event of the workflow by the author
+        if the event is not older. Concurrent events are resolved
+        by the unique (workflow, author) constraint """
+
+    def __init__(self, event):
+        self.params = {
+            'account_id': event.account_id,
+            'workflow_id': event.workflow_id,
+            'author_id': event.user_id or 0,
+            'event_id': event.id,
+            'created': event.created,
+        }
+
+    def get_sql(self):
+        return """
+          INSERT INTO processes_workflowhighlight (
+            account_id,
+            workflow_id,
+            author_id,
+            event_id,
+            created
+          )
+          VALUES (
+            %(account_id)s,
+            %(workflow_id)s,
+            %(author_id)s,
+            %(event_id)s,
+            %(created)s
+          )
+          ON CONFLICT (workflow_id, author_id) DO UPDATE SET
+            event_id = EXCLUDED.event_id,
+            created = EXCLUDED.created
+          WHERE processes_workflowhighlight.created <= EXCLUDED.created
+        """, self.params
+
+
 class UpdateWorkflowEventWatchedQuery(SqlQueryObject):
     """ Construct ARRAY[]::jsonb[] from newly created
         WorkflowEventAction records and add to WorkflowEvent.watched array """
@@ -1644,7 +1702,9 @@ class UpdateWorkflowEventWatchedQuery(SqlQueryObject):
     def get_sql(self) -> Tuple[str, dict]:
         query = f"""
         UPDATE processes_workflowevent
-        SET watched = updated.watched
+        SET
+          watched = updated.watched,
+          changed = now()
         FROM (
           SELECT
             we.id,
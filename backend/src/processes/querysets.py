@@ -9,6 +9,7 @@ from django.db.models import (
     Avg,
     Max,
     Prefetch,
+    Subquery,
 )
 from src.processes.queries import (
     WorkflowListQuery,
@@ -50,6 +51,15 @@ class DelayBaseQuerySet(BaseQuerySet):
     def active(self):
         return self.filter(end_date__isnull=True)
 
+    def delayed_tasks(self):
+        return self.filter(
+            end_date__isnull=True,
+            task__status=TaskStatus.DELAYED,
+        )
+
+    def ending_before(self, date: datetime):
+        return self.delayed_tasks().filter(estimated_end_date__lte=date)
+
 
 class TasksBaseQuerySet(BaseQuerySet):
 
@@ -216,6 +226,7 @@ class TemplateQuerySet(WorkflowsBaseQuerySet):
             is_active=is_active,
             is_public=is_public
         )
+        # The kickoff is loaded for the page by TemplateListSerializer
         return (
             self.execute_raw(query)
             .prefetch_related(
@@ -223,9 +234,6 @@ class TemplateQuerySet(WorkflowsBaseQuerySet):
                     'owners',
                     queryset=TemplateOwner.objects.order_by('type', 'id')
                 ),
-                'kickoff',
-                'kickoff__fields',
-                'kickoff__fields__selections'
             )
         )
 
@@ -949,6 +957,8 @@ class WorkflowEventQuerySet(AccountBaseQuerySet):
         current_performer_group_ids: Optional[List[int]] = None,
         date_before_tsp: Optional[datetime] = None,
         date_after_tsp: Optional[datetime] = None,
+        before_id: Optional[int] = None,
+        limit: Optional[int] = None,
     ):
         # TODO refactoring need
 
@@ -960,7 +970,9 @@ class WorkflowEventQuerySet(AccountBaseQuerySet):
             current_performer_ids=current_performer_ids,
             current_performer_group_ids=current_performer_group_ids,
             date_before_tsp=date_before_tsp,
-            date_after_tsp=date_after_tsp
+            date_after_tsp=date_after_tsp,
+            before_id=before_id,
+            limit=limit,
         )
         return self.execute_raw(query)
 
@@ -976,6 +988,32 @@ class WorkflowEventQuerySet(AccountBaseQuerySet):
     def by_user(self, user_id: int):
         return self.filter(user_id=user_id)
 
+    def since(self, event_id: int):
+
+        """ Events created after the given event and the events
+            changed after it was created (comments updates,
+            reactions, watched) """
+
+        created = self.model.objects.filter(id=event_id).values('created')
+        return self.filter(
+            Q(id__gt=event_id) | Q(changed__gte=Subquery(created[:1]))
+        )
+
+    def get_feed_state(self) -> str:
+
+        """ Short description of the events feed state,
+            it changes on creation, change and deletion of events """
+
+        state = self.order_by().aggregate(
+            count=Count('id'),
+            last_id=Max('id'),
+            last_changed=Max('changed'),
+        )
+        return (
+            f"{state['count']}:{state['last_id']}:"
+            f"{state['last_changed'] and state['last_changed'].isoformat()}"
+        )
+
     def update_watched_from(self, actions_ids: List[int]):
         from src.processes.queries import (
             UpdateWorkflowEventWatchedQuery
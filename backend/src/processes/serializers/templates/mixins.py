@@ -1,6 +1,8 @@
 from typing import Dict, Any, List, Optional, Set
 from django.contrib.auth import get_user_model
+from django.core.exceptions import FieldDoesNotExist
 from django.db import IntegrityError, transaction
+from django.db.models import Model
 from rest_framework.serializers import Serializer
 from src.utils.validation import raise_validation_error
 from src.processes.messages.template import MSG_PT_0041
@@ -42,13 +44,54 @@ class CreateOrUpdateInstanceMixin:
                 pass
         return data
 
+    def _get_changed_fields(
+        self,
+        instance,
+        data: Dict[str, Any]
+    ) -> Set[str]:
+
+        """ Compares the foreign keys by the id
+            without loading of the related objects.
+            The values which aren't the model fields are skipped,
+            e.g. the "source_id" of the template owner """
+
+        changed_fields = set()
+        for field_name, field_value in data.items():
+            try:
+                field = instance._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if not field.concrete:
+                continue
+            if field.many_to_one or field.one_to_one:
+                current_value = getattr(instance, field.attname)
+                if isinstance(field_value, Model):
+                    field_value = field_value.pk
+            else:
+                current_value = getattr(instance, field_name)
+            if current_value != field_value:
+                changed_fields.add(field_name)
+        return changed_fields
+
     def _update(
         self,
         instance,
         validated_data: Dict[str, Any]
     ):
 
+        """ The unchanged instance is not saved, except the models
+            with "auto_now" fields (e.g. the template updating date) """
+
         data = self._get_create_or_update_data(validated_data)
+        has_auto_now_fields = any(
+            getattr(field, 'auto_now', False)
+            for field in instance._meta.concrete_fields
+        )
+        if not has_auto_now_fields and not self._get_changed_fields(
+            instance=instance,
+            data=data,
+        ):
+            return
         for field_name, field_value in data.items():
             setattr(instance, field_name, field_value)
         with transaction.atomic():
@@ -107,11 +150,14 @@ class CreateOrUpdateRelatedMixin:
         data,
         ancestors_data,
         slz_context=None,
+        instances: Optional[Dict[Any, Any]] = None,
     ) -> Serializer:
 
         """ This method checks existing of object either by id or api_name.
             If objects exists then returns serializer
-            for update else for create. """
+            for update else for create.
+            The preloaded "instances" by the primary value are used
+            instead of the query if passed """
 
         slz_context = {} if slz_context is None else slz_context
         model_cls = slz_cls.Meta.model
@@ -119,9 +165,12 @@ class CreateOrUpdateRelatedMixin:
         api_primary_field = self._get_api_primary_field(slz_cls)
         primary_value = data.get(api_primary_field)
         if primary_value:
-            obj_filter = ancestors_data.copy()
-            obj_filter[api_primary_field] = primary_value
-            instance = model_cls.objects.filter(**obj_filter).first()
+            if instances is not None:
+                instance = instances.get(primary_value)
+            else:
+                obj_filter = ancestors_data.copy()
+                obj_filter[api_primary_field] = primary_value
+                instance = model_cls.objects.filter(**obj_filter).first()
             if instance:
                 slz = slz_cls(instance, data=data, context=slz_context)
         if slz is None:
@@ -192,32 +241,46 @@ class CreateOrUpdateRelatedMixin:
 
         """ Create or update foreign key related records
             in right order and delete prev record
-            If not the data - then all prev records are deleted """
+            If not the data - then all prev records are deleted.
+
+            The records are selected once and compared with the data,
+            the queries are executed only for the changed records """
 
         model_cls = slz_cls.Meta.model
-        if data:
-            existent_ids = set()
-            api_primary_field = self._get_api_primary_field(slz_cls)
-            for elem in data:
-                primary_value = elem.get(api_primary_field)
-                if primary_value:
-                    existent_ids.add(primary_value)
-            model_cls.objects.filter(**ancestors_data).exclude(
-                **{f'{api_primary_field}__in': existent_ids}
-            ).delete()
-        else:
+        if not data:
             model_cls.objects.filter(**ancestors_data).delete()
+            return
 
-        if data:
-            for el in data:
-                slz = self._get_related_serializer(
-                    slz_cls=slz_cls,
-                    slz_context=slz_context,
-                    data=el,
-                    ancestors_data=ancestors_data,
-                )
-                slz.is_valid(raise_exception=True)
-                slz.save()
+        api_primary_field = self._get_api_primary_field(slz_cls)
+        existent_ids = set()
+        for elem in data:
+            primary_value = elem.get(api_primary_field)
+            if primary_value:
+                existent_ids.add(primary_value)
+        instances = {}
+        deleted_ids = []
+        for instance in model_cls.objects.filter(**ancestors_data):
+            primary_value = getattr(instance, api_primary_field)
+            if primary_value in existent_ids:
+                instances[primary_value] = instance
+            else:
+                deleted_ids.append(instance.id)
+        if deleted_ids:
+            model_cls.objects.filter(id__in=deleted_ids).delete()
+
+        for el in data:
+            slz = self._get_related_serializer(
+                slz_cls=slz_cls,
+                slz_context=slz_context,
+                data=el,
+                ancestors_data=ancestors_data,
+                instances=instances,
+            )
+            slz.is_valid(raise_exception=True)
+            obj = slz.save()
+            primary_value = getattr(obj, api_primary_field, None)
+            if primary_value:
+                instances[primary_value] = obj
 
 
 class CustomValidationApiNameMixin:
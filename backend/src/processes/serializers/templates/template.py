@@ -7,6 +7,7 @@ from src.processes.consts import TEMPLATE_NAME_LENGTH
 from rest_framework.serializers import (
     Serializer,
     ModelSerializer,
+    ListSerializer,
     BooleanField,
     IntegerField,
     DateTimeField,
@@ -43,7 +44,6 @@ from src.processes.serializers.templates.task import (
 from src.processes.serializers.templates.kickoff import (
     KickoffSerializer,
     KickoffOnlyFieldsSerializer,
-    KickoffListSerializer,
 )
 from src.processes.serializers.templates.task import (
     ShortTaskSerializer
@@ -71,6 +71,9 @@ from src.processes.enums import (
     WorkflowApiStatus,
 )
 from src.generics.exceptions import BaseServiceException
+from src.processes.services.templates.kickoff_cache import (
+    TemplateListKickoffCache
+)
 from src.processes.services.templates.integrations import (
     TemplateIntegrationsService
 )
@@ -747,10 +750,23 @@ class TemplateListFilterSerializer(
         return clear_text if clear_text else None
 
 
+class TemplateListListSerializer(ListSerializer):
+
+    def to_representation(self, data):
+
+        """ Loads the kickoff of all page templates at once,
+            TemplateListSerializer reads it from the "kickoffs" attr """
+
+        templates = list(data)
+        self.kickoffs = TemplateListKickoffCache.get_many(templates)
+        return super().to_representation(templates)
+
+
 class TemplateListSerializer(ModelSerializer):
 
     class Meta:
         model = Template
+        list_serializer_class = TemplateListListSerializer
         fields = (
             'id',
             'wf_name_template',
@@ -774,7 +790,10 @@ class TemplateListSerializer(ModelSerializer):
         return TemplateOwnerSerializer(instance.owners, many=True).data
 
     def get_kickoff(self, instance: Template):
-        return KickoffListSerializer(instance.kickoff, many=True).data[0]
+        kickoffs = getattr(self.parent, 'kickoffs', None)
+        if kickoffs is None:
+            kickoffs = TemplateListKickoffCache.get_many([instance])
+        return kickoffs.get(instance.id)
 
 
 class TemplateOnlyFieldsSerializer(ModelSerializer):
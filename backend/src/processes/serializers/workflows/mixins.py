@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable
 from django.contrib.auth import get_user_model
 from src.processes.consts import WORKFLOW_NAME_LENGTH
 from src.processes.enums import TaskStatus
@@ -8,7 +8,8 @@ from src.processes.utils.common import (
 from src.processes.serializers.workflows.kickoff_value import (
     KickoffValueSerializer
 )
-from src.processes.services.tasks.task import TaskService
+from src.processes.services.tasks.texts import TaskTextsService
+from src.processes.services.tasks.due_date import WorkflowDueDateService
 
 
 UserModel = get_user_model()
@@ -20,24 +21,25 @@ class WorkflowSerializerMixin:
         self,
         update_fields_values: bool,
         is_urgent: Optional[bool] = None,
+        fields_api_names: Iterable[str] = (),
     ):
         tasks = self.instance.tasks.exclude_pending().order_by('id')
-        if is_urgent is not None and not update_fields_values:
+        if is_urgent is not None:
             tasks.update(is_urgent=is_urgent)
-        elif update_fields_values:
+        if update_fields_values:
             fields_values = self.instance.get_fields_markdown_values(
                 tasks_filter_kwargs={'task__status': TaskStatus.COMPLETED})
+            tasks = list(tasks)
+            TaskTextsService(tasks).insert_fields_values(
+                fields_values=fields_values,
+                api_names=fields_api_names,
+            )
             for task in tasks:
-                task_service = TaskService(
-                    instance=task,
-                    user=self.context['user']
-                )
-                if is_urgent is not None:
-                    task_service.partial_update(is_urgent=is_urgent)
-                task_service.insert_fields_values(fields_values)
                 if task.is_active:
-                    task_service.set_due_date_from_template()
                     task.update_performers()
+            WorkflowDueDateService(self.instance.id).update_dependents(
+                field_api_names=fields_api_names
+            )
 
     def _update_kickoff_value(
         self,
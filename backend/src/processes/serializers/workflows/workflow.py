@@ -1,4 +1,5 @@
 import re
+from functools import partial
 from typing import Dict, Any
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ObjectDoesNotExist
@@ -43,6 +44,9 @@ from src.processes.serializers.workflows.task import (
 from src.processes.serializers.workflows.mixins import (
     WorkflowSerializerMixin,
 )
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 from src.processes.services.urgent import (
     UrgentService
 )
@@ -276,7 +280,8 @@ class WorkflowUpdateSerializer(
             if update_tasks_kwargs:
                 self._update_tasks(
                     is_urgent=is_urgent,
-                    update_fields_values=bool(kickoff_fields_data)
+                    update_fields_values=bool(kickoff_fields_data),
+                    fields_api_names=(kickoff_fields_data or {}).keys()
                 )
             if is_urgent_changed:
                 UrgentService.resolve(
@@ -396,15 +401,42 @@ class WorkflowDetailsSerializer(serializers.ModelSerializer):
         read_only=True
     )
 
-    def get_kickoff(self, instance: Workflow):
+    def _build_snapshot(self, instance: Workflow) -> dict:
         kickoff = instance.kickoff_instance
-        if kickoff:
-            return KickoffValueInfoSerializer(kickoff).data
-        return None
+        tasks = instance.tasks.exclude(status=TaskStatus.SKIPPED)
+        return {
+            'kickoff': (
+                KickoffValueInfoSerializer(kickoff).data if kickoff else None
+            ),
+            'tasks': WorkflowCurrentTaskSerializer(
+                instance=tasks,
+                many=True
+            ).data,
+        }
+
+    def _get_snapshot(self, instance: Workflow) -> dict:
+
+        """ Tasks and kickoff are the heaviest part of the details,
+            they are cached until the workflow revision changes """
+
+        snapshot = getattr(self, '_snapshot', None)
+        if snapshot is None or snapshot[0] != instance.id:
+            snapshot = (
+                instance.id,
+                WorkflowDetailsCache.get_snapshot(
+                    workflow_id=instance.id,
+                    account_id=instance.account_id,
+                    build=partial(self._build_snapshot, instance),
+                )
+            )
+            self._snapshot = snapshot
+        return snapshot[1]
+
+    def get_kickoff(self, instance: Workflow):
+        return self._get_snapshot(instance)['kickoff']
 
     def get_tasks(self, instance: Workflow):
-        tasks = instance.tasks.exclude(status=TaskStatus.SKIPPED)
-        return WorkflowCurrentTaskSerializer(instance=tasks, many=True).data
+        return self._get_snapshot(instance)['tasks']
 
 
 class WorkflowNotificationSerializer(serializers.ModelSerializer):
@@ -1,7 +1,11 @@
 from abc import abstractmethod
+from typing import Optional
 from django.db.models import Model
 from django.contrib.auth import get_user_model
 from src.generics.base.service import BaseModelService
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 from src.authentication.enums import (
     AuthTokenType
 )
@@ -29,6 +33,19 @@ class BaseWorkflowService(BaseModelService):
     ):
         pass
 
+    def _get_workflow_id(self) -> Optional[int]:
+        return getattr(self.instance, 'workflow_id', None)
+
+    def create(self, **kwargs) -> Model:
+        instance = super().create(**kwargs)
+        WorkflowDetailsCache.workflow_changed(self._get_workflow_id())
+        return instance
+
+    def save(self):
+        if self.update_fields:
+            super().save()
+            WorkflowDetailsCache.workflow_changed(self._get_workflow_id())
+
 
 class BaseUpdateVersionService:
 
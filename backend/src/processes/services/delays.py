@@ -0,0 +1,94 @@
+from datetime import timedelta
+from functools import partial
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import timezone
+from src.processes.models import Delay
+
+
+class DelayScheduler:
+
+    """ Resumes the delayed tasks on time with the celery ETA tasks.
+
+        The worker keeps the ETA task in memory until the due time,
+        so only the delays ending within DELAY_ETA_HORIZON are scheduled
+        at once. The later delays are scheduled by the periodic sweep
+        when they come into the horizon. The scheduled end date is saved
+        to the cache, so each end date is scheduled once """
+
+    cache = caches['default']
+    key_prefix = 'delay_eta'
+    # The ETA task may be received a bit before the due time
+    eta_tolerance = timedelta(seconds=1)
+
+    @classmethod
+    def _get_cache_key(cls, delay: Delay) -> str:
+        return (
+            f'{cls.key_prefix}:{delay.id}:'
+            f'{delay.estimated_end_date.timestamp()}'
+        )
+
+    @classmethod
+    def _get_horizon(cls):
+        return timezone.now() + timedelta(seconds=settings.DELAY_ETA_HORIZON)
+
+    @classmethod
+    def _send_task(cls, delay_id: int, end_date_tsp: float, eta):
+        from src.processes.tasks.delay import resume_delayed_task
+        resume_delayed_task.apply_async(
+            kwargs={'delay_id': delay_id, 'end_date_tsp': end_date_tsp},
+            eta=eta
+        )
+
+    @classmethod
+    def schedule(cls, delay: Delay):
+
+        """ Schedules the resume of the delay after the commit,
+            if the delay ends within the horizon """
+
+        end_date = delay.estimated_end_date
+        if end_date is None or end_date > cls._get_horizon():
+            return
+        if cls.cache.add(
+            cls._get_cache_key(delay),
+            1,
+            settings.DELAY_ETA_HORIZON * 2
+        ):
+            transaction.on_commit(
+                partial(
+                    cls._send_task,
+                    delay_id=delay.id,
+                    end_date_tsp=end_date.timestamp(),
+                    eta=end_date
+                )
+            )
+
+    @classmethod
+    def reschedule(cls, delay: Delay):
+
+        """ Schedules the resume again, used when the ETA task
+            fired before the end date of the delay """
+
+        end_date = delay.estimated_end_date
+        transaction.on_commit(
+            partial(
+                cls._send_task,
+                delay_id=delay.id,
+                end_date_tsp=end_date.timestamp(),
+                eta=end_date
+            )
+        )
+
+    @classmethod
+    def schedule_upcoming(cls):
+
+        """ Schedules the delays came into the horizon """
+
+        delays = (
+            Delay.objects
+            .ending_before(cls._get_horizon())
+            .only('id', 'estimated_end_date')
+        )
+        for delay in delays:
+            cls.schedule(delay)
@@ -36,6 +36,11 @@ from src.processes.serializers.workflows.events import (
     WorkflowEventSerializer,
 )
 from src.analytics.services import AnalyticService
+from src.executor import RawSqlExecutor
+from src.processes.queries import (
+    HighlightsQuery,
+    UpsertWorkflowHighlightQuery,
+)
 from src.generics.base.service import BaseModelService
 from src.notifications.tasks import send_workflow_event
 from src.services.markdown import (
@@ -49,6 +54,15 @@ UserModel = get_user_model()
 
 class WorkflowEventService:
 
+    @classmethod
+    def _create_event(cls, **kwargs) -> WorkflowEvent:
+        event = WorkflowEvent.objects.create(**kwargs)
+        if event.type in HighlightsQuery.event_types:
+            RawSqlExecutor.execute(
+                *UpsertWorkflowHighlightQuery(event).get_sql()
+            )
+        return event
+
     @classmethod
     def _after_create_actions(cls, event: WorkflowEvent):
 
@@ -71,7 +85,7 @@ class WorkflowEventService:
     ) -> WorkflowEvent:
 
         with_attachments = task.output.with_attachments().exists()
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_COMPLETE,
             account=user.account,
             task=task,
@@ -97,7 +111,7 @@ class WorkflowEventService:
         after_create_actions: bool = True,
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_REVERT,
             text=text,
             clear_text=clear_text or text,
@@ -123,7 +137,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_DELAY,
             account=user.account,
             task=task,
@@ -146,7 +160,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.ENDED,
             account=user.account,
             workflow=workflow,
@@ -165,7 +179,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.FORCE_DELAY,
             account=user.account,
             user=user,
@@ -184,7 +198,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.FORCE_RESUME,
             account=user.account,
             user=user,
@@ -202,7 +216,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             account=user.account,
             type=WorkflowEventType.REVERT,
             workflow=task.workflow,
@@ -228,7 +242,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             account=user.account,
             type=WorkflowEventType.COMMENT,
             text=text,
@@ -255,7 +269,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=event_type,
             account=user.account,
             workflow=workflow,
@@ -274,7 +288,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_CREATED,
             account=user.account,
             task=task,
@@ -301,7 +315,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_GROUP_CREATED,
             account=user.account,
             task=task,
@@ -329,7 +343,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_DELETED,
             account=user.account,
             task=task,
@@ -356,7 +370,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_PERFORMER_GROUP_DELETED,
             account=user.account,
             task=task,
@@ -383,7 +397,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.DUE_DATE_CHANGED,
             account=user.account,
             workflow=task.workflow,
@@ -405,7 +419,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_SKIP,
             account=task.account,
             workflow=task.workflow,
@@ -426,7 +440,7 @@ class WorkflowEventService:
         user: Optional[UserModel] = None,
     ) -> WorkflowEvent:
 
-        return WorkflowEvent.objects.create(
+        return cls._create_event(
             type=WorkflowEventType.RUN,
             account=workflow.account,
             workflow=workflow,
@@ -442,7 +456,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.SUB_WORKFLOW_RUN,
             account=workflow.account,
             workflow=workflow,
@@ -469,7 +483,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.COMPLETE,
             account=workflow.account,
             task=task,
@@ -493,7 +507,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.ENDED_BY_CONDITION,
             account=workflow.account,
             task=task,
@@ -516,7 +530,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.DELAY,
             account=workflow.account,
             workflow=workflow,
@@ -533,7 +547,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_START,
             account=task.account,
             task=task,
@@ -554,7 +568,7 @@ class WorkflowEventService:
         after_create_actions: bool = True
     ) -> WorkflowEvent:
 
-        event = WorkflowEvent.objects.create(
+        event = cls._create_event(
             type=WorkflowEventType.TASK_SKIP_NO_PERFORMERS,
             account=task.account,
             workflow=task.workflow,
@@ -760,9 +774,11 @@ class CommentService(BaseModelService):
             attachments = pattern.findall(text)
             if attachments:
                 attachments = [int(e) for e in attachments]
+        current_date = timezone.now()
         kwargs = {
             'status': CommentStatus.UPDATED,
-            'updated': timezone.now(),
+            'updated': current_date,
+            'changed': current_date,
             'with_attachments': bool(attachments),
             'text': text,
             'clear_text': clear_text
@@ -810,6 +826,7 @@ class CommentService(BaseModelService):
             status=CommentStatus.DELETED,
             with_attachments=False,
             text=None,
+            changed=timezone.now(),
             force_save=True,
         )
         self._send_workflow_event()
@@ -847,6 +864,7 @@ class CommentService(BaseModelService):
             self.instance.reactions.setdefault(value, []).append(self.user.id)
             self.partial_update(
                 reactions=self.instance.reactions,
+                changed=timezone.now(),
                 force_save=True
             )
             AnalyticService.comment_reaction_added(
@@ -884,6 +902,7 @@ class CommentService(BaseModelService):
                 self.instance.reactions.pop(value)
             self.partial_update(
                 reactions=self.instance.reactions,
+                changed=timezone.now(),
                 force_save=True
             )
             AnalyticService.comment_reaction_deleted(
@@ -22,6 +22,9 @@ from src.processes.messages.workflow import (
     MSG_PW_0021,
 )
 from src.processes.models import Task
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 
 
 UserModel = get_user_model()
@@ -152,6 +155,8 @@ class BasePerformersService:
             task_performer.directly_status = DirectlyStatus.CREATED
             task_performer.save()
             created = True
+        if created:
+            WorkflowDetailsCache.workflow_changed(task.workflow_id)
         if created and run_actions:
             cls._create_actions(
                 task=task,
@@ -186,6 +191,7 @@ class BasePerformersService:
         if task_performer is not None:
             task_performer.directly_status = DirectlyStatus.DELETED
             task_performer.save()
+            WorkflowDetailsCache.workflow_changed(task.workflow_id)
             if run_actions:
                 cls._delete_actions(
                     task=task,
@@ -13,6 +13,9 @@ from src.processes.services.base import (
     BaseWorkflowService,
     BaseUpdateVersionService,
 )
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 from src.processes.utils.common import (
     insert_fields_values_to_text
 )
@@ -107,6 +110,7 @@ class ChecklistSelectionService(BaseWorkflowService):
             checklist__task=task,
         ).marked().count()
         task.save()
+        WorkflowDetailsCache.workflow_changed(task.workflow_id)
 
     def insert_fields_values(
         self,
@@ -0,0 +1,171 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+from django.db.models import Q
+from src.processes.models import (
+    Task,
+    TaskField,
+    RawDueDate,
+)
+from src.processes.enums import (
+    DueDateRule,
+    FieldType,
+)
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
+
+
+class WorkflowDueDateService:
+
+    """ Calculates the due dates of the workflow tasks by the rules
+        from one snapshot of the task dates and the date fields.
+
+        The dependents index maps the source of the rule (the task,
+        the field or the workflow start) to the tasks with the rule,
+        so a change of the source recalculates only the dependent tasks.
+        The snapshot parts are loaded on the first use, the service
+        may be shared while the tasks of the workflow are changed """
+
+    SOURCE_TASK = 'task'
+    SOURCE_FIELD = 'field'
+    SOURCE_WORKFLOW = 'workflow'
+    SNAPSHOT_FIELDS = (
+        'status',
+        'date_first_started',
+        'date_completed',
+        'due_date',
+        'due_date_directly_status',
+    )
+
+    def __init__(self, workflow_id: int):
+        self.workflow_id = workflow_id
+        self._tasks: Optional[Dict[str, Task]] = None
+        self._fields: Optional[Dict[str, Optional[str]]] = None
+        self._dependents: Optional[Dict[Tuple[str, str], List[Task]]] = None
+
+    def _get_tasks(self) -> Dict[str, Task]:
+        if self._tasks is None:
+            self._tasks = {
+                task.api_name: task for task in (
+                    Task.objects
+                    .filter(workflow_id=self.workflow_id)
+                    .select_related('raw_due_date', 'workflow')
+                )
+            }
+        return self._tasks
+
+    def _get_fields(self) -> Dict[str, Optional[str]]:
+        if self._fields is None:
+            self._fields = {}
+            values = TaskField.objects.filter(
+                (
+                    Q(task__workflow_id=self.workflow_id) |
+                    Q(kickoff__workflow_id=self.workflow_id)
+                ),
+                workflow_id=self.workflow_id,
+                type=FieldType.DATE,
+            ).values_list('api_name', 'value')
+            for api_name, value in values:
+                self._fields.setdefault(api_name, value)
+        return self._fields
+
+    def _get_source(self, raw_due_date: RawDueDate) -> Tuple[str, str]:
+        if raw_due_date.rule in DueDateRule.TASK_RULES:
+            return self.SOURCE_TASK, raw_due_date.source_id
+        if raw_due_date.rule in DueDateRule.FIELD_RULES:
+            return self.SOURCE_FIELD, raw_due_date.source_id
+        return self.SOURCE_WORKFLOW, ''
+
+    def _get_dependents(self) -> Dict[Tuple[str, str], List[Task]]:
+        if self._dependents is None:
+            self._dependents = defaultdict(list)
+            for task in self._get_tasks().values():
+                raw_due_date = getattr(task, 'raw_due_date', None)
+                if raw_due_date:
+                    source = self._get_source(raw_due_date)
+                    self._dependents[source].append(task)
+        return self._dependents
+
+    def get_due_date(self, task: Task) -> Optional[datetime]:
+
+        """ Calculates the due date value by rule """
+
+        raw_due_date = getattr(task, 'raw_due_date', None)
+        if not raw_due_date:
+            return None
+        start_date = None
+        end_date = None
+        rule = raw_due_date.rule
+        duration = raw_due_date.duration
+        if raw_due_date.duration_months > 0:
+            duration += timedelta(days=(30 * raw_due_date.duration_months))
+
+        if rule in DueDateRule.TASK_RULES:
+            if task.api_name == raw_due_date.source_id:
+                source_task = task
+            else:
+                source_task = self._get_tasks().get(raw_due_date.source_id)
+            if source_task:
+                if rule == DueDateRule.AFTER_TASK_STARTED:
+                    start_date = source_task.date_first_started
+                else:
+                    start_date = source_task.date_completed
+        elif rule in DueDateRule.FIELD_RULES:
+            value = self._get_fields().get(raw_due_date.source_id)
+            if value:
+                if rule == DueDateRule.AFTER_FIELD:
+                    start_date = datetime.fromtimestamp(float(value))
+                if rule == DueDateRule.BEFORE_FIELD:
+                    end_date = datetime.fromtimestamp(float(value))
+        elif rule == DueDateRule.AFTER_WORKFLOW_STARTED:
+            start_date = task.workflow.date_created
+
+        if start_date:
+            return start_date + duration
+        if end_date:
+            return end_date - duration
+        return None
+
+    def task_changed(self, task: Task):
+
+        """ Copies the changed dates and status of the task
+            to the loaded snapshot, so the service can be shared
+            by the actions with the tasks of the workflow """
+
+        if self._tasks is None:
+            return
+        snapshot_task = self._tasks.get(task.api_name)
+        if snapshot_task is None or snapshot_task is task:
+            return
+        for field in self.SNAPSHOT_FIELDS:
+            setattr(snapshot_task, field, getattr(task, field))
+
+    def update_dependents(
+        self,
+        task_api_names: Iterable[str] = (),
+        field_api_names: Iterable[str] = (),
+    ) -> List[Task]:
+
+        """ Recalculates the due dates of the active tasks depending
+            on the changed tasks and fields, the due dates set directly
+            are kept. Returns the updated tasks """
+
+        dependents = self._get_dependents()
+        sources = [
+            *((self.SOURCE_TASK, api_name) for api_name in task_api_names),
+            *((self.SOURCE_FIELD, api_name) for api_name in field_api_names),
+        ]
+        updated_tasks = []
+        for source in sources:
+            for task in dependents.get(source, ()):
+                if not task.is_active or task.due_date_directly_status:
+                    continue
+                due_date = self.get_due_date(task)
+                if due_date != task.due_date:
+                    task.due_date = due_date
+                    updated_tasks.append(task)
+        if updated_tasks:
+            Task.objects.bulk_update(updated_tasks, ['due_date'])
+            WorkflowDetailsCache.workflow_changed(self.workflow_id)
+        return updated_tasks
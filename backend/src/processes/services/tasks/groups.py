@@ -14,6 +14,9 @@ from src.processes.services.tasks.exceptions import (
 from src.processes.enums import DirectlyStatus
 from src.processes.messages.workflow import MSG_PW_0082
 from src.processes.enums import PerformerType
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
 from src.notifications.tasks import (
     send_new_task_notification,
     send_removed_task_notification,
@@ -61,6 +64,8 @@ class GroupPerformerService(BasePerformerService2):
             task_performer.directly_status = DirectlyStatus.CREATED
             task_performer.save()
             created = True
+        if created:
+            WorkflowDetailsCache.workflow_changed(self.task.workflow_id)
         if created and run_actions:
             self._create_group_actions(group=group)
 
@@ -75,6 +80,7 @@ class GroupPerformerService(BasePerformerService2):
         if task_performer is not None:
             task_performer.directly_status = DirectlyStatus.DELETED
             task_performer.save()
+            WorkflowDetailsCache.workflow_changed(self.task.workflow_id)
             if run_actions:
                 self._delete_group_actions(group=group)
 
@@ -1,6 +1,5 @@
-from datetime import datetime, timedelta
-from typing import Dict, Optional
-from django.db.models import Q
+from datetime import datetime
+from typing import Dict, Iterable, Optional
 from django.contrib.auth import get_user_model
 from src.processes.models import (
     Task,
@@ -11,24 +10,20 @@ from src.processes.models import (
     Rule,
     Delay,
     RawDueDate,
-    TaskField,
-)
-from src.processes.enums import (
-    DueDateRule,
-    FieldType,
 )
 from src.processes.services.tasks.checklist import (
     ChecklistService,
 )
+from src.processes.services.tasks.due_date import (
+    WorkflowDueDateService,
+)
+from src.processes.services.tasks.texts import TaskTextsService
 from src.processes.services.base import (
     BaseWorkflowService,
 )
 from src.processes.services.tasks.field import (
     TaskFieldService
 )
-from src.processes.utils.common import (
-    insert_fields_values_to_text
-)
 from src.processes.services.tasks.mixins import (
     ConditionMixin,
 )
@@ -123,30 +118,15 @@ class TaskService(
     def insert_fields_values(
         self,
         fields_values: Dict[str, str],
+        api_names: Optional[Iterable[str]] = None,
     ):
-        self.instance.description = insert_fields_values_to_text(
-            text=self.instance.description_template,
-            fields_values=fields_values
-        )
-        self.instance.clear_description = MarkdownService.clear(
-            self.instance.description
-        )
-        self.update_fields.add('description')
-        self.update_fields.add('clear_description')
-        self.instance.name = insert_fields_values_to_text(
-            text=self.instance.name_template,
+
+        """ api_names - the changed fields, all texts are rendered if None """
+
+        TaskTextsService([self.instance]).insert_fields_values(
             fields_values=fields_values,
+            api_names=api_names,
         )
-        self.update_fields.add('name')
-        self.save()
-        for checklist in self.instance.checklists.all():
-            checklist_service = ChecklistService(
-                instance=checklist,
-                user=self.user,
-                is_superuser=self.is_superuser,
-                auth_type=self.auth_type,
-            )
-            checklist_service.insert_fields_values(fields_values)
 
     def create_conditions_from_template(
         self,
@@ -241,69 +221,28 @@ class TaskService(
                 api_name=raw_due_date_template.api_name
             )
 
-    def get_task_due_date(self) -> Optional[datetime]:
-
-        """ Calculates the due date value by rule """
-
-        raw_due_date = getattr(self.instance, 'raw_due_date', None)
-        due_date = None
-        if raw_due_date:
-            start_date = None
-            end_date = None
-            rule = raw_due_date.rule
-            duration = raw_due_date.duration
-            if raw_due_date.duration_months > 0:
-                duration += timedelta(days=(30 * raw_due_date.duration_months))
+    def get_task_due_date(
+        self,
+        due_dates: Optional[WorkflowDueDateService] = None,
+    ) -> Optional[datetime]:
 
-            if rule in DueDateRule.TASK_RULES:
-                if rule == DueDateRule.AFTER_TASK_STARTED:
-                    if self.instance.api_name == raw_due_date.source_id:
-                        start_date = self.instance.date_first_started
-                    else:
-                        task = Task.objects.filter(
-                            workflow_id=self.instance.workflow_id,
-                            api_name=raw_due_date.source_id,
-                        ).only('date_first_started').first()
-                        if task:
-                            start_date = task.date_first_started
-                elif rule == DueDateRule.AFTER_TASK_COMPLETED:
-                    task = Task.objects.filter(
-                        workflow_id=self.instance.workflow_id,
-                        api_name=raw_due_date.source_id,
-                    ).only('date_completed').first()
-                    if task:
-                        start_date = task.date_completed
-            elif rule in DueDateRule.FIELD_RULES:
-                field = TaskField.objects.filter(
-                    (
-                        Q(task__workflow_id=self.instance.workflow_id) |
-                        Q(kickoff__workflow_id=self.instance.workflow_id)
-                    ),
-                    workflow_id=self.instance.workflow_id,
-                    api_name=raw_due_date.source_id,
-                    type=FieldType.DATE,
-                ).first()
-                if field and field.value:
-                    if rule == DueDateRule.AFTER_FIELD:
-                        start_date = datetime.fromtimestamp(float(field.value))
-                    if rule == DueDateRule.BEFORE_FIELD:
-                        end_date = datetime.fromtimestamp(float(field.value))
-            elif rule == DueDateRule.AFTER_WORKFLOW_STARTED:
-                start_date = self.instance.workflow.date_created
+        """ Calculates the due date value by rule,
+            due_dates may be shared between the tasks of the workflow """
 
-            if start_date:
-                due_date = start_date + duration
-            elif end_date:
-                due_date = end_date - duration
-        return due_date
+        if due_dates is None:
+            due_dates = WorkflowDueDateService(self.instance.workflow_id)
+        return due_dates.get_due_date(self.instance)
 
-    def set_due_date_from_template(self):
+    def set_due_date_from_template(
+        self,
+        due_dates: Optional[WorkflowDueDateService] = None,
+    ):
 
         """ Update if not changed directly """
 
         if self.instance.due_date_directly_status:
             return
-        due_date = self.get_task_due_date()
+        due_date = self.get_task_due_date(due_dates)
         if due_date != self.instance.due_date:
             self.partial_update(
                 due_date=due_date,
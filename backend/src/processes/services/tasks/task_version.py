@@ -416,7 +416,9 @@ class TaskUpdateVersionService(
             self._update_performers(data)
             self._update_raw_due_date(data=data.get('raw_due_date'))
             service = TaskService(instance=self.instance, user=self.user)
-            service.set_due_date_from_template()
+            service.set_due_date_from_template(
+                due_dates=kwargs.get('due_dates')
+            )
         elif self.instance.is_pending:
             self.instance.update_raw_performers_from_task_template(data)
             self._update_raw_due_date(data=data.get('raw_due_date'))
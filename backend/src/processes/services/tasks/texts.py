@@ -0,0 +1,127 @@
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from src.processes.models import (
+    Task,
+    ChecklistSelection,
+)
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
+from src.processes.utils.common import (
+    get_text_vars,
+    insert_fields_values_to_text,
+)
+from src.services.markdown import MarkdownService
+
+
+class TaskTextsService:
+
+    """ Inserts the fields values into the names and the descriptions
+        of the tasks and into the checklist items.
+
+        The texts are indexed by the api names of the fields they refer,
+        so a change of the fields re-renders only the dependent texts.
+        The changed texts are written in bulk """
+
+    def __init__(self, tasks: Iterable[Task]):
+        self.tasks = list(tasks)
+        self._selections: Optional[List[ChecklistSelection]] = None
+        self._index: Optional[
+            Dict[str, Tuple[Set[Task], Set[ChecklistSelection]]]
+        ] = None
+
+    def _get_selections(self) -> List[ChecklistSelection]:
+        if self._selections is None:
+            self._selections = list(
+                ChecklistSelection.objects
+                .filter(checklist__task__in=[task.id for task in self.tasks])
+                .only('id', 'value', 'value_template')
+                .order_by('id')
+            )
+        return self._selections
+
+    def _get_index(
+        self
+    ) -> Dict[str, Tuple[Set[Task], Set[ChecklistSelection]]]:
+        if self._index is None:
+            self._index = defaultdict(lambda: (set(), set()))
+            for task in self.tasks:
+                api_names = (
+                    get_text_vars(task.name_template)
+                    | get_text_vars(task.description_template)
+                )
+                for api_name in api_names:
+                    self._index[api_name][0].add(task)
+            for selection in self._get_selections():
+                for api_name in get_text_vars(selection.value_template):
+                    self._index[api_name][1].add(selection)
+        return self._index
+
+    def _get_dependents(
+        self,
+        api_names: Optional[Iterable[str]],
+    ) -> Tuple[List[Task], List[ChecklistSelection]]:
+        if api_names is None:
+            return self.tasks, self._get_selections()
+        tasks = set()
+        selections = set()
+        index = self._get_index()
+        for api_name in api_names:
+            if api_name in index:
+                tasks.update(index[api_name][0])
+                selections.update(index[api_name][1])
+        return (
+            [task for task in self.tasks if task in tasks],
+            sorted(selections, key=lambda selection: selection.id)
+        )
+
+    def insert_fields_values(
+        self,
+        fields_values: Dict[str, str],
+        api_names: Optional[Iterable[str]] = None,
+    ):
+
+        """ api_names - the changed fields, all texts are rendered if None """
+
+        tasks, selections = self._get_dependents(api_names)
+        updated_tasks = []
+        for task in tasks:
+            name = insert_fields_values_to_text(
+                text=task.name_template,
+                fields_values=fields_values,
+            )
+            description = insert_fields_values_to_text(
+                text=task.description_template,
+                fields_values=fields_values
+            )
+            if name == task.name and description == task.description:
+                continue
+            if description != task.description:
+                task.description = description
+                task.clear_description = MarkdownService.clear(description)
+            task.name = name
+            updated_tasks.append(task)
+        if updated_tasks:
+            Task.objects.bulk_update(
+                updated_tasks,
+                ['name', 'description', 'clear_description']
+            )
+
+        updated_selections = []
+        for selection in selections:
+            value = insert_fields_values_to_text(
+                text=selection.value_template,
+                fields_values=fields_values
+            )
+            if value != selection.value:
+                selection.value = value
+                updated_selections.append(selection)
+        if updated_selections:
+            ChecklistSelection.objects.bulk_update(
+                updated_selections,
+                ['value']
+            )
+
+        if updated_tasks or updated_selections:
+            for workflow_id in {task.workflow_id for task in self.tasks}:
+                WorkflowDetailsCache.workflow_changed(workflow_id)
@@ -29,6 +29,15 @@ from src.processes.services.templates.template import (
 from src.ai.models import (
     OpenAiPrompt
 )
+from src.ai.enums import OpenAIPromptTarget
+from src.ai.backends import (
+    OpenAiCompletionBackend,
+    FakeCompletionBackend,
+)
+from src.ai.cache import (
+    OpenAiPromptCache,
+    OpenAiResponseCache,
+)
 from src.processes.utils.common import (
     insert_fields_values_to_text, create_api_name
 )
@@ -66,21 +75,38 @@ class BaseAiService:
     ):
         pass
 
-    def _get_response(
+    def _get_completion_backend(
+        self
+    ) -> Union[OpenAiCompletionBackend, FakeCompletionBackend]:
+        if settings.AI_FAKE_COMPLETION or (
+            settings.CONFIGURATION_CURRENT not in (
+                settings.CONFIGURATION_PROD,
+                settings.CONFIGURATION_STAGING
+            )
+        ):
+            return FakeCompletionBackend(
+                content=self._test_response(),
+                delay=settings.AI_FAKE_COMPLETION_DELAY,
+            )
+        return OpenAiCompletionBackend()
+
+    def _get_prompt(self) -> OpenAiPrompt:
+        prompt = OpenAiPromptCache.get(OpenAIPromptTarget.GET_STEPS)
+        if not prompt or not any(
+            elem.is_active for elem in prompt.messages.all()
+        ):
+            raise OpenAiStepsPromptNotExist()
+        return prompt
+
+    def _create_completion(
         self,
         prompt: OpenAiPrompt,
         user_description: str
     ) -> str:
 
-        if settings.CONFIGURATION_CURRENT not in (
-            settings.CONFIGURATION_PROD,
-            settings.CONFIGURATION_STAGING
-        ):
-            return self._test_response()
-        openai.api_key = settings.OPENAI_API_KEY
-        openai.organization = settings.OPENAI_API_ORG
+        backend = self._get_completion_backend()
         messages = []
-        for elem in prompt.messages.order_by('order'):
+        for elem in prompt.messages.all():
             messages.append(
                 {
                     "role": elem.role,
@@ -91,7 +117,7 @@ class BaseAiService:
                 }
             )
         try:
-            completion = openai.ChatCompletion.create(
+            completion = backend.create(
                 user=f'u{self.ident}',
                 model=prompt.model,
                 temperature=prompt.temperature,
@@ -127,6 +153,31 @@ class BaseAiService:
                 raise OpenAiServiceFailed()
             return choice.message.content
 
+    def _get_response(
+        self,
+        prompt: OpenAiPrompt,
+        user_description: str
+    ) -> str:
+
+        """ The same description for the same prompt version
+            is answered from the cache """
+
+        response = OpenAiResponseCache.get(
+            prompt=prompt,
+            user_description=user_description
+        )
+        if response is None:
+            response = self._create_completion(
+                prompt=prompt,
+                user_description=user_description
+            )
+            OpenAiResponseCache.set(
+                prompt=prompt,
+                user_description=user_description,
+                response=response
+            )
+        return response
+
     def _test_response(self):
         return (
             '1. Prepare equipment and supplies | Gather the necessary '
@@ -330,10 +381,7 @@ class OpenAiService(BaseAiService):
 
         if self.account.ai_template_generations_limit_exceeded:
             raise OpenAiLimitTemplateGenerations()
-        prompt = OpenAiPrompt.objects.active().target_steps().first()
-        if not prompt or not prompt.messages.active().exists():
-            raise OpenAiStepsPromptNotExist()
-
+        prompt = self._get_prompt()
         response_text = self._get_response(
             prompt=prompt,
             user_description=user_description
@@ -471,10 +519,7 @@ class AnonOpenAiService(BaseAiService):
 
         """ Generate minimal template data dict from description """
 
-        prompt = OpenAiPrompt.objects.active().target_steps().first()
-        if not prompt or not prompt.messages.active().exists():
-            raise OpenAiStepsPromptNotExist()
-
+        prompt = self._get_prompt()
         response_text = self._get_response(
             prompt=prompt,
             user_description=user_description
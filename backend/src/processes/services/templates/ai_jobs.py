@@ -0,0 +1,120 @@
+import uuid
+from functools import partial
+from typing import Optional
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db import transaction
+from django.utils import translation
+from src.ai.enums import AiJobStatus
+from src.authentication.enums import AuthTokenType
+from src.processes.services.exceptions import (
+    OpenAiServiceException,
+    OpenAiServiceFailed,
+)
+from src.processes.services.templates.ai import OpenAiService
+
+UserModel = get_user_model()
+
+
+class AiTemplateJobService:
+
+    """ Generates the template data by the description in the celery task,
+        the request gets the job id at once and polls the job state.
+        The state is saved to the cache for AI_JOB_TIMEOUT """
+
+    cache = caches['default']
+    key_prefix = 'ai_template_job'
+
+    @classmethod
+    def _get_cache_key(cls, user_id: int, job_id: str) -> str:
+        return f'{cls.key_prefix}:{user_id}:{job_id}'
+
+    @classmethod
+    def _save(cls, user_id: int, job: dict):
+        cls.cache.set(
+            cls._get_cache_key(user_id, job['id']),
+            job,
+            settings.AI_JOB_TIMEOUT
+        )
+
+    @classmethod
+    def _send_task(cls, **kwargs):
+        from src.processes.tasks.ai import generate_template
+        generate_template.delay(**kwargs)
+
+    @classmethod
+    def create(
+        cls,
+        user: UserModel,
+        description: str,
+        auth_type: AuthTokenType,
+        is_superuser: bool = False,
+    ) -> dict:
+
+        """ Saves the pending job and queues the generation
+            after the commit """
+
+        job = {
+            'id': uuid.uuid4().hex,
+            'status': AiJobStatus.PENDING,
+            'data': None,
+            'message': None,
+        }
+        cls._save(user.id, job)
+        transaction.on_commit(
+            partial(
+                cls._send_task,
+                job_id=job['id'],
+                user_id=user.id,
+                description=description,
+                auth_type=auth_type,
+                is_superuser=is_superuser,
+            )
+        )
+        return job
+
+    @classmethod
+    def get(cls, user_id: int, job_id: str) -> Optional[dict]:
+        return cls.cache.get(cls._get_cache_key(user_id, job_id))
+
+    @classmethod
+    def run(
+        cls,
+        job_id: str,
+        user_id: int,
+        description: str,
+        auth_type: AuthTokenType,
+        is_superuser: bool,
+    ):
+
+        """ Generates the template data and saves the result
+            or the error message to the job """
+
+        job = cls.get(user_id, job_id)
+        user = UserModel.objects.filter(id=user_id).first()
+        if job is None or user is None:
+            return
+        service = OpenAiService(
+            ident=user.id,
+            user=user,
+            auth_type=auth_type,
+            is_superuser=is_superuser,
+        )
+        try:
+            job['data'] = service.get_template_data(
+                user_description=description
+            )
+        except OpenAiServiceException as ex:
+            job['status'] = AiJobStatus.FAILED
+            with translation.override(user.language):
+                job['message'] = str(ex.message)
+        except Exception:
+            job['status'] = AiJobStatus.FAILED
+            with translation.override(user.language):
+                job['message'] = str(OpenAiServiceFailed().message)
+            cls._save(user_id, job)
+            raise
+        else:
+            job['status'] = AiJobStatus.COMPLETED
+        cls._save(user_id, job)
@@ -0,0 +1,58 @@
+from typing import Dict, Iterable
+from src.generics.mixins.services import ClsCacheMixin
+from src.processes.models import Kickoff, Template
+from src.processes.serializers.templates.kickoff import (
+    KickoffListSerializer
+)
+
+
+class TemplateListKickoffCache(ClsCacheMixin):
+
+    """ Serialized kickoff of the templates list.
+
+        The key contains the template version. The version is increased
+        on each template update, so after publishing the old value
+        is no longer read and expires by timeout """
+
+    cache_timeout = 86400  # 24 hours in seconds
+    cache_key_prefix = 't_list_kickoff'
+
+    @classmethod
+    def _get_version_key(cls, template: Template) -> str:
+        return cls._get_cache_key(f'{template.id}:{template.version}')
+
+    @classmethod
+    def get_many(cls, templates: Iterable[Template]) -> Dict[int, dict]:
+
+        """ Returns the serialized kickoff by the template id.
+            All templates are read from the cache with one request,
+            missing values are loaded with one query for all of them """
+
+        keys = {
+            cls._get_version_key(template): template.id
+            for template in templates
+        }
+        result = {
+            keys[key]: value
+            for key, value in cls.cache.get_many(list(keys)).items()
+        }
+        missing_ids = set(keys.values()) - set(result)
+        if missing_ids:
+            kickoffs = (
+                Kickoff.objects
+                .filter(template_id__in=missing_ids)
+                .prefetch_related('fields', 'fields__selections')
+            )
+            for kickoff in kickoffs:
+                result[kickoff.template_id] = (
+                    KickoffListSerializer(kickoff).data
+                )
+            cls.cache.set_many(
+                {
+                    key: result[template_id]
+                    for key, template_id in keys.items()
+                    if template_id in missing_ids and template_id in result
+                },
+                cls.cache_timeout
+            )
+        return result
@@ -0,0 +1,75 @@
+""" Subset of the JSON Patch (RFC 6902): the "add", "remove" and "replace"
+    operations with the JSON pointer paths """
+
+from typing import Any, List
+
+
+def _escape(key: Any) -> str:
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def _make_patch(src: Any, dst: Any, path: str, patch: List[dict]):
+    if isinstance(src, dict) and isinstance(dst, dict):
+        for key in src.keys() - dst.keys():
+            patch.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+        for key, value in dst.items():
+            key_path = f'{path}/{_escape(key)}'
+            if key not in src:
+                patch.append({'op': 'add', 'path': key_path, 'value': value})
+            else:
+                _make_patch(src[key], value, key_path, patch)
+    elif isinstance(src, list) and isinstance(dst, list):
+        common = min(len(src), len(dst))
+        for index in range(common):
+            _make_patch(src[index], dst[index], f'{path}/{index}', patch)
+        # Removed from the end, so the indexes of the next ones stay valid
+        for index in range(len(src) - 1, common - 1, -1):
+            patch.append({'op': 'remove', 'path': f'{path}/{index}'})
+        for index in range(common, len(dst)):
+            patch.append({
+                'op': 'add',
+                'path': f'{path}/{index}',
+                'value': dst[index]
+            })
+    elif type(src) is not type(dst) or src != dst:
+        patch.append({'op': 'replace', 'path': path, 'value': dst})
+
+
+def make_patch(src: Any, dst: Any) -> List[dict]:
+
+    """ Returns the operations turning the src document into the dst """
+
+    patch = []
+    _make_patch(src, dst, '', patch)
+    return patch
+
+
+def apply_patch(doc: Any, patch: List[dict]) -> Any:
+
+    """ Applies the patch in place, returns the patched document.
+        The values of the operations are shared with the patch """
+
+    for operation in patch:
+        path = operation['path']
+        if not path:
+            doc = operation['value']
+            continue
+        tokens = [_unescape(token) for token in path[1:].split('/')]
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token) if isinstance(parent, list) else token]
+        key = tokens[-1]
+        if isinstance(parent, list):
+            key = int(key)
+            if operation['op'] == 'add':
+                parent.insert(key, operation['value'])
+                continue
+        if operation['op'] == 'remove':
+            del parent[key]
+        else:
+            parent[key] = operation['value']
+    return doc
@@ -1,11 +1,62 @@
-from typing import Dict, Any, Type
+import copy
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Type, Optional, Tuple
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework.serializers import Serializer
 
 from src.processes.models import TemplateVersion, Template
+from src.processes.services.versioning.patch import (
+    apply_patch,
+    make_patch,
+)
+
+
+class TemplateVersionsCache:
+
+    """ LRU of the reconstructed versions in the memory of the process,
+        the callers get the copies of the cached data """
+
+    def __init__(self):
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[int, int]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            data = self._items.get(key)
+            if data is None:
+                return None
+            self._items.move_to_end(key)
+        return copy.deepcopy(data)
+
+    def set(self, key: Tuple[int, int], data: Dict[str, Any]):
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._items[key] = data
+            self._items.move_to_end(key)
+            while len(self._items) > settings.TEMPLATE_VERSION_CACHE_SIZE:
+                self._items.popitem(last=False)
+
+    def delete(self, key: Tuple[int, int]):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
 
 
 class TemplateVersioningService:
+
+    """ Each TEMPLATE_VERSION_SNAPSHOT_INTERVAL version is stored
+        as the full snapshot, the versions between the snapshots are stored
+        as the deltas from the previous version """
+
+    cache = TemplateVersionsCache()
+
     def __init__(
         self,
         schema: Type[Serializer],
@@ -16,24 +67,154 @@ class TemplateVersioningService:
         template_data = self.schema(instance=template).data
         return template_data
 
-    def get_template_dict(
+    def _reconstruct(
         self,
         template_id: int,
         version: int,
     ) -> Dict[str, Any]:
-        template_dict = TemplateVersion.objects.get(
+        instance = TemplateVersion.objects.get(
             template_id=template_id,
             version=version,
-        ).data
+        )
+        if instance.is_snapshot:
+            return instance.data
+        chain = {
+            item.version: item for item in TemplateVersion.objects.filter(
+                template_id=template_id,
+                version__gte=instance.snapshot_version,
+                version__lt=version,
+            )
+        }
+        deltas = [instance.delta]
+        base = chain[instance.base_version]
+        while not base.is_snapshot:
+            deltas.append(base.delta)
+            base = chain[base.base_version]
+        template_dict = base.data
+        for delta in reversed(deltas):
+            template_dict = apply_patch(template_dict, delta)
+        return template_dict
+
+    def get_template_dict(
+        self,
+        template_id: int,
+        version: int,
+    ) -> Dict[str, Any]:
+        key = (template_id, version)
+        template_dict = self.cache.get(key)
+        if template_dict is None:
+            template_dict = self._reconstruct(template_id, version)
+            self.cache.set(key, template_dict)
         return template_dict
 
+    def _get_stored_fields(
+        self,
+        version: int,
+        template_dict: Dict[str, Any],
+        base: Optional[TemplateVersion],
+        base_dict: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+
+        """ The delta is stored if it's smaller than the snapshot
+            and the chain of the deltas is shorter than the interval """
+
+        snapshot_fields = {
+            'data': template_dict,
+            'base_version': None,
+            'snapshot_version': version,
+            'delta': None,
+        }
+        if base is None:
+            return snapshot_fields
+        # The versions saved before the deltas have no snapshot_version
+        snapshot_version = base.snapshot_version
+        if snapshot_version is None:
+            snapshot_version = base.version
+        interval = settings.TEMPLATE_VERSION_SNAPSHOT_INTERVAL
+        if version - snapshot_version >= interval:
+            return snapshot_fields
+        delta = make_patch(base_dict, template_dict)
+        if len(json.dumps(delta)) >= len(json.dumps(template_dict)):
+            return snapshot_fields
+        return {
+            'data': None,
+            'base_version': base.version,
+            'snapshot_version': snapshot_version,
+            'delta': delta,
+        }
+
     def save(self, template: Template) -> TemplateVersion:
+
+        """ The data of the returned instance is the full version,
+            even if the delta is stored """
+
         template_dict = self.map_to_dict(template)
+        base = (
+            TemplateVersion.objects
+            .filter(template_id=template.id, version__lt=template.version)
+            .order_by('-version')
+            .defer('data', 'delta')
+            .first()
+        )
+        base_dict = None
+        if base is not None:
+            base_dict = self.get_template_dict(template.id, base.version)
         instance, _ = TemplateVersion.objects.update_or_create(
             template_id=template.id,
             version=template.version,
-            defaults={
-                "data": template_dict
-            }
+            defaults=self._get_stored_fields(
+                version=template.version,
+                template_dict=template_dict,
+                base=base,
+                base_dict=base_dict,
+            )
         )
+        instance.data = template_dict
+        self.cache.delete((template.id, template.version))
         return instance
+
+    def compact(self, template_id: int) -> Tuple[int, int]:
+
+        """ Stores the versions of the template as the snapshots
+            and the deltas, returns the size of the stored json
+            before and after """
+
+        size_before = size_after = 0
+        base = base_dict = None
+        with transaction.atomic():
+            versions = (
+                TemplateVersion.objects
+                .select_for_update()
+                .filter(template_id=template_id)
+                .order_by('version')
+            )
+            for instance in versions.iterator():
+                if instance.is_snapshot:
+                    template_dict = instance.data
+                    size_before += len(json.dumps(instance.data))
+                else:
+                    template_dict = apply_patch(
+                        copy.deepcopy(base_dict),
+                        instance.delta
+                    )
+                    size_before += len(json.dumps(instance.delta))
+                fields = self._get_stored_fields(
+                    version=instance.version,
+                    template_dict=template_dict,
+                    base=base,
+                    base_dict=base_dict,
+                )
+                update_fields = [
+                    name for name, value in fields.items()
+                    if getattr(instance, name) != value
+                ]
+                if update_fields:
+                    for name in update_fields:
+                        setattr(instance, name, fields[name])
+                    instance.save(update_fields=update_fields)
+                size_after += len(json.dumps(
+                    fields['data'] if fields['delta'] is None
+                    else fields['delta']
+                ))
+                base, base_dict = instance, template_dict
+        return size_before, size_after
@@ -36,6 +36,11 @@ from src.processes.enums import (
 )
 from src.authentication.services import GuestJWTAuthService
 from src.processes.services.tasks.task import TaskService
+from src.processes.services.tasks.due_date import WorkflowDueDateService
+from src.processes.services.delays import DelayScheduler
+from src.processes.services.workflows.details_cache import (
+    workflow_changed
+)
 from src.authentication.enums import AuthTokenType
 from src.processes.services import exceptions
 from src.analytics.services import AnalyticService
@@ -72,6 +77,17 @@ class WorkflowActionService:
         self.is_superuser = is_superuser
         self.auth_type = auth_type
         self.sync = sync
+        self._due_dates: Optional[WorkflowDueDateService] = None
+
+    @property
+    def due_dates(self) -> WorkflowDueDateService:
+
+        """ One snapshot of the due date rules sources
+            for all tasks changed by the action """
+
+        if self._due_dates is None:
+            self._due_dates = WorkflowDueDateService(self.workflow.id)
+        return self._due_dates
 
     def check_delay_workflow(self):
 
@@ -83,6 +99,7 @@ class WorkflowActionService:
             self.workflow.status = WorkflowStatus.DELAYED
             self.workflow.save(update_fields=['status'])
 
+    @workflow_changed
     def force_delay_workflow(self, date: datetime):
 
         """ Create or update existent task delay with new duration """
@@ -96,6 +113,7 @@ class WorkflowActionService:
             for task in self.workflow.tasks.active():
                 task.status = TaskStatus.DELAYED
                 task.save(update_fields=['status'])
+                self.due_dates.task_changed(task)
                 delay = task.get_active_delay()
 
                 if delay:
@@ -117,6 +135,7 @@ class WorkflowActionService:
                         directly_status=DirectlyStatus.CREATED,
                         workflow=self.workflow
                     )
+                DelayScheduler.schedule(delay)
                 recipients = list(
                     TaskPerformer.objects
                     .filter(task_id=task.id)
@@ -154,6 +173,7 @@ class WorkflowActionService:
                 duration=duration
             )
 
+    @workflow_changed
     def resume_task(self, task: Task):
 
         if self.workflow.is_completed:
@@ -165,6 +185,7 @@ class WorkflowActionService:
                 self.workflow.status = WorkflowStatus.RUNNING
                 self.workflow.save(update_fields=['status'])
 
+    @workflow_changed
     def force_resume_workflow(self):
 
         """ Resume delayed workflow before the timeout """
@@ -206,10 +227,9 @@ class WorkflowActionService:
                 recipients=recipients,
                 account_id=task.account_id,
             )
-        for task_id in self.workflow.tasks.only_ids():
-            GuestJWTAuthService.deactivate_task_guest_cache(
-                task_id=task_id
-            )
+        GuestJWTAuthService.deactivate_tasks_guest_cache(
+            task_ids=self.workflow.tasks.only_ids()
+        )
         AnalyticService.workflows_terminated(
             user=self.user,
             workflow=self.workflow,
@@ -228,10 +248,7 @@ class WorkflowActionService:
             task.save(update_fields=['status'])
 
         tasks_ids = self.workflow.tasks.only_ids()
-        for task_id in tasks_ids:
-            GuestJWTAuthService.deactivate_task_guest_cache(
-                task_id=task_id
-            )
+        GuestJWTAuthService.deactivate_tasks_guest_cache(task_ids=tasks_ids)
 
         update_fields = ['status', 'date_completed']
         if self.workflow.is_urgent:
@@ -248,6 +265,7 @@ class WorkflowActionService:
                 payload=self.workflow.webhook_payload()
             )
 
+    @workflow_changed
     def force_complete_workflow(self):
 
         self._complete_workflow()
@@ -268,6 +286,7 @@ class WorkflowActionService:
                 account_id=task.account_id,
             )
 
+    @workflow_changed
     def end_process(
         self,
         task: Task,
@@ -298,6 +317,7 @@ class WorkflowActionService:
         else:
             self.force_complete_workflow()
 
+    @workflow_changed
     def skip_task(
         self,
         task: Task,
@@ -319,10 +339,12 @@ class WorkflowActionService:
         if is_returned and task.parents:
             task.status = TaskStatus.PENDING
             task.save(update_fields=['status'])
+            self.due_dates.task_changed(task)
             self._start_prev_tasks(task)
         else:
             task.status = TaskStatus.SKIPPED
             task.save(update_fields=['status'])
+            self.due_dates.task_changed(task)
             self._start_next_tasks(parent_task=task)
 
     def _execute_skip_conditions(
@@ -391,6 +413,7 @@ class WorkflowActionService:
                 # Start task condition not passed - task continues to wait
                 return None, False
 
+    @workflow_changed
     def start_workflow(self):
 
         # Duplicate start task code, need for workflow_run_event
@@ -434,6 +457,7 @@ class WorkflowActionService:
         self.workflow.members.add(*users_performers_set)
         self.continue_task(task=task, is_returned=is_returned)
 
+    @workflow_changed
     def continue_task(self, task: Task, is_returned: bool = False):
 
         """ Continue start task after run or workflow delay """
@@ -456,7 +480,8 @@ class WorkflowActionService:
             date_started=timezone.now(),
             force_save=True
         )
-        task_service.set_due_date_from_template()
+        task_service.set_due_date_from_template(due_dates=self.due_dates)
+        self.due_dates.task_changed(task)
         (
             TaskPerformer.objects
             .by_workflow(self.workflow.id).with_tasks_after(task)
@@ -533,6 +558,9 @@ class WorkflowActionService:
                     task_data=task_data or task.get_data_for_list()
                 )
 
+        # The guests were deactivated when the task was completed
+        # or the workflow was finished before the return
+        GuestJWTAuthService.delete_task_guest_cache(task_id=task.id)
         for task_id in self.workflow.tasks.filter(
             parents__contains=[task.api_name]
         ).only_ids():
@@ -582,6 +610,7 @@ class WorkflowActionService:
                     by_complete_task=by_complete_task,
                 )
 
+    @workflow_changed
     def update_tasks_status(self):
         for task in self.workflow.tasks.apd_status():
             action_method, _ = self.execute_conditions(task)
@@ -602,18 +631,22 @@ class WorkflowActionService:
         if not self.workflow.tasks.apd_status().exists():
             self._complete_workflow()
 
+    @workflow_changed
     def delay_task(self, task: Task, delay: Delay):
 
         task.status = TaskStatus.DELAYED
         task.save(update_fields=['status'])
+        self.due_dates.task_changed(task)
         delay.start_date = timezone.now()
         delay.save(update_fields=['start_date'])
+        DelayScheduler.schedule(delay)
         WorkflowEventService.task_delay_event(
             user=self.user,
             task=task,
             delay=delay
         )
 
+    @workflow_changed
     def start_task(
         self,
         task: Task,
@@ -641,6 +674,7 @@ class WorkflowActionService:
             WorkflowEventService.task_skip_no_performers_event(task)
             task.status = TaskStatus.SKIPPED
             task.save(update_fields=('status',))
+            self.due_dates.task_changed(task)
             if is_returned:
                 self._start_prev_tasks(task)
             else:
@@ -656,6 +690,7 @@ class WorkflowActionService:
                 else:
                     self.continue_workflow(task=task, is_returned=is_returned)
 
+    @workflow_changed
     def complete_task(self, task: Task, by_user: bool = False):
 
         """ Complete workflow task if it <= current task
@@ -674,6 +709,9 @@ class WorkflowActionService:
             user=self.user
         )
         task_service.partial_update(**update_fields, force_save=True)
+        self.due_dates.task_changed(task)
+        self.due_dates.update_dependents(task_api_names=[task.api_name])
+        GuestJWTAuthService.deactivate_task_guest_cache(task_id=task.id)
         # Not include guests
         performers_ids = (
             TaskPerformer.objects.by_task(task.id)
@@ -771,6 +809,7 @@ class WorkflowActionService:
                 by_all and not incompleted_performers
             )
 
+    @workflow_changed
     def complete_task_for_user(
         self,
         task: Task,
@@ -960,6 +999,7 @@ class WorkflowActionService:
                         'status',
                     ]
                 )
+                self.due_dates.task_changed(task)
                 (
                     TaskPerformer.objects
                     .filter(task=task)
@@ -1015,6 +1055,7 @@ class WorkflowActionService:
                     payload=revert_from_task.webhook_payload()
                 )
 
+    @workflow_changed
     def revert(
         self,
         comment: str,
@@ -1073,6 +1114,7 @@ class WorkflowActionService:
                 revert_to_tasks=revert_to_tasks,
             )
 
+    @workflow_changed
     def return_to(self, revert_to_task: Optional[Task] = None):
 
         # validate revert to task
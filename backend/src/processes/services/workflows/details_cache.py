@@ -0,0 +1,111 @@
+import time
+from functools import partial, wraps
+from typing import Callable, Optional
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+
+class WorkflowDetailsCache:
+
+    """ Snapshot of the serialized workflow tasks and kickoff
+        used by WorkflowDetailsSerializer.
+
+        The snapshot key contains the workflow revision
+        and the account revision. The workflow revision is increased
+        by the services on each change of the workflow tasks, performers,
+        checklists and fields. The account revision is increased
+        by the bulk changes of the account users and groups.
+        The snapshot of the previous revision is not read anymore
+        and expires by timeout """
+
+    cache = caches['default']
+    workflow_key_prefix = 'wf_rev'
+    account_key_prefix = 'wf_acc_rev'
+    snapshot_key_prefix = 'wf_details'
+
+    @classmethod
+    def _get_start_revision(cls) -> int:
+
+        """ The first revision is unique, so the snapshots
+            of the evicted revision counter are not read """
+
+        return int(time.time() * 1000000)
+
+    @classmethod
+    def _increase(cls, key: str):
+        try:
+            cls.cache.incr(key)
+        except ValueError:
+            if not cls.cache.add(key, cls._get_start_revision(), None):
+                cls.cache.incr(key)
+
+    @classmethod
+    def _on_commit_increase(cls, key: str):
+        if settings.WORKFLOW_DETAILS_CACHE:
+            transaction.on_commit(partial(cls._increase, key))
+
+    @classmethod
+    def workflow_changed(cls, workflow_id: Optional[int]):
+        if workflow_id is not None:
+            cls._on_commit_increase(
+                f'{cls.workflow_key_prefix}:{workflow_id}'
+            )
+
+    @classmethod
+    def account_changed(cls, account_id: int):
+        cls._on_commit_increase(f'{cls.account_key_prefix}:{account_id}')
+
+    @classmethod
+    def _get_revision(cls, key: str, revisions: dict) -> int:
+        revision = revisions.get(key)
+        if revision is None:
+            revision = cls._get_start_revision()
+            if not cls.cache.add(key, revision, None):
+                revision = cls.cache.get(key)
+        return revision
+
+    @classmethod
+    def get_snapshot(
+        cls,
+        workflow_id: int,
+        account_id: int,
+        build: Callable[[], dict],
+    ) -> dict:
+
+        """ Returns the cached snapshot of the current revision,
+            or builds and saves a new one """
+
+        if not settings.WORKFLOW_DETAILS_CACHE:
+            return build()
+        workflow_key = f'{cls.workflow_key_prefix}:{workflow_id}'
+        account_key = f'{cls.account_key_prefix}:{account_id}'
+        revisions = cls.cache.get_many([workflow_key, account_key])
+        snapshot_key = (
+            f'{cls.snapshot_key_prefix}:{workflow_id}:'
+            f'{cls._get_revision(account_key, revisions)}:'
+            f'{cls._get_revision(workflow_key, revisions)}'
+        )
+        snapshot = cls.cache.get(snapshot_key)
+        if snapshot is None:
+            snapshot = build()
+            cls.cache.set(
+                snapshot_key,
+                snapshot,
+                settings.WORKFLOW_DETAILS_CACHE_TIMEOUT
+            )
+        return snapshot
+
+
+def workflow_changed(method):
+
+    """ Increases the workflow revision after the call
+        of the WorkflowActionService method """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            WorkflowDetailsCache.workflow_changed(self.workflow.id)
+    return wrapper
@@ -48,6 +48,9 @@ class WorkflowService(
         is_external: external workflow flag
     """
 
+    def _get_workflow_id(self) -> Optional[int]:
+        return self.instance.id if self.instance else None
+
     def _create_workflow_name(
         self,
         template: Template,
@@ -6,6 +6,7 @@ from src.processes.services.base import (
 from src.processes.services.tasks.task_version import (
     TaskUpdateVersionService,
 )
+from src.processes.services.tasks.due_date import WorkflowDueDateService
 from src.processes.services.workflows.kickoff_version import (
         KickoffUpdateVersionService
     )
@@ -33,6 +34,9 @@ class WorkflowUpdateVersionService(BaseUpdateVersionService):
         tasks_data: List[Dict],
     ):
         tasks_api_names = []
+        # The dates of the tasks are not changed by the update,
+        # so one snapshot is used for the due dates of all tasks
+        due_dates = WorkflowDueDateService(self.instance.id)
         for data in tasks_data:
             task_service = TaskUpdateVersionService(
                 user=self.user,
@@ -43,7 +47,8 @@ class WorkflowUpdateVersionService(BaseUpdateVersionService):
             task_service.update_from_version(
                 workflow=self.instance,
                 version=version,
-                data=data
+                data=data,
+                due_dates=due_dates
             )
             tasks_api_names.append(data['api_name'])
         deleted_tasks = self.instance.tasks.exclude(
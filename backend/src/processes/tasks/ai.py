@@ -0,0 +1,20 @@
+from celery import shared_task
+from src.authentication.enums import AuthTokenType
+from src.processes.services.templates.ai_jobs import AiTemplateJobService
+
+
+@shared_task(ignore_result=True)
+def generate_template(
+    job_id: str,
+    user_id: int,
+    description: str,
+    auth_type: AuthTokenType,
+    is_superuser: bool,
+) -> None:
+    AiTemplateJobService.run(
+        job_id=job_id,
+        user_id=user_id,
+        description=description,
+        auth_type=auth_type,
+        is_superuser=is_superuser,
+    )
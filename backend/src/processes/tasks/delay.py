@@ -1,13 +1,33 @@
+from datetime import timedelta
 from celery import shared_task
+from django.conf import settings
+from django.utils import timezone
 from src.celery import periodic_lock
+from src.processes.services.delays import DelayScheduler
 from src.processes.utils.workflows import (
-    resume_delayed_workflows
+    resume_delay,
+    resume_delayed_workflows,
 )
 
 
 @shared_task(ignore_result=True)
 def continue_delayed_workflows() -> None:
+
+    """ Schedules the delays came into the horizon and resumes
+        the delays missed by the ETA tasks """
+
     with periodic_lock('continue_delayed_workflows') as acquired:
         if not acquired:
             return
-        resume_delayed_workflows()
+        DelayScheduler.schedule_upcoming()
+        resume_delayed_workflows(
+            ended_before=(
+                timezone.now()
+                - timedelta(seconds=settings.DELAY_RESUME_GRACE)
+            )
+        )
+
+
+@shared_task(ignore_result=True)
+def resume_delayed_task(delay_id: int, end_date_tsp: float) -> None:
+    resume_delay(delay_id=delay_id, end_date_tsp=end_date_tsp)
@@ -1,3 +1,4 @@
+from typing import List, Optional
 from celery import shared_task
 from django.contrib.auth import get_user_model
 from src.processes.enums import WorkflowStatus, TaskStatus
@@ -16,13 +17,15 @@ UserModel = get_user_model()
 def complete_tasks(
     user_id: int,
     is_superuser: bool,
-    auth_type: AuthTokenType.LITERALS
+    auth_type: AuthTokenType.LITERALS,
+    task_ids: Optional[List[int]] = None,
 ):
 
     """ Complete all tasks for specific user where completion_by_all is True
         and the only one performer already complete the task
 
-        Use after deletion task performer """
+        Use after deletion task performer,
+        task_ids restrict the tasks to the reassigned chunk """
 
     user = UserModel.objects.get(id=user_id)
     tasks = (
@@ -36,6 +39,8 @@ def complete_tasks(
         .exclude(taskperformer__is_completed=False)
         .exclude_directly_deleted().prefetch_related('performers')
     )
+    if task_ids is not None:
+        tasks = tasks.filter(id__in=task_ids)
     for task in tasks:
         service = WorkflowActionService(
             workflow=task.workflow,
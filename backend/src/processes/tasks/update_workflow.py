@@ -6,7 +6,6 @@ from src.processes.enums import WorkflowStatus
 from src.processes.tasks.tasks import UserModel
 from src.processes.models import (
     Template,
-    TemplateVersion,
     Workflow,
 )
 from src.processes.queries import (
@@ -16,8 +15,16 @@ from src.processes.queries import (
 from src.processes.services.workflows.workflow_version import (
         WorkflowUpdateVersionService
     )
+from src.processes.services.versioning.schemas import TemplateSchemaV1
+from src.processes.services.versioning.versioning import (
+    TemplateVersioningService
+)
 from src.executor import RawSqlExecutor
 from src.authentication.enums import AuthTokenType
+from src.fairness import AccountTokenBucket
+
+
+UPDATE_WORKFLOWS_CHUNK_SIZE = 100
 
 
 def _update_workflows(
@@ -26,22 +33,52 @@ def _update_workflows(
     updated_by: int,
     sync: bool,
     auth_type: AuthTokenType,
-    is_superuser: bool
+    is_superuser: bool,
+    after_id: int = 0,
 ):
+
+    """ Updates one chunk of the template workflows
+        and queues the task for the next chunk.
+        The chunk takes a token of the account, so the queue
+        is shared fairly with the tasks of the other accounts """
+
     template = Template.objects.by_id(template_id).first()
     if not template or template.version > version:
         return
 
+    task_kwargs = {
+        'template_id': template_id,
+        'version': version,
+        'updated_by': updated_by,
+        'auth_type': auth_type,
+        'is_superuser': is_superuser,
+    }
+    wait = AccountTokenBucket.take(template.account_id)
+    if wait:
+        update_workflows.apply_async(
+            kwargs={**task_kwargs, 'after_id': after_id},
+            countdown=wait
+        )
+        return
+
     updated_by = UserModel.objects.get(id=updated_by)
-    version_dict = TemplateVersion.objects.filter(
+    version_dict = TemplateVersioningService(
+        TemplateSchemaV1
+    ).get_template_dict(
         template_id=template_id,
         version=version,
-    ).first().data
+    )
 
-    for workflow in template.workflows.all().only('id'):
+    workflow_ids = list(
+        template.workflows
+        .filter(id__gt=after_id)
+        .order_by('id')
+        .values_list('id', flat=True)[:UPDATE_WORKFLOWS_CHUNK_SIZE]
+    )
+    for workflow_id in workflow_ids:
         with transaction.atomic():
             workflow = Workflow.objects.select_for_update().get(
-                id=workflow.id
+                id=workflow_id
             )
             if not workflow.is_version_lower(version):
                 return
@@ -62,6 +99,8 @@ def _update_workflows(
                     data=version_dict,
                     version=version
                 )
+    if len(workflow_ids) == UPDATE_WORKFLOWS_CHUNK_SIZE:
+        update_workflows.delay(**task_kwargs, after_id=workflow_ids[-1])
 
 
 @shared_task(
@@ -8,6 +8,7 @@ from src.processes.models import (
 )
 from src.processes.tasks.delay import (
     continue_delayed_workflows,
+    resume_delayed_task,
 )
 from src.processes.tests.fixtures import (
     create_test_owner,
@@ -35,6 +36,9 @@ def test_continue_delayed_workflows__ok(mocker):
         'src.celery.periodic_lock'
     )
     periodic_lock_mock.__enter__.return_value = True
+    schedule_upcoming_mock = mocker.patch(
+        'src.processes.tasks.delay.DelayScheduler.schedule_upcoming'
+    )
     resume_delayed_workflows_mock = mocker.patch(
         'src.processes.tasks.delay.resume_delayed_workflows'
     )
@@ -43,7 +47,10 @@ def test_continue_delayed_workflows__ok(mocker):
     continue_delayed_workflows()
 
     # assert
+    schedule_upcoming_mock.assert_called_once()
     resume_delayed_workflows_mock.assert_called_once()
+    ended_before = resume_delayed_workflows_mock.call_args[1]['ended_before']
+    assert ended_before < timezone.now()
 
 
 def test_resume_delayed_workflows__delay_expired__resume(
@@ -197,3 +204,148 @@ def test_resume_delayed_workflows__delay_already_ended__not_resume(
     # assert
     service_init_mock.assert_not_called()
     resume_task_mock.assert_not_called()
+
+
+def test_resume_delayed_task__delay_expired__resume(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user=user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.status = TaskStatus.DELAYED
+    task_1.save()
+    delay = Delay.objects.create(
+        task=task_1,
+        start_date=timezone.now() - timedelta(hours=2),
+        duration=timedelta(hours=1),
+        workflow=workflow
+    )
+    service_init_mock = mocker.patch.object(
+        WorkflowActionService,
+        attribute='__init__',
+        return_value=None
+    )
+    resume_task_mock = mocker.patch(
+        'src.processes.services.'
+        'workflow_action.WorkflowActionService.resume_task'
+    )
+
+    # act
+    resume_delayed_task(
+        delay_id=delay.id,
+        end_date_tsp=delay.estimated_end_date.timestamp()
+    )
+
+    # assert
+    service_init_mock.assert_called_once_with(
+        workflow=workflow,
+        user=user,
+        is_superuser=False,
+        auth_type=AuthTokenType.USER
+    )
+    resume_task_mock.assert_called_once_with(task_1)
+
+
+def test_resume_delayed_task__end_date_changed__not_resume(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user=user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.status = TaskStatus.DELAYED
+    task_1.save()
+    delay = Delay.objects.create(
+        task=task_1,
+        start_date=timezone.now() - timedelta(hours=2),
+        duration=timedelta(hours=1),
+        workflow=workflow
+    )
+    end_date_tsp = delay.estimated_end_date.timestamp()
+    delay.duration = timedelta(minutes=30)
+    delay.save()
+    resume_task_mock = mocker.patch(
+        'src.processes.services.'
+        'workflow_action.WorkflowActionService.resume_task'
+    )
+
+    # act
+    resume_delayed_task(delay_id=delay.id, end_date_tsp=end_date_tsp)
+
+    # assert
+    resume_task_mock.assert_not_called()
+
+
+def test_resume_delayed_task__fired_early__reschedule(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user=user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.status = TaskStatus.DELAYED
+    task_1.save()
+    delay = Delay.objects.create(
+        task=task_1,
+        start_date=timezone.now(),
+        duration=timedelta(hours=1),
+        workflow=workflow
+    )
+    resume_task_mock = mocker.patch(
+        'src.processes.services.'
+        'workflow_action.WorkflowActionService.resume_task'
+    )
+    mocker.patch(
+        'src.processes.services.delays.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    apply_async_mock = mocker.patch(
+        'src.processes.tasks.delay.resume_delayed_task.apply_async'
+    )
+
+    # act
+    resume_delayed_task(
+        delay_id=delay.id,
+        end_date_tsp=delay.estimated_end_date.timestamp()
+    )
+
+    # assert
+    resume_task_mock.assert_not_called()
+    apply_async_mock.assert_called_once_with(
+        kwargs={
+            'delay_id': delay.id,
+            'end_date_tsp': delay.estimated_end_date.timestamp(),
+        },
+        eta=delay.estimated_end_date
+    )
+
+
+def test_resume_delayed_task__fired_within_tolerance__resume(mocker):
+
+    # arrange
+    user = create_test_owner()
+    workflow = create_test_workflow(user=user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.status = TaskStatus.DELAYED
+    task_1.save()
+    delay = Delay.objects.create(
+        task=task_1,
+        start_date=timezone.now() - timedelta(hours=1),
+        duration=timedelta(hours=1, milliseconds=500),
+        workflow=workflow
+    )
+    resume_task_mock = mocker.patch(
+        'src.processes.services.'
+        'workflow_action.WorkflowActionService.resume_task'
+    )
+    apply_async_mock = mocker.patch(
+        'src.processes.tasks.delay.resume_delayed_task.apply_async'
+    )
+
+    # act
+    resume_delayed_task(
+        delay_id=delay.id,
+        end_date_tsp=delay.estimated_end_date.timestamp()
+    )
+
+    # assert
+    resume_task_mock.assert_called_once_with(task_1)
+    apply_async_mock.assert_not_called()
@@ -194,3 +194,90 @@ def test_update_workflows__process_version_difference__ok(api_client):
     assert workflow.version == version
     task.refresh_from_db()
     assert task.name == task_name
+
+
+def test_update_workflows__bucket_empty__postpone(mocker):
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(
+        user=user,
+        is_active=True,
+        tasks_count=1
+    )
+    create_test_workflow(user=user, template=template)
+    mocker.patch(
+        'src.processes.tasks.update_workflow.AccountTokenBucket.take',
+        return_value=1.5
+    )
+    apply_async_mock = mocker.patch(
+        'src.processes.tasks.update_workflow.update_workflows.apply_async'
+    )
+    version_service_mock = mocker.patch(
+        'src.processes.tasks.update_workflow.WorkflowUpdateVersionService'
+    )
+
+    # act
+    update_workflows(
+        template_id=template.id,
+        version=template.version,
+        updated_by=user.id,
+        auth_type=AuthTokenType.USER,
+        is_superuser=True
+    )
+
+    # assert
+    apply_async_mock.assert_called_once_with(
+        kwargs={
+            'template_id': template.id,
+            'version': template.version,
+            'updated_by': user.id,
+            'auth_type': AuthTokenType.USER,
+            'is_superuser': True,
+            'after_id': 0,
+        },
+        countdown=1.5
+    )
+    version_service_mock.assert_not_called()
+
+
+def test_update_workflows__full_chunk__queue_next_chunk(mocker):
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(
+        user=user,
+        is_active=True,
+        tasks_count=1
+    )
+    create_test_workflow(user=user, template=template)
+    workflow_2 = create_test_workflow(user=user, template=template)
+    template.version += 1
+    template.save()
+    TemplateVersioningService(TemplateSchemaV1).save(template)
+    mocker.patch(
+        'src.processes.tasks.update_workflow.UPDATE_WORKFLOWS_CHUNK_SIZE',
+        2
+    )
+    delay_mock = mocker.patch(
+        'src.processes.tasks.update_workflow.update_workflows.delay'
+    )
+
+    # act
+    update_workflows(
+        template_id=template.id,
+        version=template.version,
+        updated_by=user.id,
+        auth_type=AuthTokenType.USER,
+        is_superuser=True
+    )
+
+    # assert
+    delay_mock.assert_called_once_with(
+        template_id=template.id,
+        version=template.version,
+        updated_by=user.id,
+        auth_type=AuthTokenType.USER,
+        is_superuser=True,
+        after_id=workflow_2.id
+    )
@@ -1671,6 +1671,7 @@ def test_update__text__ok(mocker):
         clear_text=clear_text,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         with_attachments=False,
         force_save=True
     )
@@ -1776,6 +1777,7 @@ def test_update__task_delete__ok(mocker):
         clear_text=clear_text,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         with_attachments=False,
         force_save=True
     )
@@ -1874,6 +1876,7 @@ def test_update__attachments__ok(mocker):
         with_attachments=True,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         text=None,
         clear_text=None,
         force_save=True
@@ -2010,6 +2013,7 @@ def test_update__find_attachments_in_text__ok(data, mocker):
         with_attachments=True,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         text=text,
         clear_text=clear_text,
         force_save=True
@@ -2120,6 +2124,7 @@ def test_update__not_found_attachments_in_text__ok(text, mocker):
         with_attachments=False,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         text=text,
         clear_text=clear_text,
         force_save=True
@@ -2239,6 +2244,7 @@ def test_update__notified_users__ok(mocker):
         with_attachments=True,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         force_save=True
     )
     comment_edited_analytics_mock.assert_called_once_with(
@@ -2354,6 +2360,7 @@ def test_update__mentioned_users__ok(mocker):
         clear_text=clear_text,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         with_attachments=False,
         force_save=True
     )
@@ -2446,6 +2453,7 @@ def test_update__remove_text__ok(mocker):
         clear_text=None,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         with_attachments=True,
         force_save=True
     )
@@ -2538,6 +2546,7 @@ def test_update__remove_attachments__ok(mocker):
         clear_text=clear_text,
         status=CommentStatus.UPDATED,
         updated=date_updated,
+        changed=date_updated,
         with_attachments=False,
         force_save=True
     )
@@ -2805,6 +2814,11 @@ def test_delete__ok(mocker):
         'CommentService._send_workflow_event'
     )
 
+    date_changed = timezone.now()
+    mocker.patch(
+        'src.processes.services.events.timezone.now',
+        return_value=date_changed
+    )
     service = CommentService(
         instance=event,
         user=account_owner
@@ -2821,6 +2835,7 @@ def test_delete__ok(mocker):
         status=CommentStatus.DELETED,
         with_attachments=False,
         text=None,
+        changed=date_changed,
         force_save=True
     )
     assert event.attachments.count() == 0
@@ -2876,6 +2891,11 @@ def test_delete__task_delete__ok(mocker):
         'CommentService._send_workflow_event'
     )
 
+    date_changed = timezone.now()
+    mocker.patch(
+        'src.processes.services.events.timezone.now',
+        return_value=date_changed
+    )
     service = CommentService(
         instance=event,
         user=account_owner
@@ -2892,6 +2912,7 @@ def test_delete__task_delete__ok(mocker):
         status=CommentStatus.DELETED,
         with_attachments=False,
         text=None,
+        changed=date_changed,
         force_save=True
     )
     assert event.attachments.count() == 0
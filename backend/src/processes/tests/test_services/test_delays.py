@@ -0,0 +1,104 @@
+from datetime import timedelta
+import pytest
+from django.utils import timezone
+from src.processes.enums import TaskStatus
+from src.processes.models import Delay
+from src.processes.services.delays import DelayScheduler
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_workflow,
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+def create_delay(duration: timedelta) -> Delay:
+    user = create_test_user()
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.status = TaskStatus.DELAYED
+    task.save()
+    return Delay.objects.create(
+        task=task,
+        start_date=timezone.now(),
+        duration=duration,
+        workflow=workflow
+    )
+
+
+def test_schedule__within_horizon__send_eta_task(mocker):
+
+    # arrange
+    delay = create_delay(duration=timedelta(minutes=1))
+    mocker.patch(
+        'src.processes.services.delays.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    apply_async_mock = mocker.patch(
+        'src.processes.tasks.delay.resume_delayed_task.apply_async'
+    )
+
+    # act
+    DelayScheduler.schedule(delay)
+
+    # assert
+    apply_async_mock.assert_called_once_with(
+        kwargs={
+            'delay_id': delay.id,
+            'end_date_tsp': delay.estimated_end_date.timestamp(),
+        },
+        eta=delay.estimated_end_date
+    )
+
+
+def test_schedule__already_scheduled__skip(mocker):
+
+    # arrange
+    delay = create_delay(duration=timedelta(minutes=2))
+    mocker.patch(
+        'src.processes.services.delays.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    apply_async_mock = mocker.patch(
+        'src.processes.tasks.delay.resume_delayed_task.apply_async'
+    )
+    DelayScheduler.schedule(delay)
+
+    # act
+    DelayScheduler.schedule(delay)
+
+    # assert
+    apply_async_mock.assert_called_once()
+
+
+def test_schedule__after_horizon__skip(mocker):
+
+    # arrange
+    delay = create_delay(duration=timedelta(days=3))
+    on_commit_mock = mocker.patch(
+        'src.processes.services.delays.transaction.on_commit'
+    )
+
+    # act
+    DelayScheduler.schedule(delay)
+
+    # assert
+    on_commit_mock.assert_not_called()
+
+
+def test_schedule_upcoming__schedule_delays_within_horizon(mocker):
+
+    # arrange
+    delay = create_delay(duration=timedelta(minutes=3))
+    create_delay(duration=timedelta(days=3))
+    schedule_mock = mocker.patch(
+        'src.processes.services.delays.DelayScheduler.schedule'
+    )
+
+    # act
+    DelayScheduler.schedule_upcoming()
+
+    # assert
+    schedule_mock.assert_called_once()
+    assert schedule_mock.call_args[0][0].id == delay.id
@@ -20,6 +20,7 @@ from src.processes.serializers.workflows.events import (
 from src.processes.models import (
     FileAttachment,
     WorkflowEvent,
+    WorkflowHighlight,
 )
 from src.utils.dates import date_format
 
@@ -60,6 +61,51 @@ def test_after_create_actions(mocker):
     )
 
 
+def test_create_event__highlight_type__replace_last_highlight():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    WorkflowEventService.comment_created_event(
+        user=user,
+        text='First',
+        task=task,
+        after_create_actions=False
+    )
+
+    # act
+    event = WorkflowEventService.comment_created_event(
+        user=user,
+        text='Second',
+        task=task,
+        after_create_actions=False
+    )
+
+    # assert
+    highlight = WorkflowHighlight.objects.get(workflow=workflow)
+    assert highlight.event_id == event.id
+    assert highlight.author_id == user.id
+    assert highlight.created == event.created
+
+
+def test_create_event__not_highlight_type__skip():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+
+    # act
+    WorkflowEventService.task_started_event(
+        task=task,
+        after_create_actions=False
+    )
+
+    # assert
+    assert not WorkflowHighlight.objects.filter(workflow=workflow).exists()
+
+
 def test_comment_created_event__ok(mocker):
 
     # arrange
@@ -0,0 +1,200 @@
+import pytest
+from datetime import timedelta, datetime
+from django.utils import timezone
+from src.processes.models import (
+    TaskField,
+    RawDueDate,
+)
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_workflow,
+)
+from src.processes.enums import (
+    FieldType,
+    DueDateRule,
+    DirectlyStatus,
+    TaskStatus,
+)
+from src.processes.services.tasks.due_date import WorkflowDueDateService
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_due_date__all_rules__one_snapshot(django_assert_num_queries):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=3)
+    task_1 = workflow.tasks.get(number=1)
+    task_2 = workflow.tasks.get(number=2)
+    task_3 = workflow.tasks.get(number=3)
+    tsp_date = (timezone.now() + timedelta(days=3)).timestamp()
+    field = TaskField.objects.create(
+        kickoff=workflow.kickoff_instance,
+        name='date',
+        api_name='date-1',
+        type=FieldType.DATE,
+        value=tsp_date,
+        workflow=workflow
+    )
+    duration = timedelta(hours=1)
+    RawDueDate.objects.create(
+        task=task_1,
+        duration=duration,
+        rule=DueDateRule.AFTER_WORKFLOW_STARTED,
+    )
+    RawDueDate.objects.create(
+        task=task_2,
+        duration=duration,
+        rule=DueDateRule.AFTER_TASK_STARTED,
+        source_id=task_1.api_name,
+    )
+    RawDueDate.objects.create(
+        task=task_3,
+        duration=duration,
+        rule=DueDateRule.BEFORE_FIELD,
+        source_id=field.api_name,
+    )
+    service = WorkflowDueDateService(workflow.id)
+    tasks = service._get_tasks()
+
+    # act
+    with django_assert_num_queries(1):
+        due_dates = [
+            service.get_due_date(tasks[task.api_name])
+            for task in (task_1, task_2, task_3)
+        ]
+
+    # assert
+    assert due_dates == [
+        workflow.date_created + duration,
+        task_1.date_first_started + duration,
+        datetime.fromtimestamp(tsp_date) - duration,
+    ]
+
+
+def test_get_due_date__source_task_changed__use_changed_date():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_2 = workflow.tasks.get(number=2)
+    duration = timedelta(hours=2)
+    RawDueDate.objects.create(
+        task=task_2,
+        duration=duration,
+        rule=DueDateRule.AFTER_TASK_COMPLETED,
+        source_id=task_1.api_name,
+    )
+    task_2 = workflow.tasks.select_related('raw_due_date').get(number=2)
+    service = WorkflowDueDateService(workflow.id)
+    service._get_tasks()
+    task_1.status = TaskStatus.COMPLETED
+    task_1.date_completed = timezone.now()
+    task_1.save(update_fields=['status', 'date_completed'])
+
+    # act
+    service.task_changed(task_1)
+    due_date = service.get_due_date(task_2)
+
+    # assert
+    assert due_date == task_1.date_completed + duration
+
+
+def test_update_dependents__field_changed__update_dependent_tasks():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=3)
+    task_1 = workflow.tasks.get(number=1)
+    task_2 = workflow.tasks.get(number=2)
+    task_2.status = TaskStatus.ACTIVE
+    task_2.due_date_directly_status = DirectlyStatus.CREATED
+    task_2.save(update_fields=['status', 'due_date_directly_status'])
+    task_3 = workflow.tasks.get(number=3)
+    tsp_date = (timezone.now() + timedelta(days=3)).timestamp()
+    TaskField.objects.create(
+        kickoff=workflow.kickoff_instance,
+        name='date',
+        api_name='date-1',
+        type=FieldType.DATE,
+        value=tsp_date,
+        workflow=workflow
+    )
+    duration = timedelta(days=1)
+    for task in (task_1, task_2, task_3):
+        RawDueDate.objects.create(
+            task=task,
+            duration=duration,
+            rule=DueDateRule.AFTER_FIELD,
+            source_id='date-1',
+        )
+    service = WorkflowDueDateService(workflow.id)
+
+    # act
+    updated_tasks = service.update_dependents(field_api_names=['date-1'])
+
+    # assert
+    assert [task.id for task in updated_tasks] == [task_1.id]
+    assert updated_tasks[0].due_date == (
+        datetime.fromtimestamp(tsp_date) + duration
+    )
+    task_1.refresh_from_db()
+    assert task_1.due_date is not None
+    task_2.refresh_from_db()
+    assert task_2.due_date is None
+    task_3.refresh_from_db()
+    assert task_3.due_date is None
+
+
+def test_update_dependents__task_completed__update_dependent_task():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.status = TaskStatus.COMPLETED
+    task_1.date_completed = timezone.now()
+    task_1.save(update_fields=['status', 'date_completed'])
+    task_2 = workflow.tasks.get(number=2)
+    task_2.status = TaskStatus.ACTIVE
+    task_2.save(update_fields=['status'])
+    duration = timedelta(hours=2)
+    RawDueDate.objects.create(
+        task=task_2,
+        duration=duration,
+        rule=DueDateRule.AFTER_TASK_COMPLETED,
+        source_id=task_1.api_name,
+    )
+    service = WorkflowDueDateService(workflow.id)
+
+    # act
+    service.update_dependents(task_api_names=[task_1.api_name])
+
+    # assert
+    task_2.refresh_from_db()
+    assert task_2.due_date == task_1.date_completed + duration
+
+
+def test_update_dependents__no_dependents__not_update(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=2)
+    workflow_changed_mock = mocker.patch(
+        'src.processes.services.tasks.due_date.'
+        'WorkflowDetailsCache.workflow_changed'
+    )
+    service = WorkflowDueDateService(workflow.id)
+
+    # act
+    updated_tasks = service.update_dependents(
+        task_api_names=['task-1'],
+        field_api_names=['date-1'],
+    )
+
+    # assert
+    assert updated_tasks == []
+    workflow_changed_mock.assert_not_called()
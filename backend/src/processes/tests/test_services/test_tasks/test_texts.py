@@ -0,0 +1,97 @@
+import pytest
+from src.processes.models import (
+    Checklist,
+    ChecklistSelection,
+)
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_workflow,
+)
+from src.processes.services.tasks.texts import TaskTextsService
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_insert_fields_values__changed_fields__render_dependents(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=2)
+    task_1 = workflow.tasks.get(number=1)
+    task_1.name_template = 'Call {{ field-a }}'
+    task_1.save(update_fields=['name_template'])
+    task_2 = workflow.tasks.get(number=2)
+    task_2.description_template = 'Visit {{field-b}}'
+    task_2.save(update_fields=['description_template'])
+    description = task_2.description
+    checklist = Checklist.objects.create(api_name='checklist-1', task=task_2)
+    selection = ChecklistSelection.objects.create(
+        checklist=checklist,
+        value='{{ field-a }}',
+        value_template='{{ field-a }}',
+    )
+    workflow_changed_mock = mocker.patch(
+        'src.processes.services.tasks.texts.'
+        'WorkflowDetailsCache.workflow_changed'
+    )
+    service = TaskTextsService(workflow.tasks.order_by('id'))
+
+    # act
+    service.insert_fields_values(
+        fields_values={'field-a': 'John', 'field-b': 'Boston'},
+        api_names=['field-a'],
+    )
+
+    # assert
+    task_1.refresh_from_db()
+    assert task_1.name == 'Call John'
+    task_2.refresh_from_db()
+    assert task_2.description == description
+    selection.refresh_from_db()
+    assert selection.value == 'John'
+    workflow_changed_mock.assert_called_once_with(workflow.id)
+
+
+def test_insert_fields_values__no_dependents__not_update(
+    mocker,
+    django_assert_num_queries,
+):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=2)
+    workflow_changed_mock = mocker.patch(
+        'src.processes.services.tasks.texts.'
+        'WorkflowDetailsCache.workflow_changed'
+    )
+    service = TaskTextsService(list(workflow.tasks.all()))
+
+    # act
+    with django_assert_num_queries(1):
+        service.insert_fields_values(
+            fields_values={'field-a': 'John'},
+            api_names=['field-a'],
+        )
+
+    # assert
+    workflow_changed_mock.assert_not_called()
+
+
+def test_insert_fields_values__all_fields__render_all_texts():
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    task.description_template = '**Visit** {{field-b}}'
+    task.save(update_fields=['description_template'])
+    service = TaskTextsService([task])
+
+    # act
+    service.insert_fields_values(fields_values={'field-b': 'Boston'})
+
+    # assert
+    task.refresh_from_db()
+    assert task.description == '**Visit** Boston'
+    assert task.clear_description == 'Visit Boston'
@@ -0,0 +1,145 @@
+import pytest
+from src.ai.enums import AiJobStatus
+from src.authentication.enums import AuthTokenType
+from src.processes.tests.fixtures import (
+    create_test_user,
+)
+from src.processes.services.templates.ai_jobs import AiTemplateJobService
+from src.processes.services.exceptions import (
+    OpenAiTemplateStepsNotExist,
+)
+from src.processes.messages import workflow as messages
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_create__ok(mocker):
+
+    # arrange
+    user = create_test_user()
+    description = 'My lovely business process'
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    delay_mock = mocker.patch(
+        'src.processes.tasks.ai.generate_template.delay'
+    )
+
+    # act
+    job = AiTemplateJobService.create(
+        user=user,
+        description=description,
+        auth_type=AuthTokenType.USER,
+    )
+
+    # assert
+    assert job['status'] == AiJobStatus.PENDING
+    assert AiTemplateJobService.get(user.id, job['id']) == job
+    delay_mock.assert_called_once_with(
+        job_id=job['id'],
+        user_id=user.id,
+        description=description,
+        auth_type=AuthTokenType.USER,
+        is_superuser=False,
+    )
+
+
+def test_run__ok(mocker):
+
+    # arrange
+    user = create_test_user()
+    description = 'My lovely business process'
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit'
+    )
+    job = AiTemplateJobService.create(
+        user=user,
+        description=description,
+        auth_type=AuthTokenType.USER,
+    )
+    template_data = {'name': description}
+    get_template_data_mock = mocker.patch(
+        'src.processes.services.templates.'
+        'ai_jobs.OpenAiService.get_template_data',
+        return_value=template_data
+    )
+
+    # act
+    AiTemplateJobService.run(
+        job_id=job['id'],
+        user_id=user.id,
+        description=description,
+        auth_type=AuthTokenType.USER,
+        is_superuser=False,
+    )
+
+    # assert
+    get_template_data_mock.assert_called_once_with(
+        user_description=description
+    )
+    result = AiTemplateJobService.get(user.id, job['id'])
+    assert result['status'] == AiJobStatus.COMPLETED
+    assert result['data'] == template_data
+    assert result['message'] is None
+
+
+def test_run__service_exception__failed(mocker):
+
+    # arrange
+    user = create_test_user()
+    description = 'My lovely business process'
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit'
+    )
+    job = AiTemplateJobService.create(
+        user=user,
+        description=description,
+        auth_type=AuthTokenType.USER,
+    )
+    mocker.patch(
+        'src.processes.services.templates.'
+        'ai_jobs.OpenAiService.get_template_data',
+        side_effect=OpenAiTemplateStepsNotExist()
+    )
+
+    # act
+    AiTemplateJobService.run(
+        job_id=job['id'],
+        user_id=user.id,
+        description=description,
+        auth_type=AuthTokenType.USER,
+        is_superuser=False,
+    )
+
+    # assert
+    result = AiTemplateJobService.get(user.id, job['id'])
+    assert result['status'] == AiJobStatus.FAILED
+    assert result['data'] is None
+    assert result['message'] == str(messages.MSG_PW_0045)
+
+
+def test_get__another_user__not_found(mocker):
+
+    # arrange
+    user = create_test_user()
+    another_user = create_test_user(
+        email='another@pneumatic.app',
+        account=user.account,
+        is_account_owner=False,
+    )
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit'
+    )
+    job = AiTemplateJobService.create(
+        user=user,
+        description='My lovely business process',
+        auth_type=AuthTokenType.USER,
+    )
+
+    # act
+    result = AiTemplateJobService.get(another_user.id, job['id'])
+
+    # assert
+    assert result is None
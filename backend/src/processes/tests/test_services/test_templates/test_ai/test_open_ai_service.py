@@ -298,6 +298,80 @@ def test_get_response__finish_reason__raise_exception(mocker):
     assert ex.value.message == messages.MSG_PW_0043
 
 
+def test_get_response__fake_completion__not_call_openai(mocker):
+
+    # arrange
+    description = 'some description'
+    prompt = create_test_prompt()
+    mocker.patch(
+        'src.processes.services.templates.'
+        'ai.settings.CONFIGURATION_CURRENT',
+        settings.CONFIGURATION_PROD
+    )
+    mocker.patch(
+        'src.processes.services.templates.'
+        'ai.settings.AI_FAKE_COMPLETION',
+        True
+    )
+    user = create_test_user()
+    service = OpenAiService(
+        ident=user.id,
+        user=user,
+        auth_type=AuthTokenType.USER
+    )
+    create_completion_mock = mocker.patch(
+        'src.processes.services.templates.'
+        'ai.openai.ChatCompletion.create'
+    )
+
+    # act
+    response = service._get_response(
+        user_description=description,
+        prompt=prompt
+    )
+
+    # assert
+    assert response == service._test_response()
+    create_completion_mock.assert_not_called()
+
+
+def test_get_response__cached__not_create_completion(mocker):
+
+    # arrange
+    description = 'some description'
+    prompt = create_test_prompt()
+    user = create_test_user()
+    service = OpenAiService(
+        ident=user.id,
+        user=user,
+        auth_type=AuthTokenType.USER
+    )
+    ai_response = 'some ai response'
+    cache_get_mock = mocker.patch(
+        'src.processes.services.templates.'
+        'ai.OpenAiResponseCache.get',
+        return_value=ai_response
+    )
+    create_completion_mock = mocker.patch(
+        'src.processes.services.templates.'
+        'ai.OpenAiService._create_completion'
+    )
+
+    # act
+    response = service._get_response(
+        user_description=description,
+        prompt=prompt
+    )
+
+    # assert
+    assert response == ai_response
+    cache_get_mock.assert_called_once_with(
+        prompt=prompt,
+        user_description=description
+    )
+    create_completion_mock.assert_not_called()
+
+
 def test_get_steps_data_from_text__ok(mocker):
 
     # arrange
@@ -0,0 +1,104 @@
+import pytest
+from src.processes.services.templates.kickoff_cache import (
+    TemplateListKickoffCache
+)
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_template,
+)
+from src.processes.models import FieldTemplate
+from src.processes.enums import FieldType
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_many__not_cached__load_and_set_cache(mocker):
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=1)
+    kickoff = template.kickoff_instance
+    FieldTemplate.objects.create(
+        name='test_field',
+        type=FieldType.TEXT,
+        is_required=True,
+        api_name='test_field',
+        kickoff=kickoff,
+        template=template,
+    )
+    key = f't_list_kickoff:{template.id}:{template.version}'
+    cache_get_many_mock = mocker.patch(
+        'src.processes.services.templates.kickoff_cache.'
+        'TemplateListKickoffCache.cache.get_many',
+        return_value={}
+    )
+    cache_set_many_mock = mocker.patch(
+        'src.processes.services.templates.kickoff_cache.'
+        'TemplateListKickoffCache.cache.set_many'
+    )
+
+    # act
+    result = TemplateListKickoffCache.get_many([template])
+
+    # assert
+    fields = result[template.id]['fields']
+    assert len(fields) == 1
+    assert fields[0]['api_name'] == 'test_field'
+    cache_get_many_mock.assert_called_once_with([key])
+    cache_set_many_mock.assert_called_once_with(
+        {key: result[template.id]},
+        TemplateListKickoffCache.cache_timeout
+    )
+
+
+def test_get_many__cached__not_load(mocker):
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=1)
+    key = f't_list_kickoff:{template.id}:{template.version}'
+    cached_value = {'fields': []}
+    mocker.patch(
+        'src.processes.services.templates.kickoff_cache.'
+        'TemplateListKickoffCache.cache.get_many',
+        return_value={key: cached_value}
+    )
+    cache_set_many_mock = mocker.patch(
+        'src.processes.services.templates.kickoff_cache.'
+        'TemplateListKickoffCache.cache.set_many'
+    )
+    kickoff_mock = mocker.patch(
+        'src.processes.services.templates.kickoff_cache.Kickoff'
+    )
+
+    # act
+    result = TemplateListKickoffCache.get_many([template])
+
+    # assert
+    assert result == {template.id: cached_value}
+    kickoff_mock.objects.filter.assert_not_called()
+    cache_set_many_mock.assert_not_called()
+
+
+def test_get_many__new_version__not_read_old_value():
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=1)
+    TemplateListKickoffCache.get_many([template])
+    FieldTemplate.objects.create(
+        name='test_field',
+        type=FieldType.TEXT,
+        api_name='test_field',
+        kickoff=template.kickoff_instance,
+        template=template,
+    )
+    template.version += 1
+    template.save(update_fields=['version'])
+
+    # act
+    result = TemplateListKickoffCache.get_many([template])
+
+    # assert
+    assert len(result[template.id]['fields']) == 1
@@ -0,0 +1,160 @@
+import json
+import pytest
+from src.processes.models import TemplateVersion
+from src.processes.services.versioning.patch import (
+    apply_patch,
+    make_patch,
+)
+from src.processes.services.versioning.schemas import TemplateSchemaV1
+from src.processes.services.versioning.versioning import (
+    TemplateVersioningService
+)
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_template,
+)
+
+
+pytestmark = pytest.mark.django_db
+
+
+def _publish(template, description: str):
+    template.description = description
+    template.version += 1
+    template.save(update_fields=['description', 'version'])
+
+
+def test_make_patch__apply__same_document():
+
+    # arrange
+    src = {'a': [1, {'b': 2}, 3], 'c/d': 'x', 'e': None}
+    dst = {'a': [1, {'b': 3}], 'c/d': 'y', 'f': {'g': [True]}}
+
+    # act
+    patch = make_patch(src, dst)
+
+    # assert
+    assert apply_patch(json.loads(json.dumps(src)), patch) == dst
+
+
+def test_save__next_version__store_delta():
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=3)
+    service = TemplateVersioningService(TemplateSchemaV1)
+    service.save(template)
+    _publish(template, description='New')
+
+    # act
+    version = service.save(template)
+
+    # assert
+    version.refresh_from_db()
+    assert version.data is None
+    assert version.base_version == template.version - 1
+    assert version.snapshot_version == template.version - 1
+    assert version.delta == [
+        {'op': 'replace', 'path': '/description', 'value': 'New'}
+    ]
+
+
+def test_save__snapshot_interval__store_snapshot(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.processes.services.versioning.versioning.settings'
+    )
+    settings_mock.TEMPLATE_VERSION_SNAPSHOT_INTERVAL = 2
+    settings_mock.TEMPLATE_VERSION_CACHE_SIZE = 10
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=1)
+    service = TemplateVersioningService(TemplateSchemaV1)
+    service.save(template)
+    _publish(template, description='Second')
+    service.save(template)
+    _publish(template, description='Third')
+
+    # act
+    version = service.save(template)
+
+    # assert
+    version.refresh_from_db()
+    assert version.delta is None
+    assert version.snapshot_version == template.version
+    assert version.data == service.map_to_dict(template)
+
+
+def test_get_template_dict__delta__reconstruct():
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=2)
+    service = TemplateVersioningService(TemplateSchemaV1)
+    service.save(template)
+    _publish(template, description='Second')
+    service.save(template)
+    _publish(template, description='Third')
+    service.save(template)
+    template_dict = json.loads(json.dumps(service.map_to_dict(template)))
+    service.cache.clear()
+
+    # act
+    result = service.get_template_dict(
+        template_id=template.id,
+        version=template.version
+    )
+
+    # assert
+    assert result == template_dict
+
+
+def test_get_template_dict__cached__not_query(django_assert_num_queries):
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=1)
+    service = TemplateVersioningService(TemplateSchemaV1)
+    service.save(template)
+    first = service.get_template_dict(template.id, template.version)
+    first['description'] = 'Changed by the caller'
+
+    # act
+    with django_assert_num_queries(0):
+        result = service.get_template_dict(template.id, template.version)
+
+    # assert
+    assert result['description'] == template.description
+
+
+def test_compact__full_versions__store_deltas():
+
+    # arrange
+    user = create_test_user()
+    template = create_test_template(user=user, tasks_count=2)
+    service = TemplateVersioningService(TemplateSchemaV1)
+    versions = {}
+    for description in ('First', 'Second', 'Third'):
+        _publish(template, description=description)
+        template_dict = json.loads(json.dumps(service.map_to_dict(template)))
+        versions[template.version] = template_dict
+        TemplateVersion.objects.create(
+            template_id=template.id,
+            version=template.version,
+            data=template_dict
+        )
+
+    # act
+    size_before, size_after = service.compact(template.id)
+
+    # assert
+    assert size_after < size_before
+    stored = TemplateVersion.objects.filter(
+        template_id=template.id
+    ).order_by('version')
+    assert [item.is_snapshot for item in stored] == [True, False, False]
+    service.cache.clear()
+    for version, template_dict in versions.items():
+        assert service.get_template_dict(template.id, version) == (
+            template_dict
+        )
@@ -0,0 +1,130 @@
+import pytest
+from src.processes.services.workflows.details_cache import (
+    WorkflowDetailsCache
+)
+from src.processes.services.workflow_action import (
+    WorkflowActionService
+)
+from src.processes.tests.fixtures import (
+    create_test_user,
+    create_test_workflow,
+)
+from src.authentication.enums import AuthTokenType
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_snapshot__disabled__build_each_time(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.processes.services.workflows.details_cache.settings'
+    )
+    settings_mock.WORKFLOW_DETAILS_CACHE = False
+    build_mock = mocker.Mock(return_value={'tasks': []})
+
+    # act
+    WorkflowDetailsCache.get_snapshot(1, 1, build=build_mock)
+    result = WorkflowDetailsCache.get_snapshot(1, 1, build=build_mock)
+
+    # assert
+    assert result == {'tasks': []}
+    assert build_mock.call_count == 2
+
+
+def test_get_snapshot__cached__not_build(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.processes.services.workflows.details_cache.settings'
+    )
+    settings_mock.WORKFLOW_DETAILS_CACHE = True
+    settings_mock.WORKFLOW_DETAILS_CACHE_TIMEOUT = 60
+    build_mock = mocker.Mock(return_value={'tasks': []})
+
+    # act
+    WorkflowDetailsCache.get_snapshot(2, 1, build=build_mock)
+    result = WorkflowDetailsCache.get_snapshot(2, 1, build=build_mock)
+
+    # assert
+    assert result == {'tasks': []}
+    build_mock.assert_called_once()
+
+
+def test_get_snapshot__workflow_changed__build_new(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.processes.services.workflows.details_cache.settings'
+    )
+    settings_mock.WORKFLOW_DETAILS_CACHE = True
+    settings_mock.WORKFLOW_DETAILS_CACHE_TIMEOUT = 60
+    mocker.patch(
+        'src.processes.services.workflows.details_cache.'
+        'transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    build_mock = mocker.Mock(side_effect=[{'tasks': [1]}, {'tasks': [2]}])
+    WorkflowDetailsCache.get_snapshot(3, 1, build=build_mock)
+
+    # act
+    WorkflowDetailsCache.workflow_changed(3)
+    result = WorkflowDetailsCache.get_snapshot(3, 1, build=build_mock)
+
+    # assert
+    assert result == {'tasks': [2]}
+    assert build_mock.call_count == 2
+
+
+def test_get_snapshot__account_changed__build_new(mocker):
+
+    # arrange
+    settings_mock = mocker.patch(
+        'src.processes.services.workflows.details_cache.settings'
+    )
+    settings_mock.WORKFLOW_DETAILS_CACHE = True
+    settings_mock.WORKFLOW_DETAILS_CACHE_TIMEOUT = 60
+    mocker.patch(
+        'src.processes.services.workflows.details_cache.'
+        'transaction.on_commit',
+        side_effect=lambda func: func()
+    )
+    build_mock = mocker.Mock(side_effect=[{'tasks': [1]}, {'tasks': [2]}])
+    WorkflowDetailsCache.get_snapshot(4, 2, build=build_mock)
+
+    # act
+    WorkflowDetailsCache.account_changed(2)
+    result = WorkflowDetailsCache.get_snapshot(4, 2, build=build_mock)
+
+    # assert
+    assert result == {'tasks': [2]}
+    assert build_mock.call_count == 2
+
+
+def test_workflow_action__update_tasks_status__workflow_changed(mocker):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    workflow_changed_mock = mocker.patch(
+        'src.processes.services.workflows.details_cache.'
+        'WorkflowDetailsCache.workflow_changed'
+    )
+    mocker.patch(
+        'src.processes.services.workflow_action.'
+        'WorkflowActionService.execute_conditions',
+        return_value=(None, None)
+    )
+    service = WorkflowActionService(
+        workflow=workflow,
+        user=user,
+        is_superuser=False,
+        auth_type=AuthTokenType.USER
+    )
+
+    # act
+    service.update_tasks_status()
+
+    # assert
+    workflow_changed_mock.assert_called_once_with(workflow.id)
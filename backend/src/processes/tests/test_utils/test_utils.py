@@ -4,6 +4,7 @@ from src.processes.utils.common import (
     is_tasks_ordering_correct,
     string_abbreviation,
     insert_fields_values_to_text,
+    compile_text_template,
     get_duration_format,
 )
 
@@ -137,6 +138,21 @@ class TestInsertValueToText:
 
         assert result == 'My name is Andre. I was born in Boston'
 
+    def test_insert_values_with_backslashes(self):
+        text = 'Path: {{ path }}'
+        values = {'path': r'C:\new\1'}
+        result = insert_fields_values_to_text(text, values)
+
+        assert result == r'Path: C:\new\1'
+
+    def test_compile_text_template__cached(self):
+        text = 'My name is {{ name}}. I was born in {{city}}'
+
+        template = compile_text_template(text)
+
+        assert compile_text_template(text) is template
+        assert template.api_names == {'name', 'city'}
+
 
 class TestGetDurationFormat:
     @pytest.mark.parametrize(
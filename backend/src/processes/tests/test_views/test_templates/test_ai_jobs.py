@@ -0,0 +1,107 @@
+import pytest
+from src.ai.enums import AiJobStatus
+from src.processes.tests.fixtures import (
+    create_test_user,
+)
+from src.authentication.enums import AuthTokenType
+from src.processes.services.templates.ai_jobs import AiTemplateJobService
+
+
+pytestmark = pytest.mark.django_db
+
+
+def test_create__ok(mocker, api_client):
+
+    # arrange
+    user = create_test_user(is_account_owner=True, is_admin=False)
+    description = 'My unbelievable processes name'
+    job = {
+        'id': 'a' * 32,
+        'status': AiJobStatus.PENDING,
+        'data': None,
+        'message': None,
+    }
+    create_job_mock = mocker.patch(
+        'src.processes.views.template.AiTemplateJobService.create',
+        return_value=job
+    )
+    mocker.patch(
+        'src.processes.views.template.'
+        'AIPermission.has_permission',
+        return_value=True
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.post(
+        path='/templates/ai-jobs',
+        data={'description': description}
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == job
+    create_job_mock.assert_called_once_with(
+        user=user,
+        description=description,
+        is_superuser=False,
+        auth_type=AuthTokenType.USER
+    )
+
+
+def test_retrieve__ok(mocker, api_client):
+
+    # arrange
+    user = create_test_user()
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit'
+    )
+    job = AiTemplateJobService.create(
+        user=user,
+        description='My unbelievable processes name',
+        auth_type=AuthTokenType.USER,
+    )
+    mocker.patch(
+        'src.processes.views.template.'
+        'AIPermission.has_permission',
+        return_value=True
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get(f'/templates/ai-jobs/{job["id"]}')
+
+    # assert
+    assert response.status_code == 200
+    assert response.data == job
+
+
+def test_retrieve__another_user__not_found(mocker, api_client):
+
+    # arrange
+    user = create_test_user()
+    another_user = create_test_user(
+        email='another@pneumatic.app',
+        account=user.account,
+        is_account_owner=False,
+    )
+    mocker.patch(
+        'src.processes.services.templates.ai_jobs.transaction.on_commit'
+    )
+    job = AiTemplateJobService.create(
+        user=user,
+        description='My unbelievable processes name',
+        auth_type=AuthTokenType.USER,
+    )
+    mocker.patch(
+        'src.processes.views.template.'
+        'AIPermission.has_permission',
+        return_value=True
+    )
+    api_client.token_authenticate(another_user)
+
+    # act
+    response = api_client.get(f'/templates/ai-jobs/{job["id"]}')
+
+    # assert
+    assert response.status_code == 404
@@ -1,5 +1,7 @@
 import pytest
 from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from src.accounts.enums import BillingPlanType
 from src.processes.tests.fixtures import (
@@ -2180,3 +2182,50 @@ class TestUpdateTemplate:
             type=PerformerType.GROUP,
             group=group,
         )
+
+    def test_update__unchanged_tasks__not_saved(
+        self,
+        api_client,
+        mocker,
+    ):
+
+        # arrange
+        user = create_test_user()
+        api_client.token_authenticate(user)
+        template = create_test_template(
+            user,
+            is_active=True,
+            tasks_count=3,
+        )
+        mocker.patch(
+            'src.processes.services.templates.'
+            'integrations.TemplateIntegrationsService.template_updated'
+        )
+        mocker.patch(
+            'src.processes.views.template.'
+            'AnalyticService.templates_updated'
+        )
+        mocker.patch(
+            'src.processes.views.template.'
+            'AnalyticService.templates_kickoff_updated'
+        )
+        request_data = api_client.get(f'/templates/{template.id}').data
+        api_client.put(path=f'/templates/{template.id}', data=request_data)
+        request_data = api_client.get(f'/templates/{template.id}').data
+
+        # act
+        with CaptureQueriesContext(connection) as context:
+            response = api_client.put(
+                path=f'/templates/{template.id}',
+                data=request_data
+            )
+
+        # assert
+        assert response.status_code == 200
+        assert not [
+            query for query in context.captured_queries
+            if query['sql'].startswith('UPDATE "processes_tasktemplate"')
+            or query['sql'].startswith('UPDATE "processes_rawperformer')
+            or query['sql'].startswith('UPDATE "processes_templateowner"')
+        ]
+        assert len(response.data['tasks']) == 3
@@ -1250,6 +1250,143 @@ def test_retrieve__task__due_date_changed__ok(api_client):
     assert task_data['due_date_tsp'] == due_date.timestamp()
 
 
+def test_retrieve__cursor_paginated__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    workflow = create_test_workflow(user=user)
+    task = workflow.tasks.get(number=1)
+    event_1 = WorkflowEventService.comment_created_event(
+        text='Comment 1',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    event_2 = WorkflowEventService.comment_created_event(
+        text='Comment 2',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    response_1 = api_client.get(
+        path=f'/workflows/{workflow.id}/events?limit=1&cursor='
+    )
+
+    # act
+    response_2 = api_client.get(path=response_1.json()['next'])
+
+    # assert
+    assert response_1.status_code == 200
+    response_data_1 = response_1.json()
+    assert 'count' not in response_data_1
+    assert len(response_data_1['results']) == 1
+    assert response_data_1['results'][0]['id'] == event_2.id
+    assert response_2.status_code == 200
+    response_data_2 = response_2.json()
+    assert response_data_2['next'] is None
+    assert len(response_data_2['results']) == 1
+    assert response_data_2['results'][0]['id'] == event_1.id
+
+
+def test_retrieve__since_id__only_new_and_changed(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    changed_event = WorkflowEventService.comment_created_event(
+        text='Comment 1',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    WorkflowEventService.comment_created_event(
+        text='Comment 2',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    last_event = WorkflowEventService.comment_created_event(
+        text='Comment 3',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    new_event = WorkflowEventService.comment_created_event(
+        text='Comment 4',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    changed_event.changed = timezone.now()
+    changed_event.save(update_fields=['changed'])
+
+    # act
+    response = api_client.get(
+        f'/workflows/{workflow.id}/events?since_id={last_event.id}'
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert {event['id'] for event in response.data} == {
+        changed_event.id,
+        new_event.id
+    }
+
+
+def test_retrieve__etag_not_changed__not_modified(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    WorkflowEventService.comment_created_event(
+        text='Comment 1',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    path = f'/workflows/{workflow.id}/events'
+    etag = api_client.get(path)['ETag']
+
+    # act
+    response = api_client.get(path, HTTP_IF_NONE_MATCH=etag)
+
+    # assert
+    assert response.status_code == 304
+
+
+def test_retrieve__etag_event_changed__ok(api_client):
+
+    # arrange
+    user = create_test_user()
+    api_client.token_authenticate(user)
+    workflow = create_test_workflow(user=user, tasks_count=1)
+    task = workflow.tasks.get(number=1)
+    event = WorkflowEventService.comment_created_event(
+        text='Comment 1',
+        task=task,
+        user=user,
+        after_create_actions=False
+    )
+    path = f'/workflows/{workflow.id}/events'
+    etag = api_client.get(path)['ETag']
+    event.reactions = {':)': [user.id]}
+    event.changed = timezone.now()
+    event.save(update_fields=['reactions', 'changed'])
+
+    # act
+    response = api_client.get(path, HTTP_IF_NONE_MATCH=etag)
+
+    # assert
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+    assert response.data[0]['reactions'] == {':)': [user.id]}
+
+
 def test_retrieve__comment__updated__ok(api_client):
 
     # arrange
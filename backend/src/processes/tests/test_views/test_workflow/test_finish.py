@@ -41,7 +41,7 @@ class TestFinishWorkflow:
         task_2 = workflow.tasks.get(number=2)
         deactivate_cache_mock = mocker.patch(
             'src.authentication.services.'
-            'GuestJWTAuthService.deactivate_task_guest_cache'
+            'GuestJWTAuthService.deactivate_tasks_guest_cache'
         )
         send_removed_task_notification_mock = mocker.patch(
             'src.notifications.tasks'
@@ -66,12 +66,9 @@ class TestFinishWorkflow:
             auth_type=AuthTokenType.USER,
             is_superuser=False
         )
-        deactivate_cache_mock.assert_has_calls(
-            [
-                mocker.call(task_id=task_1.id),
-                mocker.call(task_id=task_2.id)
-            ]
-        )
+        deactivate_cache_mock.assert_called_once()
+        task_ids = deactivate_cache_mock.call_args[1]['task_ids']
+        assert set(task_ids) == {task_1.id, task_2.id}
         send_removed_task_notification_mock.assert_called_once_with(
             task_id=task_1.id,
             recipients=[(user.id, user.email)],
@@ -176,7 +173,7 @@ class TestFinishWorkflow:
 
         mocker.patch(
             'src.authentication.services.'
-            'GuestJWTAuthService.deactivate_task_guest_cache'
+            'GuestJWTAuthService.deactivate_tasks_guest_cache'
         )
         send_removed_task_notification_mock = mocker.patch(
             'src.notifications.tasks'
@@ -9,6 +9,7 @@ from src.processes.models import (
     RuleTemplate,
     PredicateTemplate,
     FieldTemplateSelection,
+    TaskPerformer,
 )
 from src.processes.services.exceptions import \
     WorkflowActionServiceException
@@ -22,6 +23,7 @@ from src.processes.tests.fixtures import (
     create_task_returned_webhook,
     create_test_owner,
     create_test_admin,
+    create_test_guest,
 )
 from src.processes.messages import workflow as messages
 from src.utils.validation import ErrorCode
@@ -32,6 +34,7 @@ from src.processes.enums import (
     ConditionAction,
 )
 from src.authentication.enums import AuthTokenType
+from src.authentication.services import GuestJWTAuthService
 
 pytestmark = pytest.mark.django_db
 
@@ -320,9 +323,10 @@ def test_return_to__ok(mocker, api_client):
         is_superuser=False,
         auth_type=AuthTokenType.USER
     )
-    delete_task_guest_cache_mock.assert_called_once_with(
-        task_id=task_2.id
-    )
+    delete_task_guest_cache_mock.assert_has_calls([
+        mocker.call(task_id=task_1.id),
+        mocker.call(task_id=task_2.id),
+    ])
     revert_task_webhook_mock.assert_called_once_with(
         user_id=user.id,
         account_id=user.account_id,
@@ -789,10 +793,67 @@ def test_return_to__completed_workflow__ok(
     assert task_1.is_active
     send_removed_task_notification_mock.assert_not_called()
     send_new_task_notification_mock.assert_called_once()
-    delete_task_guest_cache_mock.assert_not_called()
+    delete_task_guest_cache_mock.assert_called_once_with(
+        task_id=task_1.id
+    )
     revert_task_webhook_mock.assert_called_once()
 
 
+def test_return_to__completed_workflow__activate_guest(
+    mocker,
+    api_client,
+):
+
+    # arrange
+    user = create_test_user()
+    workflow = create_test_workflow(user, tasks_count=1)
+    task_1 = workflow.tasks.get(number=1)
+    guest = create_test_guest(account=user.account)
+    TaskPerformer.objects.create(
+        task_id=task_1.id,
+        user_id=guest.id
+    )
+    str_token = GuestJWTAuthService.get_str_token(
+        task_id=task_1.id,
+        user_id=guest.id,
+        account_id=user.account_id
+    )
+    mocker.patch(
+        'src.processes.services.workflow_action.'
+        'send_new_task_notification.delay'
+    )
+    mocker.patch(
+        'src.notifications.tasks'
+        '.send_removed_task_notification.delay'
+    )
+    mocker.patch(
+        'src.processes.views.task.TaskViewSet.'
+        'identify'
+    )
+    mocker.patch(
+        'src.processes.views.task.TaskViewSet.'
+        'group'
+    )
+    api_client.token_authenticate(user)
+    response_complete = api_client.post(f'/v2/tasks/{task_1.id}/complete')
+    response_return = api_client.post(
+        path=f'/workflows/{workflow.id}/return-to',
+        data={'task_api_name': task_1.api_name}
+    )
+    api_client.logout()
+
+    # act
+    response = api_client.get(
+        f'/v2/tasks/{task_1.id}',
+        **{'X-Guest-Authorization': str_token}
+    )
+
+    # assert
+    assert response_complete.status_code == 200
+    assert response_return.status_code == 204
+    assert response.status_code == 200
+
+
 @pytest.mark.parametrize('status', WorkflowStatus.RUNNING_STATUSES)
 def test_return_to__sub_workflow_incompleted__validation_error(
     status,
@@ -1,8 +1,9 @@
 import re
+from functools import lru_cache
 from typing import Optional
 from datetime import timedelta
 from typing import (
-    Type, List, Set, Dict, Union
+    Type, List, Set, Dict, Union, Tuple, FrozenSet
 )
 from django.contrib.auth import get_user_model
 from rest_framework.serializers import ModelSerializer, ListSerializer
@@ -15,7 +16,6 @@ from src.processes.enums import (
 from src.utils.salt import get_salt
 
 VAR_PATTERN = re.compile(r'{{\s*([^\{\}\s]+)\s*}}')
-VAR_PATTERN_TEMPLATE = r'\{\{(\s*?)%s(\s*?)\}\}'
 VAR_PATTERN_FIELD = re.compile(
     r'\{\{(\s*?)((?!date|template-name).)+(\s*?)\}\}'
 )
@@ -103,16 +103,60 @@ def contains_vars(value: Optional[str] = None) -> bool:
     return bool(VAR_PATTERN.search(value))
 
 
+class TextTemplate:
+
+    """ The text split into the literal parts and the variables,
+        the values are inserted in one pass """
+
+    __slots__ = ('parts', 'tail', 'api_names')
+
+    def __init__(self, text: str):
+        parts = []
+        position = 0
+        for match in VAR_PATTERN.finditer(text):
+            parts.append(
+                (text[position:match.start()], match.group(1), match.group(0))
+            )
+            position = match.end()
+        self.parts: Tuple[Tuple[str, str, str], ...] = tuple(parts)
+        self.tail = text[position:]
+        self.api_names = frozenset(api_name for _, api_name, _ in parts)
+
+    def render(self, fields_values: Dict[str, str]) -> str:
+        chunks = []
+        for literal, api_name, variable in self.parts:
+            chunks.append(literal)
+            if api_name in fields_values:
+                value = fields_values[api_name]
+                chunks.append('' if value is None else value)
+            else:
+                chunks.append(variable)
+        chunks.append(self.tail)
+        return ''.join(chunks)
+
+
+@lru_cache(maxsize=4096)
+def compile_text_template(text: str) -> TextTemplate:
+
+    """ The templates are cached by the text, so the texts of the same
+        template version are parsed once per process """
+
+    return TextTemplate(text)
+
+
+def get_text_vars(text: Optional[str]) -> FrozenSet[str]:
+    if not text:
+        return frozenset()
+    return compile_text_template(text).api_names
+
+
 def insert_fields_values_to_text(
     text: Optional[str],
     fields_values: Dict[str, str]
 ) -> str:
 
     if contains_vars(text):
-        for api_name, value in fields_values.items():
-            value = '' if value is None else value
-            field_variable_pattern = VAR_PATTERN_TEMPLATE % api_name
-            text = re.sub(field_variable_pattern, value, text)
+        text = compile_text_template(text).render(fields_values)
     return text
 
 
@@ -1,5 +1,8 @@
+from datetime import datetime
+from typing import Optional
+from django.db import transaction
 from django.utils import timezone
-from src.processes.enums import TaskStatus
+from src.processes.services.delays import DelayScheduler
 from src.processes.services.workflow_action import (
     WorkflowActionService
 )
@@ -11,23 +14,78 @@ from django.contrib.auth import get_user_model
 UserModel = get_user_model()
 
 
-def resume_delayed_workflows():
+def _resume_delay(delay: Delay, user: UserModel):
 
-    """ Found a tasks with expired delay period and resume them """
+    """ The delay is resumed either by the ETA task or by the sweep,
+        so it is checked again with the row locked. The delay locked
+        by another worker is skipped """
 
-    for delay in Delay.objects.filter(
-        estimated_end_date__lte=timezone.now(),
-        end_date__isnull=True,
-        task__status=TaskStatus.DELAYED
-    ).prefetch_related(
-        'task__account',
-        'task__workflow',
-    ):
-        workflow = delay.task.workflow
+    with transaction.atomic():
+        delay_id = (
+            Delay.objects
+            .delayed_tasks()
+            .select_for_update(skip_locked=True, of=('self',))
+            .filter(id=delay.id)
+            .values_list('id', flat=True)
+            .first()
+        )
+        if delay_id is None:
+            return
         service = WorkflowActionService(
-            workflow=workflow,
-            user=workflow.account.get_owner(),
+            workflow=delay.task.workflow,
+            user=user,
             is_superuser=False,
             auth_type=AuthTokenType.USER
         )
         service.resume_task(delay.task)
+
+
+def resume_delay(delay_id: int, end_date_tsp: float):
+
+    """ Resume the task of the delay scheduled by the DelayScheduler.
+        The delay with the changed end date is skipped,
+        the new end date has its own ETA task. The ETA task fired
+        before the end date is scheduled again """
+
+    delay = (
+        Delay.objects
+        .delayed_tasks()
+        .filter(id=delay_id)
+        .select_related('task__workflow')
+        .first()
+    )
+    if delay is None or delay.estimated_end_date.timestamp() != end_date_tsp:
+        return
+    if delay.estimated_end_date > (
+        timezone.now() + DelayScheduler.eta_tolerance
+    ):
+        DelayScheduler.reschedule(delay)
+        return
+    owner = UserModel.objects.filter(
+        account_id=delay.task.account_id,
+        is_account_owner=True
+    ).first()
+    _resume_delay(delay=delay, user=owner)
+
+
+def resume_delayed_workflows(ended_before: Optional[datetime] = None):
+
+    """ Found a tasks with expired delay period and resume them.
+        The owners of all accounts are loaded with one query """
+
+    delays = list(
+        Delay.objects
+        .ending_before(ended_before or timezone.now())
+        .select_related('task__workflow')
+        .order_by('estimated_end_date')
+    )
+    if not delays:
+        return
+    owners = {}
+    for owner in UserModel.objects.filter(
+        account_id__in={delay.task.account_id for delay in delays},
+        is_account_owner=True
+    ).order_by('id'):
+        owners.setdefault(owner.account_id, owner)
+    for delay in delays:
+        _resume_delay(delay=delay, user=owners.get(delay.task.account_id))
@@ -3,7 +3,6 @@ from django.contrib.auth import get_user_model
 from rest_framework.decorators import action
 from rest_framework.viewsets import GenericViewSet
 from rest_framework.generics import ListAPIView, get_object_or_404
-from rest_framework.pagination import LimitOffsetPagination
 
 from src.analytics.services import AnalyticService
 from src.generics.filters import PneumaticFilterBackend
@@ -26,7 +25,9 @@ from src.accounts.permissions import (
 )
 from src.generics.mixins.views import (
     CustomViewSetMixin,
+    ConditionalResponseMixin,
 )
+from src.processes.paginations import WorkflowEventPagination
 from src.processes.models import (
     Task,
     TaskForList,
@@ -132,6 +133,7 @@ class TasksListView(ListAPIView):
 
 class TaskViewSet(
     CustomViewSetMixin,
+    ConditionalResponseMixin,
     BaseIdentifyMixin,
     GenericViewSet,
 ):
@@ -213,7 +215,7 @@ class TaskViewSet(
     }
 
     action_paginator_classes = {
-        'events': LimitOffsetPagination,
+        'events': WorkflowEventPagination,
     }
 
     def get_serializer_context(self, **kwargs):
@@ -443,7 +445,10 @@ class TaskViewSet(
             .type_in(WorkflowEventType.TASK_EVENTS)
         )
         qst = self.filter_queryset(qst)
-        return self.paginated_response(qst)
+        return self.conditional_paginated_response(
+            queryset=qst,
+            state=qst.get_feed_state()
+        )
 
     @action(methods=['post'], detail=True)
     def revert(self, request, *args, **kwargs):
@@ -86,6 +86,7 @@ from src.generics.permissions import (
 from src.processes.services.templates.ai import (
     OpenAiService
 )
+from src.processes.services.templates.ai_jobs import AiTemplateJobService
 from src.authentication.enums import AuthTokenType
 from src.processes.utils.common import get_user_agent
 from src.processes.services.exceptions import (
@@ -117,6 +118,7 @@ class TemplateViewSet(
         'run': WorkflowCreateSerializer,
         'steps': TemplateStepNameSerializer,
         'ai': TemplateAiSerializer,
+        'ai_jobs': TemplateAiSerializer,
         'by_steps': TemplateByStepsSerializer,
         'by_name': TemplateByNameSerializer,
         'titles': TemplateTitlesSerializer,
@@ -164,7 +166,7 @@ class TemplateViewSet(
                 ExpiredSubscriptionPermission(),
                 BillingPlanPermission(),
             )
-        elif self.action == 'ai':
+        elif self.action in ('ai', 'ai_jobs', 'ai_job'):
             return (
                 AIPermission(),
                 UserIsAuthenticated(),
@@ -190,7 +192,7 @@ class TemplateViewSet(
 
     @property
     def throttle_classes(self):
-        if self.action == 'ai':
+        if self.action in ('ai', 'ai_jobs'):
             return (AiTemplateGenThrottle,)
         else:
             return ()
@@ -573,6 +575,32 @@ class TemplateViewSet(
         else:
             return self.response_ok(data)
 
+    @action(methods=['POST'], detail=False, url_path='ai-jobs')
+    def ai_jobs(self, request, *args, **kwargs):
+        request_slz = self.get_serializer(data=request.data)
+        request_slz.is_valid(raise_exception=True)
+        job = AiTemplateJobService.create(
+            user=request.user,
+            description=request_slz.validated_data['description'],
+            is_superuser=request.is_superuser,
+            auth_type=request.token_type
+        )
+        return self.response_ok(job)
+
+    @action(
+        methods=['GET'],
+        detail=False,
+        url_path=r'ai-jobs/(?P<job_id>[0-9a-f]{32})'
+    )
+    def ai_job(self, request, job_id, *args, **kwargs):
+        job = AiTemplateJobService.get(
+            user_id=request.user.id,
+            job_id=job_id
+        )
+        if job is None:
+            raise Http404
+        return self.response_ok(job)
+
     @action(methods=['POST'], detail=False, url_path='by-steps')
     def by_steps(self, request, *args, **kwargs):
         request_slz = self.get_serializer(data=request.data)
@@ -4,7 +4,6 @@ from rest_framework.generics import (
 )
 from rest_framework.mixins import ListModelMixin, UpdateModelMixin
 from rest_framework.viewsets import GenericViewSet
-from rest_framework.pagination import LimitOffsetPagination
 from src.analytics.services import AnalyticService
 from src.utils.validation import raise_validation_error
 from src.accounts.permissions import (
@@ -18,7 +17,10 @@ from src.analytics.actions import (
     WorkflowActions
 )
 from src.generics.filters import PneumaticFilterBackend
-from src.processes.paginations import WorkflowListPagination
+from src.processes.paginations import (
+    WorkflowListPagination,
+    WorkflowEventPagination,
+)
 from src.generics.paginations import DefaultPagination
 
 from src.processes.models import (
@@ -50,7 +52,10 @@ from src.processes.serializers.workflows.events import (
     WorkflowEventSerializer,
 )
 from src.accounts.enums import UserType
-from src.generics.mixins.views import CustomViewSetMixin
+from src.generics.mixins.views import (
+    CustomViewSetMixin,
+    ConditionalResponseMixin,
+)
 from src.generics.permissions import (
     UserIsAuthenticated,
     IsAuthenticated,
@@ -80,6 +85,7 @@ from src.webhooks.enums import HookEvent
 
 class WorkflowViewSet(
     CustomViewSetMixin,
+    ConditionalResponseMixin,
     ListModelMixin,
     UpdateModelMixin,
     GenericViewSet
@@ -105,7 +111,7 @@ class WorkflowViewSet(
     }
 
     action_paginator_classes = {
-        'events': LimitOffsetPagination,
+        'events': WorkflowEventPagination,
         'fields': DefaultPagination,
         'list': WorkflowListPagination,
     }
@@ -462,7 +468,10 @@ class WorkflowViewSet(
                 self.request.task_id
             ).exclude(type=WorkflowEventType.TASK_START)
         qst = self.filter_queryset(qst)
-        return self.paginated_response(qst)
+        return self.conditional_paginated_response(
+            queryset=qst,
+            state=qst.get_feed_state()
+        )
 
     @action(methods=['get'], url_path='webhook-example', detail=False)
     def webhook_example(self, request, *args, **kwargs):
@@ -1,5 +1,6 @@
 from abc import ABC
-from typing import Dict, Optional, Tuple
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
 
 
 class OrderByMixin:
@@ -61,8 +62,54 @@ class OrderByMixin:
         return ''
 
 
+QUERY_LABEL_PREFIX = '/* query: '
+
+
+def get_query_label(sql: str) -> Optional[str]:
+
+    """ Returns the query class name from the sql comment
+        added by the SqlQueryObject """
+
+    if not sql.startswith(QUERY_LABEL_PREFIX):
+        return None
+    return sql[len(QUERY_LABEL_PREFIX):sql.find(' */')]
+
+
+def _add_query_label(method: Callable) -> Callable:
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        sql = result[0] if isinstance(result, tuple) else result
+        if not sql or sql.startswith(QUERY_LABEL_PREFIX):
+            return result
+        label = self.__class__.__name__
+        if method.__name__ != 'get_sql':
+            label = f'{label}.{method.__name__}'
+        sql = f'{QUERY_LABEL_PREFIX}{label} */{sql}'
+        if isinstance(result, tuple):
+            return (sql, *result[1:])
+        return sql
+
+    wrapper.labeled = True
+    return wrapper
+
+
 class SqlQueryObject(ABC):
 
+    """ The sql of the subclasses starts with the comment containing
+        the query class name. It's visible in pg_stat_activity
+        and used for the query stats, see src.query_stats """
+
+    labeled_methods = ('get_sql', 'get_count_sql', 'insert_sql')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls.labeled_methods:
+            method = getattr(cls, name, None)
+            if method is not None and not getattr(method, 'labeled', False):
+                setattr(cls, name, _add_query_label(method))
+
     def get_sql(self) -> Tuple[str, dict]:
         pass
 
@@ -0,0 +1,216 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from src.db_routing import is_read_sql
+from src.queries import get_query_label
+
+
+logger = logging.getLogger('src.query_stats')
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class QueryStats:
+
+    """ Counters of the SqlQueryObject queries by the query class name.
+        Counters are collected in the process and periodically
+        added to the redis hash shared by all processes.
+
+        Hash fields: "<label>|count", "<label>|sum_ms", "<label>|rows",
+        "<label>|le|<bucket>" (not cumulative) """
+
+    key = 'query_stats'
+    plans_key = 'query_stats:plans'
+
+    _lock = threading.Lock()
+    _counters: Dict[str, float] = defaultdict(float)
+    _flushed_at = time.monotonic()
+
+    @classmethod
+    def record(cls, label: str, duration_ms: float, row_count: int):
+        bucket = next(
+            (str(le) for le in LATENCY_BUCKETS_MS if duration_ms <= le),
+            '+Inf'
+        )
+        with cls._lock:
+            cls._counters[f'{label}|count'] += 1
+            cls._counters[f'{label}|sum_ms'] += duration_ms
+            cls._counters[f'{label}|rows'] += max(row_count, 0)
+            cls._counters[f'{label}|le|{bucket}'] += 1
+            flush_needed = (
+                time.monotonic() - cls._flushed_at
+                >= settings.QUERY_STATS_FLUSH_SECONDS
+            )
+        if flush_needed:
+            cls.flush()
+
+    @classmethod
+    def flush(cls):
+        with cls._lock:
+            counters = cls._counters
+            cls._counters = defaultdict(float)
+            cls._flushed_at = time.monotonic()
+        if not counters:
+            return
+        try:
+            pipe = get_redis_connection('default').pipeline(
+                transaction=False
+            )
+            for field, value in counters.items():
+                pipe.hincrbyfloat(cls.key, field, value)
+            pipe.execute()
+        except RedisError as ex:
+            logger.warning('Failed to save query stats: %s', ex)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, dict]:
+
+        """ Returns the stats of all processes by the query label """
+
+        stats = defaultdict(lambda: {
+            'count': 0,
+            'sum_ms': 0,
+            'rows': 0,
+            'buckets': defaultdict(int),
+        })
+        values = get_redis_connection('default').hgetall(cls.key)
+        for field, value in values.items():
+            label, name, *bucket = field.decode().split('|')
+            if name == 'le':
+                stats[label]['buckets'][bucket[0]] = int(float(value))
+            else:
+                stats[label][name] = float(value)
+        return stats
+
+    @classmethod
+    def reset(cls):
+        get_redis_connection('default').delete(cls.key, cls.plans_key)
+
+    @classmethod
+    def save_plan(cls, label: str, duration_ms: float, plan: List[str]):
+        get_redis_connection('default').hset(
+            cls.plans_key,
+            label,
+            json.dumps({
+                'date': timezone.now().isoformat(),
+                'duration_ms': duration_ms,
+                'plan': plan,
+            })
+        )
+
+    @classmethod
+    def get_plans(cls) -> Dict[str, dict]:
+        values = get_redis_connection('default').hgetall(cls.plans_key)
+        return {
+            label.decode(): json.loads(value)
+            for label, value in values.items()
+        }
+
+
+def explain_query(
+    connection,
+    label: str,
+    sql: str,
+    params: Optional[dict],
+    duration_ms: float,
+):
+
+    """ Saves the plan of the slow read query.
+        The query is executed again, so only one plan
+        per query class is taken in QUERY_STATS_EXPLAIN_INTERVAL """
+
+    if not is_read_sql(sql) or not cache.add(
+        f'query_stats:explain:{label}',
+        1,
+        settings.QUERY_STATS_EXPLAIN_INTERVAL
+    ):
+        return
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (ANALYZE, BUFFERS) {sql}', params)
+            plan = [row[0] for row in cursor.fetchall()]
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning('Failed to explain query %s: %s', label, ex)
+    else:
+        QueryStats.save_plan(label, duration_ms, plan)
+
+
+def instrument_query(execute, sql, params, many, context):
+
+    """ Database execute wrapper, records the stats
+        of the queries labeled by the SqlQueryObject """
+
+    label = get_query_label(sql) if settings.QUERY_STATS else None
+    if label is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    result = execute(sql, params, many, context)
+    duration_ms = (time.perf_counter() - started) * 1000
+    QueryStats.record(
+        label=label,
+        duration_ms=duration_ms,
+        row_count=context['cursor'].rowcount,
+    )
+    if (
+        not many
+        and duration_ms >= settings.QUERY_STATS_SLOW_QUERY_MS
+        and not context['connection'].in_atomic_block
+    ):
+        explain_query(
+            connection=context['connection'],
+            label=label,
+            sql=sql,
+            params=params,
+            duration_ms=duration_ms,
+        )
+    return result
+
+
+def install_query_instrumentation(sender, connection, **kwargs):
+
+    """ The "connection_created" signal receiver.
+        The wrapper is added first, so the wrappers
+        added with "connection.execute_wrapper()" are removed correctly """
+
+    if instrument_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, instrument_query)
+
+
+def render_prometheus_metrics() -> str:
+    lines = [
+        '# HELP sql_query_duration_ms SqlQueryObject query duration',
+        '# TYPE sql_query_duration_ms histogram',
+    ]
+    rows_lines = [
+        '# HELP sql_query_rows_total Rows returned or affected by the query',
+        '# TYPE sql_query_rows_total counter',
+    ]
+    for label, stats in sorted(QueryStats.get_stats().items()):
+        cumulative = 0
+        for le in (*LATENCY_BUCKETS_MS, '+Inf'):
+            cumulative += stats['buckets'].get(str(le), 0)
+            lines.append(
+                f'sql_query_duration_ms_bucket'
+                f'{{query="{label}",le="{le}"}} {cumulative}'
+            )
+        lines.append(
+            f'sql_query_duration_ms_sum{{query="{label}"}} '
+            f'{stats["sum_ms"]:.3f}'
+        )
+        lines.append(
+            f'sql_query_duration_ms_count{{query="{label}"}} '
+            f'{int(stats["count"])}'
+        )
+        rows_lines.append(
+            f'sql_query_rows_total{{query="{label}"}} {int(stats["rows"])}'
+        )
+    return '\n'.join(lines + rows_lines) + '\n'
@@ -0,0 +1,120 @@
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Optional
+from django.conf import settings
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+
+
+logger = logging.getLogger('src.queue_stats')
+
+
+class QueueStats:
+
+    """ Latency of the celery tasks by the queue: the time between
+        the publishing and the start of the task.
+
+        Hash fields: "<queue>|count", "<queue>|sum_ms", "<queue>|max_ms" """
+
+    key = 'queue_stats'
+
+    @classmethod
+    def record(cls, queue: str, latency_ms: float):
+        try:
+            redis = get_redis_connection('default')
+            pipe = redis.pipeline(transaction=False)
+            pipe.hincrby(cls.key, f'{queue}|count', 1)
+            pipe.hincrbyfloat(cls.key, f'{queue}|sum_ms', latency_ms)
+            pipe.hget(cls.key, f'{queue}|max_ms')
+            max_ms = pipe.execute()[-1]
+            if max_ms is None or float(max_ms) < latency_ms:
+                redis.hset(cls.key, f'{queue}|max_ms', latency_ms)
+        except RedisError as ex:
+            logger.warning('Failed to save queue stats: %s', ex)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, dict]:
+        stats = defaultdict(lambda: {'count': 0, 'sum_ms': 0, 'max_ms': 0})
+        values = get_redis_connection('default').hgetall(cls.key)
+        for field, value in values.items():
+            queue, name = field.decode().rsplit('|', 1)
+            stats[queue][name] = float(value)
+        return stats
+
+    @classmethod
+    def reset(cls):
+        get_redis_connection('default').delete(cls.key)
+
+
+def get_queue_depth(queue: str) -> Optional[int]:
+    from src.celery import celery_app
+    try:
+        with celery_app.connection_for_write() as connection:
+            return connection.default_channel.queue_declare(
+                queue=queue,
+                passive=True
+            ).message_count
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning('Failed to get the depth of %s: %s', queue, ex)
+        return None
+
+
+def mark_published(headers: dict, **kwargs):
+
+    """ The "before_task_publish" signal receiver """
+
+    if settings.CELERY_QUEUE_STATS:
+        headers['published_at'] = time.time()
+
+
+def record_latency(task, **kwargs):
+
+    """ The "task_prerun" signal receiver """
+
+    request = task.request
+    published_at = getattr(request, 'published_at', None)
+    if not settings.CELERY_QUEUE_STATS or published_at is None:
+        return
+    delivery_info = request.delivery_info or {}
+    queue = delivery_info.get('routing_key') or settings.CELERY_DEFAULT_QUEUE
+    eta = getattr(request, 'eta', None)
+    if eta:
+        # Scheduled tasks are waiting for the ETA, not for a worker
+        return
+    QueueStats.record(
+        queue=queue,
+        latency_ms=max(time.time() - published_at, 0) * 1000
+    )
+
+
+def render_prometheus_metrics() -> str:
+    lines = [
+        '# HELP celery_queue_latency_ms Time from publishing to the start',
+        '# TYPE celery_queue_latency_ms summary',
+    ]
+    depth_lines = [
+        '# HELP celery_queue_depth Messages waiting in the queue',
+        '# TYPE celery_queue_depth gauge',
+    ]
+    stats = QueueStats.get_stats()
+    for queue in settings.CELERY_QUEUES:
+        queue_stats = stats[queue.name]
+        lines.append(
+            f'celery_queue_latency_ms_sum{{queue="{queue.name}"}} '
+            f'{queue_stats["sum_ms"]:.3f}'
+        )
+        lines.append(
+            f'celery_queue_latency_ms_count{{queue="{queue.name}"}} '
+            f'{int(queue_stats["count"])}'
+        )
+        lines.append(
+            f'celery_queue_latency_ms_max{{queue="{queue.name}"}} '
+            f'{queue_stats["max_ms"]:.3f}'
+        )
+        depth = get_queue_depth(queue.name)
+        if depth is not None:
+            depth_lines.append(
+                f'celery_queue_depth{{queue="{queue.name}"}} {depth}'
+            )
+    return '\n'.join(lines + depth_lines) + '\n'
@@ -88,6 +88,8 @@ class HighlightsFilterSerializer(
     current_performer_group_ids = serializers.CharField(required=False)
     date_before_tsp = TimeStampField(required=False, allow_null=True)
     date_after_tsp = TimeStampField(required=False, allow_null=True)
+    before_id = serializers.IntegerField(required=False, min_value=1)
+    limit = serializers.IntegerField(required=False, min_value=1)
 
     def validate_users(self, value):
         return self.get_valid_list_integers(value)
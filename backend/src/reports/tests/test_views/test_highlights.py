@@ -1285,3 +1285,100 @@ def test__sub_workflow_run__ok(api_client):
     assert data['workflow']['id'] == workflow.id
     assert data['workflow']['template']['id'] == workflow.template.id
     assert data['workflow']['template']['name'] == workflow.template.name
+
+
+def test__before_id__keyset_page(api_client):
+
+    # arrange
+    account = create_test_account()
+    create_test_user(
+        email='owner@test.test',
+        account=account,
+        is_account_owner=True
+    )
+    user = create_test_user(
+        account=account,
+        is_account_owner=False
+    )
+    workflow_1 = create_test_workflow(user)
+    workflow_2 = create_test_workflow(user)
+    workflow_3 = create_test_workflow(user)
+    event_1 = WorkflowEventService.comment_created_event(
+        user=user,
+        text='Comment 1',
+        task=workflow_1.tasks.get(number=1),
+        after_create_actions=False
+    )
+    event_2 = WorkflowEventService.comment_created_event(
+        user=user,
+        text='Comment 2',
+        task=workflow_2.tasks.get(number=1),
+        after_create_actions=False
+    )
+    event_3 = WorkflowEventService.comment_created_event(
+        user=user,
+        text='Comment 3',
+        task=workflow_3.tasks.get(number=1),
+        after_create_actions=False
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get(
+        f'/reports/highlights?before_id={event_3.id}&limit=1'
+    )
+
+    # assert
+    assert response.status_code == 200
+    assert response.data['count'] == 1
+    assert response.data['previous'] is None
+    assert len(response.data['results']) == 1
+    assert response.data['results'][0]['id'] == event_2.id
+    assert f'before_id={event_2.id}' in response.data['next']
+    response = api_client.get(response.data['next'])
+    assert response.data['results'][0]['id'] == event_1.id
+    response = api_client.get(
+        f'/reports/highlights?before_id={event_1.id}&limit=1'
+    )
+    assert response.data['count'] == 0
+    assert response.data['results'] == []
+    assert response.data['next'] is None
+
+
+def test__limit__same_envelope_as_before_id(api_client):
+
+    # arrange
+    account = create_test_account()
+    create_test_user(
+        email='owner@test.test',
+        account=account,
+        is_account_owner=True
+    )
+    user = create_test_user(
+        account=account,
+        is_account_owner=False
+    )
+    workflow_1 = create_test_workflow(user)
+    workflow_2 = create_test_workflow(user)
+    WorkflowEventService.comment_created_event(
+        user=user,
+        text='Comment 1',
+        task=workflow_1.tasks.get(number=1),
+        after_create_actions=False
+    )
+    event_2 = WorkflowEventService.comment_created_event(
+        user=user,
+        text='Comment 2',
+        task=workflow_2.tasks.get(number=1),
+        after_create_actions=False
+    )
+    api_client.token_authenticate(user)
+
+    # act
+    response = api_client.get('/reports/highlights?limit=1')
+
+    # assert
+    assert response.status_code == 200
+    assert response.data.keys() == {'count', 'next', 'previous', 'results'}
+    assert response.data['count'] == 2
+    assert response.data['results'][0]['id'] == event_2.id
@@ -6,6 +6,7 @@ from src.accounts.permissions import (
     BillingPlanPermission,
 )
 from src.processes.models import WorkflowEvent
+from src.processes.paginations import HighlightsPagination
 from src.reports.serializers import (
     EventHighlightsSerializer,
     HighlightsFilterSerializer
@@ -24,6 +25,7 @@ class HighlightsView(
     BasePrefetchMixin,
 ):
     serializer_class = EventHighlightsSerializer
+    pagination_class = HighlightsPagination
     permission_classes = (
         UserIsAuthenticated,
         ExpiredSubscriptionPermission,
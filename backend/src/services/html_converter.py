@@ -1,8 +1,10 @@
 # pylint:disable=anomalous-backslash-in-string
+import threading
 from abc import abstractmethod
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 from src.services.markdown import MarkdownPatterns
-from markdown import markdown
+from markdown import Markdown
 import re
 
 
@@ -26,45 +28,67 @@ class HTMLList:
 
     def __init__(self):
         self._is_open_li = False
-        self._html = f'<{self.html_tag}>'
+        self._parts: List[str] = [f'<{self.html_tag}>']
 
     def append(self, item):
         self._is_open_li = True
-        self._html += f'<li>{item}'
+        self._parts.append(f'<li>{item}')
 
     def add_nested_list(self, nested):
-        self._html += nested
+        self._parts.append(nested)
 
     def close_li(self):
         if self._is_open_li:
-            self._html += f'</li>'
+            self._parts.append('</li>')
             self._is_open_li = False
 
     def close(self):
         self.close_li()
-        self._html += f'</{self.html_tag}>'
+        self._parts.append(f'</{self.html_tag}>')
 
     def __str__(self):
-        return self._html
+        return ''.join(self._parts)
 
 
 class HTMLNumberedList(HTMLList):
     html_tag = 'ol'
 
 
+_markdown_instances = threading.local()
+
+
+def render_markdown(text: str, tables: bool = False) -> str:
+
+    """ The same as markdown.markdown, but the converter is created
+        once per thread and reset before each conversion """
+
+    name = 'tables' if tables else 'default'
+    converter = getattr(_markdown_instances, name, None)
+    if converter is None:
+        converter = Markdown(extensions=['tables'] if tables else [])
+        setattr(_markdown_instances, name, converter)
+    return converter.reset().convert(text)
+
+
 class RichEditorToHTML:
 
+    """ The converted parts are written to the buffer
+        and joined once at the end """
+
     def __init__(self, text):
         self._text = text
-        self._converted_text = ''
+        self._buffer: List[str] = []
 
     @abstractmethod
     def _convert(self):
         pass
 
+    def _write(self, html: str):
+        self._buffer.append(html)
+
     def __call__(self):
         self._convert()
-        return self._converted_text
+        return ''.join(self._buffer)
 
 
 class BaseListToHTML(RichEditorToHTML):
@@ -91,7 +115,7 @@ class RichEditorChecklistToHTMLService(BaseListToHTML):
 
     @staticmethod
     def _no_p_html(string: str) -> str:
-        return re.sub("(^<P>|</P>$)", "", markdown(string),
+        return re.sub("(^<P>|</P>$)", "", render_markdown(string),
                       flags=re.IGNORECASE)
 
     def _close_list(self, **kwargs) -> str:
@@ -114,15 +138,15 @@ class RichEditorChecklistToHTMLService(BaseListToHTML):
         if match:
             self._process_list_item(list_item=match.group('text'))
         else:
-            self._converted_text += self._close_list()
+            self._write(self._close_list())
             if line:
-                self._converted_text += line
+                self._write(line)
 
     def _convert(self):
         for line in self._text.splitlines(True):
             self._process_line(line)
         if self._current_list:
-            self._converted_text += self._close_list()
+            self._write(self._close_list())
 
 
 def _normalize_markdown_blocks(text: str) -> str:
@@ -149,11 +173,16 @@ def _normalize_markdown_blocks(text: str) -> str:
     return re.sub(r'\n{3,}', '\n\n', text).strip('\n')
 
 
+@lru_cache(maxsize=256)
 def convert_text_to_html(text: str) -> str:
+
+    """ The results are cached by the text content, so the text
+        sent to many recipients is converted once """
+
     text = RichEditorChecklistToHTMLService(text)()
 
     # TODO delete it when fix editor on frontend
     text = _normalize_markdown_blocks(text)
 
-    text = markdown(text, extensions=['tables'])
+    text = render_markdown(text, tables=True)
     return text
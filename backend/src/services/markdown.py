@@ -1,4 +1,8 @@
 import re
+import sys
+import hashlib
+from collections import OrderedDict
+from threading import Lock
 
 
 class MarkdownPatterns:
@@ -51,37 +55,31 @@ class MarkdownPatterns:
 
 class MarkdownService:
 
+    """ Each pass replaces the matches in one sweep over the text,
+        the passes are skipped if the text has no markup of the pass.
+        The results are cached by the hash of the text content,
+        the cache is limited by the total size of the results """
+
+    cache_max_size = 1024 * 1024
+    _cache = OrderedDict()
+    _cache_size = 0
+    _cache_lock = Lock()
+
     @classmethod
     def _clear_bold(cls, text: str) -> str:
-        for bold in MarkdownPatterns.BOLD_PATTERN.finditer(text):
-            clear = bold.groups()[0]
-            text = text.replace(f'**{clear}**', clear)
-        return text
+        return MarkdownPatterns.BOLD_PATTERN.sub(r'\1', text)
 
     @classmethod
     def _clear_italic(cls, text: str) -> str:
-        for italic in MarkdownPatterns.ITALIC_PATTERN.finditer(text):
-            clear = italic.groups()[0]
-            text = text.replace(f'*{clear}*', clear)
-        return text
+        return MarkdownPatterns.ITALIC_PATTERN.sub(r'\1', text)
 
     @classmethod
     def _clear_images(cls, text: str) -> str:
-        for image in MarkdownPatterns.IMAGE_MARKDOWN_PATTERN.finditer(text):
-            name = image.group('name')
-            url = image.group('link')
-            description = image.group('desc') or ''
-            text = text.replace(f'![{name}]({url}{description})', name)
-        return text
+        return MarkdownPatterns.IMAGE_MARKDOWN_PATTERN.sub(r'\g<name>', text)
 
     @classmethod
     def _clear_links(cls, text: str) -> str:
-        for link in MarkdownPatterns.LINK_MARKDOWN_PATTERN.finditer(text):
-            name = link.group('name')
-            url = link.group('link')
-            description = link.group('desc') or ''
-            text = text.replace(f'[{name}]({url}{description})', name)
-        return text
+        return MarkdownPatterns.LINK_MARKDOWN_PATTERN.sub(r'\g<name>', text)
 
     @classmethod
     def _clear_list(cls, text: str) -> str:
@@ -108,34 +106,51 @@ class MarkdownService:
 
     @classmethod
     def _clear_mentions(cls, text: str) -> str:
-        for mention in MarkdownPatterns.MENTION_PATTERN.finditer(text):
-            name = mention.group('name')
-            user_id = mention.group('user_id')
-            text = text.replace(f'[{name}|{user_id}]', name)
-        return text
+        return MarkdownPatterns.MENTION_PATTERN.sub(r'\g<name>', text)
 
     @classmethod
     def _clear_table(cls, text: str) -> str:
-        for table in MarkdownPatterns.TABLE_MARKDOWN_PATTERN.finditer(text):
-            lines = ''.join(table.groups())
-            name = 'Table'
-            text = text.replace(lines, name)
-        return text
+        return MarkdownPatterns.TABLE_MARKDOWN_PATTERN.sub('Table', text)
+
+    @classmethod
+    def _clear(cls, text: str) -> str:
+        if '|' in text:
+            text = cls._clear_mentions(cls._clear_table(text))
+        if '*' in text:
+            text = cls._clear_italic(cls._clear_bold(text))
+        if '](' in text:
+            text = cls._clear_links(cls._clear_images(text))
+        return cls._clear_list(text)
+
+    @classmethod
+    def _get_cached(cls, key: bytes):
+        with cls._cache_lock:
+            result = cls._cache.get(key)
+            if result is not None:
+                cls._cache.move_to_end(key)
+            return result
+
+    @classmethod
+    def _set_cached(cls, key: bytes, result: str):
+        size = sys.getsizeof(result)
+        if size > cls.cache_max_size:
+            return
+        with cls._cache_lock:
+            if key in cls._cache:
+                return
+            cls._cache[key] = result
+            cls._cache_size += size
+            while cls._cache_size > cls.cache_max_size:
+                _, evicted = cls._cache.popitem(last=False)
+                cls._cache_size -= sys.getsizeof(evicted)
 
     @classmethod
     def clear(cls, text: str) -> str:
         if not text:
             return text
-        return cls._clear_list(
-            cls._clear_links(
-                cls._clear_images(
-                    cls._clear_italic(
-                        cls._clear_bold(
-                            cls._clear_mentions(
-                                cls. _clear_table(text)
-                            )
-                        )
-                    )
-                )
-            )
-        )
+        key = hashlib.sha1(text.encode()).digest()
+        result = cls._get_cached(key)
+        if result is None:
+            result = cls._clear(text)
+            cls._set_cached(key, result)
+        return result
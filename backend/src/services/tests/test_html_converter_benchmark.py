@@ -0,0 +1,89 @@
+import os
+import time
+import pytest
+from markdown import markdown
+from src.services.html_converter import (
+    RichEditorChecklistToHTMLService,
+    _normalize_markdown_blocks,
+    convert_text_to_html,
+)
+
+
+DESCRIPTION = (
+    'Text before.\n\n'
+    '- One\n'
+    '2. Two\n'
+    '    - Two.one\n\n'
+    'Checklist title:\n'
+    '[clist:cl-1|cli-1]***First item***[/clist]\n'
+    '[clist:cl-1|cli-2]**Second item**[/clist]\n'
+    '[clist:cl-1|cli-3][link](http://go.com) to site[/clist]\n'
+    '| Name | Amount |\n'
+    '|---|---|\n'
+    '| Fee | 10 |\n'
+    '![image](https://go.net/img.jpg)\n'
+    'Text after with **bold** and *italic*.\n'
+)
+RECIPIENTS_COUNT = 50
+# The wall-clock limits depend on the runner,
+# the benchmarks run only with BENCHMARK=yes
+benchmark = pytest.mark.skipif(
+    os.getenv('BENCHMARK') != 'yes',
+    reason='Benchmarks run with BENCHMARK=yes'
+)
+
+
+def _convert_with_new_converters(text: str) -> str:
+
+    """ The conversion with the new markdown converter for each call """
+
+    text = RichEditorChecklistToHTMLService(text)()
+    text = _normalize_markdown_blocks(text)
+    return markdown(text, extensions=['tables'])
+
+
+def _send_to_recipients(convert) -> float:
+    started = time.perf_counter()
+    for _ in range(RECIPIENTS_COUNT):
+        convert(DESCRIPTION)
+    return time.perf_counter() - started
+
+
+def test_convert_text_to_html__reused_converters__same_html():
+
+    # arrange
+    text = DESCRIPTION * 3
+    convert_text_to_html.cache_clear()
+
+    # act
+    result = convert_text_to_html(text)
+
+    # assert
+    assert result == _convert_with_new_converters(text)
+    assert convert_text_to_html(text) == result
+
+
+def test_convert_text_to_html__many_recipients__converted_once():
+
+    # arrange
+    convert_text_to_html.cache_clear()
+
+    # act
+    _send_to_recipients(convert_text_to_html)
+
+    # assert
+    assert convert_text_to_html.cache_info().misses == 1
+
+
+@benchmark
+def test_convert_text_to_html__many_recipients__faster():
+
+    # arrange
+    convert_text_to_html.cache_clear()
+
+    # act
+    cached_duration = _send_to_recipients(convert_text_to_html)
+    uncached_duration = _send_to_recipients(_convert_with_new_converters)
+
+    # assert
+    assert cached_duration * 5 < uncached_duration
@@ -1,3 +1,5 @@
+import sys
+from collections import OrderedDict
 import pytest
 from src.services.markdown import MarkdownService
 
@@ -276,3 +278,70 @@ def test_clear__mixed_styles__ok(text, expected):
 
     # assert
     assert result == expected
+
+
+def test_clear_table__without_body__ok():
+
+    # act
+    result = MarkdownService._clear_table('| a | b |\n|---|---|')
+
+    # assert
+    assert result == 'Table'
+
+
+def test_clear__same_text__cached(mocker):
+
+    # arrange
+    text = '**Cached** text'
+    clear_mock = mocker.patch(
+        'src.services.markdown.MarkdownService._clear',
+        return_value='Cached text'
+    )
+    MarkdownService.clear(text)
+
+    # act
+    result = MarkdownService.clear(text)
+
+    # assert
+    assert result == 'Cached text'
+    clear_mock.assert_called_once_with(text)
+
+
+def test_clear__cache_max_size__evict_oldest(mocker):
+
+    # arrange
+    mocker.patch.object(MarkdownService, '_cache', OrderedDict())
+    mocker.patch.object(MarkdownService, '_cache_size', 0)
+    mocker.patch.object(
+        MarkdownService,
+        'cache_max_size',
+        sys.getsizeof('Second text') + sys.getsizeof('Third text')
+    )
+    MarkdownService.clear('**First** text')
+    MarkdownService.clear('**Second** text')
+
+    # act
+    MarkdownService.clear('**Third** text')
+
+    # assert
+    assert list(MarkdownService._cache.values()) == [
+        'Second text',
+        'Third text',
+    ]
+    assert MarkdownService._cache_size <= MarkdownService.cache_max_size
+
+
+def test_clear__result_larger_than_cache__not_cached(mocker):
+
+    # arrange
+    mocker.patch.object(MarkdownService, '_cache', OrderedDict())
+    mocker.patch.object(MarkdownService, '_cache_size', 0)
+    mocker.patch.object(MarkdownService, 'cache_max_size', 10)
+
+    # act
+    result = MarkdownService.clear('**Large** text')
+
+    # assert
+    assert result == 'Large text'
+    assert not MarkdownService._cache
+    assert MarkdownService._cache_size == 0
@@ -0,0 +1,76 @@
+import os
+import time
+import pytest
+from src.services.markdown import MarkdownService
+
+
+# The wall-clock limits depend on the runner,
+# the benchmarks run only with BENCHMARK=yes
+pytestmark = pytest.mark.skipif(
+    os.getenv('BENCHMARK') != 'yes',
+    reason='Benchmarks run with BENCHMARK=yes'
+)
+
+LINES = (
+    '**Review** the *draft* of [the report](https://ex.com/report) '
+    'with [Mary Smith|12]',
+    '- check the ![invoice.png](https://st.com/invoice.png '
+    '"attachment_id:4186 entityType:image")',
+    '1. send [contract.pdf](https://st.com/contract.pdf '
+    '"attachment_id:4187 entityType:file") to the client',
+    '[clist:checklist-1|item-1]Call the ***client***[/clist]',
+    '| Name | Amount |\n|---|---|\n| Fee | 10 |',
+    'Plain text of the task description, without any markup',
+    '',
+)
+
+
+def _get_description(size: int) -> str:
+    lines = []
+    length = 0
+    while length < size:
+        line = LINES[len(lines) % len(LINES)]
+        lines.append(line)
+        length += len(line) + 1
+    return '\n'.join(lines)
+
+
+def _get_duration(text: str) -> float:
+
+    """ The best of the runs, the cache is bypassed """
+
+    durations = []
+    for _ in range(3):
+        started = time.perf_counter()
+        MarkdownService._clear(text)
+        durations.append(time.perf_counter() - started)
+    return min(durations)
+
+
+@pytest.mark.parametrize('size', (1_000, 10_000, 100_000))
+def test_clear__description_size__fast(size):
+
+    # arrange
+    text = _get_description(size)
+
+    # act
+    duration = _get_duration(text)
+
+    # assert
+    # About 1 ms per 10 KB, the limit is for the slow CI runners
+    assert duration < size / 10_000 * 0.02 + 0.01
+
+
+def test_clear__large_description__linear_time():
+
+    # arrange
+    small_text = _get_description(10_000)
+    large_text = _get_description(100_000)
+
+    # act
+    small_duration = _get_duration(small_text)
+    large_duration = _get_duration(large_text)
+
+    # assert
+    # 10 times longer text, the quadratic replaces are 100 times slower
+    assert large_duration < small_duration * 30
@@ -13,6 +13,7 @@ import os
 from os import environ as env
 from configurations import Configuration, values
 from corsheaders.defaults import default_headers
+from kombu import Queue
 
 
 class Common(Configuration):
@@ -101,6 +102,11 @@ class Common(Configuration):
         'X-Public-Authorization',
         'Stripe-Signature',
     ]
+    CORS_EXPOSE_HEADERS = [
+        'X-RateLimit-Limit',
+        'X-RateLimit-Remaining',
+        'X-RateLimit-Reset',
+    ]
 
     # A list of origins that are authorized to make cross-site HTTP requests.
     # A list of origins echoed back to the client in the
@@ -159,6 +165,8 @@ class Common(Configuration):
         'django.middleware.csrf.CsrfViewMiddleware',
         'src.authentication.middleware.UserAgentMiddleware',
         'src.authentication.middleware.AuthMiddleware',
+        'src.db_routing.ReadRoutingMiddleware',
+        'src.generics.middleware.RateLimitHeadersMiddleware',
         'django.contrib.messages.middleware.MessageMiddleware',
         'django.middleware.clickjacking.XFrameOptionsMiddleware',
     ]
@@ -182,6 +190,9 @@ class Common(Configuration):
 
     WSGI_APPLICATION = 'src.wsgi.application'
     ASGI_APPLICATION = 'src.asgi.application'
+    # Threads running the http views of one ASGI worker,
+    # each thread holds its own database connection
+    ASGI_HTTP_THREADS = int(env.get('ASGI_HTTP_THREADS', 4))
     CHANNEL_LAYERS = {
         'default': {
             'BACKEND': 'channels.layers.InMemoryChannelLayer'
@@ -246,7 +257,21 @@ class Common(Configuration):
             '09_auth0__token': env.get('THROTTLE_09'),
             '10_auth0__auth_uri': env.get('THROTTLE_10'),
             '11_auth__reset_password': env.get('THROTTLE_11'),
-        }
+            '12_api__account_quota': env.get('THROTTLE_12'),
+        },
+        'DEFAULT_THROTTLE_CLASSES': (
+            'src.generics.throttling.AccountApiQuotaThrottle',
+        ),
+    }
+    # Requests allowed at a time by the scope, one by default.
+    # Example: "01_accounts_invites__token=3 07_auth_ms__token=5"
+    THROTTLE_BURSTS = {
+        scope: int(burst)
+        for scope, burst in (
+            item.split('=')
+            for item in env.get('THROTTLE_BURSTS', '').split(' ')
+            if item
+        )
     }
 
     SIMPLE_JWT = {
@@ -328,11 +353,25 @@ class Common(Configuration):
         env.get('UNREAD_NOTIFICATIONS_TIMEOUT', 600)
     )
 
+    # Account events log
+    # Buffered events are saved by the "flush_account_events" task,
+    # requires the redis cache backend
+    ACCOUNT_LOG_BUFFER = env.get('ACCOUNT_LOG_BUFFER') == 'yes'
+    ACCOUNT_LOG_BUFFER_MAX_SIZE = int(
+        env.get('ACCOUNT_LOG_BUFFER_MAX_SIZE', 100000)
+    )
+    ACCOUNT_LOG_FLUSH_BATCH_SIZE = int(
+        env.get('ACCOUNT_LOG_FLUSH_BATCH_SIZE', 1000)
+    )
+    # Larger request bodies are saved truncated
+    API_LOG_MAX_BODY_SIZE = int(env.get('API_LOG_MAX_BODY_SIZE', 65536))
+
     # Celery
     CELERY_BROKER_URL = env.get('CELERY_BROKER_URL')
     CELERY_IMPORTS = [
         'src.accounts.tasks',
         'src.authentication.tasks',
+        'src.processes.tasks.ai',
         'src.processes.tasks.delay',
         'src.processes.tasks.tasks',
         'src.processes.tasks.update_workflow',
@@ -341,7 +380,41 @@ class Common(Configuration):
         'src.services.tasks',
         'src.analytics.tasks',
         'src.storage.tasks',
+        'src.logs.tasks',
     ]
+    # Queues by the workload class, so the heavy tasks of one account
+    # don't delay the notifications of the others. A worker without
+    # the "-Q" option consumes all queues
+    CELERY_DEFAULT_QUEUE = 'celery'
+    CELERY_QUEUES = (
+        Queue('celery'),
+        Queue('notifications'),
+        Queue('webhooks'),
+        Queue('digests'),
+        Queue('analytics'),
+        Queue('heavy'),
+        Queue('ai'),
+    )
+    CELERY_ROUTES = {
+        'src.notifications.tasks.*': {'queue': 'notifications'},
+        'src.services.tasks.*': {'queue': 'notifications'},
+        'src.processes.tasks.webhooks.*': {'queue': 'webhooks'},
+        'src.reports.tasks.*': {'queue': 'digests'},
+        'src.analytics.tasks.*': {'queue': 'analytics'},
+        'src.processes.tasks.update_workflow.*': {'queue': 'heavy'},
+        'src.processes.tasks.tasks.complete_tasks': {'queue': 'heavy'},
+        'src.processes.tasks.ai.*': {'queue': 'ai'},
+        'src.storage.tasks.*': {'queue': 'heavy'},
+    }
+    # Token bucket of the heavy tasks per account
+    ACCOUNT_TASKS_BUCKET_CAPACITY = int(
+        env.get('ACCOUNT_TASKS_BUCKET_CAPACITY', 10)
+    )
+    ACCOUNT_TASKS_BUCKET_RATE = float(
+        env.get('ACCOUNT_TASKS_BUCKET_RATE', 1)
+    )
+    # Latency of the tasks by the queue, requires the redis cache backend
+    CELERY_QUEUE_STATS = env.get('CELERY_QUEUE_STATS') == 'yes'
 
     # reCaptcha
     DRF_RECAPTCHA_SITE_KEY = env.get('RECAPTCHA_SITE_KEY', 'key')
@@ -356,11 +429,29 @@ class Common(Configuration):
     # OpenAI
     OPENAI_API_KEY = env.get('OPENAI_API_KEY')
     OPENAI_API_ORG = env.get('OPENAI_API_ORG')
+    # The fake completion is used out of the production and the staging,
+    # the delay imitates the response time for the load tests
+    AI_FAKE_COMPLETION = env.get('AI_FAKE_COMPLETION') == 'yes'
+    AI_FAKE_COMPLETION_DELAY = float(env.get('AI_FAKE_COMPLETION_DELAY', 0))
+    # Active prompts are cached in the process memory, the responses
+    # by the description and the prompt version
+    AI_CACHE = env.get('AI_CACHE') == 'yes'
+    AI_PROMPT_CACHE_TIMEOUT = int(env.get('AI_PROMPT_CACHE_TIMEOUT', 60))
+    AI_RESPONSE_CACHE_TIMEOUT = int(
+        env.get('AI_RESPONSE_CACHE_TIMEOUT', 86400)
+    )
+    # Lifetime of the template generation job results
+    AI_JOB_TIMEOUT = int(env.get('AI_JOB_TIMEOUT', 3600))
 
     # Microsoft auth
     MS_CLIENT_ID = env.get('MS_CLIENT_ID')
     MS_CLIENT_SECRET = env.get('MS_CLIENT_SECRET')
     MS_AUTHORITY = env.get('MS_AUTHORITY')
+    MS_GRAPH_API_URL = env.get(
+        'MS_GRAPH_API_URL',
+        'https://graph.microsoft.com/v1.0/'
+    )
+    MS_CONTACTS_PHOTO_WORKERS = int(env.get('MS_CONTACTS_PHOTO_WORKERS', 8))
 
     # SSO Auth0
     AUTH0_CLIENT_ID = env.get('AUTH0_CLIENT_ID')
@@ -369,6 +460,42 @@ class Common(Configuration):
     AUTH0_REDIRECT_URI = env.get('AUTH0_REDIRECT_URI')
 
     REPLICA = 'replica'
+    # Raw sql read queries of the requests go to the replica, if exists
+    REPLICA_READS = env.get('REPLICA_READS') == 'yes'
+    REPLICA_MAX_LAG_SECONDS = float(env.get('REPLICA_MAX_LAG_SECONDS', 5))
+    DATABASE_ROUTERS = ['src.db_routing.ReplicaRouter']
+    # Stats of the SqlQueryObject queries, requires the redis cache backend
+    QUERY_STATS = env.get('QUERY_STATS') == 'yes'
+    QUERY_STATS_FLUSH_SECONDS = int(env.get('QUERY_STATS_FLUSH_SECONDS', 10))
+    QUERY_STATS_SLOW_QUERY_MS = int(
+        env.get('QUERY_STATS_SLOW_QUERY_MS', 1000)
+    )
+    QUERY_STATS_EXPLAIN_INTERVAL = int(
+        env.get('QUERY_STATS_EXPLAIN_INTERVAL', 3600)
+    )
+    # Delays ending within the horizon are resumed by the celery ETA tasks,
+    # the periodic sweep resumes the delays missed for longer than grace
+    DELAY_ETA_HORIZON = int(env.get('DELAY_ETA_HORIZON', 900))
+    DELAY_RESUME_GRACE = int(env.get('DELAY_RESUME_GRACE', 300))
+    # Stats of the periodic locks, requires the redis cache backend
+    LOCK_STATS = env.get('LOCK_STATS') == 'yes'
+    # Tasks and kickoff of the workflow details are cached by revision
+    WORKFLOW_DETAILS_CACHE = env.get('WORKFLOW_DETAILS_CACHE') == 'yes'
+    WORKFLOW_DETAILS_CACHE_TIMEOUT = int(
+        env.get('WORKFLOW_DETAILS_CACHE_TIMEOUT', 86400)
+    )
+    # Reassignment of the performers is processed by the chunks of the keys
+    REASSIGN_CHUNK_SIZE = int(env.get('REASSIGN_CHUNK_SIZE', 500))
+    REASSIGN_JOB_TIMEOUT = int(env.get('REASSIGN_JOB_TIMEOUT', 86400))
+    # Template versions are stored as the deltas between the full snapshots
+    TEMPLATE_VERSION_SNAPSHOT_INTERVAL = int(
+        env.get('TEMPLATE_VERSION_SNAPSHOT_INTERVAL', 10)
+    )
+    TEMPLATE_VERSION_CACHE_SIZE = int(
+        env.get('TEMPLATE_VERSION_CACHE_SIZE', 64)
+    )
+    # Persistent connections, one per thread
+    POSTGRES_CONN_MAX_AGE = int(env.get('POSTGRES_CONN_MAX_AGE', 0))
     DATABASES = {
         'default': {
             'ENGINE': 'django.db.backends.postgresql_psycopg2',
@@ -377,6 +504,7 @@ class Common(Configuration):
             'PASSWORD': env.get('POSTGRES_PASSWORD', 'pneumatic'),
             'HOST': env.get('POSTGRES_HOST', 'localhost'),
             'PORT': env.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': POSTGRES_CONN_MAX_AGE,
         }
     }
 
@@ -528,6 +656,7 @@ class Staging(Development):
             'PASSWORD': env.get('POSTGRES_PASSWORD', 'pneumatic'),
             'HOST': env.get('POSTGRES_HOST', 'localhost'),
             'PORT': env.get('POSTGRES_PORT', '5432'),
+            'CONN_MAX_AGE': Common.POSTGRES_CONN_MAX_AGE,
         },
         'replica': {
             'ENGINE': 'django.db.backends.postgresql_psycopg2',
@@ -535,7 +664,8 @@ class Staging(Development):
             'USER': env.get('POSTGRES_REPLICA_USER', 'pneumatic'),
             'PASSWORD': env.get('POSTGRES_REPLICA_PASSWORD', 'pneumatic'),
             'HOST': env.get('POSTGRES_REPLICA_HOST', 'localhost'),
-            'PORT': env.get('POSTGRES_REPLICA_PORT', '5432')
+            'PORT': env.get('POSTGRES_REPLICA_PORT', '5432'),
+            'CONN_MAX_AGE': Common.POSTGRES_CONN_MAX_AGE,
         }
     }
 
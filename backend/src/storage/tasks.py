@@ -1,5 +1,6 @@
 from contextlib import contextmanager
 from django.db import transaction
+from django.utils import timezone
 from django.contrib.auth import get_user_model
 from celery import shared_task
 from celery.task import Task as TaskCelery
@@ -308,7 +309,8 @@ def switch_comments(
             if event.text.find(path_from) > -1:
                 event.text = event.text.replace(path_from, path_to)
                 event.clear_text = event.clear_text.replace(path_from, path_to)
-                event.save(update_fields=['text', 'clear_text'])
+                event.changed = timezone.now()
+                event.save(update_fields=['text', 'clear_text', 'changed'])
                 ids.append(event.id)
 
     service = AccountLogService(user)
@@ -340,7 +342,8 @@ def switch_revert_events(
             if event.text.find(path_from) > -1:
                 event.text = event.text.replace(path_from, path_to)
                 event.clear_text = event.clear_text.replace(path_from, path_to)
-                event.save(update_fields=['text', 'clear_text'])
+                event.changed = timezone.now()
+                event.save(update_fields=['text', 'clear_text', 'changed'])
                 ids.append(event.id)
 
     service = AccountLogService(user)
@@ -424,7 +427,8 @@ def switch_complete_task_events(
                             processed = True
             if processed:
                 event.task_json = task
-                event.save(update_fields=['task_json'])
+                event.changed = timezone.now()
+                event.save(update_fields=['task_json', 'changed'])
                 ids.append(event.id)
 
     service = AccountLogService(user)
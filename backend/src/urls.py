@@ -64,6 +64,7 @@ router.register('faq', FaqViewSet, basename='faq')
 
 urlpatterns = [
     path('', views.index, name='index'),
+    path('metrics/queries', views.QueryMetricsView.as_view()),
     path(f'{settings.ADMIN_PATH}/', admin.site.urls),
 
     path('auth/', include('src.authentication.urls')),
@@ -1,5 +1,33 @@
+from django.conf import settings
 from django.http import HttpResponse
+from rest_framework.views import APIView
+from src.authentication.permissions import NoAuthApiPermission
+from src.locks import (
+    render_prometheus_metrics as render_lock_metrics
+)
+from src.query_stats import render_prometheus_metrics
+from src.queue_stats import (
+    render_prometheus_metrics as render_queue_metrics
+)
 
 
 def index(request):
     return HttpResponse(status=204)
+
+
+class QueryMetricsView(APIView):
+
+    """ SqlQueryObject, periodic lock and celery queue stats
+        in the Prometheus text format """
+
+    authentication_classes = ()
+    permission_classes = (NoAuthApiPermission,)
+
+    def get(self, request, *args, **kwargs):
+        metrics = render_prometheus_metrics() + render_lock_metrics()
+        if settings.CELERY_QUEUE_STATS:
+            metrics += render_queue_metrics()
+        return HttpResponse(
+            metrics,
+            content_type='text/plain; version=0.0.4'
+        )